@@ -24,6 +24,9 @@ from common.repositories import (
     ProjectRepository,
     AffinityRepository
 )
+from common.embedding_cache import EmbeddingCache
+from common.assignment_index import AssignmentIndex
+from common.latency_budget import LatencyBudget
 
 __all__ = [
     # Models
@@ -39,5 +42,10 @@ __all__ = [
     # DynamoDB Client
     'DynamoDBClient', 'DynamoDBClientError',
     # Repositories
-    'EmployeeRepository', 'ProjectRepository', 'AffinityRepository'
+    'EmployeeRepository', 'ProjectRepository', 'AffinityRepository',
+    # Caches / Indexes
+    'EmbeddingCache',
+    'AssignmentIndex',
+    # Request budget
+    'LatencyBudget'
 ]
@@ -0,0 +1,257 @@
+"""
+직원별 상위 K 친밀도 이웃 목록 (AffinityNeighbors)
+
+추천 엔진과 팀 구성은 직원마다 가장 강한 관계만 필요하지만 EmployeeAffinity는 직원 쌍마다
+한 행이라 n² 행을 읽어야 합니다. 친밀도 계산 작업이 직원마다 종합 친밀도 상위 K 이웃을
+한 항목(인접 목록)으로 함께 저장하여
+
+- "X와 잘 맞는 사람" = GetItem 1회
+- "이 팀 안의 친밀도" = 팀원 항목 BatchGetItem 1회
+
+로 조회합니다.
+
+- 키: user_id
+- 값: neighbor_ids / scores (점수 내림차순 병렬 리스트), score_sum / pair_count, updated_at
+- score_sum / pair_count는 상위 K가 아니라 그 직원의 후보 쌍 전체(0점 포함) 합계와 쌍 수입니다.
+  추천 엔진의 평균 친밀도(affinity_score)는 EmployeeAffinity 행 평균과 같은 이 값으로 계산합니다.
+- 이웃이 없어진 직원도 빈 목록으로 다시 써서 이전 목록이 남지 않도록 합니다.
+"""
+
+import heapq
+import os
+import time
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+DEFAULT_TABLE_NAME = os.environ.get('AFFINITY_NEIGHBOR_TABLE', 'AffinityNeighbors')
+
+# 직원별 이웃 수
+NEIGHBOR_TOP_K = int(os.environ.get('AFFINITY_NEIGHBOR_TOP_K', '50'))
+
+# BatchGetItem 최대 키 수
+BATCH_GET_SIZE = 100
+
+Pair = Tuple[str, str]
+Neighbor = Tuple[str, float]
+
+
+class NeighborProfile(NamedTuple):
+    """직원 한 명의 인접 목록 항목"""
+    neighbors: List[Neighbor]
+    score_sum: float
+    pair_count: int
+
+    @property
+    def mean(self) -> float:
+        """후보 쌍 전체 평균 친밀도 (쌍이 없으면 0)"""
+        return self.score_sum / self.pair_count if self.pair_count else 0.0
+
+
+class TopKNeighbors:
+    """직원별 상위 K 이웃 누적 (직원마다 크기 K 최소 힙) + 직원별 전체 점수 합계/쌍 수"""
+
+    def __init__(self, k: int = NEIGHBOR_TOP_K):
+        self.k = k
+        self.heaps: Dict[str, List[Tuple[float, str]]] = {}
+        self.sums: Dict[str, List[float]] = {}
+
+    def add(self, employee_1: str, employee_2: str, score: float) -> None:
+        """직원 쌍 친밀도를 양쪽 합계와 목록에 반영 (0점 이하는 목록에서 제외)"""
+        if employee_1 == employee_2:
+            return
+        for owner in (employee_1, employee_2):
+            total = self.sums.setdefault(owner, [0.0, 0])
+            total[0] += score
+            total[1] += 1
+        if score <= 0:
+            return
+        self.push(employee_1, employee_2, score)
+        self.push(employee_2, employee_1, score)
+
+    def push(self, owner: str, neighbor: str, score: float) -> None:
+        """한 직원의 목록에만 이웃 반영"""
+        heap = self.heaps.setdefault(owner, [])
+        if len(heap) < self.k:
+            heapq.heappush(heap, (score, neighbor))
+        elif (score, neighbor) > heap[0]:
+            heapq.heapreplace(heap, (score, neighbor))
+
+    def merge(self, neighbor_lists: Dict[str, Iterable[Sequence]], totals: Optional[Dict[str, Sequence]] = None) -> None:
+        """
+        다른 누적기의 목록과 합계 병합 (샤드별 상위 K → 전체 상위 K)
+
+        쌍은 정확히 한 샤드에 속하므로 직원의 전체 상위 K는 샤드별 상위 K의 합집합 안에 있고,
+        합계/쌍 수는 샤드별 값을 더한 값입니다.
+
+        Args:
+            neighbor_lists: {직원 ID: [(이웃 ID, 점수)]} - lists() 또는 그 JSON 복원값
+            totals: {직원 ID: (점수 합계, 쌍 수)} - totals() 또는 그 JSON 복원값
+        """
+        for owner, neighbors in neighbor_lists.items():
+            for neighbor, score in neighbors:
+                self.push(owner, neighbor, float(score))
+        for owner, (score_sum, pair_count) in (totals or {}).items():
+            total = self.sums.setdefault(owner, [0.0, 0])
+            total[0] += float(score_sum)
+            total[1] += int(pair_count)
+
+    def totals(self) -> Dict[str, Tuple[float, int]]:
+        """직원별 (후보 쌍 점수 합계, 쌍 수)"""
+        return {owner: (score_sum, pair_count) for owner, (score_sum, pair_count) in self.sums.items()}
+
+    def lists(self) -> Dict[str, List[Neighbor]]:
+        """직원별 이웃 목록 (점수 내림차순, 동점은 ID 순)"""
+        return {
+            owner: sorted(((neighbor, score) for score, neighbor in heap), key=lambda item: (-item[1], item[0]))
+            for owner, heap in self.heaps.items()
+        }
+
+
+def to_decimal(value: float) -> Decimal:
+    """DynamoDB 숫자 변환"""
+    return Decimal(str(round(float(value), 2)))
+
+
+def parse_neighbors(item: Optional[Dict]) -> List[Neighbor]:
+    """인접 목록 항목 → [(이웃 ID, 점수)]"""
+    if not item:
+        return []
+    return [(neighbor, float(score)) for neighbor, score in zip(item.get('neighbor_ids', []), item.get('scores', []))]
+
+
+def parse_profile(item: Dict) -> NeighborProfile:
+    """인접 목록 항목 → NeighborProfile (합계가 없는 이전 항목은 목록 점수로 대신함)"""
+    neighbors = parse_neighbors(item)
+    if 'pair_count' not in item:
+        return NeighborProfile(neighbors, sum(score for _, score in neighbors), len(neighbors))
+    return NeighborProfile(neighbors, float(item.get('score_sum', 0)), int(item['pair_count']))
+
+
+def graph_of(profiles: Dict[str, NeighborProfile]) -> Dict[str, Dict[str, float]]:
+    """인접 목록 → 친밀도 그래프 {직원 ID: {직원 ID: 점수}} (한쪽 목록에만 있는 관계도 양방향으로 채움)"""
+    graph: Dict[str, Dict[str, float]] = {}
+    for owner, profile in profiles.items():
+        for neighbor, score in profile.neighbors:
+            graph.setdefault(owner, {})[neighbor] = score
+            graph.setdefault(neighbor, {})[owner] = score
+    return graph
+
+
+class AffinityNeighborStore:
+    """직원별 상위 K 친밀도 이웃 저장소 (AffinityNeighbors)"""
+
+    def __init__(self, dynamodb_resource, table_name: str = DEFAULT_TABLE_NAME):
+        """
+        Args:
+            dynamodb_resource: boto3 DynamoDB resource
+            table_name: 인접 목록 테이블 이름
+        """
+        self.dynamodb = dynamodb_resource
+        self.table = dynamodb_resource.Table(table_name)
+
+    def replace(
+        self,
+        neighbor_lists: Dict[str, List[Neighbor]],
+        employee_ids: Iterable[str] = (),
+        totals: Optional[Dict[str, Tuple[float, int]]] = None
+    ) -> int:
+        """
+        직원별 인접 목록 저장 (batch_writer)
+
+        Args:
+            neighbor_lists: {직원 ID: [(이웃 ID, 점수)]} - TopKNeighbors.lists()
+            employee_ids: 전체 직원 ID (이웃이 없는 직원은 빈 목록으로 저장)
+            totals: {직원 ID: (점수 합계, 쌍 수)} - TopKNeighbors.totals() (없는 직원은 0/0)
+
+        Returns:
+            int: 저장한 항목 수
+        """
+        totals = totals or {}
+        owners = dict.fromkeys(list(employee_ids) + list(neighbor_lists) + list(totals))
+        updated_at = int(time.time())
+        with self.table.batch_writer() as batch:
+            for owner in owners:
+                neighbors = neighbor_lists.get(owner, [])
+                score_sum, pair_count = totals.get(owner, (0.0, 0))
+                batch.put_item(Item={
+                    'user_id': owner,
+                    'neighbor_ids': [neighbor for neighbor, _ in neighbors],
+                    'scores': [to_decimal(score) for _, score in neighbors],
+                    'score_sum': to_decimal(score_sum),
+                    'pair_count': int(pair_count),
+                    'updated_at': updated_at
+                })
+        return len(owners)
+
+    def get_neighbors(self, user_id: str) -> List[Neighbor]:
+        """직원 한 명의 상위 이웃 (GetItem 1회)"""
+        return parse_neighbors(self.table.get_item(Key={'user_id': user_id}).get('Item'))
+
+    def get_profiles(self, user_ids: Iterable[str]) -> Dict[str, NeighborProfile]:
+        """여러 직원의 인접 목록 항목 (BatchGetItem, 미처리 키 재요청)"""
+        unique_ids = list(dict.fromkeys(user_ids))
+        result: Dict[str, NeighborProfile] = {}
+        for start in range(0, len(unique_ids), BATCH_GET_SIZE):
+            request = {
+                self.table.name: {'Keys': [{'user_id': user_id} for user_id in unique_ids[start:start + BATCH_GET_SIZE]]}
+            }
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get('Responses', {}).get(self.table.name, []):
+                    result[item['user_id']] = parse_profile(item)
+                request = response.get('UnprocessedKeys') or None
+        return result
+
+    def get_many(self, user_ids: Iterable[str]) -> Dict[str, List[Neighbor]]:
+        """여러 직원의 상위 이웃 (BatchGetItem)"""
+        return {user_id: profile.neighbors for user_id, profile in self.get_profiles(user_ids).items()}
+
+    def team_affinity(
+        self,
+        user_ids: Iterable[str],
+        profiles: Optional[Dict[str, NeighborProfile]] = None
+    ) -> Dict[Pair, float]:
+        """
+        팀 안의 직원 쌍 친밀도 (팀원 인접 목록 BatchGet 1회)
+
+        어느 한쪽의 상위 K 목록에라도 있는 쌍만 반환합니다 (없는 쌍은 약한 관계 - 0으로 취급).
+
+        Args:
+            user_ids: 팀원(또는 후보) 직원 ID
+            profiles: 이미 조회한 인접 목록 항목 (없으면 BatchGet)
+
+        Returns:
+            dict: {(직원 ID, 직원 ID): 점수} - ID 오름차순 쌍
+        """
+        team = set(user_ids)
+        if profiles is None:
+            profiles = self.get_profiles(team)
+        pairs: Dict[Pair, float] = {}
+        for owner, profile in profiles.items():
+            if owner not in team:
+                continue
+            for neighbor, score in profile.neighbors:
+                if neighbor in team:
+                    pairs[(owner, neighbor) if owner < neighbor else (neighbor, owner)] = score
+        return pairs
+
+    def scan_profiles(self) -> Dict[str, NeighborProfile]:
+        """전체 인접 목록 항목 (직원 수만큼의 항목만 읽음)"""
+        profiles: Dict[str, NeighborProfile] = {}
+        response = self.table.scan()
+        while True:
+            for item in response.get('Items', []):
+                profiles[item['user_id']] = parse_profile(item)
+            if 'LastEvaluatedKey' not in response:
+                return profiles
+            response = self.table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+
+    def scan_graph(self) -> Dict[str, Dict[str, float]]:
+        """
+        전체 인접 목록 → 친밀도 그래프
+
+        Returns:
+            dict: {직원 ID: {직원 ID: 점수}} - 한쪽 목록에만 있는 관계도 양방향으로 채움
+        """
+        return graph_of(self.scan_profiles())
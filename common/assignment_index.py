@@ -0,0 +1,200 @@
+"""
+직원 배정 인덱스
+
+직원별 프로젝트 배정(기간 포함)을 EmployeeAssignments 테이블에 한 항목으로 유지합니다.
+프로젝트 배정 시점에 갱신되며, 추천 엔진은 후보자 ID로 BatchGet하여 가용성을 확인합니다.
+Projects 테이블 전체 스캔 없이 후보자 수에 비례하는 비용으로 조회할 수 있습니다.
+
+항목 형식:
+    {
+        'user_id': 'U_001',
+        'allocations': [
+            {'project_id': 'P_001', 'project_name': '...', 'role': '...',
+             'start_date': '2025-01-01', 'end_date': '2025-12-31'}
+        ],
+        'updated_at': '2025-01-01T09:00:00'
+    }
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import boto3
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+ASSIGNMENT_TABLE = 'EmployeeAssignments'
+
+
+def _normalize_date(value: Optional[str], end_of_period: bool = False) -> Optional[str]:
+    """
+    날짜 문자열을 YYYY-MM-DD 형식으로 정규화
+
+    ISO 일시('2025-01-15T09:00:00')는 날짜 부분만, 월 단위('2025-12')는
+    시작일이면 1일, 종료일이면 31일로 보정하여 문자열 비교가 가능하도록 합니다.
+    """
+    if not value:
+        return None
+    date = str(value).strip()[:10]
+    if len(date) == 7:
+        date += '-31' if end_of_period else '-01'
+    return date
+
+
+def make_allocation(
+    project_id: str,
+    project_name: Optional[str],
+    role: str,
+    start_date: str,
+    end_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    배정 항목 생성
+
+    Args:
+        project_id: 프로젝트 ID
+        project_name: 프로젝트 이름
+        role: 투입 역할
+        start_date: 배정 시작일
+        end_date: 배정 종료일 (없으면 종료일 미정)
+
+    Returns:
+        dict: 배정 항목
+    """
+    allocation = {
+        'project_id': project_id,
+        'project_name': project_name or '',
+        'role': role,
+        'start_date': _normalize_date(start_date)
+    }
+    end = _normalize_date(end_date, end_of_period=True)
+    if end:
+        allocation['end_date'] = end
+    return allocation
+
+
+def is_active(allocation: Dict[str, Any], as_of: Optional[str] = None) -> bool:
+    """
+    기준일에 진행 중인 배정인지 확인
+
+    Args:
+        allocation: 배정 항목
+        as_of: 기준일 (기본값: 오늘)
+
+    Returns:
+        bool: 진행 중 여부
+    """
+    today = _normalize_date(as_of) or datetime.now().strftime('%Y-%m-%d')
+    start = _normalize_date(allocation.get('start_date'))
+    end = _normalize_date(allocation.get('end_date'), end_of_period=True)
+
+    if start and start > today:
+        return False
+    if end and end < today:
+        return False
+    return True
+
+
+def active_allocations(
+    allocations: List[Dict[str, Any]],
+    as_of: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    기준일에 진행 중인 배정만 반환
+
+    Args:
+        allocations: 배정 목록
+        as_of: 기준일 (기본값: 오늘)
+
+    Returns:
+        list: 진행 중인 배정 목록
+    """
+    return [allocation for allocation in allocations or [] if is_active(allocation, as_of)]
+
+
+class AssignmentIndex:
+    """
+    EmployeeAssignments 테이블 접근 클래스
+
+    조회/갱신 오류는 호출자에게 전달되며, 가용성 판단의 대체 처리는 호출자가 결정합니다.
+    """
+
+    def __init__(self, dynamodb_resource=None, table_name: str = ASSIGNMENT_TABLE):
+        """
+        배정 인덱스 초기화
+
+        Args:
+            dynamodb_resource: boto3 DynamoDB 리소스 (기본값: 새 리소스)
+            table_name: 배정 인덱스 테이블 이름
+        """
+        self.dynamodb = dynamodb_resource or boto3.resource('dynamodb')
+        self.table_name = table_name
+        self.table = self.dynamodb.Table(table_name)
+
+    def add_allocation(self, user_id: str, allocation: Dict[str, Any]) -> None:
+        """
+        직원 배정 추가
+
+        Args:
+            user_id: 직원 ID
+            allocation: 배정 항목 (make_allocation 결과)
+        """
+        self.table.update_item(
+            Key={'user_id': user_id},
+            UpdateExpression='SET allocations = list_append(if_not_exists(allocations, :empty_list), :allocation), '
+                             'updated_at = :updated_at',
+            ExpressionAttributeValues={
+                ':empty_list': [],
+                ':allocation': [allocation],
+                ':updated_at': datetime.now().isoformat()
+            }
+        )
+        logger.info(f"배정 인덱스 갱신: {user_id} -> {allocation.get('project_id')}")
+
+    def get_allocations(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        직원 한 명의 배정 목록 조회
+
+        Args:
+            user_id: 직원 ID
+
+        Returns:
+            list: 배정 목록 (없으면 빈 리스트)
+        """
+        response = self.table.get_item(Key={'user_id': user_id})
+        return response.get('Item', {}).get('allocations', [])
+
+    def batch_get_allocations(self, user_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 직원의 배정 목록 조회 (BatchGetItem, 100건 단위)
+
+        Args:
+            user_ids: 직원 ID 목록
+
+        Returns:
+            dict: {user_id: 배정 목록} - 인덱스 항목이 없는 직원은 포함되지 않음
+        """
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        unique_ids = list(dict.fromkeys(user_ids))
+
+        for start in range(0, len(unique_ids), 100):
+            request_items = {
+                self.table_name: {
+                    'Keys': [{'user_id': user_id} for user_id in unique_ids[start:start + 100]],
+                    'ProjectionExpression': 'user_id, allocations'
+                }
+            }
+
+            # 처리되지 않은 키는 재요청
+            while request_items:
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get('Responses', {}).get(self.table_name, []):
+                    result[item['user_id']] = item.get('allocations', [])
+                request_items = response.get('UnprocessedKeys') or {}
+
+        return result
@@ -0,0 +1,236 @@
+"""
+임베딩 캐시
+
+Bedrock Titan 임베딩 결과를 2단계로 캐싱합니다.
+- L1: Lambda 컨테이너 메모리 LRU (웜 스타트 간 유지)
+- L2: DynamoDB EmbeddingCache 테이블 (TTL 기반 만료)
+
+캐시 키는 SHA-256(모델 ID + 입력 텍스트)이므로 모델이 바뀌면 자동으로 분리됩니다.
+"""
+
+import hashlib
+import logging
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = 'EmbeddingCache'
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60  # 30일
+
+
+def make_cache_key(model_id: str, text: str) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        model_id: 임베딩 모델 ID
+        text: 입력 텍스트
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(model_id.encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def pack_vector(vector: List[float]) -> bytes:
+    """벡터를 float32 바이너리로 직렬화 (1536차원 기준 약 6KB)"""
+    return array('f', vector).tobytes()
+
+
+def unpack_vector(data: Any) -> List[float]:
+    """float32 바이너리를 벡터로 역직렬화"""
+    # boto3는 Binary 속성을 boto3.dynamodb.types.Binary로 반환
+    raw = data.value if hasattr(data, 'value') else bytes(data)
+    values = array('f')
+    values.frombytes(raw)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """
+    2단계 임베딩 캐시
+
+    동일한 (모델, 텍스트) 조합에 대해 Bedrock 호출을 생략합니다.
+    DynamoDB 접근 실패는 캐시 미스로 처리하여 추천 흐름을 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        dynamodb_resource=None,
+        table_name: str = DEFAULT_TABLE_NAME,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        임베딩 캐시 초기화
+
+        Args:
+            dynamodb_resource: boto3 DynamoDB 리소스 (None이면 메모리 캐시만 사용)
+            table_name: 영구 캐시 테이블 이름
+            max_entries: 메모리 LRU 최대 항목 수
+            ttl_seconds: 영구 캐시 항목 유효 기간 (초)
+        """
+        self.dynamodb = dynamodb_resource
+        self.table_name = table_name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._stats = {
+            'memory_hits': 0,
+            'store_hits': 0,
+            'misses': 0,
+            'store_errors': 0
+        }
+
+    def get(self, model_id: str, text: str) -> Optional[List[float]]:
+        """
+        캐시 조회 (메모리 → DynamoDB 순)
+
+        Args:
+            model_id: 임베딩 모델 ID
+            text: 입력 텍스트
+
+        Returns:
+            캐시된 임베딩 또는 None
+        """
+        key = make_cache_key(model_id, text)
+
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            self._stats['memory_hits'] += 1
+            return vector
+
+        vector = self._load_from_store(key)
+        if vector is not None:
+            self._remember(key, vector)
+            self._stats['store_hits'] += 1
+            return vector
+
+        self._stats['misses'] += 1
+        return None
+
+    def put(self, model_id: str, text: str, vector: List[float]) -> None:
+        """
+        임베딩 저장 (메모리 + DynamoDB)
+
+        빈 벡터는 저장하지 않습니다.
+
+        Args:
+            model_id: 임베딩 모델 ID
+            text: 입력 텍스트
+            vector: 임베딩 벡터
+        """
+        if not vector:
+            return
+
+        key = make_cache_key(model_id, text)
+        self._remember(key, vector)
+        self._save_to_store(key, model_id, vector)
+
+    def get_or_compute(
+        self,
+        model_id: str,
+        text: str,
+        compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        """
+        캐시 조회 후 미스일 때만 임베딩 계산
+
+        Args:
+            model_id: 임베딩 모델 ID
+            text: 입력 텍스트
+            compute: 텍스트를 받아 임베딩을 반환하는 함수
+
+        Returns:
+            임베딩 벡터 (compute가 빈 값을 반환하면 빈 리스트)
+        """
+        vector = self.get(model_id, text)
+        if vector is not None:
+            return vector
+
+        vector = compute(text) or []
+        self.put(model_id, text, vector)
+        return vector
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중률 통계
+
+        Returns:
+            dict: 적중/미스 카운터와 적중률
+        """
+        hits = self._stats['memory_hits'] + self._stats['store_hits']
+        lookups = hits + self._stats['misses']
+        return {
+            **self._stats,
+            'lookups': lookups,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            'memory_entries': len(self._memory)
+        }
+
+    def clear_memory(self) -> None:
+        """메모리 캐시 비우기 (통계는 유지)"""
+        self._memory.clear()
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        """메모리 LRU에 저장하고 용량 초과 시 가장 오래된 항목 제거"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _load_from_store(self, key: str) -> Optional[List[float]]:
+        """DynamoDB에서 캐시 항목 조회 (만료 항목은 무시)"""
+        if self.dynamodb is None:
+            return None
+
+        try:
+            table = self.dynamodb.Table(self.table_name)
+            response = table.get_item(Key={'cache_key': key})
+            item = response.get('Item')
+            if not item:
+                return None
+
+            # DynamoDB TTL 삭제는 지연될 수 있으므로 직접 만료 확인
+            if int(item.get('expires_at', 0)) <= int(time.time()):
+                return None
+
+            return unpack_vector(item['embedding'])
+
+        except Exception as e:
+            self._stats['store_errors'] += 1
+            logger.warning(f"임베딩 캐시 조회 실패: {str(e)}")
+            return None
+
+    def _save_to_store(self, key: str, model_id: str, vector: List[float]) -> None:
+        """DynamoDB에 캐시 항목 저장"""
+        if self.dynamodb is None:
+            return
+
+        try:
+            table = self.dynamodb.Table(self.table_name)
+            table.put_item(Item={
+                'cache_key': key,
+                'model_id': model_id,
+                'dimensions': len(vector),
+                'embedding': pack_vector(vector),
+                'created_at': datetime.now().isoformat(),
+                'expires_at': int(time.time()) + self.ttl_seconds
+            })
+        except Exception as e:
+            self._stats['store_errors'] += 1
+            logger.warning(f"임베딩 캐시 저장 실패: {str(e)}")
@@ -0,0 +1,127 @@
+"""
+요청 처리 시간 예산
+
+API Gateway 통합은 29초 후 응답을 끊으므로 Lambda 자체 제한 시간(수 분)보다 먼저 종료됩니다.
+요청 시작 시점부터 남은 시간을 추적하여, 선택 단계(벡터 검색, LLM 근거 생성, 기술 격차 분석 등)를
+실행하기 전에 예상 소요 시간이 남아 있는지 확인하고 부족하면 결정적 대체 경로를 사용하도록 합니다.
+
+남은 시간 = min(API Gateway 제한 - 경과 시간, context.get_remaining_time_in_millis()) - 응답 여유분
+"""
+
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# API Gateway 통합 제한 시간 (29초)
+API_GATEWAY_TIMEOUT_MS = int(os.environ.get('LATENCY_BUDGET_MS', '29000'))
+
+# 응답 직렬화·반환을 위해 남겨 둘 시간
+DEFAULT_RESERVE_MS = int(os.environ.get('LATENCY_RESERVE_MS', '1500'))
+
+
+class LatencyBudget:
+    """
+    요청 단위 처리 시간 예산
+
+    핸들러 시작 시 생성하고 선택 단계마다 allows()로 실행 여부를 확인합니다.
+    생략된 단계는 skipped_stages로 응답에 포함합니다.
+    """
+
+    def __init__(
+        self,
+        context: Any = None,
+        limit_ms: int = API_GATEWAY_TIMEOUT_MS,
+        reserve_ms: int = DEFAULT_RESERVE_MS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        처리 시간 예산 초기화
+
+        Args:
+            context: Lambda 컨텍스트 (None이면 limit_ms만 사용)
+            limit_ms: 요청 전체 제한 시간(ms)
+            reserve_ms: 응답 반환을 위한 여유 시간(ms)
+            clock: 단조 시계 (초 단위, 테스트용)
+        """
+        self.context = context
+        self.limit_ms = limit_ms
+        self.reserve_ms = reserve_ms
+        self._clock = clock
+        self._started = clock()
+        self._skipped: Dict[str, Dict[str, Any]] = {}
+
+    def elapsed_ms(self) -> int:
+        """요청 시작 후 경과 시간(ms)"""
+        return int((self._clock() - self._started) * 1000)
+
+    def remaining_ms(self) -> int:
+        """
+        선택 단계에 사용할 수 있는 남은 시간(ms)
+
+        Returns:
+            int: 여유 시간을 제외한 남은 시간 (0 이상)
+        """
+        remaining = self.limit_ms - self.elapsed_ms()
+
+        get_remaining = getattr(self.context, 'get_remaining_time_in_millis', None)
+        if callable(get_remaining):
+            try:
+                remaining = min(remaining, int(get_remaining()))
+            except Exception as e:
+                logger.warning(f"Lambda 남은 시간 조회 실패: {str(e)}")
+
+        return max(0, remaining - self.reserve_ms)
+
+    def allows(self, stage: str, estimated_ms: int) -> bool:
+        """
+        선택 단계 실행 가능 여부 확인
+
+        남은 시간이 예상 소요 시간보다 적으면 단계를 생략한 것으로 기록합니다.
+
+        Args:
+            stage: 단계 이름 (예: vector_search, llm_reasoning)
+            estimated_ms: 단계 예상 소요 시간(ms)
+
+        Returns:
+            bool: 실행 가능하면 True
+        """
+        remaining = self.remaining_ms()
+        if remaining >= estimated_ms:
+            return True
+
+        self.skip(stage, remaining_ms=remaining)
+        return False
+
+    def skip(self, stage: str, reason: str = 'deadline', remaining_ms: Optional[int] = None) -> None:
+        """
+        생략된 단계 기록 (같은 단계는 횟수만 증가)
+
+        Args:
+            stage: 단계 이름
+            reason: 생략 사유
+            remaining_ms: 생략 시점의 남은 시간(ms)
+        """
+        entry = self._skipped.get(stage)
+        if entry is None:
+            remaining = self.remaining_ms() if remaining_ms is None else remaining_ms
+            entry = {'stage': stage, 'reason': reason, 'remaining_ms': remaining, 'count': 0}
+            self._skipped[stage] = entry
+            logger.warning(f"처리 시간 부족으로 '{stage}' 단계를 생략합니다 (남은 시간 {remaining}ms)")
+        entry['count'] += 1
+
+    @property
+    def skipped_stages(self) -> List[Dict[str, Any]]:
+        """생략된 단계 목록 (처음 생략된 순서)"""
+        return [dict(entry) for entry in self._skipped.values()]
+
+    @property
+    def degraded(self) -> bool:
+        """생략된 단계가 있으면 True"""
+        return bool(self._skipped)
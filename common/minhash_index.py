@@ -0,0 +1,336 @@
+"""
+MinHash LSH 직원 유사도 색인
+
+직원별 정규화 기술 집합과 프로젝트 이력 집합의 MinHash 서명을 만들고, LSH 밴드 버킷으로
+"X와 비슷한 직원" Jaccard 이웃을 전체 비교 없이 찾습니다.
+
+- 서명: NUM_PERMUTATIONS개의 해시 함수 h(x) = (a·x + b) mod (2^31 - 1)의 최소값
+- LSH: 서명을 BANDS개 밴드(밴드당 ROWS_PER_BAND행)로 나누어 밴드가 하나라도 같으면 후보
+  (Jaccard ≈ (1/BANDS)^(1/ROWS_PER_BAND) ≈ 0.42 이상이면 높은 확률로 후보가 됨)
+- 유사도: 후보의 서명 일치 비율로 Jaccard 추정
+
+서명은 스냅샷 작업이 직원 스냅샷에 함께 저장하며, 버킷은 로드 시 다시 만듭니다.
+토큰 해시는 프로세스와 무관하게 같은 값이 되도록 blake2b를 사용합니다.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from common.skill_embedding import skill_key
+from common.workforce_snapshot import WorkforceSnapshot, get_workforce_snapshot
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없는 레이어에서는 색인 비활성화
+    np = None
+
+
+NUM_PERMUTATIONS = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+# 해시 함수 계수 생성 시드 (서명 호환을 위해 고정)
+PERMUTATION_SEED = 20240101
+
+MERSENNE_PRIME = (1 << 31) - 1
+EMPTY_SLOT = MERSENNE_PRIME
+
+# 색인 종류
+SKILL_SETS = 'skills'
+PROJECT_SETS = 'projects'
+
+# 비교 기준별 종류 가중치
+BASIS_WEIGHTS = {
+    SKILL_SETS: {SKILL_SETS: 1.0},
+    PROJECT_SETS: {PROJECT_SETS: 1.0},
+    'both': {SKILL_SETS: 0.5, PROJECT_SETS: 0.5}
+}
+
+# 위치별 (스냅샷, 색인) - 스냅샷이 다시 로드되면 새로 생성
+_indexes: Dict[Optional[str], Tuple[WorkforceSnapshot, 'EmployeeSimilarityIndex']] = {}
+
+
+def employee_skill_tokens(employee: Dict[str, Any]) -> Set[str]:
+    """직원 정규화 기술 집합"""
+    tokens = set()
+    for skill in employee.get('skills', []) or []:
+        name = skill.get('name', '') if isinstance(skill, dict) else str(skill)
+        if name and name.strip():
+            tokens.add(skill_key(name))
+    return tokens
+
+
+def employee_project_tokens(employee: Dict[str, Any]) -> Set[str]:
+    """직원 프로젝트 이력 집합 (프로젝트 ID, 없으면 프로젝트 이름)"""
+    tokens = set()
+    for experience in employee.get('work_experience', []) or []:
+        if not isinstance(experience, dict):
+            continue
+        token = experience.get('project_id') or experience.get('project_name')
+        if token:
+            tokens.add(str(token).strip().lower())
+    return tokens
+
+
+def token_hash(token: str) -> int:
+    """토큰의 32비트 안정 해시"""
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+class MinHasher:
+    """고정 계수 MinHash 서명 생성기"""
+
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, seed: int = PERMUTATION_SEED):
+        """
+        Args:
+            num_permutations: 해시 함수 수 (서명 길이)
+            seed: 계수 생성 시드
+        """
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, MERSENNE_PRIME, num_permutations, dtype=np.uint64)
+        self.b = rng.integers(0, MERSENNE_PRIME, num_permutations, dtype=np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> 'np.ndarray':
+        """
+        MinHash 서명
+
+        Args:
+            tokens: 토큰 집합
+
+        Returns:
+            ndarray: uint32 서명 (빈 집합이면 모든 값이 EMPTY_SLOT)
+        """
+        hashes = np.array(sorted({token_hash(token) for token in tokens}), dtype=np.uint64)
+        if len(hashes) == 0:
+            return np.full(len(self.a), EMPTY_SLOT, dtype=np.uint32)
+        # a < 2^31, x < 2^32 이므로 곱은 uint64 범위 안
+        values = (np.outer(hashes, self.a) + self.b) % MERSENNE_PRIME
+        return values.min(axis=0).astype(np.uint32)
+
+
+def estimated_jaccard(signature: 'np.ndarray', others: 'np.ndarray') -> 'np.ndarray':
+    """서명 일치 비율로 Jaccard 추정 (빈 집합은 0)"""
+    similarity = (others == signature).mean(axis=-1)
+    empty = (others == EMPTY_SLOT).all(axis=-1) | bool((signature == EMPTY_SLOT).all())
+    return np.where(empty, 0.0, similarity)
+
+
+class MinHashLSH:
+    """
+    MinHash LSH 색인
+
+    밴드별 버킷(밴드 번호, 밴드 서명 바이트) → 행 번호 목록. 질의는 같은 버킷의 행만 비교합니다.
+    """
+
+    def __init__(self, keys: List[str], signatures: 'np.ndarray', bands: int = BANDS):
+        """
+        Args:
+            keys: 행별 키 (직원 ID)
+            signatures: 행별 서명 행렬 [행 수 × 서명 길이]
+            bands: 밴드 수 (서명 길이의 약수)
+        """
+        if signatures.shape[1] % bands != 0:
+            raise ValueError(f"서명 길이 {signatures.shape[1]}는 밴드 수 {bands}로 나누어떨어져야 합니다")
+        self.keys = list(keys)
+        self.signatures = signatures
+        self.bands = bands
+        self.rows_per_band = signatures.shape[1] // bands
+
+        self.buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        for row, signature in enumerate(signatures):
+            if (signature == EMPTY_SLOT).all():
+                continue
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self.buckets.setdefault((band, band_key), []).append(row)
+
+    def _band_keys(self, signature: 'np.ndarray') -> List[bytes]:
+        """밴드별 버킷 키"""
+        width = self.rows_per_band
+        return [signature[band * width:(band + 1) * width].tobytes() for band in range(self.bands)]
+
+    def candidates(self, signature: 'np.ndarray') -> 'np.ndarray':
+        """밴드가 하나 이상 같은 행 번호 (오름차순)"""
+        rows = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            rows.update(self.buckets.get((band, band_key), ()))
+        return np.array(sorted(rows), dtype=np.int64)
+
+    def query(
+        self,
+        signature: 'np.ndarray',
+        k: int = 10,
+        exclude: Optional[str] = None,
+        min_similarity: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Jaccard 이웃 검색
+
+        Args:
+            signature: 질의 서명
+            k: 반환할 최대 이웃 수
+            exclude: 제외할 키 (질의 직원 자신)
+            min_similarity: 최소 추정 Jaccard
+
+        Returns:
+            list: (키, 추정 Jaccard) 목록 - 유사도 내림차순
+        """
+        rows = self.candidates(signature)
+        if len(rows) == 0:
+            return []
+        similarity = estimated_jaccard(signature, self.signatures[rows])
+        order = np.argsort(-similarity, kind='stable')
+
+        neighbours = []
+        for position in order:
+            key = self.keys[rows[position]]
+            score = float(similarity[position])
+            if key == exclude:
+                continue
+            if score < min_similarity or len(neighbours) >= k:
+                break
+            neighbours.append((key, score))
+        return neighbours
+
+
+def build_minhash_signatures(
+    employees: Iterable[Dict[str, Any]],
+    hasher: Optional[MinHasher] = None
+) -> Tuple[List[str], Dict[str, 'np.ndarray']]:
+    """
+    직원 목록의 기술/프로젝트 이력 서명 생성 (스냅샷 작업용)
+
+    Args:
+        employees: 직원 데이터 (user_id, skills, work_experience)
+        hasher: 서명 생성기 (기본값: 고정 계수)
+
+    Returns:
+        tuple: (직원 ID 목록, {SKILL_SETS: 서명 행렬, PROJECT_SETS: 서명 행렬})
+    """
+    hasher = hasher or MinHasher()
+    user_ids = []
+    skills = []
+    projects = []
+    for employee in employees:
+        if not employee.get('user_id'):
+            continue
+        user_ids.append(employee['user_id'])
+        skills.append(hasher.signature(employee_skill_tokens(employee)))
+        projects.append(hasher.signature(employee_project_tokens(employee)))
+
+    width = len(hasher.a)
+    return user_ids, {
+        SKILL_SETS: np.array(skills, dtype=np.uint32).reshape(-1, width),
+        PROJECT_SETS: np.array(projects, dtype=np.uint32).reshape(-1, width)
+    }
+
+
+class EmployeeSimilarityIndex:
+    """
+    직원 유사도 색인 (기술 집합 + 프로젝트 이력 집합)
+
+    종류별 LSH 후보의 합집합에 대해서만 추정 Jaccard를 계산하고 기준별 가중 평균으로 순위를 매깁니다.
+    """
+
+    def __init__(self, user_ids: List[str], signatures: Dict[str, 'np.ndarray'], hasher: Optional[MinHasher] = None):
+        """
+        Args:
+            user_ids: 행별 직원 ID
+            signatures: 종류별 서명 행렬 (행 순서는 user_ids와 같음)
+            hasher: 색인에 없는 직원의 서명 생성기 (기본값: 고정 계수)
+        """
+        self.user_ids = list(user_ids)
+        self.row_by_user = {user_id: row for row, user_id in enumerate(self.user_ids)}
+        self.lsh = {kind: MinHashLSH(self.user_ids, matrix) for kind, matrix in signatures.items()}
+        self.hasher = hasher or MinHasher(signatures[SKILL_SETS].shape[1])
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self.row_by_user
+
+    def signatures_for(self, employee: Dict[str, Any]) -> Dict[str, 'np.ndarray']:
+        """직원 데이터의 종류별 서명 (색인에 없는 직원 질의용)"""
+        return {
+            SKILL_SETS: self.hasher.signature(employee_skill_tokens(employee)),
+            PROJECT_SETS: self.hasher.signature(employee_project_tokens(employee))
+        }
+
+    def similar(
+        self,
+        user_id: Optional[str] = None,
+        signatures: Optional[Dict[str, 'np.ndarray']] = None,
+        k: int = 10,
+        basis: str = 'both',
+        min_similarity: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        유사 직원 검색
+
+        Args:
+            user_id: 기준 직원 ID (결과에서 제외)
+            signatures: 기준 직원 서명 (없으면 색인에 저장된 서명 사용)
+            k: 반환할 최대 직원 수
+            basis: 비교 기준 (skills, projects, both)
+            min_similarity: 최소 종합 유사도
+
+        Returns:
+            list: {user_id, similarity, skill_similarity, project_similarity} 목록 - 유사도 내림차순
+
+        Raises:
+            ValueError: 지원하지 않는 기준이거나 기준 직원의 서명이 없는 경우
+        """
+        weights = BASIS_WEIGHTS.get(basis)
+        if weights is None:
+            raise ValueError(f"basis는 {', '.join(BASIS_WEIGHTS)} 중 하나여야 합니다")
+        if signatures is None:
+            row = self.row_by_user.get(user_id)
+            if row is None:
+                raise ValueError(f"색인에 없는 직원입니다: {user_id}")
+            signatures = {kind: lsh.signatures[row] for kind, lsh in self.lsh.items()}
+
+        rows = np.unique(np.concatenate([
+            self.lsh[kind].candidates(signatures[kind]) for kind in weights
+        ] + [np.empty(0, dtype=np.int64)]))
+        if user_id in self.row_by_user:
+            rows = rows[rows != self.row_by_user[user_id]]
+        if len(rows) == 0:
+            return []
+
+        scores = {
+            kind: estimated_jaccard(signatures[kind], lsh.signatures[rows])
+            for kind, lsh in self.lsh.items()
+        }
+        combined = sum(scores[kind] * weight for kind, weight in weights.items())
+
+        results = []
+        for position in np.argsort(-combined, kind='stable')[:k]:
+            if combined[position] < min_similarity or combined[position] <= 0:
+                break
+            results.append({
+                'user_id': self.user_ids[rows[position]],
+                'similarity': round(float(combined[position]), 4),
+                'skill_similarity': round(float(scores[SKILL_SETS][position]), 4),
+                'project_similarity': round(float(scores[PROJECT_SETS][position]), 4)
+            })
+        return results
+
+
+def get_employee_similarity_index(uri: Optional[str] = None) -> Optional[EmployeeSimilarityIndex]:
+    """
+    직원 스냅샷의 유사도 색인 조회 (스냅샷당 한 번 버킷 생성)
+
+    Args:
+        uri: 스냅샷 위치 (기본값: WORKFORCE_SNAPSHOT_URI 환경 변수)
+
+    Returns:
+        EmployeeSimilarityIndex: 색인 (스냅샷 또는 서명이 없으면 None)
+    """
+    snapshot = get_workforce_snapshot(uri)
+    if snapshot is None or not snapshot.minhash_user_ids:
+        return None
+
+    cached = _indexes.get(uri)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    index = EmployeeSimilarityIndex(snapshot.minhash_user_ids, snapshot.minhash_signatures)
+    _indexes[uri] = (snapshot, index)
+    return index
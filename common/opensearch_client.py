@@ -0,0 +1,235 @@
+"""
+OpenSearch 클라이언트 풀
+
+Lambda 컨테이너 단위로 OpenSearch 클라이언트를 재사용하고,
+직원 프로필 k-NN 검색 쿼리를 구성하는 공통 함수를 제공합니다.
+
+- 클라이언트는 엔드포인트별로 한 번만 생성되며 HTTP 커넥션 풀(TLS 세션)을 재사용합니다.
+- 서명은 botocore의 RefreshableCredentials를 사용하므로 임시 자격 증명이
+  교체되어도 클라이언트를 다시 만들 필요가 없습니다.
+"""
+
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import boto3
+from opensearchpy import OpenSearch, RequestsHttpConnection
+from requests_aws4auth import AWS4Auth
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+EMPLOYEE_INDEX = 'employee_profiles'
+VECTOR_FIELD = 'profile_vector'
+SKILL_FILTER_FIELD = 'skill_names'
+
+_clients: Dict[str, OpenSearch] = {}
+_lock = threading.Lock()
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    엔드포인트에서 스킴과 후행 슬래시 제거
+
+    Args:
+        endpoint: OpenSearch 엔드포인트 (예: https://search-xxx.es.amazonaws.com/)
+
+    Returns:
+        호스트 이름
+    """
+    host = endpoint.strip()
+    for scheme in ('https://', 'http://'):
+        if host.startswith(scheme):
+            host = host[len(scheme):]
+    return host.rstrip('/')
+
+
+def _build_auth(region: str) -> AWS4Auth:
+    """자동 갱신 자격 증명을 사용하는 SigV4 서명 객체 생성"""
+    credentials = boto3.Session().get_credentials()
+    return AWS4Auth(
+        region=region,
+        service='es',
+        refreshable_credentials=credentials
+    )
+
+
+def get_opensearch_client(
+    endpoint: Optional[str] = None,
+    region: Optional[str] = None
+) -> OpenSearch:
+    """
+    풀링된 OpenSearch 클라이언트 반환
+
+    같은 엔드포인트에 대해서는 컨테이너 수명 동안 동일한 클라이언트를 반환합니다.
+
+    Args:
+        endpoint: OpenSearch 엔드포인트 (기본값: OPENSEARCH_ENDPOINT 환경 변수)
+        region: AWS 리전 (기본값: AWS_REGION 환경 변수)
+
+    Returns:
+        OpenSearch: OpenSearch 클라이언트
+
+    Raises:
+        ValueError: 엔드포인트가 설정되지 않은 경우
+    """
+    endpoint = endpoint or os.environ.get('OPENSEARCH_ENDPOINT')
+    if not endpoint:
+        raise ValueError("OPENSEARCH_ENDPOINT 환경 변수가 설정되지 않았습니다")
+
+    host = normalize_endpoint(endpoint)
+    region = region or os.environ.get('AWS_REGION', 'us-east-2')
+    cache_key = f"{host}|{region}"
+
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            client = OpenSearch(
+                hosts=[{'host': host, 'port': 443}],
+                http_auth=_build_auth(region),
+                use_ssl=True,
+                verify_certs=True,
+                connection_class=RequestsHttpConnection,
+                pool_maxsize=int(os.environ.get('OPENSEARCH_POOL_MAXSIZE', '10')),
+                timeout=int(os.environ.get('OPENSEARCH_TIMEOUT_SECONDS', '10'))
+            )
+            _clients[cache_key] = client
+            logger.info(f"OpenSearch 클라이언트 생성: {host}")
+
+    return client
+
+
+def reset_opensearch_clients() -> None:
+    """
+    캐시된 클라이언트 제거
+
+    인증 오류가 반복될 때 강제로 자격 증명과 커넥션을 다시 만들기 위해 사용합니다.
+    """
+    with _lock:
+        _clients.clear()
+
+
+def normalize_vector(vector: List[float]) -> List[float]:
+    """
+    벡터를 단위 길이로 정규화
+
+    내적(innerproduct) 공간에서 코사인 유사도와 같은 순위를 얻기 위해 사용합니다.
+
+    Args:
+        vector: 입력 벡터
+
+    Returns:
+        정규화된 벡터 (영벡터는 그대로 반환)
+    """
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+def skill_filter_terms(skills: List[str]) -> List[str]:
+    """
+    필터용 기술 키워드 생성 (대소문자 무시 매칭을 위해 소문자로 저장/조회)
+
+    Args:
+        skills: 기술 이름 목록
+
+    Returns:
+        중복이 제거된 소문자 기술 이름 목록
+    """
+    terms = []
+    for skill in skills:
+        term = str(skill).strip().lower()
+        if term and term not in terms:
+            terms.append(term)
+    return terms
+
+
+def build_knn_query(
+    vector: List[float],
+    k: int,
+    required_skills: Optional[List[str]] = None,
+    source_fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    직원 프로필 k-NN 쿼리 생성
+
+    required_skills가 주어지면 요구 기술 중 하나 이상을 보유한 직원으로
+    knn 절 내부에서 필터링합니다 (efficient filtering). 필터는 k-NN 탐색 중에
+    적용되므로 후처리 필터와 달리 결과가 k개보다 적게 잘리지 않습니다.
+
+    Args:
+        vector: 질의 벡터
+        k: 반환할 최근접 이웃 수
+        required_skills: 필터링할 요구 기술 목록 (선택사항)
+        source_fields: 반환할 _source 필드 (기본값: 벡터 제외 주요 필드)
+
+    Returns:
+        dict: OpenSearch 검색 본문
+    """
+    knn_clause: Dict[str, Any] = {
+        'vector': vector,
+        'k': k
+    }
+
+    terms = skill_filter_terms(required_skills or [])
+    if terms:
+        knn_clause['filter'] = {
+            'bool': {
+                'filter': [
+                    {'terms': {SKILL_FILTER_FIELD: terms}}
+                ]
+            }
+        }
+
+    return {
+        'size': k,
+        '_source': source_fields or ['user_id', 'name', 'role', SKILL_FILTER_FIELD],
+        'query': {
+            'knn': {
+                VECTOR_FIELD: knn_clause
+            }
+        }
+    }
+
+
+def build_skill_filter_query(
+    required_skills: List[str],
+    size: int,
+    source_fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    요구 기술 중 하나 이상을 보유한 직원 조회 쿼리 생성 (벡터 없음)
+
+    기술 목록만으로 이루어진 요구사항은 질의 임베딩 없이 후보를 필터링하고,
+    유사도는 로컬 기술 임베딩으로 계산합니다.
+
+    Args:
+        required_skills: 요구 기술 목록
+        size: 반환할 최대 문서 수
+        source_fields: 반환할 _source 필드 (기본값: 벡터 제외 주요 필드)
+
+    Returns:
+        dict: OpenSearch 검색 본문
+    """
+    return {
+        'size': size,
+        '_source': source_fields or ['user_id', 'name', 'role', SKILL_FILTER_FIELD],
+        'query': {
+            'bool': {
+                'filter': [
+                    {'terms': {SKILL_FILTER_FIELD: skill_filter_terms(required_skills)}}
+                ]
+            }
+        }
+    }
@@ -0,0 +1,261 @@
+"""
+직원 쌍 일별 메신저 집계 (PairDailyStats)
+
+MessengerLogs 원본 대신 (직원 쌍, 날짜)별 집계 행을 유지하여, 친밀도 계산의 증분 갱신이
+메시지 수가 아닌 새 날짜의 쌍 수만큼만 읽도록 합니다 (DayIndex로 날짜마다 Query 1회,
+affinity_calculator.pair_state 참고).
+
+- 키: pair_id ("직원1#직원2", ID 오름차순) + day ("YYYY-MM-DD", UTC)
+- GSI DayIndex: day + pair_id - 하루치 전체 쌍 조회 (친밀도 증분 갱신이 새 날짜의 행만 읽음)
+- 값: 상황별 메시지 수 (업무 시간 / 업무 외 / 주말 / 행사일 / 연차), 전체 메시지 수,
+  응답 시간 합계/건수
+- 적재: MessengerLogs 스트림 소비자(messenger_rollup Lambda)가 UpdateItem ADD로 누적하고,
+  배치 로더(deployment/build_pair_daily_stats.py)가 전체 이력으로 행을 다시 씁니다.
+
+스트림은 최소 1회 전달이므로 재시도된 배치는 중복 누적될 수 있고, 메시지 적재 후 등록된
+회사 행사는 기존 행에 반영되지 않습니다. 두 경우 모두 배치 로더로 다시 만들면 정확해집니다.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from boto3.dynamodb.conditions import Key
+
+
+DEFAULT_TABLE_NAME = 'PairDailyStats'
+
+# 날짜별 조회 GSI
+DAY_INDEX = 'DayIndex'
+
+# 상황 구분 (우선순위: 연차 > 행사일 > 주말 > 업무 외 > 업무 시간)
+WORK_HOURS = 'work_hours'
+AFTER_HOURS = 'after_hours'
+WEEKEND = 'weekend'
+EVENT_DAY = 'event_day'
+VACATION = 'vacation'
+CONTEXT_BUCKETS = (WORK_HOURS, AFTER_HOURS, WEEKEND, EVENT_DAY, VACATION)
+
+# 업무 시간 (09:00 ~ 18:00)
+WORK_START_HOUR = 9
+WORK_END_HOUR = 18
+
+DAY_FORMAT = '%Y-%m-%d'
+
+Pair = Tuple[str, str]
+
+
+def canonical_pair(employee_1_id: str, employee_2_id: str) -> Pair:
+    """방향과 무관한 표준 직원 쌍 (ID 오름차순)"""
+    return (employee_1_id, employee_2_id) if employee_1_id <= employee_2_id else (employee_2_id, employee_1_id)
+
+
+def pair_key(pair: Pair) -> str:
+    """집계 항목 파티션 키 ("직원1#직원2")"""
+    return f"{pair[0]}#{pair[1]}"
+
+
+def parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """ISO 8601 시각 파싱 (시간대가 없으면 UTC, 형식 오류면 None)"""
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def context_bucket(message: Dict[str, Any], message_time: datetime, event_dates: Set[str]) -> str:
+    """
+    메시지 상황 구분
+
+    Args:
+        message: 메시지 항목 (is_vacation_period)
+        message_time: 메시지 시각
+        event_dates: 회사 행사 날짜 집합 (YYYY-MM-DD)
+
+    Returns:
+        str: CONTEXT_BUCKETS 중 하나
+    """
+    if message.get('is_vacation_period', False):
+        return VACATION
+    if message_time.strftime(DAY_FORMAT) in event_dates:
+        return EVENT_DAY
+    if message_time.weekday() >= 5:
+        return WEEKEND
+    if message_time.hour < WORK_START_HOUR or message_time.hour >= WORK_END_HOUR:
+        return AFTER_HOURS
+    return WORK_HOURS
+
+
+class DailyPairStats:
+    """직원 쌍의 하루 메시지 집계"""
+
+    __slots__ = ('counts', 'response_time_sum', 'response_count')
+
+    def __init__(self):
+        self.counts = {bucket: 0 for bucket in CONTEXT_BUCKETS}
+        self.response_time_sum = 0.0
+        self.response_count = 0
+
+    @property
+    def message_count(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, bucket: str, response_time_minutes: Optional[float] = None) -> None:
+        """
+        메시지 한 건 누적
+
+        Args:
+            bucket: 상황 구분
+            response_time_minutes: 응답 시간(분) - 없거나 0이면 평균에서 제외
+        """
+        self.counts[bucket] += 1
+        if response_time_minutes:
+            self.response_time_sum += float(response_time_minutes)
+            self.response_count += 1
+
+    def merge(self, other: 'DailyPairStats') -> None:
+        """집계 합산"""
+        for bucket in CONTEXT_BUCKETS:
+            self.counts[bucket] += other.counts[bucket]
+        self.response_time_sum += other.response_time_sum
+        self.response_count += other.response_count
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> 'DailyPairStats':
+        """DynamoDB 항목에서 복원"""
+        stats = cls()
+        for bucket in CONTEXT_BUCKETS:
+            stats.counts[bucket] = int(item.get(f'count_{bucket}', 0))
+        stats.response_time_sum = float(item.get('response_time_sum', 0))
+        stats.response_count = int(item.get('response_count', 0))
+        return stats
+
+
+def rollup_messages(
+    messages: Iterable[Dict[str, Any]],
+    event_dates: Set[str]
+) -> Dict[Tuple[Pair, str], DailyPairStats]:
+    """
+    메시지를 (표준 쌍, 날짜)별로 집계 (한 번 순회)
+
+    Args:
+        messages: 메시지 항목 (sender_id, receiver_id, timestamp, response_time_minutes, is_vacation_period)
+        event_dates: 회사 행사 날짜 집합
+
+    Returns:
+        dict: {((직원 ID, 직원 ID), YYYY-MM-DD): DailyPairStats}
+    """
+    rollups: Dict[Tuple[Pair, str], DailyPairStats] = {}
+
+    for message in messages:
+        sender_id = message.get('sender_id')
+        receiver_id = message.get('receiver_id')
+        message_time = parse_timestamp(message.get('timestamp', ''))
+        if not sender_id or not receiver_id or sender_id == receiver_id or message_time is None:
+            continue
+
+        key = (canonical_pair(sender_id, receiver_id), message_time.astimezone(timezone.utc).strftime(DAY_FORMAT))
+        stats = rollups.get(key)
+        if stats is None:
+            stats = rollups[key] = DailyPairStats()
+        stats.add(context_bucket(message, message_time, event_dates), message.get('response_time_minutes'))
+
+    return rollups
+
+
+def to_decimal(value: float) -> Decimal:
+    """DynamoDB 숫자 변환"""
+    return Decimal(str(round(float(value), 4)))
+
+
+class PairDailyStatsStore:
+    """
+    직원 쌍 일별 집계 저장소 (PairDailyStats)
+
+    항목: pair_id, day, employee_1, employee_2, message_count, count_<상황>,
+    response_time_sum, response_count
+    """
+
+    def __init__(self, dynamodb_resource, table_name: str = DEFAULT_TABLE_NAME):
+        """
+        Args:
+            dynamodb_resource: boto3 DynamoDB resource
+            table_name: 집계 테이블 이름
+        """
+        self.table = dynamodb_resource.Table(table_name)
+
+    def increment(self, rollups: Dict[Tuple[Pair, str], DailyPairStats]) -> int:
+        """
+        집계를 기존 행에 원자적으로 더함 (스트림 소비자용, 행이 없으면 생성)
+
+        Returns:
+            int: 갱신한 행 수
+        """
+        for (pair, day), stats in rollups.items():
+            names = {'#e1': 'employee_1', '#e2': 'employee_2'}
+            values = {
+                ':e1': pair[0],
+                ':e2': pair[1],
+                ':message_count': stats.message_count,
+                ':response_time_sum': to_decimal(stats.response_time_sum),
+                ':response_count': stats.response_count
+            }
+            additions = ['message_count :message_count', 'response_time_sum :response_time_sum',
+                         'response_count :response_count']
+            for bucket in CONTEXT_BUCKETS:
+                if stats.counts[bucket]:
+                    additions.append(f'count_{bucket} :{bucket}')
+                    values[f':{bucket}'] = stats.counts[bucket]
+
+            self.table.update_item(
+                Key={'pair_id': pair_key(pair), 'day': day},
+                UpdateExpression=f"SET #e1 = :e1, #e2 = :e2 ADD {', '.join(additions)}",
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values
+            )
+        return len(rollups)
+
+    def replace(self, rollups: Dict[Tuple[Pair, str], DailyPairStats]) -> int:
+        """
+        집계 행을 덮어씀 (배치 로더용 - 전체 이력으로 다시 만들 때)
+
+        Returns:
+            int: 저장한 행 수
+        """
+        with self.table.batch_writer() as batch:
+            for (pair, day), stats in rollups.items():
+                item = {
+                    'pair_id': pair_key(pair),
+                    'day': day,
+                    'employee_1': pair[0],
+                    'employee_2': pair[1],
+                    'message_count': stats.message_count,
+                    'response_time_sum': to_decimal(stats.response_time_sum),
+                    'response_count': stats.response_count
+                }
+                for bucket in CONTEXT_BUCKETS:
+                    item[f'count_{bucket}'] = stats.counts[bucket]
+                batch.put_item(Item=item)
+        return len(rollups)
+
+    def query_day(self, day: str) -> Iterator[Tuple[Pair, DailyPairStats]]:
+        """
+        하루치 전체 쌍 집계 (DayIndex Query, 페이지 단위)
+
+        Args:
+            day: 날짜 (YYYY-MM-DD)
+
+        Yields:
+            tuple: ((직원 ID, 직원 ID), DailyPairStats)
+        """
+        query_kwargs = {'IndexName': DAY_INDEX, 'KeyConditionExpression': Key('day').eq(day)}
+        response = self.table.query(**query_kwargs)
+        while True:
+            for item in response.get('Items', []):
+                yield (item['employee_1'], item['employee_2']), DailyPairStats.from_item(item)
+            if 'LastEvaluatedKey' not in response:
+                return
+            response = self.table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query_kwargs)
@@ -0,0 +1,164 @@
+"""
+프로젝트별 사전 계산 후보 목록 (shortlist)
+
+프로젝트 등록·수정 시 스트림으로 미리 계산한 후보 목록을 DynamoDB RecommendationCache 테이블의
+SHORTLIST#{project_id} 항목에 저장합니다. 항목에는 다음이 포함됩니다.
+
+- 정규화된 요구 기술과 계산 시점의 인력 데이터 버전 (신선도 판단)
+- 후보자별 구성 점수 (우선순위와 무관하게 저장하여 조회 시 가중치만 적용)
+- 우선순위별 상위 후보의 추천 근거 (reasoning_by_priority - 근거에 우선순위별 종합 점수가 들어감)
+- 요구사항 임베딩 벡터
+
+요구 기술 또는 인력 데이터 버전이 다르면 오래된 목록으로 보고 사용하지 않습니다.
+DynamoDB 접근 실패는 미스로 처리하여 추천 흐름을 막지 않습니다.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from common.recommendation_cache import json_default, normalize_skill_key
+from common.recommendation_runs import snapshot_candidate
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = 'RecommendationCache'
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7일
+
+
+def shortlist_key(project_id: str) -> str:
+    """후보 목록 항목 키"""
+    return f"SHORTLIST#{project_id}"
+
+
+def shortlist_candidate(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """저장용 후보자 (스냅샷 + 우선순위별 추천 근거)"""
+    snapshot = snapshot_candidate(candidate)
+    if candidate.get('reasoning_by_priority'):
+        snapshot['reasoning_by_priority'] = dict(candidate['reasoning_by_priority'])
+    return snapshot
+
+
+class ProjectShortlistStore:
+    """
+    프로젝트별 사전 계산 후보 목록 저장소
+
+    목록은 JSON 문자열로 저장하여 float/Decimal 변환 없이 그대로 복원합니다.
+    """
+
+    def __init__(
+        self,
+        dynamodb_resource=None,
+        table_name: str = DEFAULT_TABLE_NAME,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        후보 목록 저장소 초기화
+
+        Args:
+            dynamodb_resource: boto3 DynamoDB 리소스 (None이면 비활성화)
+            table_name: 저장 테이블 이름
+            ttl_seconds: 목록 보관 시간(초)
+        """
+        self.table = dynamodb_resource.Table(table_name) if dynamodb_resource is not None else None
+        self.ttl_seconds = ttl_seconds
+
+    def put(
+        self,
+        project_id: str,
+        required_skills: List[str],
+        data_version: int,
+        candidates: List[Dict[str, Any]],
+        requirement_embedding: Optional[List[float]] = None
+    ) -> None:
+        """
+        후보 목록 저장
+
+        Args:
+            project_id: 프로젝트 ID
+            required_skills: 요구 기술 목록
+            data_version: 계산 시점의 인력 데이터 버전
+            candidates: 점수 계산이 끝난 후보자 목록
+            requirement_embedding: 요구사항 임베딩 벡터
+        """
+        if self.table is None:
+            return
+        try:
+            now = int(time.time())
+            payload = {
+                'candidates': [shortlist_candidate(candidate) for candidate in candidates],
+                'requirement_embedding': requirement_embedding or []
+            }
+            self.table.put_item(Item={
+                'cache_key': shortlist_key(project_id),
+                'project_id': project_id,
+                'skills': normalize_skill_key(required_skills),
+                'data_version': int(data_version),
+                'payload': json.dumps(payload, default=json_default, ensure_ascii=False),
+                'created_at': now,
+                'expires_at': now + self.ttl_seconds
+            })
+            logger.info(f"후보 목록 저장: {project_id} ({len(candidates)}명, 데이터 버전 {data_version})")
+        except Exception as e:
+            logger.warning(f"후보 목록 저장 실패: {str(e)}")
+
+    def get_fresh(
+        self,
+        project_id: str,
+        required_skills: List[str],
+        data_version: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        신선한 후보 목록 조회
+
+        Args:
+            project_id: 프로젝트 ID
+            required_skills: 요청의 요구 기술 목록
+            data_version: 현재 인력 데이터 버전
+
+        Returns:
+            dict: {candidates, requirement_embedding, created_at} - 없거나 오래되었으면 None
+        """
+        item = self.get_item(project_id)
+        if not item:
+            return None
+
+        if int(item.get('expires_at', 0)) < int(time.time()):
+            return None
+        if int(item.get('data_version', -1)) != int(data_version):
+            return None
+        if list(item.get('skills', [])) != normalize_skill_key(required_skills):
+            return None
+
+        try:
+            payload = json.loads(item['payload'])
+        except (KeyError, ValueError) as e:
+            logger.warning(f"후보 목록 복원 실패: {str(e)}")
+            return None
+
+        payload['created_at'] = int(item.get('created_at', 0))
+        return payload
+
+    def get_item(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """
+        후보 목록 항목 원본 조회
+
+        Args:
+            project_id: 프로젝트 ID
+
+        Returns:
+            dict: DynamoDB 항목 (없거나 조회 실패 시 None)
+        """
+        if self.table is None:
+            return None
+        try:
+            response = self.table.get_item(Key={'cache_key': shortlist_key(project_id)})
+            return response.get('Item')
+        except Exception as e:
+            logger.warning(f"후보 목록 조회 실패: {str(e)}")
+            return None
@@ -0,0 +1,207 @@
+"""
+추천 결과 캐시
+
+generate_recommendations 결과를 DynamoDB RecommendationCache 테이블에 TTL과 함께 저장합니다.
+
+- 캐시 키: SHA-256(project_id, 정규화된 요구 기술, team_size, priority, 인력 데이터 버전)
+- 인력 데이터 버전: Employees/EmployeeAffinity 스트림 변경 시 1씩 증가하는 카운터로,
+  같은 테이블의 DATA_VERSION#workforce 항목에 저장됩니다. 버전이 바뀌면 키가 달라지므로
+  이전 결과는 조회되지 않고 TTL로 만료됩니다.
+
+DynamoDB 접근 실패는 캐시 미스로 처리하여 추천 흐름을 막지 않습니다.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.utils import get_unique_skills
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = 'RecommendationCache'
+DEFAULT_TTL_SECONDS = 60 * 60  # 1시간
+WORKFORCE_VERSION_KEY = 'DATA_VERSION#workforce'
+
+
+def normalize_skill_key(required_skills: List[str]) -> List[str]:
+    """
+    요구 기술 목록 정규화 (별칭 통일, 소문자, 중복 제거, 정렬)
+
+    Args:
+        required_skills: 요구 기술 목록
+
+    Returns:
+        list: 순서·표기와 무관하게 같은 요청이면 같은 목록
+    """
+    return sorted(skill.lower() for skill in get_unique_skills(required_skills))
+
+
+def make_request_key(
+    project_id: str,
+    required_skills: List[str],
+    team_size: int,
+    priority: str,
+    data_version: int
+) -> str:
+    """
+    추천 요청 캐시 키 생성
+
+    기술 이름은 정규화·정렬하므로 순서나 표기(대소문자, 별칭)가 달라도 같은 키가 됩니다.
+
+    Args:
+        project_id: 프로젝트 ID
+        required_skills: 요구 기술 목록
+        team_size: 팀 크기
+        priority: 우선순위
+        data_version: 인력 데이터 버전
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    payload = json.dumps({
+        'project_id': project_id,
+        'skills': normalize_skill_key(required_skills),
+        'team_size': int(team_size),
+        'priority': priority,
+        'data_version': int(data_version)
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RecommendationCache:
+    """
+    추천 결과 캐시
+
+    결과는 JSON 문자열로 저장하여 float/Decimal 변환 없이 그대로 복원합니다.
+    """
+
+    def __init__(
+        self,
+        dynamodb_resource=None,
+        table_name: str = DEFAULT_TABLE_NAME,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        추천 결과 캐시 초기화
+
+        Args:
+            dynamodb_resource: boto3 DynamoDB 리소스 (None이면 캐시 비활성화)
+            table_name: 캐시 테이블 이름
+            ttl_seconds: 캐시 유효 시간(초)
+        """
+        self.table = dynamodb_resource.Table(table_name) if dynamodb_resource is not None else None
+        self.ttl_seconds = ttl_seconds
+
+    def get_data_version(self) -> int:
+        """
+        현재 인력 데이터 버전 조회
+
+        Returns:
+            int: 데이터 버전 (항목이 없거나 조회 실패 시 0)
+        """
+        if self.table is None:
+            return 0
+        try:
+            response = self.table.get_item(
+                Key={'cache_key': WORKFORCE_VERSION_KEY},
+                ConsistentRead=True
+            )
+            return int(response.get('Item', {}).get('version', 0))
+        except Exception as e:
+            logger.warning(f"데이터 버전 조회 실패: {str(e)}")
+            return 0
+
+    def bump_data_version(self, source: str) -> int:
+        """
+        인력 데이터 버전 증가 (원자적 ADD)
+
+        Args:
+            source: 변경 원인 (예: 테이블 이름)
+
+        Returns:
+            int: 증가된 데이터 버전
+
+        Raises:
+            Exception: 갱신 실패 시 (스트림 재시도를 위해 호출자에게 전달)
+        """
+        response = self.table.update_item(
+            Key={'cache_key': WORKFORCE_VERSION_KEY},
+            UpdateExpression='ADD version :one SET updated_at = :now, updated_by = :source',
+            ExpressionAttributeValues={
+                ':one': 1,
+                ':now': int(time.time()),
+                ':source': source
+            },
+            ReturnValues='UPDATED_NEW'
+        )
+        version = int(response['Attributes']['version'])
+        logger.info(f"인력 데이터 버전 증가: {version} ({source})")
+        return version
+
+    def get(self, cache_key: str) -> Optional[Tuple[Any, int]]:
+        """
+        캐시된 추천 결과 조회
+
+        Args:
+            cache_key: make_request_key 결과
+
+        Returns:
+            tuple: (추천 결과, 캐시 경과 시간(초)) - 없거나 만료되었으면 None
+        """
+        if self.table is None:
+            return None
+        try:
+            response = self.table.get_item(Key={'cache_key': cache_key})
+            item = response.get('Item')
+            if not item:
+                return None
+
+            # TTL 삭제는 지연될 수 있으므로 만료 시각을 직접 확인
+            now = int(time.time())
+            if int(item.get('expires_at', 0)) < now:
+                return None
+
+            age_seconds = max(0, now - int(item.get('created_at', now)))
+            return json.loads(item['payload']), age_seconds
+
+        except Exception as e:
+            logger.warning(f"추천 캐시 조회 실패: {str(e)}")
+            return None
+
+    def put(self, cache_key: str, result: Any, data_version: int) -> None:
+        """
+        추천 결과 저장
+
+        Args:
+            cache_key: make_request_key 결과
+            result: 추천 결과 (JSON 직렬화 가능)
+            data_version: 결과 생성 시점의 데이터 버전
+        """
+        if self.table is None:
+            return
+        try:
+            now = int(time.time())
+            self.table.put_item(Item={
+                'cache_key': cache_key,
+                'payload': json.dumps(result, default=json_default, ensure_ascii=False),
+                'data_version': data_version,
+                'created_at': now,
+                'expires_at': now + self.ttl_seconds
+            })
+        except Exception as e:
+            logger.warning(f"추천 캐시 저장 실패: {str(e)}")
+
+
+def json_default(obj: Any) -> Any:
+    """Decimal 등 JSON 기본 직렬화가 불가능한 값 변환"""
+    try:
+        return float(obj)
+    except (TypeError, ValueError):
+        return str(obj)
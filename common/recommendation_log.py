@@ -0,0 +1,236 @@
+"""
+추천 실행 로그
+
+추천 요청 1회의 결과 요약(프로젝트, 상위 후보와 점수, 처리 시간, 캐시 적중)을
+RecommendationRuns 테이블에 기록하고, 대시보드가 최근 N건을 조회합니다.
+
+- 기록: 백그라운드 스레드에서 PutItem (프로젝트 이름 조회 포함), 핸들러는 응답 반환 전에 flush로 완료 대기
+- 조회: RecentRunsIndex GSI (log_partition, created_at) Query, 최신순 - 보관 기간 안의 created_at만 키 조건으로 읽음
+- 보관: expires_at TTL 속성으로 자동 만료
+
+기록은 최선 노력(best-effort) 방식입니다. 실패는 경고 로그만 남기며 추천 응답에 영향을 주지 않습니다.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from boto3.dynamodb.conditions import Key
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = 'RecommendationRuns'
+RECENT_RUNS_INDEX = 'RecentRunsIndex'
+DEFAULT_TTL_SECONDS = 90 * 24 * 60 * 60  # 90일
+
+# GSI 파티션 키 (모든 실행이 한 파티션에서 created_at 순으로 정렬)
+LOG_PARTITION = 'RUN'
+
+# 로그에 남길 상위 후보 수
+LOG_TOP_CANDIDATES = 5
+
+# 실행 상태
+STATUS_COMPLETED = '추천 완료'
+STATUS_DEGRADED = '부분 추천'
+
+
+def to_decimal(value: float, digits: int = 2) -> Decimal:
+    """DynamoDB Number 저장용 Decimal 변환"""
+    return Decimal(str(round(float(value or 0), digits)))
+
+
+def build_run_entry(
+    project_id: str,
+    run_id: Optional[str],
+    recommendations: List[Dict[str, Any]],
+    latency_ms: float,
+    cache_hit: bool,
+    mode: str = 'individual',
+    priority: str = 'balanced',
+    skipped_stages: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    추천 실행 로그 항목 생성
+
+    Args:
+        project_id: 프로젝트 ID
+        run_id: run ID (팀 추천 등 run이 없으면 None)
+        recommendations: 응답에 포함된 추천 후보자 목록 (점수 내림차순)
+        latency_ms: 요청 처리 시간(ms)
+        cache_hit: 추천 캐시 적중 여부
+        mode: 추천 모드 (individual, team)
+        priority: 우선순위
+        skipped_stages: 생략된 단계 목록
+
+    Returns:
+        dict: 로그 항목 (created_at은 기록 시점에 추가)
+    """
+    skill_scores = [float(candidate.get('skill_match_score', 0) or 0) for candidate in recommendations]
+    return {
+        'project_id': project_id,
+        'run_id': run_id,
+        'mode': mode,
+        'priority': priority,
+        'recommended_count': len(recommendations),
+        'match_rate': round(sum(skill_scores) / len(skill_scores)) if skill_scores else 0,
+        'top_candidates': [
+            {
+                'user_id': candidate.get('user_id'),
+                'name': candidate.get('name', ''),
+                'overall_score': float(candidate.get('overall_score', 0) or 0)
+            }
+            for candidate in recommendations[:LOG_TOP_CANDIDATES]
+        ],
+        'latency_ms': latency_ms,
+        'cache_hit': cache_hit,
+        'status': STATUS_DEGRADED if skipped_stages else STATUS_COMPLETED
+    }
+
+
+class RecommendationRunLog:
+    """
+    추천 실행 로그 저장소
+
+    record()는 즉시 반환하고 쓰기는 단일 백그라운드 스레드에서 순서대로 처리합니다.
+    Lambda는 반환 후 컨테이너가 정지되어 쓰기가 유실될 수 있으므로 호출자가 반환 전에 flush()로 기다립니다.
+    """
+
+    def __init__(
+        self,
+        dynamodb_resource,
+        table_name: str = DEFAULT_TABLE_NAME,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        projects_table_name: Optional[str] = 'Projects',
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        실행 로그 초기화
+
+        Args:
+            dynamodb_resource: boto3 DynamoDB 리소스
+            table_name: 로그 테이블 이름
+            ttl_seconds: 로그 보관 시간(초)
+            projects_table_name: 프로젝트 이름 조회 테이블 (None이면 조회 생략)
+            clock: 현재 시각(초) 함수
+        """
+        self.table = dynamodb_resource.Table(table_name)
+        self.projects_table = dynamodb_resource.Table(projects_table_name) if projects_table_name else None
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def record(self, entry: Dict[str, Any]) -> Future:
+        """
+        실행 로그 비동기 기록
+
+        Args:
+            entry: build_run_entry 결과
+
+        Returns:
+            Future: 쓰기 작업 (테스트·종료 시 flush로 대기)
+        """
+        created_at_ms = int(self.clock() * 1000)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='run-log')
+        self._pending = [future for future in self._pending if not future.done()]
+        future = self._executor.submit(self._write, dict(entry), created_at_ms)
+        self._pending.append(future)
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 쓰기 완료 대기
+
+        Args:
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            bool: 모든 쓰기가 끝났으면 True
+        """
+        _, not_done = wait(self._pending, timeout=timeout)
+        return not not_done
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        최근 실행 로그 조회 (GSI Query, 최신순)
+
+        만료 기준 시각을 created_at 키 조건에 넣어 만료되었지만 아직 삭제되지 않은 항목은 읽지 않고,
+        보관 기간이 바뀌어 남은 만료 항목을 거르느라 부족하면 다음 페이지를 이어서 읽습니다.
+
+        Args:
+            limit: 조회할 최대 건수
+
+        Returns:
+            list: 로그 항목 목록 (만료 항목 제외, 최대 limit건)
+        """
+        now = int(self.clock())
+        query_kwargs = {
+            'IndexName': RECENT_RUNS_INDEX,
+            'KeyConditionExpression': Key('log_partition').eq(LOG_PARTITION) &
+                Key('created_at').gte((now - self.ttl_seconds) * 1000),
+            'ScanIndexForward': False,
+            'Limit': limit
+        }
+        items: List[Dict[str, Any]] = []
+        response = self.table.query(**query_kwargs)
+        while True:
+            items.extend(
+                item for item in response.get('Items', [])
+                if int(item.get('expires_at', now)) >= now
+            )
+            if len(items) >= limit or 'LastEvaluatedKey' not in response:
+                return items[:limit]
+            response = self.table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query_kwargs)
+
+    def _write(self, entry: Dict[str, Any], created_at_ms: int) -> None:
+        """로그 항목 저장 (백그라운드 스레드)"""
+        try:
+            item = {
+                'log_id': f"{created_at_ms}#{entry.get('run_id') or entry['project_id']}",
+                'log_partition': LOG_PARTITION,
+                'created_at': created_at_ms,
+                'expires_at': created_at_ms // 1000 + self.ttl_seconds,
+                'project_id': entry['project_id'],
+                'project_name': entry.get('project_name') or self._project_name(entry['project_id']),
+                'mode': entry.get('mode', 'individual'),
+                'priority': entry.get('priority', 'balanced'),
+                'recommended_count': int(entry.get('recommended_count', 0)),
+                'match_rate': int(entry.get('match_rate', 0)),
+                'top_candidates': [
+                    {
+                        'user_id': candidate['user_id'],
+                        'name': candidate.get('name', ''),
+                        'overall_score': to_decimal(candidate.get('overall_score', 0))
+                    }
+                    for candidate in entry.get('top_candidates', [])
+                ],
+                'latency_ms': int(entry.get('latency_ms', 0)),
+                'cache_hit': bool(entry.get('cache_hit', False)),
+                'status': entry.get('status', STATUS_COMPLETED)
+            }
+            if entry.get('run_id'):
+                item['run_id'] = entry['run_id']
+            self.table.put_item(Item=item)
+        except Exception as e:
+            logger.warning(f"추천 실행 로그 기록 실패: {str(e)}")
+
+    def _project_name(self, project_id: str) -> str:
+        """프로젝트 이름 조회 (없으면 빈 문자열)"""
+        if self.projects_table is None:
+            return ''
+        try:
+            response = self.projects_table.get_item(
+                Key={'project_id': project_id},
+                ProjectionExpression='project_name'
+            )
+            return response.get('Item', {}).get('project_name', '')
+        except Exception as e:
+            logger.warning(f"프로젝트 이름 조회 실패: {str(e)}")
+            return ''
@@ -0,0 +1,251 @@
+"""
+추천 실행(run) 저장소 및 재점수화
+
+추천 1회 실행의 후보자별 구성 점수(기술, 유사도, 친밀도, 가용성)를 run ID로 저장하고,
+임의의 가중치로 메모리에서 다시 순위를 매깁니다.
+
+- L1: Lambda 컨테이너 메모리 LRU (웜 컨테이너에서는 외부 호출 없이 재점수화)
+- L2: DynamoDB RecommendationCache 테이블의 RUN#{run_id} 항목 (TTL 기반 만료)
+
+재점수화는 저장된 구성 점수만 사용하므로 Employees 스캔, OpenSearch, Bedrock을 호출하지 않습니다.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from common.recommendation_cache import json_default
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = 'RecommendationCache'
+DEFAULT_TTL_SECONDS = 24 * 60 * 60  # 24시간
+DEFAULT_MAX_RUNS = 64
+
+# 재점수화에 사용하는 구성 점수
+COMPONENTS = ['skill', 'similarity', 'affinity', 'availability']
+
+# 가용성 상태별 점수
+AVAILABILITY_SCORES = {
+    'Available': 100.0,
+    'Unknown': 50.0,
+    'Busy': 0.0
+}
+
+# 후보자 표시용 필드 (구성 점수와 함께 저장)
+DISPLAY_FIELDS = [
+    'user_id', 'name', 'role', 'matched_skills', 'skill_details', 'years_of_experience',
+    'skill_match_score', 'similarity_score', 'affinity_score', 'domain_bonus',
+    'availability', 'current_project', 'reasoning'
+]
+
+
+def new_run_id() -> str:
+    """run ID 생성"""
+    return f"RUN_{uuid.uuid4().hex}"
+
+
+def extract_components(candidate: Dict[str, Any]) -> Dict[str, float]:
+    """
+    후보자의 구성 점수 추출
+
+    Args:
+        candidate: merge_and_score_candidates/check_availability 결과 후보자
+
+    Returns:
+        dict: {skill, similarity, affinity, availability}
+    """
+    return {
+        'skill': float(candidate.get('skill_match_score', 0) or 0),
+        'similarity': float(candidate.get('similarity_score', 0) or 0),
+        'affinity': float(candidate.get('affinity_score', 0) or 0),
+        'availability': AVAILABILITY_SCORES.get(candidate.get('availability', 'Unknown'), 50.0)
+    }
+
+
+def snapshot_candidate(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    저장용 후보자 스냅샷 (표시용 필드 + 구성 점수)
+
+    Args:
+        candidate: merge_and_score_candidates/check_availability 결과 후보자
+
+    Returns:
+        dict: DISPLAY_FIELDS와 components만 포함한 후보자
+    """
+    return {
+        **{field: candidate.get(field) for field in DISPLAY_FIELDS if field in candidate},
+        'components': extract_components(candidate)
+    }
+
+
+def normalize_weights(weights: Dict[str, Any]) -> Dict[str, float]:
+    """
+    가중치 정규화 (합이 1이 되도록)
+
+    슬라이더 값의 스케일과 무관하게 같은 비율이면 같은 결과가 나오도록 합니다.
+
+    Args:
+        weights: 구성 요소별 가중치 (누락된 항목은 0)
+
+    Returns:
+        dict: 정규화된 가중치
+
+    Raises:
+        ValueError: 음수 가중치, 알 수 없는 구성 요소, 합이 0인 경우
+    """
+    unknown = set(weights) - set(COMPONENTS)
+    if unknown:
+        raise ValueError(f"알 수 없는 가중치 항목: {', '.join(sorted(unknown))}")
+
+    values = {name: float(weights.get(name, 0) or 0) for name in COMPONENTS}
+    if any(value < 0 for value in values.values()):
+        raise ValueError("가중치는 0 이상이어야 합니다")
+
+    total = sum(values.values())
+    if total <= 0:
+        raise ValueError("가중치 합이 0보다 커야 합니다")
+
+    return {name: value / total for name, value in values.items()}
+
+
+def rescore_candidates(
+    candidates: List[Dict[str, Any]],
+    weights: Dict[str, Any],
+    top_k: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    저장된 구성 점수에 새 가중치를 적용하여 재정렬
+
+    Args:
+        candidates: 저장된 후보자 목록 (components 포함)
+        weights: 구성 요소별 가중치
+        top_k: 반환할 후보 수 (None이면 전체)
+
+    Returns:
+        list: overall_score 내림차순 후보자 목록 (원본은 변경하지 않음)
+    """
+    normalized = normalize_weights(weights)
+
+    scored = []
+    for candidate in candidates:
+        components = candidate.get('components', {})
+        overall = sum(normalized[name] * float(components.get(name, 0)) for name in COMPONENTS)
+        scored.append({**candidate, 'overall_score': round(overall, 4)})
+
+    scored.sort(key=lambda candidate: candidate['overall_score'], reverse=True)
+    return scored[:top_k] if top_k else scored
+
+
+class RecommendationRunStore:
+    """
+    추천 실행 저장소
+
+    DynamoDB 접근 실패는 경고 로그만 남기고 메모리 저장소로 계속 동작합니다.
+    """
+
+    def __init__(
+        self,
+        dynamodb_resource=None,
+        table_name: str = DEFAULT_TABLE_NAME,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_runs: int = DEFAULT_MAX_RUNS
+    ):
+        """
+        실행 저장소 초기화
+
+        Args:
+            dynamodb_resource: boto3 DynamoDB 리소스 (None이면 메모리만 사용)
+            table_name: 저장 테이블 이름
+            ttl_seconds: 실행 보관 시간(초)
+            max_runs: 메모리에 유지할 최대 실행 수
+        """
+        self.table = dynamodb_resource.Table(table_name) if dynamodb_resource is not None else None
+        self.ttl_seconds = ttl_seconds
+        self.max_runs = max_runs
+        self._memory: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+    def save(
+        self,
+        run_id: str,
+        candidates: List[Dict[str, Any]],
+        request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        추천 실행 저장
+
+        Args:
+            run_id: run ID
+            candidates: 점수 계산이 끝난 전체 후보자 목록
+            request: 원본 요청 정보 (project_id, required_skills, team_size, priority)
+
+        Returns:
+            dict: 저장된 실행 데이터
+        """
+        now = int(time.time())
+        run = {
+            'run_id': run_id,
+            'request': request,
+            'created_at': now,
+            'candidates': [snapshot_candidate(candidate) for candidate in candidates]
+        }
+        self._remember(run_id, run)
+
+        if self.table is not None:
+            try:
+                self.table.put_item(Item={
+                    'cache_key': f"RUN#{run_id}",
+                    'payload': json.dumps(run, default=json_default, ensure_ascii=False),
+                    'created_at': now,
+                    'expires_at': now + self.ttl_seconds
+                })
+            except Exception as e:
+                logger.warning(f"추천 실행 저장 실패: {str(e)}")
+
+        return run
+
+    def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        추천 실행 조회 (메모리 → DynamoDB)
+
+        Args:
+            run_id: run ID
+
+        Returns:
+            dict: 실행 데이터 (없거나 만료되었으면 None)
+        """
+        run = self._memory.get(run_id)
+        if run is not None:
+            self._memory.move_to_end(run_id)
+            return run
+
+        if self.table is None:
+            return None
+
+        try:
+            response = self.table.get_item(Key={'cache_key': f"RUN#{run_id}"})
+            item = response.get('Item')
+            if not item or int(item.get('expires_at', 0)) < int(time.time()):
+                return None
+            run = json.loads(item['payload'])
+            self._remember(run_id, run)
+            return run
+
+        except Exception as e:
+            logger.warning(f"추천 실행 조회 실패: {str(e)}")
+            return None
+
+    def _remember(self, run_id: str, run: Dict[str, Any]) -> None:
+        """메모리 LRU에 저장"""
+        self._memory[run_id] = run
+        self._memory.move_to_end(run_id)
+        while len(self._memory) > self.max_runs:
+            self._memory.popitem(last=False)
+
@@ -0,0 +1,343 @@
+"""
+요청 단위 프로파일러
+
+추천 요청 한 건의 처리 시간이 어디에 쓰였는지(Employees 스캔, Titan 임베딩, OpenSearch 검색,
+친밀도 스캔, Claude 근거 생성 등) 확인하기 위한 진단 도구입니다.
+
+- 단계 시간 트리: profile_stage 데코레이터/컨텍스트 매니저로 감싼 구간의 중첩 시간 (같은 이름의 형제 단계는 합산)
+- DynamoDB: 작업별 호출 수, 반환 항목 수, 소비 용량 (프로파일링 중에만 ReturnConsumedCapacity=TOTAL 요청)
+- Bedrock: 모델별 호출 수와 입력/출력 토큰 수 (응답 헤더)
+- OpenSearch: 검색 호출 수와 took(ms) 합계
+- cProfile 상위 N개 함수 (선택)
+
+활성 프로파일러는 ContextVar로 관리하므로 프로파일링하지 않는 요청과 백그라운드 스레드 작업에는
+영향이 없습니다 (비활성 상태의 오버헤드는 ContextVar 조회 한 번).
+"""
+
+import cProfile
+import functools
+import logging
+import pstats
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# cProfile 요약 최대 함수 수
+MAX_PROFILE_TOP = 50
+
+# 소비 용량을 반환하는 DynamoDB 작업
+DYNAMODB_READ_OPERATIONS = {'GetItem', 'BatchGetItem', 'Query', 'Scan', 'TransactGetItems'}
+DYNAMODB_WRITE_OPERATIONS = {
+    'PutItem', 'UpdateItem', 'DeleteItem', 'BatchWriteItem', 'TransactWriteItems'
+}
+
+# Bedrock 토큰 수 응답 헤더
+BEDROCK_INPUT_TOKENS_HEADER = 'x-amzn-bedrock-input-token-count'
+BEDROCK_OUTPUT_TOKENS_HEADER = 'x-amzn-bedrock-output-token-count'
+
+_active: ContextVar[Optional['RequestProfiler']] = ContextVar('request_profiler', default=None)
+
+
+class StageNode:
+    """단계 시간 트리 노드"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.children: Dict[str, 'StageNode'] = {}
+
+    def child(self, name: str) -> 'StageNode':
+        """이름이 같은 하위 단계는 하나의 노드로 합산"""
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = StageNode(name)
+        return node
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 딕셔너리 (하위 단계는 시간 내림차순, 하위 단계 밖의 시간은 self_ms)"""
+        children = sorted(self.children.values(), key=lambda node: node.seconds, reverse=True)
+        child_seconds = sum(node.seconds for node in children)
+        result = {
+            'stage': self.name,
+            'ms': round(self.seconds * 1000, 2),
+            'calls': self.calls
+        }
+        if children:
+            result['self_ms'] = round(max(0.0, self.seconds - child_seconds) * 1000, 2)
+            result['children'] = [node.to_dict() for node in children]
+        return result
+
+
+class RequestProfiler:
+    """
+    요청 한 건의 단계 시간과 외부 호출 지표 수집
+
+    activate() 구간 안에서 실행된 profile_stage 단계, instrument_client로 계측한
+    boto3 클라이언트 호출, record_opensearch 호출이 이 프로파일러에 기록됩니다.
+    """
+
+    def __init__(self, top_n: int = 0, clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            top_n: cProfile 요약 함수 수 (0이면 cProfile 미사용, 최대 MAX_PROFILE_TOP)
+            clock: 시계 (초 단위, 테스트용)
+        """
+        self.top_n = max(0, min(int(top_n), MAX_PROFILE_TOP))
+        self._clock = clock
+        self._root = StageNode('request')
+        self._stack: List[StageNode] = [self._root]
+        self._profile: Optional[cProfile.Profile] = None
+        self.dynamodb: Dict[str, Dict[str, float]] = {}
+        self.bedrock: Dict[str, Dict[str, int]] = {}
+        self.opensearch = {'searches': 0, 'took_ms': 0}
+
+    @contextmanager
+    def activate(self) -> Iterator['RequestProfiler']:
+        """이 프로파일러를 현재 컨텍스트의 활성 프로파일러로 지정하고 전체 시간을 측정"""
+        token = _active.set(self)
+        if self.top_n:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        started = self._clock()
+        try:
+            yield self
+        finally:
+            self._root.seconds += self._clock() - started
+            self._root.calls += 1
+            if self._profile is not None:
+                self._profile.disable()
+            _active.reset(token)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """현재 단계의 하위 단계 시간 측정"""
+        node = self._stack[-1].child(name)
+        self._stack.append(node)
+        started = self._clock()
+        try:
+            yield
+        finally:
+            node.seconds += self._clock() - started
+            node.calls += 1
+            self._stack.pop()
+
+    def record_dynamodb(self, operation: str, items: int, capacity_units: float) -> None:
+        """DynamoDB 호출 기록"""
+        entry = self.dynamodb.setdefault(operation, {'calls': 0, 'items': 0, 'capacity_units': 0.0})
+        entry['calls'] += 1
+        entry['items'] += items
+        entry['capacity_units'] += capacity_units
+
+    def record_bedrock(self, model_id: str, input_tokens: int, output_tokens: int) -> None:
+        """Bedrock 모델 호출 기록"""
+        entry = self.bedrock.setdefault(model_id, {'calls': 0, 'input_tokens': 0, 'output_tokens': 0})
+        entry['calls'] += 1
+        entry['input_tokens'] += input_tokens
+        entry['output_tokens'] += output_tokens
+
+    def record_opensearch(self, took_ms: Optional[int]) -> None:
+        """OpenSearch(또는 로컬 대체 인덱스) 검색 기록"""
+        self.opensearch['searches'] += 1
+        self.opensearch['took_ms'] += int(took_ms or 0)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        프로파일 보고서
+
+        Returns:
+            dict: stages(시간 트리), dynamodb, bedrock, opensearch, cprofile(top_n 지정 시)
+        """
+        read_units = sum(
+            entry['capacity_units'] for operation, entry in self.dynamodb.items()
+            if operation in DYNAMODB_READ_OPERATIONS
+        )
+        write_units = sum(
+            entry['capacity_units'] for operation, entry in self.dynamodb.items()
+            if operation in DYNAMODB_WRITE_OPERATIONS
+        )
+        report = {
+            'stages': self._root.to_dict(),
+            'dynamodb': {
+                'items': sum(int(entry['items']) for entry in self.dynamodb.values()),
+                'read_capacity_units': round(read_units, 2),
+                'write_capacity_units': round(write_units, 2),
+                'operations': {
+                    operation: {**entry, 'capacity_units': round(entry['capacity_units'], 2)}
+                    for operation, entry in sorted(self.dynamodb.items())
+                }
+            },
+            'bedrock': {
+                'input_tokens': sum(entry['input_tokens'] for entry in self.bedrock.values()),
+                'output_tokens': sum(entry['output_tokens'] for entry in self.bedrock.values()),
+                'models': dict(sorted(self.bedrock.items()))
+            },
+            'opensearch': dict(self.opensearch)
+        }
+        if self._profile is not None:
+            report['cprofile'] = summarize_profile(self._profile, self.top_n)
+        return report
+
+
+def current_profiler() -> Optional[RequestProfiler]:
+    """현재 컨텍스트의 활성 프로파일러 (없으면 None)"""
+    return _active.get()
+
+
+class profile_stage:
+    """
+    단계 시간 측정 (컨텍스트 매니저 또는 데코레이터)
+
+    활성 프로파일러가 없으면 아무것도 하지 않습니다.
+
+        @profile_stage('affinity_lookup')
+        def load_affinity(): ...
+
+        with profile_stage('reasoning'):
+            ...
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._context = None
+
+    def __enter__(self) -> None:
+        profiler = _active.get()
+        if profiler is not None:
+            self._context = profiler.stage(self.name)
+            self._context.__enter__()
+
+    def __exit__(self, *exc_info) -> bool:
+        context, self._context = self._context, None
+        if context is not None:
+            context.__exit__(*exc_info)
+        return False
+
+    def __call__(self, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _active.get()
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.stage(self.name):
+                return function(*args, **kwargs)
+        return wrapper
+
+
+def record_opensearch_response(response: Dict[str, Any]) -> None:
+    """활성 프로파일러에 검색 응답의 took(ms) 기록"""
+    profiler = _active.get()
+    if profiler is not None and isinstance(response, dict):
+        profiler.record_opensearch(response.get('took'))
+
+
+def instrument_client(client: Any) -> None:
+    """
+    boto3 클라이언트 계측 (DynamoDB, Bedrock Runtime)
+
+    클라이언트 이벤트 훅을 등록하며, 활성 프로파일러가 있을 때만 기록합니다.
+    같은 클라이언트에 여러 번 호출해도 훅은 한 번만 등록됩니다.
+
+    Args:
+        client: boto3 클라이언트 (DynamoDB 리소스는 resource.meta.client)
+    """
+    service = client.meta.service_model.service_name
+    events = client.meta.events
+    if service == 'dynamodb':
+        events.register(
+            'provide-client-params.dynamodb',
+            _request_consumed_capacity,
+            unique_id='request-profiler-dynamodb-params'
+        )
+        events.register('after-call.dynamodb', _record_dynamodb_call, unique_id='request-profiler-dynamodb')
+    elif service == 'bedrock-runtime':
+        events.register(
+            'provide-client-params.bedrock-runtime',
+            _remember_model_id,
+            unique_id='request-profiler-bedrock-params'
+        )
+        events.register(
+            'after-call.bedrock-runtime',
+            _record_bedrock_call,
+            unique_id='request-profiler-bedrock'
+        )
+    else:
+        logger.warning(f"프로파일러가 지원하지 않는 서비스입니다: {service}")
+
+
+def _request_consumed_capacity(params: Dict[str, Any], model: Any, **kwargs) -> None:
+    """프로파일링 중이면 소비 용량 반환 요청"""
+    if _active.get() is None:
+        return
+    if model.name in DYNAMODB_READ_OPERATIONS or model.name in DYNAMODB_WRITE_OPERATIONS:
+        params.setdefault('ReturnConsumedCapacity', 'TOTAL')
+
+
+def _record_dynamodb_call(model: Any, parsed: Dict[str, Any], **kwargs) -> None:
+    """DynamoDB 응답의 항목 수와 소비 용량 기록"""
+    profiler = _active.get()
+    if profiler is None or not isinstance(parsed, dict):
+        return
+
+    if 'Count' in parsed:
+        items = int(parsed['Count'])
+    elif 'Item' in parsed:
+        items = 1
+    elif 'Responses' in parsed:
+        responses = parsed['Responses']
+        items = sum(len(rows) for rows in responses.values()) if isinstance(responses, dict) else len(responses)
+    else:
+        items = 0
+
+    consumed = parsed.get('ConsumedCapacity') or []
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+    capacity_units = sum(float(entry.get('CapacityUnits', 0)) for entry in consumed)
+
+    profiler.record_dynamodb(model.name, items, capacity_units)
+
+
+def _remember_model_id(params: Dict[str, Any], context: Dict[str, Any], **kwargs) -> None:
+    """응답 훅에서 사용할 모델 ID 보관"""
+    if _active.get() is not None and 'modelId' in params:
+        context['request_profiler_model_id'] = params['modelId']
+
+
+def _record_bedrock_call(http_response: Any, context: Dict[str, Any], **kwargs) -> None:
+    """Bedrock 응답 헤더의 토큰 수 기록"""
+    profiler = _active.get()
+    if profiler is None:
+        return
+    headers = getattr(http_response, 'headers', None) or {}
+    profiler.record_bedrock(
+        context.get('request_profiler_model_id', 'unknown'),
+        int(headers.get(BEDROCK_INPUT_TOKENS_HEADER, 0) or 0),
+        int(headers.get(BEDROCK_OUTPUT_TOKENS_HEADER, 0) or 0)
+    )
+
+
+def summarize_profile(profile: cProfile.Profile, top_n: int) -> List[Dict[str, Any]]:
+    """
+    cProfile 결과 상위 N개 함수 (누적 시간 내림차순)
+
+    Returns:
+        list: [{function, calls, total_ms, cumulative_ms}]
+    """
+    stats = pstats.Stats(profile).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:top_n]
+    return [
+        {
+            'function': f"{filename}:{line}({name})",
+            'calls': calls,
+            'total_ms': round(total * 1000, 2),
+            'cumulative_ms': round(cumulative * 1000, 2)
+        }
+        for (filename, line, name), (_, calls, total, cumulative, _) in rows
+    ]
@@ -0,0 +1,257 @@
+"""
+로컬 기술 임베딩
+
+직원 보유 기술과 프로젝트 기술 스택의 동시 출현(co-occurrence) 행렬에 PPMI와 절단 SVD를 적용해
+기술별 저차원 벡터를 학습하고, 작은 NumPy 아티팩트(.npz)로 레이어에 포함합니다.
+기술 목록만으로 이루어진 요구사항은 Titan 호출 없이 프로세스 내에서 유사도를 계산합니다
+(자유 텍스트 설명은 계속 Titan 임베딩 사용).
+
+- 학습: train_skill_embedding(skill_sets) - deployment/train_skill_embedding.py에서 사용
+- 조회: get_skill_embedding() - 아티팩트가 없거나 NumPy를 사용할 수 없으면 None
+
+기술 집합 벡터 = 기술 벡터 평균의 단위 벡터이며, 점수는 OpenSearch faiss innerproduct
+_score와 같은 척도(cos ≥ 0이면 1 + cos, 아니면 1 / (1 - cos))로 반환합니다.
+"""
+
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from common.utils import normalize_skill
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없는 레이어에서는 Titan 경로만 사용
+    np = None
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_embedding.npz')
+DEFAULT_DIMENSIONS = 32
+
+# PPMI 문맥 분포 평활 지수 (드문 기술의 PMI 과대평가 완화)
+CONTEXT_SMOOTHING = 0.75
+
+# OpenSearch innerproduct _score 최대값 (cos = 1)
+MAX_SIMILARITY_SCORE = 2.0
+
+_loaded: Dict[str, Optional['SkillEmbedding']] = {}
+
+
+def skill_key(skill: str) -> str:
+    """기술 이름 정규화 키 (별칭 통일 + 소문자)"""
+    return normalize_skill(str(skill)).strip().lower()
+
+
+def innerproduct_score(cosine: float) -> float:
+    """코사인 유사도를 OpenSearch faiss innerproduct _score 척도로 변환"""
+    if cosine >= 0:
+        return 1.0 + cosine
+    return 1.0 / (1.0 - cosine)
+
+
+def train_skill_embedding(
+    skill_sets: Iterable[Iterable[str]],
+    dimensions: int = DEFAULT_DIMENSIONS,
+    min_count: int = 1
+) -> Tuple[List[str], 'np.ndarray']:
+    """
+    기술 집합 목록으로 기술 임베딩 학습 (PPMI + 절단 SVD)
+
+    Args:
+        skill_sets: 기술 집합 목록 (직원별 보유 기술, 프로젝트별 기술 스택 등)
+        dimensions: 임베딩 차원
+        min_count: 어휘에 포함할 최소 출현 집합 수
+
+    Returns:
+        tuple: (기술 키 목록, 단위 길이 행 벡터 행렬 [어휘 수 × 차원])
+    """
+    if np is None:
+        raise RuntimeError("기술 임베딩 학습에는 NumPy가 필요합니다")
+
+    sets = [sorted({skill_key(skill) for skill in skill_set if str(skill).strip()}) for skill_set in skill_sets]
+
+    counts: Dict[str, int] = {}
+    for skill_set in sets:
+        for skill in skill_set:
+            counts[skill] = counts.get(skill, 0) + 1
+    vocab = sorted(skill for skill, count in counts.items() if count >= min_count)
+    index = {skill: position for position, skill in enumerate(vocab)}
+
+    # 같은 집합에 함께 나타난 횟수 (대각 제외)
+    cooccurrence = np.zeros((len(vocab), len(vocab)), dtype=np.float64)
+    for skill_set in sets:
+        positions = [index[skill] for skill in skill_set if skill in index]
+        for i in positions:
+            for j in positions:
+                if i != j:
+                    cooccurrence[i, j] += 1
+
+    total = cooccurrence.sum()
+    if total == 0:
+        return vocab, np.zeros((len(vocab), dimensions), dtype=np.float32)
+
+    # PPMI = max(0, log(P(i, j) / (P(i) × Pα(j))))
+    row_probability = cooccurrence.sum(axis=1) / total
+    context = cooccurrence.sum(axis=0) ** CONTEXT_SMOOTHING
+    context_probability = context / context.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pmi = np.log((cooccurrence / total) / np.outer(row_probability, context_probability))
+    ppmi = np.where(np.isfinite(pmi) & (pmi > 0), pmi, 0.0)
+
+    # 절단 SVD: 기술 벡터 = U_k × sqrt(S_k)
+    u, singular_values, _ = np.linalg.svd(ppmi, full_matrices=False)
+    rank = min(dimensions, len(singular_values))
+    vectors = np.zeros((len(vocab), dimensions), dtype=np.float64)
+    vectors[:, :rank] = u[:, :rank] * np.sqrt(singular_values[:rank])
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    return vocab, vectors.astype(np.float32)
+
+
+class SkillEmbedding:
+    """
+    기술 임베딩 모델
+
+    어휘에 없는 기술은 무시하며, 알려진 기술이 하나도 없으면 집합 벡터는 None입니다.
+    """
+
+    def __init__(self, vocab: List[str], vectors: 'np.ndarray'):
+        """
+        Args:
+            vocab: 기술 키 목록
+            vectors: 기술별 단위 벡터 행렬
+        """
+        self.vocab = list(vocab)
+        self.vectors = vectors
+        self.index = {skill: position for position, skill in enumerate(self.vocab)}
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_ARTIFACT_PATH) -> 'SkillEmbedding':
+        """
+        아티팩트 로드
+
+        Args:
+            path: .npz 파일 경로 (vocab, vectors 배열)
+
+        Returns:
+            SkillEmbedding: 로드된 모델
+        """
+        with np.load(path, allow_pickle=False) as artifact:
+            return cls([str(skill) for skill in artifact['vocab']], artifact['vectors'])
+
+    def save(self, path: str) -> None:
+        """
+        아티팩트 저장 (.npz, 압축)
+
+        Args:
+            path: 저장 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(path, vocab=np.array(self.vocab), vectors=self.vectors)
+
+    def known_skills(self, skills: Iterable[str]) -> List[str]:
+        """어휘에 있는 기술 키 목록"""
+        return [key for key in (skill_key(skill) for skill in skills) if key in self.index]
+
+    def embed(self, skills: Iterable[str]) -> Optional['np.ndarray']:
+        """
+        기술 집합 벡터 (기술 벡터 평균의 단위 벡터)
+
+        Args:
+            skills: 기술 이름 목록
+
+        Returns:
+            ndarray: 단위 벡터 (알려진 기술이 없으면 None)
+        """
+        positions = sorted({self.index[key] for key in self.known_skills(skills)})
+        if not positions:
+            return None
+
+        vector = self.vectors[positions].mean(axis=0)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def cosine(self, query: Optional['np.ndarray'], skills: Iterable[str]) -> Optional[float]:
+        """
+        질의 벡터와 기술 집합의 코사인 유사도
+
+        Args:
+            query: embed() 결과
+            skills: 비교할 기술 이름 목록
+
+        Returns:
+            float: 코사인 유사도 (계산할 수 없으면 None)
+        """
+        if query is None:
+            return None
+        target = self.embed(skills)
+        if target is None:
+            return None
+        return float(np.dot(query, target))
+
+    def score(self, query: Optional['np.ndarray'], skills: Iterable[str]) -> float:
+        """
+        질의 벡터와 기술 집합의 유사도 점수 (OpenSearch innerproduct _score 척도, 0~2)
+
+        Args:
+            query: embed() 결과
+            skills: 비교할 기술 이름 목록
+
+        Returns:
+            float: 유사도 점수 (계산할 수 없으면 0)
+        """
+        cosine = self.cosine(query, skills)
+        if cosine is None:
+            return 0.0
+        return innerproduct_score(max(-1.0, min(1.0, cosine)))
+
+
+def get_skill_embedding(path: Optional[str] = None) -> Optional[SkillEmbedding]:
+    """
+    기술 임베딩 모델 조회 (컨테이너당 한 번 로드)
+
+    Args:
+        path: 아티팩트 경로 (기본값: SKILL_EMBEDDING_PATH 환경 변수 또는 레이어 내장 파일)
+
+    Returns:
+        SkillEmbedding: 모델 (NumPy 또는 아티팩트가 없으면 None)
+    """
+    path = path or os.environ.get('SKILL_EMBEDDING_PATH', DEFAULT_ARTIFACT_PATH)
+    if path in _loaded:
+        return _loaded[path]
+
+    model = None
+    if np is None:
+        logger.warning("NumPy를 사용할 수 없어 로컬 기술 임베딩을 비활성화합니다")
+    elif not os.path.exists(path):
+        logger.warning(f"기술 임베딩 아티팩트가 없습니다: {path}")
+    else:
+        try:
+            model = SkillEmbedding.load(path)
+            logger.info(f"기술 임베딩 로드: {len(model.vocab)}개 기술, {model.vectors.shape[1]}차원")
+        except Exception as e:
+            logger.warning(f"기술 임베딩 로드 실패: {str(e)}")
+
+    _loaded[path] = model
+    return model
+
+
+def skill_set_similarity(skills_a: Iterable[str], skills_b: Iterable[str]) -> Optional[float]:
+    """
+    두 기술 집합의 코사인 유사도 (모델이 없거나 계산할 수 없으면 None)
+    """
+    model = get_skill_embedding()
+    if model is None:
+        return None
+    return model.cosine(model.embed(skills_a), skills_b)
@@ -0,0 +1,334 @@
+"""
+프로세스 내 벡터 인덱스
+
+직원 스냅샷의 프로필 벡터로 OpenSearch k-NN 검색을 대신합니다.
+OpenSearch가 느리거나 연결할 수 없을 때의 대체 경로이며, OpenSearch 도메인 없이
+벤치마크를 실행할 때의 로컬 백엔드로도 사용합니다.
+
+- 작은 집합: NumPy 행렬곱 정확 검색 (ExactVectorIndex)
+- 큰 집합: 구면 k-means 역색인 IVF (IVFVectorIndex) - nprobe개 리스트만 탐색
+- LocalVectorSearch.search(index, body)는 build_knn_query / build_skill_filter_query가
+  만드는 쿼리 본문을 받아 OpenSearch와 같은 응답 형식(hits.hits[]._source/_score)을 반환
+
+점수는 faiss innerproduct와 같은 척도(cos ≥ 0이면 1 + cos, 아니면 1 / (1 - cos))입니다.
+"""
+
+import logging
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.opensearch_client import SKILL_FILTER_FIELD, VECTOR_FIELD
+from common.skill_embedding import innerproduct_score
+from common.workforce_snapshot import WorkforceSnapshot, get_workforce_snapshot
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없는 레이어에서는 로컬 인덱스 비활성화
+    np = None
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# 이 수 이하의 직원은 정확 검색 (행렬곱 한 번이 IVF 탐색보다 빠름)
+EXACT_SEARCH_THRESHOLD = int(os.environ.get('VECTOR_INDEX_EXACT_THRESHOLD', '20000'))
+
+# IVF 기본 탐색 리스트 비율 (nlist 대비)
+DEFAULT_PROBE_RATIO = 0.1
+
+# k-means 반복 횟수 / 할당 계산 배치 크기
+KMEANS_ITERATIONS = 10
+ASSIGN_BATCH_SIZE = 65536
+
+# 위치별 (스냅샷, 검색 백엔드) - 스냅샷이 다시 로드되면 새로 생성
+_searches: Dict[Optional[str], Tuple['WorkforceSnapshot', 'LocalVectorSearch']] = {}
+
+
+def top_k_rows(scores: 'np.ndarray', rows: 'np.ndarray', k: int) -> Tuple['np.ndarray', 'np.ndarray']:
+    """점수 상위 k개 행 (점수 내림차순)"""
+    if k <= 0 or len(rows) == 0:
+        return rows[:0], scores[:0]
+    if len(rows) > k:
+        part = np.argpartition(-scores, k - 1)[:k]
+        rows, scores = rows[part], scores[part]
+    order = np.argsort(-scores, kind='stable')
+    return rows[order], scores[order]
+
+
+class ExactVectorIndex:
+    """정확 코사인 검색 (단위 벡터 내적)"""
+
+    def __init__(self, vectors: 'np.ndarray'):
+        """
+        Args:
+            vectors: 단위 길이 행 벡터 행렬
+        """
+        self.vectors = vectors
+
+    def search(
+        self,
+        query: 'np.ndarray',
+        k: int,
+        allowed: Optional['np.ndarray'] = None
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        최근접 이웃 검색
+
+        Args:
+            query: 단위 질의 벡터
+            k: 반환할 이웃 수
+            allowed: 허용 행 번호 배열 (필터, None이면 전체)
+
+        Returns:
+            tuple: (행 번호 배열, 코사인 배열) - 코사인 내림차순
+        """
+        if allowed is None:
+            rows = np.arange(len(self.vectors))
+            scores = self.vectors @ query
+        else:
+            rows = allowed
+            scores = self.vectors[rows] @ query
+        return top_k_rows(scores, rows, k)
+
+
+class IVFVectorIndex:
+    """
+    역색인 IVF 근사 검색
+
+    구면 k-means로 벡터를 nlist개 리스트로 나누고, 질의와 가까운 중심 nprobe개의
+    리스트만 정확히 비교합니다. 필터 적용 후 후보가 k개보다 적으면 리스트를 더 탐색하므로
+    OpenSearch efficient filtering처럼 결과가 k개보다 적게 잘리지 않습니다.
+    """
+
+    def __init__(
+        self,
+        vectors: 'np.ndarray',
+        nlist: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            vectors: 단위 길이 행 벡터 행렬
+            nlist: 리스트 수 (기본값: sqrt(직원 수))
+            nprobe: 탐색할 리스트 수 (기본값: nlist의 10%)
+            seed: 초기 중심 선택 시드
+        """
+        self.vectors = vectors
+        size = len(vectors)
+        self.nlist = max(1, min(size, nlist or int(math.sqrt(size))))
+        self.nprobe = max(1, min(self.nlist, nprobe or math.ceil(self.nlist * DEFAULT_PROBE_RATIO)))
+
+        rng = np.random.default_rng(seed)
+        self.centroids = vectors[rng.choice(size, self.nlist, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = self._assign(vectors)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assignment, vectors)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # 빈 리스트는 이전 중심 유지
+            self.centroids = np.where(norms > 0, sums / np.where(norms > 0, norms, 1), self.centroids)
+
+        assignment = self._assign(vectors)
+        self.rows = np.argsort(assignment, kind='stable')
+        self.offsets = np.concatenate(([0], np.cumsum(np.bincount(assignment, minlength=self.nlist))))
+
+    def _assign(self, vectors: 'np.ndarray') -> 'np.ndarray':
+        """가장 가까운 중심 번호 (배치 단위 계산으로 메모리 제한)"""
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), ASSIGN_BATCH_SIZE):
+            batch = vectors[start:start + ASSIGN_BATCH_SIZE]
+            assignment[start:start + len(batch)] = np.argmax(batch @ self.centroids.T, axis=1)
+        return assignment
+
+    def search(
+        self,
+        query: 'np.ndarray',
+        k: int,
+        allowed: Optional['np.ndarray'] = None
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        근사 최근접 이웃 검색
+
+        Args:
+            query: 단위 질의 벡터
+            k: 반환할 이웃 수
+            allowed: 허용 행 번호 배열 (필터, None이면 전체)
+
+        Returns:
+            tuple: (행 번호 배열, 코사인 배열) - 코사인 내림차순
+        """
+        mask = None
+        if allowed is not None:
+            mask = np.zeros(len(self.vectors), dtype=bool)
+            mask[allowed] = True
+
+        probe_order = np.argsort(-(self.centroids @ query))
+        candidates = []
+        found = 0
+        for probed, centroid in enumerate(probe_order, start=1):
+            rows = self.rows[self.offsets[centroid]:self.offsets[centroid + 1]]
+            if mask is not None:
+                rows = rows[mask[rows]]
+            candidates.append(rows)
+            found += len(rows)
+            if probed >= self.nprobe and found >= k:
+                break
+
+        rows = np.concatenate(candidates) if candidates else np.empty(0, dtype=np.int64)
+        return top_k_rows(self.vectors[rows] @ query, rows, k)
+
+
+def build_vector_index(vectors: 'np.ndarray', exact_threshold: int = EXACT_SEARCH_THRESHOLD):
+    """
+    직원 수에 맞는 벡터 인덱스 생성
+
+    Args:
+        vectors: 단위 길이 행 벡터 행렬
+        exact_threshold: 정확 검색을 사용할 최대 직원 수
+
+    Returns:
+        ExactVectorIndex 또는 IVFVectorIndex
+    """
+    if len(vectors) <= exact_threshold:
+        return ExactVectorIndex(vectors)
+    return IVFVectorIndex(vectors)
+
+
+class LocalVectorSearch:
+    """
+    OpenSearch 검색 호환 로컬 백엔드
+
+    지원하는 쿼리: knn(벡터, k, skill_names terms 필터), bool terms 필터, match_all
+    """
+
+    def __init__(self, snapshot: WorkforceSnapshot, index=None):
+        """
+        Args:
+            snapshot: 직원 스냅샷
+            index: 벡터 인덱스 (기본값: 직원 수에 따라 build_vector_index)
+        """
+        self.snapshot = snapshot
+        self.index = index or build_vector_index(snapshot.vectors)
+
+        # 기술 키워드 → 행 번호 역색인 (terms 필터)
+        postings: Dict[str, List[int]] = {}
+        for row, source in enumerate(snapshot.sources):
+            for term in source.get(SKILL_FILTER_FIELD) or []:
+                postings.setdefault(term, []).append(row)
+        self.postings = {term: np.array(rows, dtype=np.int64) for term, rows in postings.items()}
+
+    def filter_rows(self, terms: List[str]) -> 'np.ndarray':
+        """기술 키워드 중 하나 이상을 가진 행 번호 (오름차순)"""
+        matched = [self.postings[term] for term in terms if term in self.postings]
+        if not matched:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(matched))
+
+    def search(self, index: Optional[str] = None, body: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        OpenSearch search 호환 검색
+
+        Args:
+            index: 인덱스 이름 (무시 - 스냅샷은 employee_profiles 하나)
+            body: 검색 본문
+            **kwargs: request_timeout 등 OpenSearch 클라이언트 인자 (무시)
+
+        Returns:
+            dict: OpenSearch 검색 응답 형식
+        """
+        started = time.perf_counter()
+        body = body or {}
+        query = body.get('query') or {'match_all': {}}
+        size = int(body.get('size', 10))
+
+        if 'knn' in query:
+            knn = query['knn'][VECTOR_FIELD]
+            rows, scores = self._knn(knn, size)
+        elif 'bool' in query:
+            rows = self._filtered_rows(query['bool']).copy()[:size]
+            scores = np.zeros(len(rows))
+        elif 'match_all' in query:
+            rows = np.arange(min(size, len(self.snapshot)))
+            scores = np.zeros(len(rows))
+        else:
+            raise ValueError(f"지원하지 않는 쿼리입니다: {list(query.keys())}")
+
+        fields = body.get('_source')
+        hits = []
+        for row, score in zip(rows.tolist(), scores.tolist()):
+            source = self.snapshot.sources[row]
+            if isinstance(fields, list):
+                source = {field: source[field] for field in fields if field in source}
+            hits.append({
+                '_index': index,
+                '_id': self.snapshot.sources[row].get('user_id'),
+                '_score': score,
+                '_source': source
+            })
+
+        return {
+            'took': int((time.perf_counter() - started) * 1000),
+            'timed_out': False,
+            'hits': {
+                'total': {'value': len(hits), 'relation': 'eq'},
+                'max_score': hits[0]['_score'] if hits else None,
+                'hits': hits
+            }
+        }
+
+    def _filtered_rows(self, bool_query: Dict[str, Any]) -> 'np.ndarray':
+        """bool.filter의 terms 절 적용 (여러 절은 교집합)"""
+        rows = None
+        for clause in bool_query.get('filter', []):
+            terms = clause.get('terms', {}).get(SKILL_FILTER_FIELD)
+            if terms is None:
+                raise ValueError(f"지원하지 않는 필터입니다: {clause}")
+            matched = self.filter_rows(terms)
+            rows = matched if rows is None else np.intersect1d(rows, matched)
+        return np.arange(len(self.snapshot)) if rows is None else rows
+
+    def _knn(self, knn: Dict[str, Any], size: int) -> Tuple['np.ndarray', 'np.ndarray']:
+        """knn 절 검색 (필터는 탐색 중 적용)"""
+        query = np.asarray(knn['vector'], dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or query.shape[0] != self.snapshot.vectors.shape[1]:
+            raise ValueError("질의 벡터 차원이 스냅샷과 다르거나 영벡터입니다")
+
+        allowed = self._filtered_rows(knn['filter']['bool']) if 'filter' in knn else None
+        k = min(int(knn.get('k', size)), size)
+        rows, cosines = self.index.search(query / norm, k, allowed)
+        scores = np.array([innerproduct_score(float(cosine)) for cosine in cosines])
+        return rows, scores
+
+
+def get_local_vector_search(uri: Optional[str] = None) -> Optional[LocalVectorSearch]:
+    """
+    로컬 벡터 검색 백엔드 조회 (스냅샷당 한 번 인덱스 생성)
+
+    Args:
+        uri: 스냅샷 위치 (기본값: WORKFORCE_SNAPSHOT_URI 환경 변수)
+
+    Returns:
+        LocalVectorSearch: 로컬 백엔드 (스냅샷이 없으면 None)
+    """
+    snapshot = get_workforce_snapshot(uri)
+    if snapshot is None or len(snapshot) == 0:
+        return None
+
+    cached = _searches.get(uri)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    started = time.perf_counter()
+    search = LocalVectorSearch(snapshot)
+    _searches[uri] = (snapshot, search)
+    logger.info(
+        f"로컬 벡터 인덱스 생성: {type(search.index).__name__}, {len(snapshot)}명, "
+        f"{(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return search
@@ -0,0 +1,227 @@
+"""
+직원 스냅샷
+
+OpenSearch employee_profiles 인덱스의 직원 문서(벡터 제외 주요 필드)와 프로필 벡터를
+하나의 NumPy 아티팩트(.npz)로 저장하고, 직원별 기술/프로젝트 이력 MinHash 서명도 함께 담습니다.
+스냅샷 작업(deployment/build_workforce_snapshot.py)이 생성하여 S3에 올리고,
+Lambda는 /tmp로 내려받아 로컬 검색에 사용합니다.
+
+- 위치: WORKFORCE_SNAPSHOT_URI 환경 변수 (s3://버킷/키 또는 로컬 파일 경로)
+- 갱신: 로드 후 WORKFORCE_SNAPSHOT_CHECK_SECONDS(기본 300초)가 지나면 버전(S3 ETag 또는 파일 수정 시각·크기)을
+  확인하여 바뀌었을 때만 다시 로드 (재배포 없이 스냅샷 작업 결과를 반영)
+- 로드 실패(미설정, NumPy 없음, 파일 없음)는 None으로 처리하여 호출 측이 기존 경로를 사용하고,
+  실패는 보관하지 않아 다음 호출이 다시 로드를 시도
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없는 레이어에서는 스냅샷 비활성화
+    np = None
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# 스냅샷에 포함하는 직원 문서 필드
+SNAPSHOT_SOURCE_FIELDS = ['user_id', 'name', 'role', 'skill_names']
+
+# MinHash 서명 배열 이름 접두사 (minhash_sig_skills 등)
+MINHASH_PREFIX = 'minhash_sig_'
+
+# Lambda 내려받기 경로
+LOCAL_SNAPSHOT_PATH = '/tmp/workforce_snapshot.npz'
+
+# 로드 후 버전을 다시 확인하기까지의 시간(초)
+SNAPSHOT_CHECK_SECONDS = float(os.environ.get('WORKFORCE_SNAPSHOT_CHECK_SECONDS', '300'))
+
+# 위치별 로드된 스냅샷 {uri: (스냅샷, 버전, 확인 시각)} - 로드 실패는 보관하지 않음
+_loaded: Dict[str, Tuple['WorkforceSnapshot', Optional[str], float]] = {}
+
+
+class WorkforceSnapshot:
+    """
+    직원 스냅샷
+
+    sources[i]와 vectors[i]는 같은 직원이며, vectors는 단위 길이 float32 행렬입니다.
+    MinHash 서명은 벡터가 없는 직원도 포함하므로 별도의 직원 ID 목록(minhash_user_ids)을 가집니다.
+    """
+
+    def __init__(
+        self,
+        sources: List[Dict[str, Any]],
+        vectors: 'np.ndarray',
+        created_at: Optional[float] = None,
+        minhash_user_ids: Optional[List[str]] = None,
+        minhash_signatures: Optional[Dict[str, 'np.ndarray']] = None
+    ):
+        """
+        Args:
+            sources: 직원 문서 목록 (SNAPSHOT_SOURCE_FIELDS)
+            vectors: 프로필 벡터 행렬 [직원 수 × 차원]
+            created_at: 생성 시각 (epoch 초)
+            minhash_user_ids: MinHash 서명 행별 직원 ID
+            minhash_signatures: 종류별 서명 행렬 (common.minhash_index.SKILL_SETS, PROJECT_SETS)
+        """
+        self.sources = sources
+        self.vectors = normalize_rows(np.asarray(vectors, dtype=np.float32))
+        self.created_at = created_at if created_at is not None else time.time()
+        self.minhash_user_ids = list(minhash_user_ids or [])
+        self.minhash_signatures = dict(minhash_signatures or {})
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    @classmethod
+    def load(cls, path: str) -> 'WorkforceSnapshot':
+        """
+        스냅샷 로드
+
+        Args:
+            path: .npz 파일 경로
+
+        Returns:
+            WorkforceSnapshot: 로드된 스냅샷
+        """
+        with np.load(path, allow_pickle=False) as artifact:
+            minhash_signatures = {
+                name[len(MINHASH_PREFIX):]: artifact[name]
+                for name in artifact.files if name.startswith(MINHASH_PREFIX)
+            }
+            minhash_user_ids = (
+                [str(user_id) for user_id in artifact['minhash_user_ids']]
+                if 'minhash_user_ids' in artifact.files else []
+            )
+            return cls(
+                json.loads(str(artifact['sources'])),
+                artifact['vectors'],
+                float(artifact['created_at']),
+                minhash_user_ids,
+                minhash_signatures
+            )
+
+    def save(self, path: str) -> None:
+        """
+        스냅샷 저장 (.npz, 압축)
+
+        Args:
+            path: 저장 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        minhash_arrays = {
+            f"{MINHASH_PREFIX}{name}": signatures for name, signatures in self.minhash_signatures.items()
+        }
+        if self.minhash_user_ids:
+            minhash_arrays['minhash_user_ids'] = np.array(self.minhash_user_ids)
+        np.savez_compressed(
+            path,
+            sources=np.array(json.dumps(self.sources, ensure_ascii=False)),
+            vectors=self.vectors,
+            created_at=np.array(self.created_at),
+            **minhash_arrays
+        )
+
+
+def normalize_rows(vectors: 'np.ndarray') -> 'np.ndarray':
+    """행 벡터를 단위 길이로 정규화 (영벡터는 그대로)"""
+    if len(vectors) == 0:
+        return np.zeros((0, vectors.shape[1] if vectors.ndim == 2 else 0), dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def parse_s3_uri(uri: str) -> Optional[tuple]:
+    """s3://버킷/키 형식이면 (버킷, 키), 아니면 None"""
+    if not uri.startswith('s3://'):
+        return None
+    bucket, _, key = uri[len('s3://'):].partition('/')
+    return bucket, key
+
+
+def snapshot_version(uri: str) -> Optional[str]:
+    """
+    스냅샷 버전 (S3 ETag 또는 로컬 파일 수정 시각·크기)
+
+    Args:
+        uri: s3://버킷/키 또는 로컬 경로
+
+    Returns:
+        str: 버전 (확인할 수 없으면 None)
+    """
+    s3_location = parse_s3_uri(uri)
+    if s3_location:
+        import boto3
+        return boto3.client('s3').head_object(Bucket=s3_location[0], Key=s3_location[1]).get('ETag')
+    stat = os.stat(uri)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def get_workforce_snapshot(uri: Optional[str] = None, clock=time.monotonic) -> Optional[WorkforceSnapshot]:
+    """
+    직원 스냅샷 조회 (버전이 바뀌었을 때만 다시 로드)
+
+    Args:
+        uri: s3://버킷/키 또는 로컬 경로 (기본값: WORKFORCE_SNAPSHOT_URI 환경 변수)
+        clock: 확인 주기 계산용 시각(초) 함수
+
+    Returns:
+        WorkforceSnapshot: 스냅샷 (미설정이거나 로드할 수 없으면 None)
+    """
+    uri = uri or os.environ.get('WORKFORCE_SNAPSHOT_URI')
+    if not uri:
+        return None
+
+    now = clock()
+    cached = _loaded.get(uri)
+    if cached is not None:
+        snapshot, version, checked_at = cached
+        if now - checked_at < SNAPSHOT_CHECK_SECONDS:
+            return snapshot
+        try:
+            latest = snapshot_version(uri)
+        except Exception as e:
+            # 버전을 확인할 수 없으면 기존 스냅샷을 계속 사용하고 다음 주기에 다시 확인
+            logger.warning(f"직원 스냅샷 버전 확인 실패: {str(e)}")
+            latest = version
+        if latest == version:
+            _loaded[uri] = (snapshot, version, now)
+            return snapshot
+
+    if np is None:
+        logger.warning("NumPy를 사용할 수 없어 직원 스냅샷을 비활성화합니다")
+        return None
+
+    try:
+        path = uri
+        s3_location = parse_s3_uri(uri)
+        if s3_location:
+            import boto3
+            response = boto3.client('s3').get_object(Bucket=s3_location[0], Key=s3_location[1])
+            with open(LOCAL_SNAPSHOT_PATH, 'wb') as file:
+                for chunk in response['Body'].iter_chunks():
+                    file.write(chunk)
+            version = response.get('ETag')
+            path = LOCAL_SNAPSHOT_PATH
+        else:
+            version = snapshot_version(uri)
+        snapshot = WorkforceSnapshot.load(path)
+    except Exception as e:
+        # 실패는 보관하지 않음 - 이전 스냅샷이 있으면 다음 주기까지 계속 사용
+        logger.warning(f"직원 스냅샷 로드 실패: {str(e)}")
+        if cached is None:
+            return None
+        _loaded[uri] = (cached[0], cached[1], now)
+        return cached[0]
+
+    logger.info(f"직원 스냅샷 로드: {len(snapshot)}명, {snapshot.vectors.shape[1]}차원 (버전 {version})")
+    _loaded[uri] = (snapshot, version, now)
+    return snapshot
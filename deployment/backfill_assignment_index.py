@@ -0,0 +1,90 @@
+"""
+직원 배정 인덱스(EmployeeAssignments) 초기 적재
+
+Projects 테이블의 team_composition 명단과 프로젝트 기간, Employees 테이블의 current_project를
+배정 인덱스로 옮깁니다. 이후 배정은 ProjectAssignment Lambda가 인덱스를 직접 갱신합니다.
+
+사용법:
+    python deployment/backfill_assignment_index.py
+"""
+
+import sys
+import os
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from common.assignment_index import ASSIGNMENT_TABLE, make_allocation
+
+
+def scan_all(table):
+    """테이블 전체 스캔 (페이지네이션 처리)"""
+    response = table.scan()
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+    return items
+
+
+def main():
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+
+    print("=" * 70)
+    print("직원 배정 인덱스 초기 적재")
+    print("=" * 70)
+
+    allocations = {}
+
+    # 1. 프로젝트 명단에서 배정 수집
+    print("\n[1단계] Projects 테이블 스캔 중...")
+    projects = scan_all(dynamodb.Table('Projects'))
+    projects_by_id = {project['project_id']: project for project in projects}
+
+    for project in projects:
+        period = project.get('period', {})
+        for role, members in project.get('team_composition', {}).items():
+            if not isinstance(members, list):
+                continue
+            for member_id in members:
+                allocations.setdefault(member_id, []).append(make_allocation(
+                    project['project_id'],
+                    project.get('project_name'),
+                    role,
+                    period.get('start'),
+                    period.get('end')
+                ))
+    print(f"  ✓ {len(projects)}개 프로젝트 확인")
+
+    # 2. 직원의 current_project 반영 (명단에 없는 배정만 추가)
+    print("\n[2단계] Employees 테이블 스캔 중...")
+    employees = scan_all(dynamodb.Table('Employees'))
+    for employee in employees:
+        project_id = employee.get('current_project')
+        user_id = employee.get('user_id')
+        if not project_id or not user_id:
+            continue
+        existing = {allocation['project_id'] for allocation in allocations.get(user_id, [])}
+        if project_id in existing:
+            continue
+        project = projects_by_id.get(project_id, {})
+        allocations.setdefault(user_id, []).append(make_allocation(
+            project_id,
+            project.get('project_name'),
+            employee.get('current_role', 'Team Member'),
+            employee.get('assignment_date') or project.get('period', {}).get('start'),
+            project.get('period', {}).get('end')
+        ))
+    print(f"  ✓ {len(employees)}명 직원 확인")
+
+    # 3. 인덱스 저장
+    print(f"\n[3단계] {ASSIGNMENT_TABLE} 테이블 저장 중...")
+    table = dynamodb.Table(ASSIGNMENT_TABLE)
+    with table.batch_writer() as batch:
+        for user_id, items in allocations.items():
+            batch.put_item(Item={'user_id': user_id, 'allocations': items})
+    print(f"  ✓ {len(allocations)}명의 배정 인덱스 저장 완료")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+메신저 쌍별 집계 벤치마크 (메시지 단위 루프 vs NumPy 벡터화)
+
+익명화 메신저 로그(test_data/messenger_logs_anonymized.json)를 복제하여 지정한 행 수로 늘린 뒤
+친밀도 메신저 점수 집계의 처리 시간을 비교합니다. 복제본마다 날짜를 하루씩(최대 1년) 앞당겨
+감쇠와 요일/행사일 구분이 골고루 섞이도록 합니다.
+
+- 메시지 단위 루프: --scalar-rows 건을 측정하고 전체 행 수로 환산
+- 벡터화: 열 배열 생성(메시지 dict 순회)과 집계(배열 연산)를 나누어 측정
+- 원본 로그에 대해 두 경로의 결과 일치를 확인
+
+사용법:
+    # 1,000만 건
+    python deployment/benchmark_messenger_scoring.py --rows 10000000
+
+    # 빠른 확인
+    python deployment/benchmark_messenger_scoring.py --rows 1000000 --scalar-rows 20000
+"""
+
+import argparse
+import json
+import sys
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from lambda_functions.affinity_calculator.messenger_aggregation import aggregate_messages
+from lambda_functions.affinity_calculator.vectorized_scoring import MessageColumns, aggregate_columns
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(__file__), '..', 'test_data', 'messenger_logs_anonymized.json')
+
+# 복제본 날짜 이동 주기 (일)
+SHIFT_PERIOD_DAYS = 365
+
+
+def replicate_messages(messages, rows):
+    """메시지 dict 복제 (복제본마다 하루씩 이전 날짜)"""
+    replicated = []
+    copy_index = 0
+    while len(replicated) < rows:
+        shift = timedelta(days=copy_index % SHIFT_PERIOD_DAYS)
+        for message in messages:
+            if len(replicated) == rows:
+                break
+            timestamp = datetime.fromisoformat(message['timestamp'].replace('Z', '+00:00')) - shift
+            replicated.append({**message, 'timestamp': timestamp.strftime('%Y-%m-%dT%H:%M:%SZ')})
+        copy_index += 1
+    return replicated
+
+
+def replicate_columns(base, rows):
+    """열 배열 복제 (replicate_messages와 같은 날짜 이동)"""
+    repeats = -(-rows // len(base))
+    shifts = np.repeat(np.arange(repeats) % SHIFT_PERIOD_DAYS, len(base))[:rows].astype('timedelta64[D]')
+
+    def tile(values):
+        return np.tile(values, repeats)[:rows]
+
+    return MessageColumns(
+        base.employee_ids,
+        tile(base.senders),
+        tile(base.receivers),
+        tile(base.utc_times) - shifts,
+        tile(base.wall_times) - shifts,
+        tile(base.response_times),
+        tile(base.vacation)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메신저 쌍별 집계 벤치마크')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='메신저 로그 JSON 파일')
+    parser.add_argument('--rows', type=int, default=10_000_000, help='벤치마크 행 수')
+    parser.add_argument('--scalar-rows', type=int, default=100_000, help='메시지 단위 루프 측정 행 수')
+    parser.add_argument('--event-dates', nargs='*', default=['2025-12-05', '2025-12-24'], help='회사 행사 날짜')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("메신저 쌍별 집계 벤치마크")
+    print("=" * 70)
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        messages = json.load(f)
+    event_dates = set(args.event_dates)
+    now = datetime.now(timezone.utc)
+    print(f"\n원본 메시지 {len(messages)}건 → {args.rows:,}건, 행사일 {len(event_dates)}일")
+
+    print("\n[1단계] 결과 일치 확인 (원본 로그)...")
+    expected = aggregate_messages(messages, event_dates, now)
+    actual = aggregate_columns(MessageColumns.from_messages(messages), event_dates, now)
+    max_error = max(abs(actual[pair].weighted_score - stats.weighted_score) for pair, stats in expected.items())
+    same = set(actual) == set(expected) and all(
+        actual[pair].total_messages == stats.total_messages for pair, stats in expected.items()
+    )
+    print(f"  {'✓' if same else '✗'} 직원 쌍 {len(expected)}개, 가중 점수 최대 오차 {max_error:.2e}")
+
+    print(f"\n[2단계] 메시지 단위 루프 ({args.scalar_rows:,}건)...")
+    sample = replicate_messages(messages, args.scalar_rows)
+    started = time.perf_counter()
+    aggregate_messages(sample, event_dates, now)
+    scalar_seconds = time.perf_counter() - started
+    scalar_total = scalar_seconds * args.rows / args.scalar_rows
+    print(f"  ✓ {scalar_seconds:.2f}s ({args.scalar_rows / scalar_seconds:,.0f}건/s) → {args.rows:,}건 환산 {scalar_total:.1f}s")
+
+    print(f"\n[3단계] 열 배열 생성 ({args.scalar_rows:,}건 dict 순회, 시각 파싱 포함)...")
+    started = time.perf_counter()
+    MessageColumns.from_messages(sample)
+    build_seconds = time.perf_counter() - started
+    build_total = build_seconds * args.rows / args.scalar_rows
+    print(f"  ✓ {build_seconds:.2f}s ({args.scalar_rows / build_seconds:,.0f}건/s) → {args.rows:,}건 환산 {build_total:.1f}s")
+
+    print(f"\n[4단계] 벡터화 집계 ({args.rows:,}건)...")
+    columns = replicate_columns(MessageColumns.from_messages(messages), args.rows)
+    started = time.perf_counter()
+    stats = aggregate_columns(columns, event_dates, now)
+    vector_seconds = time.perf_counter() - started
+    print(f"  ✓ {vector_seconds:.2f}s ({args.rows / vector_seconds:,.0f}건/s), 직원 쌍 {len(stats)}개")
+
+    print("\n" + "=" * 70)
+    print(f"메시지 단위 루프 (환산): {scalar_total:.1f}s")
+    print(f"벡터화 (열 생성 환산 + 집계): {build_total + vector_seconds:.1f}s "
+          f"(집계만 {vector_seconds:.1f}s, {scalar_total / vector_seconds:.0f}배)")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+벡터 검색 벤치마크 (로컬 백엔드)
+
+OpenSearch 도메인 없이 로컬 벡터 인덱스의 검색 지연 시간과 정확 검색 대비 재현율을 측정합니다.
+직원 스냅샷이 주어지면 그 벡터를, 아니면 지정한 크기의 합성 벡터(군집 구조)를 사용합니다.
+
+사용법:
+    # 합성 벡터 100,000명 (Titan 1536차원)
+    python deployment/benchmark_vector_search.py --size 100000
+
+    # 직원 스냅샷 사용
+    python deployment/benchmark_vector_search.py --snapshot /tmp/workforce_snapshot.npz
+"""
+
+import argparse
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from common.vector_index import ExactVectorIndex, IVFVectorIndex
+from common.workforce_snapshot import WorkforceSnapshot, normalize_rows
+
+
+def synthetic_vectors(size, dimensions, clusters, seed):
+    """군집 구조가 있는 합성 단위 벡터"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimensions)).astype(np.float32)
+    labels = rng.integers(0, clusters, size)
+    vectors = centers[labels] + 0.5 * rng.standard_normal((size, dimensions)).astype(np.float32)
+    return normalize_rows(vectors)
+
+
+def measure(index, queries, k):
+    """질의별 검색 결과와 평균 지연 시간(ms)"""
+    results = []
+    started = time.perf_counter()
+    for query in queries:
+        rows, _ = index.search(query, k)
+        results.append(set(rows.tolist()))
+    elapsed_ms = (time.perf_counter() - started) * 1000 / len(queries)
+    return results, elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description='벡터 검색 벤치마크 (로컬 백엔드)')
+    parser.add_argument('--snapshot', help='직원 스냅샷 경로 (없으면 합성 벡터)')
+    parser.add_argument('--size', type=int, default=100000, help='합성 벡터 수')
+    parser.add_argument('--dimensions', type=int, default=1536, help='합성 벡터 차원')
+    parser.add_argument('--queries', type=int, default=100, help='질의 수')
+    parser.add_argument('--k', type=int, default=50, help='최근접 이웃 수')
+    parser.add_argument('--nprobe', type=int, nargs='*', default=[1, 4, 16], help='IVF 탐색 리스트 수')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("벡터 검색 벤치마크 (로컬 백엔드)")
+    print("=" * 70)
+
+    if args.snapshot:
+        vectors = WorkforceSnapshot.load(args.snapshot).vectors
+    else:
+        vectors = synthetic_vectors(args.size, args.dimensions, clusters=64, seed=0)
+    rng = np.random.default_rng(1)
+    queries = vectors[rng.choice(len(vectors), args.queries, replace=False)]
+    print(f"\n직원 {len(vectors)}명, {vectors.shape[1]}차원, 질의 {len(queries)}개, k={args.k}")
+
+    exact_results, exact_ms = measure(ExactVectorIndex(vectors), queries, args.k)
+    print(f"\n정확 검색: {exact_ms:.2f}ms/질의")
+
+    started = time.perf_counter()
+    ivf = IVFVectorIndex(vectors)
+    print(f"IVF 생성: nlist={ivf.nlist}, {(time.perf_counter() - started):.1f}s")
+
+    for nprobe in args.nprobe:
+        ivf.nprobe = min(nprobe, ivf.nlist)
+        results, elapsed_ms = measure(ivf, queries, args.k)
+        recall = np.mean([len(found & expected) / args.k for found, expected in zip(results, exact_results)])
+        print(f"IVF nprobe={ivf.nprobe:>3}: {elapsed_ms:.2f}ms/질의, recall@{args.k}={recall:.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+직원 쌍 일별 메신저 집계 생성
+
+MessengerLogs 전체(또는 메신저 로그 JSON 파일)를 한 번 읽어 (직원 쌍, 날짜)별
+상황별 메시지 수와 응답 시간 합계를 만들고 PairDailyStats 테이블에 덮어씁니다.
+스트림 소비자(messenger_rollup Lambda)를 켜기 전 초기 적재, 스트림 재시도로 인한 중복 누적 보정,
+메시지 적재 후 등록된 회사 행사 반영에 사용합니다.
+
+사용법:
+    # MessengerLogs 테이블 전체로 재생성
+    python deployment/build_pair_daily_stats.py
+
+    # 메신저 로그 JSON 파일로 생성
+    python deployment/build_pair_daily_stats.py --input test_data/messenger_logs_anonymized.json
+
+    # 집계만 확인 (테이블에 쓰지 않음)
+    python deployment/build_pair_daily_stats.py --input test_data/messenger_logs_anonymized.json --dry-run
+"""
+
+import argparse
+import json
+import sys
+import os
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from common.pair_daily_stats import DEFAULT_TABLE_NAME, PairDailyStatsStore, rollup_messages
+
+
+def scan_all(table, **scan_kwargs):
+    """테이블 전체 스캔 (페이지네이션 처리)"""
+    response = table.scan(**scan_kwargs)
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan_kwargs)
+        items.extend(response.get('Items', []))
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description='직원 쌍 일별 메신저 집계 생성')
+    parser.add_argument('--input', help='메신저 로그 JSON 파일 (기본값: MessengerLogs 테이블 스캔)')
+    parser.add_argument('--table', default=DEFAULT_TABLE_NAME, help='집계 테이블 이름')
+    parser.add_argument('--dry-run', action='store_true', help='집계 결과만 출력')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("직원 쌍 일별 메신저 집계 생성")
+    print("=" * 70)
+
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+
+    print("\n[1단계] 메신저 로그 읽는 중...")
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            messages = json.load(f)
+    else:
+        messages = scan_all(dynamodb.Table('MessengerLogs'))
+    print(f"  ✓ 메시지 {len(messages)}건")
+
+    print("\n[2단계] 회사 행사 날짜 조회 중...")
+    try:
+        events = scan_all(dynamodb.Table('CompanyEvents'), ProjectionExpression='event_date')
+        event_dates = {str(event['event_date'])[:10] for event in events if event.get('event_date')}
+    except Exception as e:
+        if not args.dry_run:
+            raise
+        print(f"  ✗ CompanyEvents 조회 실패 (행사일 구분 없이 집계): {e}")
+        event_dates = set()
+    print(f"  ✓ 행사일 {len(event_dates)}일")
+
+    print("\n[3단계] (직원 쌍, 날짜)별 집계 중...")
+    rollups = rollup_messages(messages, event_dates)
+    pairs = {pair for pair, _ in rollups}
+    print(f"  ✓ 집계 행 {len(rollups)}개 (직원 쌍 {len(pairs)}개, 메시지 {len(messages)}건)")
+
+    if args.dry_run:
+        print("\n--dry-run: 테이블에 쓰지 않고 종료합니다.")
+        return
+
+    print(f"\n[4단계] {args.table} 테이블에 저장 중...")
+    written = PairDailyStatsStore(dynamodb, args.table).replace(rollups)
+    print(f"  ✓ {written}개 행 저장")
+
+
+if __name__ == '__main__':
+    main()
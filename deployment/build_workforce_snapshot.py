@@ -0,0 +1,99 @@
+"""
+직원 스냅샷 생성
+
+OpenSearch employee_profiles 인덱스 전체를 스크롤하여 직원 문서 주요 필드와 프로필 벡터를,
+Employees 테이블을 스캔하여 직원별 기술/프로젝트 이력 MinHash 서명을 만들고
+common.workforce_snapshot 형식(.npz)으로 저장한 뒤 선택적으로 S3에 업로드합니다.
+추천 엔진은 WORKFORCE_SNAPSHOT_URI의 스냅샷으로 OpenSearch 장애 시 로컬 벡터 인덱스와
+유사 직원(MinHash LSH) 색인을 만듭니다.
+
+사용법:
+    # 로컬 파일로 저장
+    python deployment/build_workforce_snapshot.py --output /tmp/workforce_snapshot.npz
+
+    # S3에 업로드 (추천 엔진 WORKFORCE_SNAPSHOT_URI와 같은 위치)
+    python deployment/build_workforce_snapshot.py --upload s3://<버킷>/workforce/snapshot.npz
+"""
+
+import argparse
+import sys
+import os
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from opensearchpy import helpers
+
+from common.minhash_index import build_minhash_signatures
+from common.opensearch_client import EMPLOYEE_INDEX, VECTOR_FIELD, get_opensearch_client
+from common.workforce_snapshot import SNAPSHOT_SOURCE_FIELDS, WorkforceSnapshot, parse_s3_uri
+
+
+def scroll_employee_documents(client):
+    """직원 인덱스 전체 문서 (주요 필드 + 프로필 벡터)"""
+    query = {'query': {'match_all': {}}, '_source': SNAPSHOT_SOURCE_FIELDS + [VECTOR_FIELD]}
+    for hit in helpers.scan(client, index=EMPLOYEE_INDEX, query=query, size=500):
+        yield hit['_source']
+
+
+def scan_all(table):
+    """테이블 전체 스캔 (페이지네이션 처리)"""
+    response = table.scan()
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description='직원 스냅샷 생성')
+    parser.add_argument('--endpoint', help='OpenSearch 엔드포인트 (기본값: OPENSEARCH_ENDPOINT 환경 변수)')
+    parser.add_argument('--output', default='/tmp/workforce_snapshot.npz', help='스냅샷 저장 경로')
+    parser.add_argument('--upload', help='업로드할 S3 URI (s3://버킷/키)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("직원 스냅샷 생성")
+    print("=" * 70)
+
+    print("\n[1단계] OpenSearch 직원 문서 스크롤 중...")
+    client = get_opensearch_client(endpoint=args.endpoint)
+    sources = []
+    vectors = []
+    skipped = 0
+    for document in scroll_employee_documents(client):
+        vector = document.pop(VECTOR_FIELD, None)
+        if not vector or not document.get('user_id'):
+            skipped += 1
+            continue
+        sources.append({field: document.get(field) for field in SNAPSHOT_SOURCE_FIELDS})
+        vectors.append(vector)
+    print(f"  ✓ 직원 {len(sources)}명 (벡터 없음 {skipped}건 제외)")
+
+    print("\n[2단계] Employees 스캔 및 MinHash 서명 생성 중...")
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+    minhash_user_ids, minhash_signatures = build_minhash_signatures(scan_all(dynamodb.Table('Employees')))
+    print(f"  ✓ 직원 {len(minhash_user_ids)}명 (기술 집합, 프로젝트 이력 집합)")
+
+    print("\n[3단계] 스냅샷 저장 중...")
+    WorkforceSnapshot(
+        sources,
+        vectors,
+        minhash_user_ids=minhash_user_ids,
+        minhash_signatures=minhash_signatures
+    ).save(args.output)
+    print(f"  ✓ {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+    if args.upload:
+        print("\n[4단계] S3 업로드 중...")
+        s3_location = parse_s3_uri(args.upload)
+        if not s3_location:
+            print(f"  ✗ S3 URI 형식이 아닙니다: {args.upload}")
+            sys.exit(1)
+        boto3.client('s3', region_name='us-east-2').upload_file(args.output, *s3_location)
+        print(f"  ✓ {args.upload}")
+
+
+if __name__ == '__main__':
+    main()
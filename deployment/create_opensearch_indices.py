@@ -94,13 +94,19 @@ def create_employee_profiles_index(client):
                         }
                     }
                 },
+                # k-NN 효율적 필터링(knn 절 내부 filter)용 소문자 기술 키워드
+                'skill_names': {
+                    'type': 'keyword'
+                },
+                # faiss 엔진은 knn 절 내부 필터를 지원 (nmslib은 미지원)
+                # 벡터는 단위 길이로 저장하므로 내적 = 코사인 유사도
                 'profile_vector': {
                     'type': 'knn_vector',
                     'dimension': 1536,  # Titan Embeddings 차원
                     'method': {
                         'name': 'hnsw',
-                        'space_type': 'cosinesimil',
-                        'engine': 'nmslib',
+                        'space_type': 'innerproduct',
+                        'engine': 'faiss',
                         'parameters': {
                             'ef_construction': 512,
                             'm': 16
@@ -11,6 +11,8 @@ $lambdaFunctions = @(
     "domain_analysis",
     "tech_trend_collector",
     "vector_embedding",
+    "workforce_version_updater",
+    "messenger_rollup",
     "employees_list",
     "employee_create",
     "projects_list",
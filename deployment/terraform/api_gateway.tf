@@ -39,6 +39,98 @@ resource "aws_api_gateway_integration" "recommendations_lambda" {
   uri                     = aws_lambda_function.recommendation_engine.invoke_arn
 }
 
+# /recommendations/batch resource (포트폴리오 일괄 추천)
+resource "aws_api_gateway_resource" "recommendations_batch" {
+  rest_api_id = aws_api_gateway_rest_api.hr_api.id
+  parent_id   = aws_api_gateway_resource.recommendations.id
+  path_part   = "batch"
+}
+
+resource "aws_api_gateway_method" "recommendations_batch_post" {
+  rest_api_id   = aws_api_gateway_rest_api.hr_api.id
+  resource_id   = aws_api_gateway_resource.recommendations_batch.id
+  http_method   = "POST"
+  authorization = "NONE"
+}
+
+resource "aws_api_gateway_integration" "recommendations_batch_lambda" {
+  rest_api_id             = aws_api_gateway_rest_api.hr_api.id
+  resource_id             = aws_api_gateway_resource.recommendations_batch.id
+  http_method             = aws_api_gateway_method.recommendations_batch_post.http_method
+  integration_http_method = "POST"
+  type                    = "AWS_PROXY"
+  uri                     = aws_lambda_function.recommendation_engine.invoke_arn
+}
+
+# /recommendations/rescore resource (가중치 재점수화)
+resource "aws_api_gateway_resource" "recommendations_rescore" {
+  rest_api_id = aws_api_gateway_rest_api.hr_api.id
+  parent_id   = aws_api_gateway_resource.recommendations.id
+  path_part   = "rescore"
+}
+
+resource "aws_api_gateway_method" "recommendations_rescore_post" {
+  rest_api_id   = aws_api_gateway_rest_api.hr_api.id
+  resource_id   = aws_api_gateway_resource.recommendations_rescore.id
+  http_method   = "POST"
+  authorization = "NONE"
+}
+
+resource "aws_api_gateway_integration" "recommendations_rescore_lambda" {
+  rest_api_id             = aws_api_gateway_rest_api.hr_api.id
+  resource_id             = aws_api_gateway_resource.recommendations_rescore.id
+  http_method             = aws_api_gateway_method.recommendations_rescore_post.http_method
+  integration_http_method = "POST"
+  type                    = "AWS_PROXY"
+  uri                     = aws_lambda_function.recommendation_engine.invoke_arn
+}
+
+# /recommendations/similar resource (유사 직원 검색)
+resource "aws_api_gateway_resource" "recommendations_similar" {
+  rest_api_id = aws_api_gateway_rest_api.hr_api.id
+  parent_id   = aws_api_gateway_resource.recommendations.id
+  path_part   = "similar"
+}
+
+resource "aws_api_gateway_method" "recommendations_similar_post" {
+  rest_api_id   = aws_api_gateway_rest_api.hr_api.id
+  resource_id   = aws_api_gateway_resource.recommendations_similar.id
+  http_method   = "POST"
+  authorization = "NONE"
+}
+
+resource "aws_api_gateway_integration" "recommendations_similar_lambda" {
+  rest_api_id             = aws_api_gateway_rest_api.hr_api.id
+  resource_id             = aws_api_gateway_resource.recommendations_similar.id
+  http_method             = aws_api_gateway_method.recommendations_similar_post.http_method
+  integration_http_method = "POST"
+  type                    = "AWS_PROXY"
+  uri                     = aws_lambda_function.recommendation_engine.invoke_arn
+}
+
+# /recommendations/profile resource (관리자 단계별 프로파일링 - IAM 인증으로 호출 주체 ARN 확인)
+resource "aws_api_gateway_resource" "recommendations_profile" {
+  rest_api_id = aws_api_gateway_rest_api.hr_api.id
+  parent_id   = aws_api_gateway_resource.recommendations.id
+  path_part   = "profile"
+}
+
+resource "aws_api_gateway_method" "recommendations_profile_post" {
+  rest_api_id   = aws_api_gateway_rest_api.hr_api.id
+  resource_id   = aws_api_gateway_resource.recommendations_profile.id
+  http_method   = "POST"
+  authorization = "AWS_IAM"
+}
+
+resource "aws_api_gateway_integration" "recommendations_profile_lambda" {
+  rest_api_id             = aws_api_gateway_rest_api.hr_api.id
+  resource_id             = aws_api_gateway_resource.recommendations_profile.id
+  http_method             = aws_api_gateway_method.recommendations_profile_post.http_method
+  integration_http_method = "POST"
+  type                    = "AWS_PROXY"
+  uri                     = aws_lambda_function.recommendation_engine.invoke_arn
+}
+
 resource "aws_lambda_permission" "api_gateway_recommendations" {
   statement_id  = "AllowAPIGatewayInvoke"
   action        = "lambda:InvokeFunction"
@@ -224,6 +316,18 @@ resource "aws_api_gateway_deployment" "hr_api" {
       aws_api_gateway_resource.recommendations.id,
       aws_api_gateway_method.recommendations_post.id,
       aws_api_gateway_integration.recommendations_lambda.id,
+      aws_api_gateway_resource.recommendations_batch.id,
+      aws_api_gateway_method.recommendations_batch_post.id,
+      aws_api_gateway_integration.recommendations_batch_lambda.id,
+      aws_api_gateway_resource.recommendations_rescore.id,
+      aws_api_gateway_method.recommendations_rescore_post.id,
+      aws_api_gateway_integration.recommendations_rescore_lambda.id,
+      aws_api_gateway_resource.recommendations_similar.id,
+      aws_api_gateway_method.recommendations_similar_post.id,
+      aws_api_gateway_integration.recommendations_similar_lambda.id,
+      aws_api_gateway_resource.recommendations_profile.id,
+      aws_api_gateway_method.recommendations_profile_post.id,
+      aws_api_gateway_integration.recommendations_profile_lambda.id,
     ]))
   }
   
@@ -233,6 +337,10 @@ resource "aws_api_gateway_deployment" "hr_api" {
   
   depends_on = [
     aws_api_gateway_integration.recommendations_lambda,
+    aws_api_gateway_integration.recommendations_batch_lambda,
+    aws_api_gateway_integration.recommendations_rescore_lambda,
+    aws_api_gateway_integration.recommendations_similar_lambda,
+    aws_api_gateway_integration.recommendations_profile_lambda,
     aws_api_gateway_integration.domain_analysis_lambda,
     aws_api_gateway_integration.quantitative_analysis_lambda,
     aws_api_gateway_integration.qualitative_analysis_lambda
@@ -53,6 +53,10 @@ resource "aws_dynamodb_table" "projects" {
     projection_type = "ALL"
   }
   
+  # 프로젝트 등록·수정 시 추천 후보 목록 사전 계산
+  stream_enabled   = true
+  stream_view_type = "NEW_IMAGE"
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -82,6 +86,9 @@ resource "aws_dynamodb_table" "employee_affinity" {
     projection_type = "ALL"
   }
   
+  stream_enabled   = true
+  stream_view_type = "KEYS_ONLY"
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -117,6 +124,114 @@ resource "aws_dynamodb_table" "messenger_logs" {
     projection_type = "ALL"
   }
   
+  # 직원 쌍 일별 집계 갱신용 (messenger_rollup Lambda)
+  stream_enabled   = true
+  stream_view_type = "NEW_IMAGE"
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# 직원 쌍 일별 메신저 집계 (상황별 메시지 수, 응답 시간 합계)
+resource "aws_dynamodb_table" "pair_daily_stats" {
+  name           = "PairDailyStats"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "pair_id"
+  range_key      = "day"
+  
+  attribute {
+    name = "pair_id"
+    type = "S"
+  }
+  
+  attribute {
+    name = "day"
+    type = "S"
+  }
+  
+  # 하루치 전체 쌍 조회 (친밀도 증분 갱신이 새 날짜의 행만 읽음)
+  global_secondary_index {
+    name            = "DayIndex"
+    hash_key        = "day"
+    range_key       = "pair_id"
+    projection_type = "ALL"
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# 메신저 친밀도 증분 감쇠 상태 (직원 쌍별 가중 점수, 기준 시각, 워터마크)
+resource "aws_dynamodb_table" "affinity_pair_state" {
+  name           = "AffinityPairState"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "pair_id"
+  
+  attribute {
+    name = "pair_id"
+    type = "S"
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# 친밀도 분산 작업 실행/샤드 체크포인트 (run_id별 #RUN 요약, 샤드별 진행, #LATEST 게시 포인터)
+resource "aws_dynamodb_table" "affinity_job_runs" {
+  name           = "AffinityJobRuns"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "run_id"
+  range_key      = "shard_id"
+  
+  attribute {
+    name = "run_id"
+    type = "S"
+  }
+  
+  attribute {
+    name = "shard_id"
+    type = "S"
+  }
+  
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# 직원별 상위 K 친밀도 이웃 인접 목록 (neighbor_ids / scores 병렬 리스트)
+resource "aws_dynamodb_table" "affinity_neighbors" {
+  name           = "AffinityNeighbors"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "user_id"
+  
+  attribute {
+    name = "user_id"
+    type = "S"
+  }
+  
+  stream_enabled   = true
+  stream_view_type = "KEYS_ONLY"
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -207,3 +322,111 @@ resource "aws_dynamodb_table" "employee_evaluations" {
     Environment = var.environment
   }
 }
+
+# Embedding Cache Table (Bedrock Titan 임베딩 영구 캐시)
+resource "aws_dynamodb_table" "embedding_cache" {
+  name           = "EmbeddingCache"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "cache_key"
+  
+  attribute {
+    name = "cache_key"
+    type = "S"
+  }
+  
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# EmployeeAssignments Table (직원별 프로젝트 배정 인덱스)
+resource "aws_dynamodb_table" "employee_assignments" {
+  name           = "EmployeeAssignments"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "user_id"
+  
+  attribute {
+    name = "user_id"
+    type = "S"
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Recommendation Runs Table (추천 실행 로그 - 대시보드 최근 추천)
+resource "aws_dynamodb_table" "recommendation_runs" {
+  name           = "RecommendationRuns"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "log_id"
+  
+  attribute {
+    name = "log_id"
+    type = "S"
+  }
+  
+  attribute {
+    name = "log_partition"
+    type = "S"
+  }
+  
+  attribute {
+    name = "created_at"
+    type = "N"
+  }
+  
+  global_secondary_index {
+    name            = "RecentRunsIndex"
+    hash_key        = "log_partition"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+  
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Recommendation Cache Table (추천 결과 캐시 및 인력 데이터 버전)
+resource "aws_dynamodb_table" "recommendation_cache" {
+  name           = "RecommendationCache"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "cache_key"
+  
+  attribute {
+    name = "cache_key"
+    type = "S"
+  }
+  
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
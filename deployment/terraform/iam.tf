@@ -47,7 +47,9 @@ resource "aws_iam_role_policy" "lambda_dynamodb_access" {
         Effect = "Allow"
         Action = [
           "dynamodb:GetItem",
+          "dynamodb:BatchGetItem",
           "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:UpdateItem",
           "dynamodb:DeleteItem",
           "dynamodb:Query",
@@ -176,6 +178,23 @@ resource "aws_iam_role_policy" "lambda_opensearch_access" {
   })
 }
 
+# Affinity Calculator Self-Invoke Policy (코디네이터/워커 비동기 자기 호출, AFFINITY_SHARD_COUNT > 1)
+resource "aws_iam_role_policy" "lambda_affinity_self_invoke" {
+  name = "Team2-Affinity-Self-Invoke"
+  role = aws_iam_role.lambda_execution_team2.id
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = "lambda:InvokeFunction"
+        Resource = aws_lambda_function.affinity_calculator.arn
+      }
+    ]
+  })
+}
+
 # API Gateway Execution Role
 resource "aws_iam_role" "api_gateway_execution_team2" {
   name = "APIGatewayExecutionRole-Team2"
@@ -47,11 +47,24 @@ resource "aws_lambda_function" "affinity_calculator" {
   role          = aws_iam_role.lambda_execution_team2.arn
   handler       = "index.handler"
   runtime       = "python3.11"
-  timeout       = 180
+  timeout       = 900
   memory_size   = 512
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      AFFINITY_STATE_TABLE      = aws_dynamodb_table.affinity_pair_state.name
+      PAIR_DAILY_STATS_TABLE    = aws_dynamodb_table.pair_daily_stats.name
+      AFFINITY_JOB_TABLE        = aws_dynamodb_table.affinity_job_runs.name
+      AFFINITY_SHARD_COUNT      = "8"
+      AFFINITY_WRITE_EPSILON    = "0.5"
+      AFFINITY_NEIGHBOR_TABLE   = aws_dynamodb_table.affinity_neighbors.name
+      AFFINITY_NEIGHBOR_TOP_K   = "50"
+      AFFINITY_JOB_SNAPSHOT_URI = "s3://${aws_s3_bucket.data_lake.bucket}/affinity-jobs"
+    }
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -99,6 +112,19 @@ resource "aws_lambda_function" "recommendation_engine" {
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      EMBEDDING_CACHE_TABLE       = aws_dynamodb_table.embedding_cache.name
+      EMBEDDING_CACHE_TTL_SECONDS = "2592000"
+      ASSIGNMENT_INDEX_TABLE      = aws_dynamodb_table.employee_assignments.name
+      RECOMMENDATION_CACHE_TABLE  = aws_dynamodb_table.recommendation_cache.name
+      WORKFORCE_SNAPSHOT_URI      = "s3://${aws_s3_bucket.data_lake.bucket}/workforce/snapshot.npz"
+      RECOMMENDATION_RUNS_TABLE   = aws_dynamodb_table.recommendation_runs.name
+      PROFILING_ADMIN_PRINCIPALS  = join(",", var.profiling_admin_principals)
+      AFFINITY_NEIGHBOR_TABLE     = aws_dynamodb_table.affinity_neighbors.name
+    }
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -107,6 +133,29 @@ resource "aws_lambda_function" "recommendation_engine" {
   }
 }
 
+# 추천 요청 프로파일링(POST /recommendations/profile, IAM 인증)을 허용하는 IAM 주체 ARN
+variable "profiling_admin_principals" {
+  description = "IAM principal ARNs allowed to request recommendation profiling"
+  type        = list(string)
+  default     = []
+}
+
+# 프로젝트 등록·수정 시 추천 후보 목록 사전 계산
+resource "aws_lambda_event_source_mapping" "projects_shortlist_stream" {
+  event_source_arn  = aws_dynamodb_table.projects.stream_arn
+  function_name     = aws_lambda_function.recommendation_engine.arn
+  starting_position = "LATEST"
+  batch_size        = 10
+  
+  filter_criteria {
+    filter {
+      pattern = jsonencode({
+        eventName = ["INSERT", "MODIFY"]
+      })
+    }
+  }
+}
+
 # Domain Analysis Engine Lambda
 resource "aws_lambda_function" "domain_analysis" {
   filename      = "../../lambda_functions/domain_analysis.zip"
@@ -241,6 +290,91 @@ resource "aws_lambda_event_source_mapping" "employees_stream" {
   starting_position = "LATEST"
 }
 
+# Workforce Version Updater Lambda (추천 캐시 무효화)
+resource "aws_lambda_function" "workforce_version_updater" {
+  filename      = "../../lambda_functions/workforce_version_updater.zip"
+  function_name = "WorkforceVersionUpdater"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.handler"
+  runtime       = "python3.11"
+  timeout       = 30
+  memory_size   = 128
+  
+  layers = [aws_lambda_layer_version.boto3_layer.arn]
+  
+  environment {
+    variables = {
+      RECOMMENDATION_CACHE_TABLE = aws_dynamodb_table.recommendation_cache.name
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+resource "aws_lambda_event_source_mapping" "employees_version_stream" {
+  event_source_arn                   = aws_dynamodb_table.employees.stream_arn
+  function_name                      = aws_lambda_function.workforce_version_updater.arn
+  starting_position                  = "LATEST"
+  batch_size                         = 100
+  maximum_batching_window_in_seconds = 5
+}
+
+resource "aws_lambda_event_source_mapping" "affinity_version_stream" {
+  event_source_arn                   = aws_dynamodb_table.employee_affinity.stream_arn
+  function_name                      = aws_lambda_function.workforce_version_updater.arn
+  starting_position                  = "LATEST"
+  batch_size                         = 1000
+  maximum_batching_window_in_seconds = 10
+}
+
+resource "aws_lambda_event_source_mapping" "affinity_neighbors_version_stream" {
+  event_source_arn                   = aws_dynamodb_table.affinity_neighbors.stream_arn
+  function_name                      = aws_lambda_function.workforce_version_updater.arn
+  starting_position                  = "LATEST"
+  batch_size                         = 1000
+  maximum_batching_window_in_seconds = 10
+}
+
+# Messenger Rollup Lambda (직원 쌍 일별 메신저 집계)
+resource "aws_lambda_function" "messenger_rollup" {
+  filename      = "../../lambda_functions/messenger_rollup.zip"
+  function_name = "MessengerRollup"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.handler"
+  runtime       = "python3.11"
+  timeout       = 60
+  memory_size   = 256
+  
+  layers = [aws_lambda_layer_version.boto3_layer.arn]
+  
+  environment {
+    variables = {
+      PAIR_DAILY_STATS_TABLE = aws_dynamodb_table.pair_daily_stats.name
+      COMPANY_EVENTS_TABLE   = aws_dynamodb_table.company_events.name
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+resource "aws_lambda_event_source_mapping" "messenger_rollup_stream" {
+  event_source_arn                   = aws_dynamodb_table.messenger_logs.stream_arn
+  function_name                      = aws_lambda_function.messenger_rollup.arn
+  starting_position                  = "LATEST"
+  batch_size                         = 1000
+  maximum_batching_window_in_seconds = 10
+}
+
 # Variable for external API key
 variable "external_api_key" {
   description = "External API key for tech trend collection"
@@ -356,9 +490,10 @@ resource "aws_lambda_function" "dashboard_metrics" {
   
   environment {
     variables = {
-      EMPLOYEES_TABLE   = aws_dynamodb_table.employees.name
-      PROJECTS_TABLE    = aws_dynamodb_table.projects.name
-      EVALUATIONS_TABLE = "EmployeeEvaluations"
+      EMPLOYEES_TABLE           = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE            = aws_dynamodb_table.projects.name
+      EVALUATIONS_TABLE         = "EmployeeEvaluations"
+      RECOMMENDATION_RUNS_TABLE = aws_dynamodb_table.recommendation_runs.name
     }
   }
   
@@ -384,8 +519,9 @@ resource "aws_lambda_function" "project_assign" {
   
   environment {
     variables = {
-      EMPLOYEES_TABLE = aws_dynamodb_table.employees.name
-      PROJECTS_TABLE  = aws_dynamodb_table.projects.name
+      EMPLOYEES_TABLE        = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE         = aws_dynamodb_table.projects.name
+      ASSIGNMENT_INDEX_TABLE = aws_dynamodb_table.employee_assignments.name
     }
   }
   
@@ -181,4 +181,18 @@ resource "aws_s3_bucket_lifecycle_configuration" "data_lake" {
       storage_class = "GLACIER"
     }
   }
+  
+  # 친밀도 분산 작업 실행별 샤드 입력 (워커 완료 후 불필요)
+  rule {
+    id     = "ExpireAffinityJobRuns"
+    status = "Enabled"
+    
+    filter {
+      prefix = "affinity-jobs/runs/"
+    }
+    
+    expiration {
+      days = 7
+    }
+  }
 }
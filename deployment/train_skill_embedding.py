@@ -0,0 +1,109 @@
+"""
+로컬 기술 임베딩 학습
+
+직원 보유 기술과 프로젝트 기술 스택·요구 기술의 동시 출현 행렬로 PPMI + 절단 SVD 기술 임베딩을 학습하여
+common/data/skill_embedding.npz 아티팩트로 저장합니다. 아티팩트는 common 레이어와 함께 배포됩니다.
+
+사용법:
+    # DynamoDB Employees/Projects 테이블에서 학습
+    python deployment/train_skill_embedding.py
+
+    # JSON 파일에서 학습 (예: 테스트 데이터)
+    python deployment/train_skill_embedding.py \\
+        --employees test_data/employees_extended.json --projects test_data/projects_data.json
+"""
+
+import argparse
+import json
+import sys
+import os
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from common.skill_embedding import (
+    DEFAULT_ARTIFACT_PATH,
+    DEFAULT_DIMENSIONS,
+    SkillEmbedding,
+    train_skill_embedding
+)
+
+
+def scan_all(table):
+    """테이블 전체 스캔 (페이지네이션 처리)"""
+    response = table.scan()
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+    return items
+
+
+def load_json_items(path):
+    """JSON 파일에서 항목 목록 로드 (리스트 또는 {키: 리스트} 형식)"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = next((value for value in data.values() if isinstance(value, list)), [])
+    return data
+
+
+def employee_skill_set(employee):
+    """직원 보유 기술 집합"""
+    return [
+        skill.get('name', '') for skill in employee.get('skills', [])
+        if isinstance(skill, dict) and skill.get('name')
+    ]
+
+
+def project_skill_set(project):
+    """프로젝트 기술 스택 + 요구 기술 집합"""
+    skills = []
+    tech_stack = project.get('tech_stack') or {}
+    if isinstance(tech_stack, dict):
+        for values in tech_stack.values():
+            if isinstance(values, list):
+                skills.extend(str(value) for value in values)
+    requirements = project.get('requirements') or []
+    if isinstance(requirements, list):
+        skills.extend(str(value) for value in requirements)
+    return skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 기술 임베딩 학습')
+    parser.add_argument('--employees', help='직원 JSON 파일 (없으면 DynamoDB Employees 스캔)')
+    parser.add_argument('--projects', help='프로젝트 JSON 파일 (없으면 DynamoDB Projects 스캔)')
+    parser.add_argument('--dimensions', type=int, default=DEFAULT_DIMENSIONS, help='임베딩 차원')
+    parser.add_argument('--min-count', type=int, default=1, help='어휘에 포함할 최소 출현 수')
+    parser.add_argument('--output', default=DEFAULT_ARTIFACT_PATH, help='아티팩트 저장 경로')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("로컬 기술 임베딩 학습")
+    print("=" * 70)
+
+    dynamodb = None
+    if not (args.employees and args.projects):
+        dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+
+    print("\n[1단계] 기술 집합 수집 중...")
+    employees = load_json_items(args.employees) if args.employees else scan_all(dynamodb.Table('Employees'))
+    projects = load_json_items(args.projects) if args.projects else scan_all(dynamodb.Table('Projects'))
+
+    skill_sets = [employee_skill_set(employee) for employee in employees]
+    skill_sets += [project_skill_set(project) for project in projects]
+    skill_sets = [skill_set for skill_set in skill_sets if skill_set]
+    print(f"  ✓ 직원 {len(employees)}명, 프로젝트 {len(projects)}개 → 기술 집합 {len(skill_sets)}개")
+
+    print("\n[2단계] PPMI + SVD 학습 중...")
+    vocab, vectors = train_skill_embedding(skill_sets, dimensions=args.dimensions, min_count=args.min_count)
+    print(f"  ✓ 어휘 {len(vocab)}개, {vectors.shape[1]}차원")
+
+    print("\n[3단계] 아티팩트 저장 중...")
+    SkillEmbedding(vocab, vectors).save(args.output)
+    print(f"  ✓ {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+친밀도 점수 변경분 저장 모듈
+
+매일 실행에서 모든 후보 쌍의 친밀도 문서를 다시 쓰면 점수가 0.01만 바뀌어도 쓰기 용량을 쓰고
+EmployeeAffinity 스트림 구독자(workforce_version_updater 등)를 모두 깨웁니다.
+쌍을 청크 단위로 모아 이전 점수(종합 + 항목별)만 BatchGetItem으로 읽어 비교하고,
+어느 점수든 WRITE_EPSILON보다 크게 바뀐 쌍과 새 쌍만 batch_writer로 저장합니다.
+
+- 비교 점수: overall_affinity_score, 협업/커뮤니케이션/행사/개인 점수
+- 허용 오차: AFFINITY_WRITE_EPSILON 환경 변수 (기본값: 0.5점, 0이면 모든 변경을 저장)
+- 청크 단위 읽기라서 샤드 워커도 자기 샤드의 쌍만 읽습니다 (테이블 전체 스캔 없음).
+- 이전 실행에는 있었지만 이번 후보 쌍에서 빠진 쌍은 remove()로 행을 삭제합니다
+  (조회 시 행이 없으면 0점 - 마지막 점수가 남지 않도록).
+"""
+
+import json
+import os
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from common.models import Affinity
+
+
+# 점수 변경 허용 오차 (0~100점 척도)
+WRITE_EPSILON = float(os.environ.get('AFFINITY_WRITE_EPSILON', '0.5'))
+
+# BatchGetItem 최대 키 수
+BATCH_GET_SIZE = 100
+
+# 비교하는 점수 속성 경로
+SCORE_PATHS = (
+    ('overall_affinity_score',),
+    ('project_collaboration', 'collaboration_score'),
+    ('messenger_communication', 'communication_score'),
+    ('company_events', 'social_score'),
+    ('personal_closeness', 'personal_score')
+)
+
+ScoreVector = Tuple[float, ...]
+
+
+def score_vector(item: Dict[str, Any]) -> ScoreVector:
+    """친밀도 항목(dict)의 점수 벡터 (없는 점수는 0)"""
+    scores = []
+    for path in SCORE_PATHS:
+        value: Any = item
+        for name in path:
+            value = value.get(name) if isinstance(value, dict) else None
+        scores.append(float(value or 0))
+    return tuple(scores)
+
+
+def scores_changed(previous: Optional[ScoreVector], current: ScoreVector, epsilon: float = WRITE_EPSILON) -> bool:
+    """이전 점수가 없거나 어느 점수든 epsilon보다 크게 바뀌었는지"""
+    if previous is None:
+        return True
+    return any(abs(new - old) > epsilon for old, new in zip(previous, current))
+
+
+def score_projection() -> Dict[str, Any]:
+    """점수 속성만 읽는 ProjectionExpression (중첩 경로)"""
+    names: Dict[str, str] = {'#id': 'affinity_id'}
+    expressions = ['#id']
+    for path in SCORE_PATHS:
+        aliases = []
+        for name in path:
+            alias = f"#s{len(names)}"
+            names[alias] = name
+            aliases.append(alias)
+        expressions.append('.'.join(aliases))
+    return {'ProjectionExpression': ', '.join(expressions), 'ExpressionAttributeNames': names}
+
+
+def affinity_id_of(pair: Tuple[str, str]) -> str:
+    """직원 쌍의 친밀도 ID (calculate_affinity_score와 같은 형식)"""
+    return f"AFF_{pair[0]}_{pair[1]}"
+
+
+def to_item(affinity: Affinity) -> Dict[str, Any]:
+    """친밀도 객체 → DynamoDB 항목 (float → Decimal)"""
+    return json.loads(json.dumps(affinity.to_dynamodb()), parse_float=Decimal)
+
+
+class DeltaAffinityWriter:
+    """
+    점수가 바뀐 쌍만 저장하는 친밀도 쓰기 버퍼
+
+    with DeltaAffinityWriter(table) as writer:
+        writer.add(affinity)
+
+    add()는 청크가 차면 flush()하고, with 블록을 정상 종료하면 남은 쌍을 flush()합니다.
+    체크포인트 전에는 flush()를 호출하여 체크포인트 이전 쌍이 모두 반영되도록 해야 합니다.
+    """
+
+    def __init__(self, table, epsilon: float = WRITE_EPSILON, chunk_size: int = BATCH_GET_SIZE):
+        """
+        Args:
+            table: EmployeeAffinity boto3 Table
+            epsilon: 점수 변경 허용 오차
+            chunk_size: 이전 점수 조회 청크 크기 (최대 100)
+        """
+        self.table = table
+        self.epsilon = epsilon
+        self.chunk_size = min(chunk_size, BATCH_GET_SIZE)
+        self.pending: List[Affinity] = []
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def __enter__(self) -> 'DeltaAffinityWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """저장/건너뜀/삭제 쌍 수"""
+        return {'written_pairs': self.written, 'unchanged_pairs': self.unchanged, 'removed_pairs': self.removed}
+
+    def add(self, affinity: Affinity) -> None:
+        """쌍 추가 (청크가 차면 비교 후 저장)"""
+        self.pending.append(affinity)
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """대기 중인 쌍의 이전 점수를 읽어 비교하고 바뀐 쌍만 저장"""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+
+        previous = self.load_scores([affinity.affinity_id for affinity in pending])
+        changed = [
+            affinity for affinity in pending
+            if scores_changed(previous.get(affinity.affinity_id), score_vector(affinity.to_dynamodb()), self.epsilon)
+        ]
+
+        if changed:
+            with self.table.batch_writer() as batch:
+                for affinity in changed:
+                    batch.put_item(Item=to_item(affinity))
+
+        self.written += len(changed)
+        self.unchanged += len(pending) - len(changed)
+
+    def remove(self, affinity_ids: Iterable[str]) -> None:
+        """후보에서 빠진 쌍의 행 삭제 (batch_writer, 없는 행 삭제는 무시되므로 재실행 안전)"""
+        affinity_ids = list(dict.fromkeys(affinity_ids))
+        if not affinity_ids:
+            return
+        with self.table.batch_writer() as batch:
+            for affinity_id in affinity_ids:
+                batch.delete_item(Key={'affinity_id': affinity_id})
+        self.removed += len(affinity_ids)
+
+    def load_scores(self, affinity_ids: List[str]) -> Dict[str, ScoreVector]:
+        """친밀도 ID들의 이전 점수 벡터 (BatchGetItem, 미처리 키 재요청)"""
+        scores: Dict[str, ScoreVector] = {}
+        request = {
+            self.table.name: {
+                'Keys': [{'affinity_id': affinity_id} for affinity_id in dict.fromkeys(affinity_ids)],
+                **score_projection()
+            }
+        }
+        while request:
+            response = self.table.meta.client.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(self.table.name, []):
+                scores[item['affinity_id']] = score_vector(item)
+            request = response.get('UnprocessedKeys') or None
+        return scores
@@ -0,0 +1,136 @@
+"""
+친밀도 후보 쌍 생성 모듈
+
+모든 직원 쌍(O(n²))을 계산하는 대신 상호작용 근거가 있는 쌍만 역색인으로 생성합니다.
+
+- 프로젝트 → 참여 직원 (work_experience / project_history)
+- 회사 행사 → 참여 직원 (CompanyEvents.participants)
+- 메신저 대화 쌍 (MessengerLogs 쌍별 집계 키)
+
+근거가 없는 쌍은 친밀도 행을 저장하지 않으며 조회 측에서 0으로 취급합니다.
+참여 인원이 MAX_GROUP_SIZE를 넘는 그룹(전사 행사 등)은 그 자체로는 후보 쌍을 만들지 않습니다.
+"""
+
+import os
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 후보 쌍을 생성하는 최대 그룹 인원 (이보다 큰 그룹은 다른 근거가 있는 쌍에서만 반영)
+MAX_GROUP_SIZE = int(os.environ.get('AFFINITY_MAX_GROUP_SIZE', '50'))
+
+# 근거 종류
+PROJECT_EVIDENCE = 'project'
+EVENT_EVIDENCE = 'event'
+MESSAGE_EVIDENCE = 'message'
+
+Pair = Tuple[str, str]
+
+
+def get_project_history(employee: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """프로젝트 이력 추출 (work_experience 우선)"""
+    return (
+        employee.get('work_experience') or
+        employee.get('projectHistory') or
+        employee.get('project_history') or
+        []
+    )
+
+
+def project_key(project: Dict[str, Any]) -> Optional[str]:
+    """프로젝트 식별자 (프로젝트 이름, 없으면 ID)"""
+    return project.get('project_name') or project.get('project_id') or None
+
+
+def build_project_members(employees: Dict[str, Dict[str, Any]]) -> Dict[str, Set[str]]:
+    """
+    프로젝트 → 참여 직원 역색인
+
+    Args:
+        employees: {직원 ID: 직원 데이터}
+
+    Returns:
+        dict: {프로젝트 식별자: 직원 ID 집합}
+    """
+    members: Dict[str, Set[str]] = {}
+    for employee_id, employee in employees.items():
+        for project in get_project_history(employee):
+            if not isinstance(project, dict):
+                continue
+            key = project_key(project)
+            if key:
+                members.setdefault(key, set()).add(employee_id)
+    return members
+
+
+def build_event_participants(events: Iterable[Dict[str, Any]]) -> Dict[str, Set[str]]:
+    """
+    회사 행사 → 참여 직원 역색인
+
+    Args:
+        events: CompanyEvents 항목 (event_id, participants)
+
+    Returns:
+        dict: {행사 ID: 직원 ID 집합}
+    """
+    return {
+        event['event_id']: set(event.get('participants') or [])
+        for event in events if event.get('event_id')
+    }
+
+
+def pairs_from_groups(groups: Iterable[Set[str]], max_group_size: int = MAX_GROUP_SIZE) -> Set[Pair]:
+    """
+    그룹 내 직원 쌍 (ID 오름차순, 인원이 max_group_size를 넘는 그룹 제외)
+
+    Args:
+        groups: 직원 ID 집합 목록
+        max_group_size: 최대 그룹 인원
+
+    Returns:
+        set: 표준 직원 쌍 집합
+    """
+    pairs: Set[Pair] = set()
+    for group in groups:
+        if len(group) < 2 or len(group) > max_group_size:
+            continue
+        pairs.update(combinations(sorted(group), 2))
+    return pairs
+
+
+def generate_candidate_pairs(
+    employee_ids: Iterable[str],
+    project_members: Dict[str, Set[str]],
+    event_participants: Dict[str, Set[str]],
+    message_pairs: Iterable[Pair],
+    max_group_size: int = MAX_GROUP_SIZE
+) -> Tuple[Set[Pair], Dict[str, int]]:
+    """
+    상호작용 근거가 있는 후보 쌍 생성
+
+    Args:
+        employee_ids: Employees에 있는 직원 ID (이 밖의 ID가 포함된 쌍은 제외)
+        project_members: 프로젝트 → 참여 직원
+        event_participants: 행사 → 참여 직원
+        message_pairs: 메시지를 주고받은 표준 쌍
+        max_group_size: 후보 쌍을 만드는 최대 그룹 인원
+
+    Returns:
+        tuple: (후보 쌍 집합, 근거 종류별 쌍 수)
+    """
+    known = set(employee_ids)
+
+    def known_pairs(pairs: Iterable[Pair]) -> Set[Pair]:
+        return {pair for pair in pairs if pair[0] in known and pair[1] in known}
+
+    by_evidence = {
+        PROJECT_EVIDENCE: known_pairs(pairs_from_groups(project_members.values(), max_group_size)),
+        EVENT_EVIDENCE: known_pairs(pairs_from_groups(event_participants.values(), max_group_size)),
+        MESSAGE_EVIDENCE: known_pairs(tuple(sorted(pair)) for pair in message_pairs)
+    }
+
+    candidates: Set[Pair] = set()
+    for pairs in by_evidence.values():
+        candidates |= pairs
+
+    return candidates, {evidence: len(pairs) for evidence, pairs in by_evidence.items()}
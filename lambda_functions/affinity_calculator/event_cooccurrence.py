@@ -0,0 +1,177 @@
+"""
+회사 행사 공동 참여 모듈
+
+직원 × 행사 희소 참여 행렬 A (A[i, e] = 1: 직원 i가 행사 e에 참여)로 모든 직원 쌍의
+공동 참여 행사 수 C = A·Aᵀ를 한 번에 계산합니다. 쌍마다 참여 행사 집합을 교집합하는 대신
+행사별 참여자 외적(a_e·a_eᵀ)을 누적하는 희소 곱(outer-product SpGEMM)이며,
+같은 쌍의 외적 항목을 정렬해 묶으면 공동 참여 행사 ID 목록도 함께 얻습니다.
+
+행(직원)마다 공동 참여 수가 min_shared 이상인 상위 top_k 쌍만 남기고
+(두 직원 중 한쪽의 상위 K에 들면 유지), 그 결과가 CompanyEvents.shared_events/social_score가 됩니다.
+
+- 계산량: Σ 행사 참여자 수² (직원 수²가 아님)
+- NumPy가 없는 레이어에서는 행사별 참여자 조합을 파이썬으로 누적합니다.
+"""
+
+import os
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없는 레이어에서는 파이썬 누적 사용
+    np = None
+
+
+# 직원별로 유지할 공동 참여 상위 쌍 수
+EVENT_TOP_K = int(os.environ.get('AFFINITY_EVENT_TOP_K', '50'))
+
+# 공동 참여로 인정할 최소 행사 수
+MIN_SHARED_EVENTS = 1
+
+Pair = Tuple[str, str]
+
+
+def build_incidence(events: Iterable[Dict[str, Any]]):
+    """
+    희소 참여 행렬 A의 좌표 목록 (행사 순으로 정렬된 COO)
+
+    Args:
+        events: CompanyEvents 항목 (event_id, participants)
+
+    Returns:
+        tuple: (직원 ID 목록 - 정렬, 행사 ID 목록, 직원 행 인덱스 목록, 행사 열 인덱스 목록)
+    """
+    memberships = []
+    for event in events:
+        event_id = event.get('event_id')
+        participants = sorted({participant for participant in event.get('participants') or [] if participant})
+        if event_id and len(participants) > 1:
+            memberships.append((str(event_id), participants))
+
+    employee_ids = sorted({participant for _, participants in memberships for participant in participants})
+    row_of = {employee_id: row for row, employee_id in enumerate(employee_ids)}
+    event_ids = [event_id for event_id, _ in memberships]
+    rows = [row_of[participant] for _, participants in memberships for participant in participants]
+    cols = [col for col, (_, participants) in enumerate(memberships) for _ in participants]
+    return employee_ids, event_ids, rows, cols
+
+
+def cooccurrence_entries(rows, cols):
+    """
+    A·Aᵀ 상삼각 외적 항목 (행사별 참여자 쌍)
+
+    행사 순으로 정렬된 좌표에서 같은 행사 안의 뒤쪽 참여자와 짝을 지어
+    (낮은 행, 높은 행, 행사) 배열을 만듭니다. 행사 안에서 행 인덱스가 오름차순이므로 낮은 행이 먼저 옵니다.
+
+    Returns:
+        tuple: (낮은 행 배열, 높은 행 배열, 행사 열 배열)
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    positions = np.arange(len(cols))
+    group_ends = np.searchsorted(cols, cols, side='right')
+    partners = group_ends - positions - 1
+
+    left = np.repeat(positions, partners)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(partners) - partners, partners)
+    right = left + 1 + offsets
+    return rows[left], rows[right], cols[left]
+
+
+def top_k_mask(low, high, counts, top_k: int):
+    """
+    행마다 공동 참여 수 상위 top_k에 드는 쌍 (대칭: 두 행 중 한쪽이라도 상위면 유지)
+
+    Args:
+        low, high: 쌍의 행 인덱스 배열
+        counts: 쌍의 공동 참여 수 배열
+        top_k: 행별 유지 수
+
+    Returns:
+        ndarray: 쌍별 유지 여부 (bool)
+    """
+    pair_count = len(counts)
+    row = np.concatenate([low, high])
+    other = np.concatenate([high, low])
+    score = np.concatenate([counts, counts])
+    pair = np.concatenate([np.arange(pair_count), np.arange(pair_count)])
+
+    # 행 오름차순, 공동 참여 수 내림차순, 상대 행 오름차순 (동점은 ID 순)
+    order = np.lexsort((other, -score, row))
+    sorted_rows = row[order]
+    row_starts = np.searchsorted(sorted_rows, sorted_rows, side='left')
+    ranks = np.arange(len(order)) - row_starts
+
+    keep = np.zeros(pair_count, dtype=bool)
+    keep[pair[order[ranks < top_k]]] = True
+    return keep
+
+
+def compute_shared_events(
+    events: Iterable[Dict[str, Any]],
+    top_k: int = EVENT_TOP_K,
+    min_shared: int = MIN_SHARED_EVENTS
+) -> Dict[Pair, List[str]]:
+    """
+    직원 쌍별 공동 참여 행사 (A·Aᵀ 임계값 + 행별 상위 K)
+
+    Args:
+        events: CompanyEvents 항목 (event_id, participants)
+        top_k: 직원별 유지할 상위 쌍 수
+        min_shared: 최소 공동 참여 행사 수
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): [공동 참여 행사 ID]} - 행사 ID는 입력 순서
+    """
+    employee_ids, event_ids, rows, cols = build_incidence(events)
+    if not event_ids:
+        return {}
+    if np is None:
+        return _compute_shared_events_python(employee_ids, event_ids, rows, cols, top_k, min_shared)
+
+    low, high, event_cols = cooccurrence_entries(rows, cols)
+    employee_count = len(employee_ids)
+    pair_codes = low * employee_count + high
+
+    # 같은 쌍의 외적 항목을 묶어 C[i, j]와 행사 목록을 얻음 (쌍 안에서는 행사 순 유지)
+    order = np.argsort(pair_codes, kind='stable')
+    unique_codes, starts, counts = np.unique(pair_codes[order], return_index=True, return_counts=True)
+    event_cols = event_cols[order]
+
+    keep = counts >= min_shared
+    pair_low = unique_codes // employee_count
+    pair_high = unique_codes % employee_count
+    keep[keep] = top_k_mask(pair_low[keep], pair_high[keep], counts[keep], top_k)
+
+    shared: Dict[Pair, List[str]] = {}
+    for index in np.flatnonzero(keep).tolist():
+        start = starts[index]
+        shared[(employee_ids[pair_low[index]], employee_ids[pair_high[index]])] = [
+            event_ids[col] for col in event_cols[start:start + counts[index]].tolist()
+        ]
+    return shared
+
+
+def _compute_shared_events_python(employee_ids, event_ids, rows, cols, top_k, min_shared):
+    """compute_shared_events()의 NumPy 없는 경로 (행사별 참여자 조합 누적)"""
+    participants: Dict[int, List[int]] = {}
+    for row, col in zip(rows, cols):
+        participants.setdefault(col, []).append(row)
+
+    shared_cols: Dict[Tuple[int, int], List[int]] = {}
+    for col in sorted(participants):
+        for low, high in combinations(participants[col], 2):
+            shared_cols.setdefault((low, high), []).append(col)
+
+    candidates = {pair: cols for pair, cols in shared_cols.items() if len(cols) >= min_shared}
+    by_row: Dict[int, List[Tuple[int, int, Tuple[int, int]]]] = {}
+    for (low, high), pair_cols in candidates.items():
+        by_row.setdefault(low, []).append((-len(pair_cols), high, (low, high)))
+        by_row.setdefault(high, []).append((-len(pair_cols), low, (low, high)))
+    kept = {entry[2] for entries in by_row.values() for entry in sorted(entries)[:top_k]}
+
+    return {
+        (employee_ids[low], employee_ids[high]): [event_ids[col] for col in candidates[(low, high)]]
+        for low, high in sorted(kept)
+    }
@@ -7,15 +7,65 @@ Requirements: 2-1.1, 2-1.2, 2-1.3, 2-1.4, 2-1.5, 2-1.6, 2-1.7
 
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Tuple
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Set, Tuple
+from common.affinity_neighbors import AffinityNeighborStore, TopKNeighbors
 from common.dynamodb_client import DynamoDBClient
+from common.pair_daily_stats import DEFAULT_TABLE_NAME as PAIR_DAILY_STATS_DEFAULT_TABLE, PairDailyStatsStore
 from common.repositories import AffinityRepository, EmployeeRepository
 from common.models import (
     Affinity, EmployeePair, ProjectCollaboration, SharedProject,
     MessengerCommunication, CompanyEvents, PersonalCloseness
 )
 
+try:
+    from affinity_writes import DeltaAffinityWriter, affinity_id_of
+    from candidate_pairs import (
+        build_event_participants, build_project_members, generate_candidate_pairs
+    )
+    from event_cooccurrence import compute_shared_events
+    from project_overlap import compute_project_overlaps, overlap_months, parse_period
+    from messenger_aggregation import (
+        PairMessageStats, aggregate_messenger_logs, canonical_pair, event_dates_of,
+        iter_scan, projection_kwargs
+    )
+    from pair_state import DecayedPairStats, PairStateStore, update_pair_states
+    from shard_inputs import (
+        KNOWN_ROWS_OBJECT, JobSnapshotStore, ShardSlice, build_shard_slice, neighbors_object_name,
+        parse_shard_slice, run_object_name, shard_object_name
+    )
+    from sharded_job import (
+        DEFAULT_SHARD_COUNT, DEFAULT_TABLE_NAME as AFFINITY_JOB_TABLE, WORKER_MODE, WORKER_TIME_MARGIN_MS,
+        JobCheckpointStore, LambdaInvokeRunner, STATUS_DONE, new_job_run_id, pair_key, run_shard, shard_of,
+        shard_of_key
+    )
+except ImportError:
+    from lambda_functions.affinity_calculator.affinity_writes import DeltaAffinityWriter, affinity_id_of
+    from lambda_functions.affinity_calculator.candidate_pairs import (
+        build_event_participants, build_project_members, generate_candidate_pairs
+    )
+    from lambda_functions.affinity_calculator.event_cooccurrence import compute_shared_events
+    from lambda_functions.affinity_calculator.project_overlap import (
+        compute_project_overlaps, overlap_months, parse_period
+    )
+    from lambda_functions.affinity_calculator.messenger_aggregation import (
+        PairMessageStats, aggregate_messenger_logs, canonical_pair, event_dates_of,
+        iter_scan, projection_kwargs
+    )
+    from lambda_functions.affinity_calculator.pair_state import (
+        DecayedPairStats, PairStateStore, update_pair_states
+    )
+    from lambda_functions.affinity_calculator.shard_inputs import (
+        KNOWN_ROWS_OBJECT, JobSnapshotStore, ShardSlice, build_shard_slice, neighbors_object_name,
+        parse_shard_slice, run_object_name, shard_object_name
+    )
+    from lambda_functions.affinity_calculator.sharded_job import (
+        DEFAULT_SHARD_COUNT, DEFAULT_TABLE_NAME as AFFINITY_JOB_TABLE, WORKER_MODE, WORKER_TIME_MARGIN_MS,
+        JobCheckpointStore, LambdaInvokeRunner, STATUS_DONE, new_job_run_id, pair_key, run_shard, shard_of,
+        shard_of_key
+    )
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -25,6 +75,27 @@ dynamodb_client = DynamoDBClient()
 affinity_repo = AffinityRepository(dynamodb_client)
 employee_repo = EmployeeRepository(dynamodb_client)
 
+# 메신저 친밀도 증분 감쇠 상태 테이블
+AFFINITY_STATE_TABLE = os.environ.get('AFFINITY_STATE_TABLE', 'AffinityPairState')
+PAIR_DAILY_STATS_TABLE = os.environ.get('PAIR_DAILY_STATS_TABLE', PAIR_DAILY_STATS_DEFAULT_TABLE)
+
+# 분산 작업 워커 실행기 (None이면 이 함수를 비동기 자기 호출)
+job_runner = None
+
+# 분산 작업 입력 스냅샷 저장소 (None이면 AFFINITY_JOB_SNAPSHOT_URI)
+snapshot_store = None
+
+
+class AffinityInputs(NamedTuple):
+    """친밀도 계산 입력 (실행당 1회 집계)"""
+    employees: Dict[str, Dict[str, Any]]
+    message_stats: Mapping[Tuple[str, str], PairMessageStats]
+    message_update: Optional[Dict[str, Any]]
+    shared_events: Dict[Tuple[str, str], List[str]]
+    project_overlaps: Dict[Tuple[str, str], Dict[str, int]]
+    candidate_pairs: Set[Tuple[str, str]]
+    evidence_counts: Dict[str, int]
+
 
 def handler(event, context):
     """
@@ -32,6 +103,10 @@ def handler(event, context):
     
     Requirements: 2-1.7 - 일일 친밀도 점수 계산
     
+    샤드 수(AFFINITY_SHARD_COUNT 또는 이벤트 shard_count)가 1이면 한 번의 호출에서 모든 후보 쌍을 처리하고,
+    2 이상이면 코디네이터로 동작하여 샤드별 워커를 비동기 호출합니다.
+    {"mode": "worker", ...} 이벤트는 워커 호출입니다 (sharded_job 참고).
+    
     Args:
         event: EventBridge 이벤트
         context: Lambda 컨텍스트
@@ -39,36 +114,57 @@ def handler(event, context):
     Returns:
         dict: 처리 결과
     """
+    event = event or {}
+    
+    # 워커 실패는 예외를 전파하여 Lambda 비동기 재시도가 체크포인트부터 이어서 처리하도록 함
+    if event.get('mode') == WORKER_MODE:
+        return run_affinity_worker(event, context)
+    
     try:
-        logger.info("친밀도 점수 계산 시작")
+        full_rebuild = bool(event.get('full_rebuild', False))
+        shard_count = int(event.get('shard_count') or DEFAULT_SHARD_COUNT)
+        if shard_count > 1:
+            return run_affinity_coordinator(shard_count, full_rebuild)
         
-        # 모든 직원 조회
-        employees = get_all_employees()
-        logger.info(f"총 {len(employees)} 명의 직원 조회")
+        logger.info("친밀도 점수 계산 시작")
+        inputs = load_affinity_inputs(full_rebuild=full_rebuild)
         
-        # 직원 쌍 생성 및 친밀도 점수 계산
+        # 친밀도 점수 계산 및 저장 (근거 없는 쌍은 행을 저장하지 않음 - 조회 시 0)
+        # 이전 점수에서 허용 오차 이상 바뀐 쌍과 새 쌍만 저장, 후보에서 빠진 이전 쌍은 삭제
         processed_pairs = 0
-        
-        for i in range(len(employees)):
-            for j in range(i + 1, len(employees)):
-                employee_1 = employees[i]
-                employee_2 = employees[j]
-                
-                # 친밀도 점수 계산
-                affinity = calculate_affinity_score(employee_1, employee_2)
-                
-                # DynamoDB에 저장
-                affinity_repo.create(affinity)
-                
+        neighbors = TopKNeighbors()
+        current_rows = {affinity_id_of(pair) for pair in inputs.candidate_pairs}
+        departed_rows = track_departed_rows(current_rows)
+        
+        # 이번 실행에 갱신하지 않은 쌍의 메신저 상태는 점수 계산 전에 한 번에 조회
+        inputs.message_stats.load(inputs.candidate_pairs)
+        
+        with get_affinity_writer() as writer:
+            writer.remove(sorted(departed_rows))
+            for pair in sorted(inputs.candidate_pairs):
+                affinity = save_pair_affinity(inputs, pair, writer)
+                neighbors.add(pair[0], pair[1], affinity.overall_affinity_score)
                 processed_pairs += 1
+        get_snapshot_store().put(KNOWN_ROWS_OBJECT, sorted(current_rows))
         
-        logger.info(f"친밀도 점수 계산 완료: {processed_pairs} pairs")
+        # 직원별 상위 K 이웃 인접 목록 (추천/팀 구성 조회용)
+        neighbor_items = get_neighbor_store().replace(neighbors.lists(), inputs.employees.keys(), neighbors.totals())
+        
+        logger.info(
+            f"친밀도 점수 계산 완료: {processed_pairs} pairs "
+            f"(저장 {writer.written}, 변경 없음 {writer.unchanged}, 삭제 {writer.removed}, 이웃 목록 {neighbor_items}명)"
+        )
         
         return {
             'statusCode': 200,
             'body': json.dumps({
                 'message': '친밀도 점수 계산 완료',
-                'processed_pairs': processed_pairs
+                'processed_pairs': processed_pairs,
+                **writer.counts,
+                'neighbor_items': neighbor_items,
+                'skipped_pairs': count_all_pairs(inputs) - processed_pairs,
+                'evidence_pairs': inputs.evidence_counts,
+                'message_update': inputs.message_update
             })
         }
         
@@ -82,6 +178,347 @@ def handler(event, context):
         }
 
 
+def load_affinity_inputs(
+    full_rebuild: bool = False,
+    as_of: Optional[datetime] = None
+) -> AffinityInputs:
+    """
+    친밀도 계산 입력 집계 (직원, 메신저, 공동 행사, 프로젝트 중복, 후보 쌍)
+    
+    Args:
+        full_rebuild: True면 메신저 감쇠 상태를 MessengerLogs 전체로 재계산
+        as_of: 메신저 감쇠 기준 시각 (기본값: 현재 UTC)
+        
+    Returns:
+        AffinityInputs: 계산 입력
+    """
+    # 모든 직원 조회
+    employees = {
+        get_employee_id(employee): employee
+        for employee in get_all_employees() if get_employee_id(employee)
+    }
+    logger.info(f"총 {len(employees)} 명의 직원 조회")
+    
+    # 회사 행사 1회 스캔, 메신저는 워터마크 이후 날짜의 일별 집계만 반영 (증분 감쇠 상태)
+    events = load_company_events()
+    message_stats, message_update = update_message_stats(
+        events,
+        full_rebuild=full_rebuild,
+        now=as_of
+    )
+    logger.info(f"메신저 로그 집계 완료: {len(message_stats)} pairs")
+    
+    # 전체 쌍의 공동 참여 행사 (참여 행렬 A·Aᵀ 1회)
+    shared_events = compute_shared_events(events)
+    logger.info(f"공동 참여 행사 집계 완료: {len(shared_events)} pairs")
+    
+    # 전체 쌍의 프로젝트 중복 개월 수 (프로젝트별 참여 기간 스윕 1회)
+    project_overlaps = compute_project_overlaps(employees)
+    logger.info(f"프로젝트 협업 기간 집계 완료: {len(project_overlaps)} pairs")
+    
+    # 상호작용 근거가 있는 후보 쌍만 생성 (프로젝트, 행사, 메신저 역색인)
+    candidate_pairs, evidence_counts = generate_candidate_pairs(
+        employees.keys(),
+        build_project_members(employees),
+        build_event_participants(events),
+        message_stats.keys()
+    )
+    logger.info(
+        f"후보 쌍 {len(candidate_pairs)}개 / 전체 {len(employees) * (len(employees) - 1) // 2}개 "
+        f"(근거별: {json.dumps(evidence_counts)})"
+    )
+    
+    return AffinityInputs(
+        employees, message_stats, message_update, shared_events, project_overlaps,
+        candidate_pairs, evidence_counts
+    )
+
+
+def count_all_pairs(inputs: AffinityInputs) -> int:
+    """전체 직원 쌍 수"""
+    return len(inputs.employees) * (len(inputs.employees) - 1) // 2
+
+
+def save_pair_affinity(inputs: AffinityInputs, pair: Tuple[str, str], writer: DeltaAffinityWriter) -> Affinity:
+    """직원 쌍 하나의 친밀도 점수 계산 후 변경분 쓰기 버퍼에 추가 (같은 입력이면 같은 행 - 재실행 안전)"""
+    employee_1_id, employee_2_id = pair
+    affinity = calculate_affinity_score(
+        inputs.employees[employee_1_id], inputs.employees[employee_2_id], inputs.message_stats,
+        inputs.shared_events, inputs.project_overlaps
+    )
+    writer.add(affinity)
+    return affinity
+
+
+def get_affinity_writer() -> DeltaAffinityWriter:
+    """점수가 바뀐 쌍만 저장하는 친밀도 쓰기 버퍼"""
+    return DeltaAffinityWriter(dynamodb_client.get_table(affinity_repo.table_name))
+
+
+def get_neighbor_store() -> AffinityNeighborStore:
+    """직원별 상위 K 이웃 인접 목록 저장소"""
+    return AffinityNeighborStore(dynamodb_client.dynamodb)
+
+
+def build_shard_neighbors(inputs: AffinityInputs, pairs: List[Tuple[str, str]]) -> TopKNeighbors:
+    """이번 실행 입력으로 샤드 쌍의 점수를 다시 계산하여 상위 K 이웃 누적 (테이블 조회 없음)"""
+    neighbors = TopKNeighbors()
+    for employee_1_id, employee_2_id in pairs:
+        affinity = calculate_affinity_score(
+            inputs.employees[employee_1_id], inputs.employees[employee_2_id], inputs.message_stats,
+            inputs.shared_events, inputs.project_overlaps
+        )
+        neighbors.add(employee_1_id, employee_2_id, affinity.overall_affinity_score)
+    return neighbors
+
+
+def get_job_store() -> JobCheckpointStore:
+    """분산 작업 체크포인트 저장소"""
+    return JobCheckpointStore(dynamodb_client.get_table(AFFINITY_JOB_TABLE))
+
+
+def get_snapshot_store() -> JobSnapshotStore:
+    """분산 작업 입력 스냅샷 저장소 (코디네이터가 저장, 워커는 자기 샤드 조각만 읽음)"""
+    global snapshot_store
+    if snapshot_store is None:
+        snapshot_store = JobSnapshotStore()
+    return snapshot_store
+
+
+def track_departed_rows(current_rows: Set[str]) -> Set[str]:
+    """
+    이전 실행의 친밀도 행 중 이번 후보에서 빠진 행 ID
+    
+    삭제가 끝나기 전에 실행이 실패해도 다음 실행이 다시 찾도록, 이전 행과 이번 행의 합집합을 먼저
+    기록합니다 (실행이 끝나면 이번 행만 남김). 목록이 아직 없으면 EmployeeAffinity 키를 한 번 스캔하여
+    이전 방식으로 저장된 행까지 정리합니다.
+    
+    Args:
+        current_rows: 이번 후보 쌍의 친밀도 ID
+        
+    Returns:
+        set: 삭제할 친밀도 ID
+    """
+    store = get_snapshot_store()
+    known_rows = store.get(KNOWN_ROWS_OBJECT)
+    if known_rows is None:
+        # 첫 실행: 목록 도입 전 행(전체 쌍을 저장하던 시절의 행 포함)을 키만 한 번 스캔
+        table = dynamodb_client.get_table(affinity_repo.table_name)
+        known_rows = [item['affinity_id'] for item in iter_scan(table, **projection_kwargs(['affinity_id']))]
+    previous_rows = set(known_rows)
+    departed_rows = previous_rows - current_rows
+    if departed_rows:
+        store.put(KNOWN_ROWS_OBJECT, sorted(previous_rows | current_rows))
+    logger.info(f"후보에서 빠진 이전 쌍: {len(departed_rows)}개")
+    return departed_rows
+
+
+def slice_affinity_inputs(shard_slice: ShardSlice) -> AffinityInputs:
+    """샤드 조각 → 계산 입력 (점수 계산에는 직원 ID만 필요)"""
+    employee_ids = {employee_id for pair in shard_slice.pairs for employee_id in pair}
+    return AffinityInputs(
+        employees={employee_id: {'user_id': employee_id} for employee_id in employee_ids},
+        message_stats=shard_slice.message_stats,
+        message_update=None,
+        shared_events=shard_slice.shared_events,
+        project_overlaps=shard_slice.project_overlaps,
+        candidate_pairs=set(shard_slice.pairs),
+        evidence_counts={}
+    )
+
+
+def get_job_runner():
+    """워커 실행기 (기본값: 이 Lambda 함수 비동기 자기 호출)"""
+    global job_runner
+    if job_runner is None:
+        job_runner = LambdaInvokeRunner(os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'AffinityScoreCalculator'))
+    return job_runner
+
+
+def run_affinity_coordinator(shard_count: int, full_rebuild: bool = False) -> Dict[str, Any]:
+    """
+    코디네이터: 메신저 상태 갱신, 후보 쌍 샤드 분할, 샤드별 입력 저장, 워커 비동기 호출
+    
+    입력(직원, 행사, 메신저 상태)은 코디네이터만 한 번 읽고, 워커는 저장된 자기 샤드 조각만 읽습니다.
+    
+    Args:
+        shard_count: 샤드(워커) 수
+        full_rebuild: 메신저 감쇠 상태 전체 재계산 여부
+        
+    Returns:
+        dict: 처리 결과 (run_id, 샤드별 쌍 수)
+    """
+    logger.info(f"친밀도 분산 작업 시작: {shard_count}개 샤드")
+    
+    # 메신저 감쇠 상태는 코디네이터만 갱신 (워커는 샤드 조각의 as_of 기준 집계만 사용)
+    as_of = datetime.now(timezone.utc)
+    inputs = load_affinity_inputs(full_rebuild=full_rebuild, as_of=as_of)
+    
+    shards: List[List[Tuple[str, str]]] = [[] for _ in range(shard_count)]
+    for pair in inputs.candidate_pairs:
+        shards[shard_of(pair, shard_count)].append(pair)
+    shard_sizes = [len(pairs) for pairs in shards]
+    
+    # 후보에서 빠진 이전 쌍은 친밀도 ID 해시로 샤드에 나누어 워커가 삭제
+    current_rows = {affinity_id_of(pair) for pair in inputs.candidate_pairs}
+    departed: List[List[str]] = [[] for _ in range(shard_count)]
+    for affinity_id in track_departed_rows(current_rows):
+        departed[shard_of_key(affinity_id, shard_count)].append(affinity_id)
+    
+    run_id = new_job_run_id(as_of)
+    store = get_snapshot_store()
+    store.put(run_object_name(run_id, 'run'), {'employee_ids': sorted(inputs.employees)})
+    store.put(run_object_name(run_id, 'rows'), sorted(current_rows))
+    for shard_index, pairs in enumerate(shards):
+        store.put(
+            shard_object_name(run_id, shard_index),
+            build_shard_slice(
+                sorted(pairs), inputs.message_stats.read(pairs), inputs.shared_events, inputs.project_overlaps,
+                departed[shard_index]
+            )
+        )
+    
+    summary = {
+        'candidate_pairs': len(inputs.candidate_pairs),
+        'skipped_pairs': count_all_pairs(inputs) - len(inputs.candidate_pairs),
+        'evidence_pairs': inputs.evidence_counts,
+        'message_update': inputs.message_update,
+        'shard_sizes': shard_sizes,
+        'departed_pairs': sum(len(ids) for ids in departed)
+    }
+    get_job_store().start_run(run_id, shard_count, as_of, summary)
+    
+    runner = get_job_runner()
+    for shard_index in range(shard_count):
+        runner.submit({'mode': WORKER_MODE, 'run_id': run_id, 'shard_index': shard_index})
+    
+    logger.info(f"친밀도 워커 {shard_count}개 호출: {run_id} (샤드별 쌍 수 {shard_sizes})")
+    
+    return {
+        'statusCode': 202,
+        'body': json.dumps({
+            'message': '친밀도 분산 작업 시작',
+            'run_id': run_id,
+            'shard_count': shard_count,
+            **summary
+        })
+    }
+
+
+def run_affinity_worker(event: Dict[str, Any], context) -> Dict[str, Any]:
+    """
+    워커: 샤드의 후보 쌍을 체크포인트 이후부터 처리
+    
+    남은 실행 시간이 부족하면 체크포인트 후 같은 샤드를 다시 호출하고,
+    마지막 샤드를 완료한 워커가 실행 버전을 게시합니다.
+    
+    Args:
+        event: {"mode": "worker", "run_id": ..., "shard_index": ...}
+        context: Lambda 컨텍스트 (남은 실행 시간 확인)
+        
+    Returns:
+        dict: 처리 결과
+    """
+    run_id = event['run_id']
+    shard_index = int(event['shard_index'])
+    job_store = get_job_store()
+    
+    run = job_store.get_run(run_id)
+    shard = job_store.get_shard(run_id, shard_index)
+    if run is None or shard is None:
+        raise ValueError(f"친밀도 분산 작업을 찾을 수 없음: {run_id} / {shard_index}")
+    
+    if shard.get('status') == STATUS_DONE:
+        logger.info(f"이미 완료된 샤드: {run_id} / {shard_index}")
+        return {'statusCode': 200, 'body': json.dumps({'run_id': run_id, 'shard_index': shard_index, 'status': 'done'})}
+    
+    # 코디네이터가 저장한 자기 샤드 조각만 읽음 (입력 테이블 재조회 없음)
+    store = get_snapshot_store()
+    payload = store.get(shard_object_name(run_id, shard_index))
+    if payload is None:
+        raise ValueError(f"샤드 입력을 찾을 수 없음: {run_id} / {shard_index}")
+    shard_slice = parse_shard_slice(payload)
+    inputs = slice_affinity_inputs(shard_slice)
+    pairs = shard_slice.pairs
+    
+    writer = get_affinity_writer()
+    if shard.get('last_pair') is None:
+        # 샤드 첫 호출: 후보에서 빠진 이전 쌍 삭제 (체크포인트 전 재시도 시 다시 삭제해도 무해)
+        writer.remove(shard_slice.departed)
+    
+    def time_is_short() -> bool:
+        return context is not None and context.get_remaining_time_in_millis() < WORKER_TIME_MARGIN_MS
+    
+    def save_progress(last_pair: str, count: int) -> None:
+        # 체크포인트 이전 쌍이 모두 저장된 뒤에 체크포인트 기록
+        writer.flush()
+        job_store.save_progress(run_id, shard_index, last_pair, count)
+    
+    processed, finished = run_shard(
+        pairs,
+        shard.get('last_pair'),
+        int(shard.get('processed_pairs', 0)),
+        process_pair=lambda pair: save_pair_affinity(inputs, pair, writer),
+        save_progress=save_progress,
+        should_yield=time_is_short
+    )
+    writer.flush()
+    job_store.add_counts(run_id, writer.counts)
+    
+    if finished and pairs and time_is_short():
+        # 이웃 요약을 계산할 시간이 부족하면 마지막 쌍까지 체크포인트 후 다시 호출
+        job_store.save_progress(run_id, shard_index, pair_key(pairs[-1]), processed)
+        finished = False
+    
+    if not finished:
+        # 실행 시간 제한 전에 같은 샤드를 이어서 처리하도록 다시 호출
+        get_job_runner().submit(event)
+        logger.info(f"샤드 이어서 처리 예약: {run_id} / {shard_index} ({processed}/{len(pairs)} pairs)")
+        return {
+            'statusCode': 202,
+            'body': json.dumps({
+                'run_id': run_id, 'shard_index': shard_index, 'status': 'continued', 'processed_pairs': processed,
+                **writer.counts
+            })
+        }
+    
+    # 이번 실행 점수로 만든 샤드별 상위 K 이웃 (단일 호출 경로와 같은 기준 - 테이블의 이전 행은 읽지 않음)
+    shard_neighbors = build_shard_neighbors(inputs, pairs)
+    store.put(
+        neighbors_object_name(run_id, shard_index),
+        {'neighbors': shard_neighbors.lists(), 'totals': shard_neighbors.totals()}
+    )
+    
+    published = job_store.complete_shard(run_id, shard_index, processed)
+    if published:
+        # 모든 샤드가 끝난 뒤 게시 담당 워커가 샤드별 목록을 병합하여 인접 목록을 한 번 다시 만듦
+        neighbors = TopKNeighbors()
+        for index in range(int(run['shard_count'])):
+            summary = store.get(neighbors_object_name(run_id, index))
+            if summary is None:
+                raise ValueError(f"샤드 이웃 목록을 찾을 수 없음: {run_id} / {index}")
+            neighbors.merge(summary['neighbors'], summary['totals'])
+        employee_ids = store.get(run_object_name(run_id, 'run'))['employee_ids']
+        get_neighbor_store().replace(neighbors.lists(), employee_ids, neighbors.totals())
+        job_store.publish(run_id)
+        # 이 실행이 최신으로 게시되었으면 다음 실행의 비교 기준을 이번 후보 쌍으로 교체
+        if job_store.get_latest()['published_run_id'] == run_id:
+            store.put(KNOWN_ROWS_OBJECT, store.get(run_object_name(run_id, 'rows')))
+    logger.info(f"샤드 완료: {run_id} / {shard_index} ({processed} pairs, 게시: {published})")
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'run_id': run_id,
+            'shard_index': shard_index,
+            'status': 'done',
+            'processed_pairs': processed,
+            **writer.counts,
+            'published': published
+        })
+    }
+
+
 def get_all_employees() -> List[Dict[str, Any]]:
     """
     모든 직원 조회
@@ -109,7 +546,76 @@ def get_all_employees() -> List[Dict[str, Any]]:
         raise
 
 
-def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, Any]) -> Affinity:
+def load_company_events() -> List[Dict[str, Any]]:
+    """
+    회사 행사 전체 조회 (1회 스캔, 행사 ID·날짜·참여자만)
+    
+    Returns:
+        list: CompanyEvents 항목
+    """
+    table = dynamodb_client.get_table('CompanyEvents')
+    return list(iter_scan(table, **projection_kwargs(['event_id', 'event_date', 'participants'])))
+
+
+def load_message_stats(
+    events: Optional[List[Dict[str, Any]]] = None
+) -> Dict[Tuple[str, str], PairMessageStats]:
+    """
+    MessengerLogs 쌍별 집계 생성 (1회 스캔)
+    
+    Args:
+        events: 회사 행사 항목 (없으면 CompanyEvents를 조회)
+        
+    Returns:
+        dict: {(직원 ID, 직원 ID): PairMessageStats}
+    """
+    if events is None:
+        events = load_company_events()
+    return aggregate_messenger_logs(dynamodb_client.get_table('MessengerLogs'), event_dates_of(events))
+
+
+def update_message_stats(
+    events: List[Dict[str, Any]],
+    full_rebuild: bool = False,
+    now: Optional[datetime] = None
+) -> Tuple[DecayedPairStats, Dict[str, Any]]:
+    """
+    메신저 쌍별 감쇠 상태를 새 날짜의 일별 집계(PairDailyStats)로 갱신하고 현재 시각 기준 집계 반환
+    
+    이번 실행에 읽은 쌍만 메모리에 들고, 나머지 쌍은 점수 계산 직전에 상태를 BatchGet으로 읽어 감쇠합니다.
+    상태가 있는 쌍 목록은 분산 작업 스냅샷 저장소에 유지합니다.
+    
+    Args:
+        events: 회사 행사 항목
+        full_rebuild: True면 MessengerLogs 전체로 상태 재계산
+        now: 감쇠 기준 시각 (기본값: 현재 UTC)
+        
+    Returns:
+        tuple: (DecayedPairStats - {(직원 ID, 직원 ID): PairMessageStats}, 갱신 요약)
+    """
+    return update_pair_states(
+        PairStateStore(dynamodb_client.get_table(AFFINITY_STATE_TABLE)),
+        dynamodb_client.get_table('MessengerLogs'),
+        PairDailyStatsStore(dynamodb_client.dynamodb, PAIR_DAILY_STATS_TABLE),
+        event_dates_of(events),
+        now=now,
+        full_rebuild=full_rebuild,
+        pair_index=get_snapshot_store()
+    )
+
+
+def get_employee_id(employee: Dict[str, Any]) -> str:
+    """직원 ID (Employees 테이블 키는 user_id)"""
+    return employee.get('employee_id') or employee.get('user_id')
+
+
+def calculate_affinity_score(
+    employee_1: Dict[str, Any],
+    employee_2: Dict[str, Any],
+    message_stats: Optional[Dict[Tuple[str, str], PairMessageStats]] = None,
+    shared_events: Optional[Dict[Tuple[str, str], List[str]]] = None,
+    project_overlaps: Optional[Dict[Tuple[str, str], Dict[str, int]]] = None
+) -> Affinity:
     """
     두 직원 간 친밀도 점수 계산
     
@@ -118,23 +624,26 @@ def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, A
     Args:
         employee_1: 직원 1 데이터
         employee_2: 직원 2 데이터
+        message_stats: 메신저 로그 쌍별 집계 (없으면 새로 집계)
+        shared_events: 쌍별 공동 참여 행사 (없으면 새로 집계)
+        project_overlaps: 쌍별 프로젝트 중복 개월 수 (없으면 두 직원 이력으로 계산)
         
     Returns:
         Affinity: 친밀도 객체
     """
-    employee_1_id = employee_1.get('employee_id')
-    employee_2_id = employee_2.get('employee_id')
+    employee_1_id = get_employee_id(employee_1)
+    employee_2_id = get_employee_id(employee_2)
     
     logger.info(f"친밀도 계산 시작: {employee_1_id} - {employee_2_id}")
     
     # 1. 프로젝트 협업 분석 (Requirements: 2-1.1)
-    project_collaboration = analyze_project_collaboration(employee_1, employee_2)
+    project_collaboration = analyze_project_collaboration(employee_1, employee_2, project_overlaps)
     
     # 2. 메신저 커뮤니케이션 분석 (Requirements: 2-1.2, 2-1.3)
-    messenger_communication = analyze_messenger_communication(employee_1_id, employee_2_id)
+    messenger_communication = analyze_messenger_communication(employee_1_id, employee_2_id, message_stats)
     
     # 3. 회사 행사 참여 분석 (Requirements: 2-1.4)
-    company_events = analyze_company_events(employee_1_id, employee_2_id)
+    company_events = analyze_company_events(employee_1_id, employee_2_id, shared_events)
     
     # 4. 특별일 연락 분석 (Requirements: 2-1.5)
     personal_closeness = analyze_personal_closeness(employee_1_id, employee_2_id)
@@ -168,57 +677,42 @@ def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, A
 
 def analyze_project_collaboration(
     employee_1: Dict[str, Any],
-    employee_2: Dict[str, Any]
+    employee_2: Dict[str, Any],
+    project_overlaps: Optional[Dict[Tuple[str, str], Dict[str, int]]] = None
 ) -> ProjectCollaboration:
     """
     프로젝트 협업 분석
     
     Requirements: 2-1.1 - 프로젝트 협업 기간 계산
     
+    두 이력을 이중 루프로 비교하지 않고 compute_project_overlaps()의 쌍별 결과(프로젝트별 스윕)를 조회합니다.
+    
     Args:
         employee_1: 직원 1 데이터
         employee_2: 직원 2 데이터
+        project_overlaps: 쌍별 프로젝트 중복 개월 수 (없으면 두 직원 이력으로 계산)
         
     Returns:
         ProjectCollaboration: 프로젝트 협업 정보
     """
     try:
-        # 프로젝트 이력 가져오기
-        projects_1 = employee_1.get('project_history', [])
-        projects_2 = employee_2.get('project_history', [])
-        
-        shared_projects = []
-        total_overlap_months = 0
-        
-        # 공동 참여 프로젝트 찾기
-        for p1 in projects_1:
-            if not isinstance(p1, dict):
-                continue
-            
-            project_name_1 = p1.get('project_name', '')
-            
-            for p2 in projects_2:
-                if not isinstance(p2, dict):
-                    continue
-                
-                project_name_2 = p2.get('project_name', '')
-                
-                # 같은 프로젝트인 경우
-                if project_name_1 == project_name_2:
-                    # 기간 중복 계산
-                    overlap_months = calculate_overlap_months(
-                        p1.get('duration', ''),
-                        p2.get('duration', '')
-                    )
-                    
-                    if overlap_months > 0:
-                        shared_project = SharedProject(
-                            project_id=project_name_1,
-                            overlap_period_months=overlap_months,
-                            same_team=True  # 간단화를 위해 True로 설정
-                        )
-                        shared_projects.append(shared_project)
-                        total_overlap_months += overlap_months
+        employee_1_id = get_employee_id(employee_1)
+        employee_2_id = get_employee_id(employee_2)
+        
+        if project_overlaps is None:
+            project_overlaps = compute_project_overlaps({employee_1_id: employee_1, employee_2_id: employee_2})
+        
+        # 공동 참여 프로젝트 (중복 기간이 있는 프로젝트만)
+        overlaps = project_overlaps.get(canonical_pair(employee_1_id, employee_2_id), {})
+        shared_projects = [
+            SharedProject(
+                project_id=project,
+                overlap_period_months=months,
+                same_team=True  # 간단화를 위해 True로 설정
+            )
+            for project, months in overlaps.items()
+        ]
+        total_overlap_months = sum(overlaps.values())
         
         # 협업 점수 계산 (0-100)
         # 기본: 중복 개월 수 * 5점 (최대 100점)
@@ -237,27 +731,28 @@ def analyze_project_collaboration(
         )
 
 
-def calculate_overlap_months(duration_1: str, duration_2: str) -> int:
+def calculate_overlap_months(duration_1: Any, duration_2: Any) -> int:
     """
-    두 기간의 중복 개월 수 계산
+    두 기간의 중복 개월 수 계산 (종료 월 포함)
     
     Args:
-        duration_1: 기간 1 (예: "2023-01 ~ 2023-06")
+        duration_1: 기간 1 (예: "2023-01 ~ 2023-06" 또는 {"start": "2023-01", "end": "2023-06"})
         duration_2: 기간 2
         
     Returns:
         int: 중복 개월 수
     """
     try:
-        # 간단한 구현: 기간이 있으면 6개월로 가정
-        if duration_1 and duration_2:
-            return 6
-        return 0
+        return overlap_months(parse_period(duration_1), parse_period(duration_2))
     except Exception:
         return 0
 
 
-def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> MessengerCommunication:
+def analyze_messenger_communication(
+    employee_1_id: str,
+    employee_2_id: str,
+    message_stats: Optional[Dict[Tuple[str, str], PairMessageStats]] = None
+) -> MessengerCommunication:
     """
     메신저 커뮤니케이션 분석 (가중치 기반)
     
@@ -268,97 +763,30 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
     - Wcontext: 상황별 가중치 (업무시간: 1.0, 업무외: 1.5, 행사: 2.0, 연차: 3.0)
     - Wdecay: 시간 감쇠 (최근 1개월: 100%, 6개월: 50%)
     
+    쌍마다 MessengerLogs를 스캔하지 않고 load_message_stats()의 쌍별 집계에서 점수를 계산합니다.
+    
     Args:
         employee_1_id: 직원 1 ID
         employee_2_id: 직원 2 ID
+        message_stats: 메신저 로그 쌍별 집계 (없으면 새로 집계 - 단건 계산용)
         
     Returns:
         MessengerCommunication: 메신저 커뮤니케이션 정보
     """
     try:
-        import math
-        from datetime import datetime, timedelta
-        
-        # MessengerLogs 테이블에서 데이터 조회
-        table = dynamodb_client.get_table('MessengerLogs')
-        
-        # 두 직원 간 메시지 조회
-        response = table.scan(
-            FilterExpression='(sender_id = :emp1 AND receiver_id = :emp2) OR (sender_id = :emp2 AND receiver_id = :emp1)',
-            ExpressionAttributeValues={
-                ':emp1': employee_1_id,
-                ':emp2': employee_2_id
-            }
-        )
+        if message_stats is None:
+            message_stats = load_message_stats()
+        
+        stats = message_stats.get(canonical_pair(employee_1_id, employee_2_id))
+        if stats is None:
+            return MessengerCommunication(
+                total_messages_exchanged=0,
+                avg_response_time_minutes=0.0,
+                communication_score=0.0
+            )
         
-        messages = response.get('Items', [])
-        
-        # 회사 행사 및 연차 정보 조회
-        events_table = dynamodb_client.get_table('CompanyEvents')
-        events_response = events_table.scan()
-        company_events = events_response.get('Items', [])
-        
-        # 가중치 점수 계산
-        weighted_score = 0.0
-        total_messages = len(messages)
-        total_response_time = 0.0
-        response_count = 0
-        
-        current_time = datetime.now()
-        
-        for message in messages:
-            timestamp = message.get('timestamp', '')
-            if not timestamp:
-                continue
-            
-            try:
-                msg_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            except:
-                continue
-            
-            # 1. 시간 감쇠 계산 (Wdecay)
-            days_ago = (current_time - msg_time).days
-            months_ago = days_ago / 30.0
-            
-            # 지수 감쇠: e^(-λt), λ = 0.1
-            time_decay = math.exp(-0.1 * months_ago)
-            
-            # 2. 상황별 가중치 계산 (Wcontext)
-            hour = msg_time.hour
-            is_weekend = msg_time.weekday() >= 5
-            
-            # 기본 가중치
-            context_weight = 1.0
-            
-            # 업무 시간 외 (18:00 이후 또는 09:00 이전)
-            if hour < 9 or hour >= 18:
-                context_weight = 1.5
-            
-            # 주말
-            if is_weekend:
-                context_weight = 1.5
-            
-            # 회사 행사 기간 확인
-            for event in company_events:
-                event_date = event.get('event_date', '')
-                if event_date and event_date == msg_time.strftime('%Y-%m-%d'):
-                    context_weight = 2.0
-                    break
-            
-            # 연차/휴가 기간 확인 (메시지 메타데이터에서)
-            if message.get('is_vacation_period', False):
-                context_weight = 3.0
-            
-            # 3. 가중치 점수 누적
-            weighted_score += 1.0 * context_weight * time_decay
-            
-            # 응답 시간 계산
-            if message.get('response_time_minutes'):
-                total_response_time += float(message.get('response_time_minutes', 0))
-                response_count += 1
-        
-        # 평균 응답 시간
-        avg_response_time = total_response_time / response_count if response_count > 0 else 0.0
+        weighted_score = stats.weighted_score
+        avg_response_time = stats.avg_response_time_minutes
         
         # 커뮤니케이션 점수 계산 (0-100)
         # 가중치 점수를 0-100 범위로 정규화
@@ -369,10 +797,10 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
             response_bonus = max(0, 20 - (avg_response_time / 10.0))
             communication_score = min(100.0, communication_score + response_bonus)
         
-        logger.info(f"메신저 분석 완료: {employee_1_id}-{employee_2_id}, 메시지: {total_messages}, 가중치 점수: {weighted_score:.2f}, 최종 점수: {communication_score:.2f}")
+        logger.info(f"메신저 분석 완료: {employee_1_id}-{employee_2_id}, 메시지: {stats.total_messages}, 가중치 점수: {weighted_score:.2f}, 최종 점수: {communication_score:.2f}")
         
         return MessengerCommunication(
-            total_messages_exchanged=total_messages,
+            total_messages_exchanged=stats.total_messages,
             avg_response_time_minutes=avg_response_time,
             communication_score=communication_score
         )
@@ -386,35 +814,39 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
         )
 
 
-def analyze_company_events(employee_1_id: str, employee_2_id: str) -> CompanyEvents:
+def analyze_company_events(
+    employee_1_id: str,
+    employee_2_id: str,
+    shared_events: Optional[Dict[Tuple[str, str], List[str]]] = None
+) -> CompanyEvents:
     """
     회사 행사 참여 분석
     
     Requirements: 2-1.4 - 공동 참여 행사 분석
     
+    쌍마다 행사 참여자를 교집합하지 않고 compute_shared_events()의 쌍별 결과(A·Aᵀ)를 조회합니다.
+    
     Args:
         employee_1_id: 직원 1 ID
         employee_2_id: 직원 2 ID
+        shared_events: 쌍별 공동 참여 행사 (없으면 CompanyEvents로 새로 집계)
         
     Returns:
         CompanyEvents: 회사 행사 정보
     """
     try:
-        # CompanyEvents 테이블에서 데이터 조회
-        table = dynamodb_client.get_table('CompanyEvents')
+        if shared_events is None:
+            shared_events = compute_shared_events(load_company_events())
         
         # 공동 참여 행사 찾기
-        shared_events = []
-        
-        # 간단한 구현: 기본값 사용
-        shared_events = ['TeamBuilding_2023', 'Workshop_2023']
+        pair_events = shared_events.get(canonical_pair(employee_1_id, employee_2_id), [])
         
         # 소셜 점수 계산 (0-100)
         # 공동 참여 행사 수 * 20점
-        social_score = min(100.0, len(shared_events) * 20.0)
+        social_score = min(100.0, len(pair_events) * 20.0)
         
         return CompanyEvents(
-            shared_events=shared_events,
+            shared_events=list(pair_events),
             social_score=social_score
         )
         
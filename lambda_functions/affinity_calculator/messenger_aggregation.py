@@ -0,0 +1,244 @@
+"""
+메신저 로그 쌍별 집계 모듈
+
+MessengerLogs를 한 번만 스트리밍하면서 (발신자, 수신자)를 정렬한 표준 쌍으로 묶어
+감쇠 가중 메시지 수, 응답 시간 합계/건수를 누적합니다. 직원 쌍마다 필터 스캔을 반복하는 대신
+모든 쌍의 커뮤니케이션 점수를 이 집계에서 계산합니다.
+CompanyEvents도 한 번만 읽어 행사 날짜 집합으로 만들고 메시지 상황 가중치 판단에 사용합니다.
+
+가중치 공식: Score(A,B) = Σ(Mt × Wcontext × Wdecay)
+- Wcontext: 상황별 가중치 (업무시간: 1.0, 업무외/주말: 1.5, 행사: 2.0, 연차: 3.0)
+- Wdecay: 시간 감쇠 e^(-λt), t = 경과 개월 수, λ = 0.1
+
+감쇠는 곱셈으로 누적되므로 기준 시각 T의 점수 S(T)는 S(T') = S(T) × e^(-λ(T'-T))로 옮길 수 있습니다
+(증분 갱신은 pair_state 참고).
+
+상황 구분은 일별 집계(common.pair_daily_stats)와 같은 규칙을 쓰므로, 증분 갱신은
+PairDailyStats 행으로도 같은 가중치를 계산합니다 (aggregate_daily_rows).
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+from common.pair_daily_stats import (
+    AFTER_HOURS, CONTEXT_BUCKETS, DAY_FORMAT, EVENT_DAY, VACATION, WEEKEND, WORK_HOURS,
+    DailyPairStats, Pair, canonical_pair, context_bucket, parse_timestamp
+)
+
+
+# 월 단위 감쇠율 (λ)
+DECAY_RATE_PER_MONTH = 0.1
+
+# 한 달 일수 (경과 개월 수 계산)
+DAYS_PER_MONTH = 30.0
+
+SECONDS_PER_DAY = 86400.0
+
+# 상황별 가중치 (Wcontext)
+WORK_HOURS_WEIGHT = 1.0
+AFTER_HOURS_WEIGHT = 1.5
+COMPANY_EVENT_WEIGHT = 2.0
+VACATION_WEIGHT = 3.0
+
+# 상황 구분별 가중치
+BUCKET_WEIGHTS = {
+    WORK_HOURS: WORK_HOURS_WEIGHT,
+    AFTER_HOURS: AFTER_HOURS_WEIGHT,
+    WEEKEND: AFTER_HOURS_WEIGHT,
+    EVENT_DAY: COMPANY_EVENT_WEIGHT,
+    VACATION: VACATION_WEIGHT
+}
+
+# 집계에 필요한 메시지 속성 (스캔 전송량 절감)
+MESSAGE_ATTRIBUTES = ['sender_id', 'receiver_id', 'timestamp', 'response_time_minutes', 'is_vacation_period']
+
+
+class PairMessageStats:
+    """직원 쌍별 메시지 누적 집계"""
+
+    __slots__ = ('total_messages', 'weighted_score', 'response_time_sum', 'response_count')
+
+    def __init__(self):
+        self.total_messages = 0
+        self.weighted_score = 0.0
+        self.response_time_sum = 0.0
+        self.response_count = 0
+
+    def add(self, weight: float, response_time_minutes: Optional[float] = None) -> None:
+        """
+        메시지 한 건 누적
+
+        Args:
+            weight: 상황 가중치 × 시간 감쇠
+            response_time_minutes: 응답 시간(분) - 없거나 0이면 평균에서 제외
+        """
+        self.total_messages += 1
+        self.weighted_score += weight
+        if response_time_minutes:
+            self.response_time_sum += float(response_time_minutes)
+            self.response_count += 1
+
+    def decay(self, factor: float) -> None:
+        """가중 점수에 감쇠 계수 적용 (메시지 수, 응답 시간은 감쇠하지 않음)"""
+        self.weighted_score *= factor
+
+    def merge(self, other: 'PairMessageStats') -> None:
+        """같은 기준 시각의 집계 합산"""
+        self.total_messages += other.total_messages
+        self.weighted_score += other.weighted_score
+        self.response_time_sum += other.response_time_sum
+        self.response_count += other.response_count
+
+    @property
+    def avg_response_time_minutes(self) -> float:
+        """평균 응답 시간 (응답 기록이 없으면 0)"""
+        return self.response_time_sum / self.response_count if self.response_count else 0.0
+
+
+def decay_factor(elapsed_days: float) -> float:
+    """경과 일수에 대한 감쇠 계수 e^(-λ × 경과 개월 수) (음수 경과는 1)"""
+    return math.exp(-DECAY_RATE_PER_MONTH * max(0.0, elapsed_days) / DAYS_PER_MONTH)
+
+
+def time_decay(message_time: datetime, now: datetime) -> float:
+    """
+    메시지 시간 감쇠 가중치 - 기준 시각 이후 메시지는 1
+
+    경과 시간을 일 단위 실수로 계산하므로 감쇠 계수의 곱셈 누적과 정확히 일치합니다.
+    """
+    return decay_factor((now - message_time).total_seconds() / SECONDS_PER_DAY)
+
+
+def context_weight(message: Dict[str, Any], message_time: datetime, event_dates: Set[str]) -> float:
+    """
+    상황별 가중치 (연차 > 회사 행사일 > 업무 시간 외/주말 > 업무 시간)
+
+    Args:
+        message: 메시지 항목
+        message_time: 메시지 시각
+        event_dates: 회사 행사 날짜 집합 (YYYY-MM-DD)
+
+    Returns:
+        float: 상황 가중치
+    """
+    return BUCKET_WEIGHTS[context_bucket(message, message_time, event_dates)]
+
+
+def aggregate_messages(
+    messages: Iterable[Dict[str, Any]],
+    event_dates: Set[str],
+    now: Optional[datetime] = None
+) -> Dict[Pair, PairMessageStats]:
+    """
+    메시지 스트림을 표준 직원 쌍별로 집계 (한 번 순회)
+
+    Args:
+        messages: 메시지 항목 (sender_id, receiver_id, timestamp, response_time_minutes)
+        event_dates: 회사 행사 날짜 집합
+        now: 감쇠 기준 시각 (기본값: 현재 UTC)
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): PairMessageStats}
+    """
+    now = now or datetime.now(timezone.utc)
+    stats: Dict[Pair, PairMessageStats] = {}
+
+    for message in messages:
+        sender_id = message.get('sender_id')
+        receiver_id = message.get('receiver_id')
+        message_time = parse_timestamp(message.get('timestamp', ''))
+        if not sender_id or not receiver_id or sender_id == receiver_id or message_time is None:
+            continue
+
+        pair = canonical_pair(sender_id, receiver_id)
+        pair_stats = stats.get(pair)
+        if pair_stats is None:
+            pair_stats = stats[pair] = PairMessageStats()
+        pair_stats.add(
+            context_weight(message, message_time, event_dates) * time_decay(message_time, now),
+            message.get('response_time_minutes')
+        )
+
+    return stats
+
+
+def aggregate_daily_rows(
+    rows: Iterable[Tuple[str, DailyPairStats]],
+    now: Optional[datetime] = None
+) -> PairMessageStats:
+    """
+    직원 쌍의 일별 집계 행으로 커뮤니케이션 집계 (메시지 원본 대신 일수에 비례)
+
+    하루 안의 메시지는 그날 정오(UTC)에 보낸 것으로 보고 감쇠하므로, 메시지 단위 집계와의
+    가중 점수 차이는 감쇠 계수 반나절분(약 0.17%) 이내입니다.
+
+    Args:
+        rows: [(YYYY-MM-DD, DailyPairStats)] - 한 쌍의 일별 집계 행 (pair_state.fetch_daily_stats)
+        now: 감쇠 기준 시각 (기본값: 현재 UTC)
+
+    Returns:
+        PairMessageStats: 쌍 집계
+    """
+    now = now or datetime.now(timezone.utc)
+    stats = PairMessageStats()
+    for day, daily in rows:
+        noon = datetime.strptime(day, DAY_FORMAT).replace(hour=12, tzinfo=timezone.utc)
+        decay = time_decay(noon, now)
+        for bucket in CONTEXT_BUCKETS:
+            count = daily.counts[bucket]
+            stats.total_messages += count
+            stats.weighted_score += count * BUCKET_WEIGHTS[bucket] * decay
+        stats.response_time_sum += daily.response_time_sum
+        stats.response_count += daily.response_count
+    return stats
+
+
+def iter_scan(table, **scan_kwargs) -> Iterator[Dict[str, Any]]:
+    """테이블 스캔 항목을 페이지 단위로 스트리밍 (전체 목록을 메모리에 올리지 않음)"""
+    response = table.scan(**scan_kwargs)
+    yield from response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan_kwargs)
+        yield from response.get('Items', [])
+
+
+def projection_kwargs(attributes: Iterable[str]) -> Dict[str, Any]:
+    """ProjectionExpression 스캔 인자 (예약어 timestamp 등을 별칭으로 처리)"""
+    names = {f"#a{index}": attribute for index, attribute in enumerate(attributes)}
+    return {
+        'ProjectionExpression': ', '.join(names),
+        'ExpressionAttributeNames': names
+    }
+
+
+def event_dates_of(events: Iterable[Dict[str, Any]]) -> Set[str]:
+    """회사 행사 항목의 날짜 집합 (YYYY-MM-DD)"""
+    return {str(event['event_date'])[:10] for event in events if event.get('event_date')}
+
+
+def load_event_dates(events_table) -> Set[str]:
+    """CompanyEvents 전체를 한 번 읽어 행사 날짜 집합 생성"""
+    return event_dates_of(iter_scan(events_table, **projection_kwargs(['event_date'])))
+
+
+def aggregate_messenger_logs(
+    messenger_table,
+    event_dates: Set[str],
+    now: Optional[datetime] = None
+) -> Dict[Pair, PairMessageStats]:
+    """
+    MessengerLogs 전체를 한 번 스트리밍하여 쌍별 집계
+
+    Args:
+        messenger_table: MessengerLogs 테이블
+        event_dates: 회사 행사 날짜 집합
+        now: 감쇠 기준 시각
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): PairMessageStats}
+    """
+    return aggregate_messages(
+        iter_scan(messenger_table, **projection_kwargs(MESSAGE_ATTRIBUTES)),
+        event_dates,
+        now
+    )
@@ -0,0 +1,437 @@
+"""
+메신저 친밀도 증분 감쇠 상태 모듈
+
+커뮤니케이션 가중 점수 Σ Wcontext × e^(-λt)는 시간이 지나면 곱셈으로만 줄어들기 때문에
+직원 쌍별로 (가중 점수, 기준 시각 as_of)를 저장해 두면 전체 이력을 다시 읽지 않아도 됩니다.
+
+    S(now) = S(as_of) × e^(-λ × (now - as_of)) + Σ 새 메시지 가중치
+
+실행마다 워터마크(반영한 마지막 날짜) 다음 날부터 끝난 날짜까지의 일별 집계 행만
+PairDailyStats DayIndex로 날짜마다 Query 1회씩 읽고, 그 행에 나온 쌍의 상태만 BatchGet으로 읽어
+갱신합니다. 상태 갱신 비용은 전체 쌍 수나 직원 수가 아니라 새 날짜의 쌍 수에 비례합니다.
+메시지 수, 응답 시간 합계/건수는 감쇠 없이 누적합니다.
+
+- 상태 테이블: AFFINITY_STATE_TABLE 환경 변수 (기본값: AffinityPairState)
+- 워터마크가 없으면(최초 실행) 또는 full_rebuild이면 MessengerLogs 전체(끝난 날짜까지)로 상태를 다시 만들고,
+  재계산에 없는 쌍의 이전 상태 행은 삭제합니다.
+- 일별 행은 그날 정오에 보낸 것으로 보고 감쇠하고(aggregate_daily_rows), 상황 구분은 스트림 적재 시점의
+  행사 날짜를 따릅니다. 스트림 중복 누적이나 뒤늦게 등록된 행사는 전체 재계산에서 바로잡힙니다.
+- 아직 끝나지 않은 날짜(오늘 등)의 일별 행도 실행마다 읽어 반환 값에 더하지만 상태에는 저장하지 않습니다.
+  그날이 끝난 뒤 실행이 완성된 행으로 한 번만 반영하므로 시간 단위 실행에서도 중복 누적이 없습니다.
+- 반환 값은 이번 실행에 읽은 쌍만 메모리에 들고, 나머지 쌍은 읽을 때 상태를 BatchGet으로 조회하여
+  기준 시각으로 감쇠합니다 (DecayedPairStats). 상태가 있는 쌍 목록은 스냅샷 저장소의 쌍 목록 항목으로
+  유지하여 실행마다 상태 테이블을 스캔하지 않습니다.
+"""
+
+import logging
+import os
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from common.pair_daily_stats import DAY_FORMAT, PairDailyStatsStore, parse_timestamp
+
+try:
+    from messenger_aggregation import (
+        SECONDS_PER_DAY, Pair, PairMessageStats, aggregate_daily_rows, decay_factor, iter_scan,
+        projection_kwargs, MESSAGE_ATTRIBUTES
+    )
+    from vectorized_scoring import aggregate_message_batch
+except ImportError:
+    from lambda_functions.affinity_calculator.messenger_aggregation import (
+        SECONDS_PER_DAY, Pair, PairMessageStats, aggregate_daily_rows, decay_factor, iter_scan,
+        projection_kwargs, MESSAGE_ATTRIBUTES
+    )
+    from lambda_functions.affinity_calculator.vectorized_scoring import aggregate_message_batch
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = os.environ.get('AFFINITY_STATE_TABLE', 'AffinityPairState')
+
+# 워터마크 항목 키
+WATERMARK_KEY = '#WATERMARK'
+
+# 날짜가 바뀐 뒤 스트림 집계가 반영될 때까지 기다리는 시간
+ROLLUP_SETTLE_HOURS = 1
+
+# BatchGetItem 최대 키 수
+BATCH_GET_SIZE = 100
+
+# 상태가 있는 쌍 목록 항목 이름 (스냅샷 저장소, 실행 간 유지)
+PAIR_INDEX_OBJECT = 'messenger-pairs'
+
+# 갱신 방식
+FULL_REBUILD = 'full'
+INCREMENTAL = 'incremental'
+
+
+class PairDecayState:
+    """직원 쌍의 누적 집계와 가중 점수 기준 시각"""
+
+    __slots__ = ('stats', 'as_of')
+
+    def __init__(self, stats: PairMessageStats, as_of: datetime):
+        self.stats = stats
+        self.as_of = as_of
+
+    def advance(self, now: datetime) -> None:
+        """가중 점수를 now 기준으로 감쇠"""
+        self.stats.decay(decay_factor((now - self.as_of).total_seconds() / SECONDS_PER_DAY))
+        self.as_of = max(self.as_of, now)
+
+    def value_at(self, now: datetime) -> PairMessageStats:
+        """now 기준으로 감쇠한 집계 사본 (상태는 변경하지 않음)"""
+        value = PairMessageStats()
+        value.merge(self.stats)
+        value.decay(decay_factor((now - self.as_of).total_seconds() / SECONDS_PER_DAY))
+        return value
+
+
+def last_complete_day(now: datetime) -> str:
+    """일별 집계가 끝났다고 볼 수 있는 마지막 날짜 (정착 시간을 뺀 시각의 전날, UTC)"""
+    settled = (now - timedelta(hours=ROLLUP_SETTLE_HOURS)).astimezone(timezone.utc)
+    return (settled.date() - timedelta(days=1)).strftime(DAY_FORMAT)
+
+
+def open_days(last_day: str, now: datetime) -> List[str]:
+    """last_day 다음 날부터 now가 속한 날짜까지 (일별 집계가 아직 끝나지 않은 날짜, UTC)"""
+    return days_after(last_day, now.astimezone(timezone.utc).strftime(DAY_FORMAT))
+
+
+def days_after(watermark_day: str, last_day: str) -> List[str]:
+    """워터마크 다음 날부터 last_day까지의 날짜 (YYYY-MM-DD)"""
+    day = datetime.strptime(watermark_day, DAY_FORMAT).date() + timedelta(days=1)
+    end = datetime.strptime(last_day, DAY_FORMAT).date()
+    days = []
+    while day <= end:
+        days.append(day.strftime(DAY_FORMAT))
+        day += timedelta(days=1)
+    return days
+
+
+def pair_id(pair: Pair) -> str:
+    """상태 항목 키 ("직원1#직원2")"""
+    return f"{pair[0]}#{pair[1]}"
+
+
+def pair_from_id(key: str) -> Pair:
+    """상태 항목 키 → 쌍"""
+    employee_1_id, employee_2_id = key.split('#', 1)
+    return employee_1_id, employee_2_id
+
+
+def to_decimal(value: float) -> Decimal:
+    """DynamoDB 숫자 변환"""
+    return Decimal(str(round(float(value), 10)))
+
+
+def state_from_item(item: Dict[str, Any]) -> Tuple[Pair, PairDecayState]:
+    """상태 항목 → (쌍, PairDecayState)"""
+    stats = PairMessageStats()
+    stats.total_messages = int(item.get('total_messages', 0))
+    stats.weighted_score = float(item.get('weighted_score', 0))
+    stats.response_time_sum = float(item.get('response_time_sum', 0))
+    stats.response_count = int(item.get('response_count', 0))
+    return (item['employee_1'], item['employee_2']), PairDecayState(stats, datetime.fromisoformat(item['as_of']))
+
+
+class PairStateStore:
+    """
+    직원 쌍별 감쇠 상태 저장소 (AffinityPairState)
+
+    항목: pair_id, employee_1, employee_2, weighted_score, as_of, total_messages,
+    response_time_sum, response_count / 워터마크 항목: pair_id=#WATERMARK, last_day
+    """
+
+    def __init__(self, table):
+        """
+        Args:
+            table: DynamoDB Table (boto3 resource)
+        """
+        self.table = table
+
+    def get_watermark(self) -> Optional[str]:
+        """반영한 마지막 날짜 (GetItem 1회, 없거나 이전 형식이면 None)"""
+        item = self.table.get_item(Key={'pair_id': WATERMARK_KEY}).get('Item') or {}
+        return item.get('last_day')
+
+    def get_many(self, pairs: Iterable[Pair]) -> Dict[Pair, PairDecayState]:
+        """
+        쌍 상태 조회 (BatchGetItem, 미처리 키 재요청)
+
+        Args:
+            pairs: 조회할 쌍
+
+        Returns:
+            dict: {쌍: PairDecayState} - 상태가 없는 쌍은 제외
+        """
+        # 리소스의 클라이언트는 Python 값 <-> DynamoDB 형식을 자동 변환
+        client = self.table.meta.client
+        keys = [pair_id(pair) for pair in pairs]
+        states: Dict[Pair, PairDecayState] = {}
+        for start in range(0, len(keys), BATCH_GET_SIZE):
+            request = {self.table.name: {'Keys': [{'pair_id': key} for key in keys[start:start + BATCH_GET_SIZE]]}}
+            while request:
+                response = client.batch_get_item(RequestItems=request)
+                for item in response.get('Responses', {}).get(self.table.name, []):
+                    pair, state = state_from_item(item)
+                    states[pair] = state
+                request = response.get('UnprocessedKeys') or None
+        return states
+
+    def scan_pairs(self) -> Set[Pair]:
+        """상태가 있는 전체 쌍 (키만 스캔, 워터마크 제외 - 전체 재계산과 쌍 목록이 없을 때만 사용)"""
+        return {
+            pair_from_id(item['pair_id'])
+            for item in iter_scan(self.table, **projection_kwargs(['pair_id']))
+            if item['pair_id'] != WATERMARK_KEY
+        }
+
+    def scan_states(self) -> Dict[Pair, PairDecayState]:
+        """전체 쌍 상태 (점수 계산 입력용 스캔, 워터마크 제외)"""
+        states: Dict[Pair, PairDecayState] = {}
+        for item in iter_scan(self.table):
+            if item['pair_id'] != WATERMARK_KEY:
+                pair, state = state_from_item(item)
+                states[pair] = state
+        return states
+
+    def save(self, states: Dict[Pair, PairDecayState], watermark: Optional[str]) -> None:
+        """
+        갱신된 쌍 상태와 워터마크 저장 (배치 쓰기)
+
+        Args:
+            states: 저장할 쌍 상태
+            watermark: 반영한 마지막 날짜 (YYYY-MM-DD)
+        """
+        with self.table.batch_writer() as batch:
+            for pair, state in states.items():
+                batch.put_item(Item={
+                    'pair_id': pair_id(pair),
+                    'employee_1': pair[0],
+                    'employee_2': pair[1],
+                    'weighted_score': to_decimal(state.stats.weighted_score),
+                    'as_of': state.as_of.isoformat(),
+                    'total_messages': state.stats.total_messages,
+                    'response_time_sum': to_decimal(state.stats.response_time_sum),
+                    'response_count': state.stats.response_count
+                })
+            if watermark:
+                batch.put_item(Item={
+                    'pair_id': WATERMARK_KEY,
+                    'last_day': watermark,
+                    'updated_at': datetime.now(timezone.utc).isoformat()
+                })
+
+    def delete(self, pairs: Iterable[Pair]) -> int:
+        """
+        쌍 상태 삭제 (배치 쓰기)
+
+        Args:
+            pairs: 삭제할 쌍
+
+        Returns:
+            int: 삭제한 쌍 수
+        """
+        count = 0
+        with self.table.batch_writer() as batch:
+            for pair in pairs:
+                batch.delete_item(Key={'pair_id': pair_id(pair)})
+                count += 1
+        return count
+
+
+class DecayedPairStats(Mapping):
+    """
+    쌍별 now 기준 메신저 집계 (읽을 때 감쇠)
+
+    이번 실행에 갱신했거나 끝나지 않은 날짜의 행을 더한 쌍은 메모리의 값을 쓰고,
+    나머지 쌍은 처음 읽을 때 저장된 상태를 BatchGet으로 조회하여 now 기준으로 감쇠합니다.
+    여러 쌍을 읽을 때는 load()나 read()로 한 번에 조회합니다.
+    """
+
+    def __init__(
+        self,
+        store: PairStateStore,
+        pairs: Set[Pair],
+        now: datetime,
+        touched: Dict[Pair, PairMessageStats]
+    ):
+        """
+        Args:
+            store: 상태 저장소
+            pairs: 메신저 집계가 있는 전체 쌍
+            now: 감쇠 기준 시각
+            touched: 이번 실행에 계산한 쌍별 집계
+        """
+        self.store = store
+        self.pairs = set(pairs) | set(touched)
+        self.now = now
+        self.values: Dict[Pair, PairMessageStats] = dict(touched)
+
+    def read(self, pairs: Iterable[Pair]) -> Dict[Pair, PairMessageStats]:
+        """
+        쌍별 집계 (메모리에 없는 쌍만 BatchGet, 조회 결과는 보관하지 않음)
+
+        Args:
+            pairs: 읽을 쌍
+
+        Returns:
+            dict: {쌍: PairMessageStats} - 집계가 없는 쌍은 제외
+        """
+        values: Dict[Pair, PairMessageStats] = {}
+        missing = []
+        for pair in pairs:
+            if pair in self.values:
+                values[pair] = self.values[pair]
+            elif pair in self.pairs:
+                missing.append(pair)
+        for pair, state in self.store.get_many(missing).items():
+            values[pair] = state.value_at(self.now)
+        return values
+
+    def load(self, pairs: Iterable[Pair]) -> None:
+        """쌍별 집계를 미리 조회하여 보관 (이후 get은 조회 없음)"""
+        self.values.update(self.read(pairs))
+
+    def __getitem__(self, pair: Pair) -> PairMessageStats:
+        if pair not in self.values:
+            if pair not in self.pairs:
+                raise KeyError(pair)
+            self.load([pair])
+        return self.values[pair]
+
+    def __iter__(self) -> Iterator[Pair]:
+        return iter(self.pairs)
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def __contains__(self, pair: object) -> bool:
+        return pair in self.pairs
+
+
+def messages_before(messages: Iterable[Dict[str, Any]], cutoff: datetime) -> Iterator[Dict[str, Any]]:
+    """cutoff 이전 메시지만 (그 이후는 다음 실행에서 일별 집계로 반영)"""
+    for message in messages:
+        message_time = parse_timestamp(message.get('timestamp', ''))
+        if message_time is not None and message_time < cutoff:
+            yield message
+
+
+def fetch_daily_stats(daily_store: PairDailyStatsStore, days: Iterable[str], now: datetime) -> Dict[Pair, PairMessageStats]:
+    """
+    새 날짜의 일별 집계 행을 쌍별 now 기준 집계로 변환 (날짜마다 DayIndex Query 1회)
+
+    Args:
+        daily_store: 일별 집계 저장소
+        days: 반영할 날짜 (YYYY-MM-DD)
+        now: 감쇠 기준 시각
+
+    Returns:
+        dict: {쌍: PairMessageStats} - 새 날짜에 메시지가 있는 쌍만
+    """
+    rows: Dict[Pair, List] = {}
+    for day in days:
+        for pair, daily in daily_store.query_day(day):
+            rows.setdefault(pair, []).append((day, daily))
+    return {pair: aggregate_daily_rows(pair_rows, now) for pair, pair_rows in rows.items()}
+
+
+def update_pair_states(
+    store: PairStateStore,
+    messenger_table,
+    daily_store: PairDailyStatsStore,
+    event_dates,
+    now: Optional[datetime] = None,
+    full_rebuild: bool = False,
+    pair_index=None
+) -> Tuple[DecayedPairStats, Dict[str, Any]]:
+    """
+    새 날짜의 일별 집계로 쌍별 감쇠 상태를 갱신하고 now 기준 집계 반환
+
+    Args:
+        store: 상태 저장소
+        messenger_table: MessengerLogs 테이블 (전체 재계산 시에만 스캔)
+        daily_store: 일별 집계 저장소 (증분 갱신 시 새 날짜와 끝나지 않은 날짜만 조회)
+        event_dates: 회사 행사 날짜 집합 (전체 재계산의 상황 가중치)
+        now: 기준 시각 (기본값: 현재 UTC)
+        full_rebuild: True면 상태를 무시하고 전체 이력으로 재계산
+        pair_index: 상태가 있는 쌍 목록 저장소 (get/put - JobSnapshotStore, 없으면 키만 스캔)
+
+    Returns:
+        tuple: (DecayedPairStats, 갱신 요약 {mode, new_messages, updated_pairs, removed_pairs,
+            partial_messages, watermark})
+    """
+    now = now or datetime.now(timezone.utc)
+    last_day = last_complete_day(now)
+    watermark = None if full_rebuild else store.get_watermark()
+
+    if watermark is None:
+        # 끝난 날짜까지의 메시지로 다시 만들고, 그 뒤의 메시지는 일별 집계로 반영
+        mode = FULL_REBUILD
+        cutoff = datetime.strptime(last_day, DAY_FORMAT).replace(tzinfo=timezone.utc) + timedelta(days=1)
+        messages = messages_before(iter_scan(messenger_table, **projection_kwargs(MESSAGE_ATTRIBUTES)), cutoff)
+        new_stats = aggregate_message_batch(messages, event_dates, now)
+        partial_stats = fetch_daily_stats(daily_store, open_days(last_day, now), now)
+        states: Dict[Pair, PairDecayState] = {}
+        known_pairs = store.scan_pairs()
+        indexed = False
+    else:
+        mode = INCREMENTAL
+        new_stats = fetch_daily_stats(daily_store, days_after(watermark, last_day), now)
+        last_day = max(last_day, watermark)
+        partial_stats = fetch_daily_stats(daily_store, open_days(last_day, now), now)
+        states = store.get_many(set(new_stats) | set(partial_stats))
+        indexed_pairs = load_pair_index(pair_index)
+        indexed = indexed_pairs is not None
+        known_pairs = indexed_pairs if indexed else store.scan_pairs()
+
+    updated: Dict[Pair, PairDecayState] = {}
+    for pair, stats in new_stats.items():
+        state = states.get(pair)
+        if state is None:
+            state = PairDecayState(PairMessageStats(), now)
+        state.advance(now)
+        state.stats.merge(stats)
+        updated[pair] = state
+
+    store.save(updated, last_day)
+
+    # 재계산에 없는 쌍의 이전 상태는 삭제 (남겨 두면 다음 증분 실행이 오래된 값을 읽음)
+    removed = store.delete(sorted(known_pairs - set(updated))) if mode == FULL_REBUILD else 0
+    pairs = set(updated) if mode == FULL_REBUILD else known_pairs | set(updated)
+    if pair_index is not None and not (indexed and set(updated) <= known_pairs):
+        pair_index.put(PAIR_INDEX_OBJECT, sorted(pair_id(pair) for pair in pairs))
+
+    # 이번 실행에 읽은 쌍: 갱신한 상태 + 끝나지 않은 날짜의 집계 (상태에는 저장하지 않음)
+    touched: Dict[Pair, PairMessageStats] = {pair: state.value_at(now) for pair, state in updated.items()}
+    for pair, stats in partial_stats.items():
+        if pair not in touched:
+            state = states.get(pair)
+            touched[pair] = state.value_at(now) if state is not None else PairMessageStats()
+        touched[pair].merge(stats)
+
+    summary = {
+        'mode': mode,
+        'new_messages': sum(stats.total_messages for stats in new_stats.values()),
+        'updated_pairs': len(updated),
+        'removed_pairs': removed,
+        'partial_messages': sum(stats.total_messages for stats in partial_stats.values()),
+        'watermark': last_day
+    }
+    logger.info(f"메신저 감쇠 상태 갱신: {summary}")
+
+    return DecayedPairStats(store, pairs, now, touched), summary
+
+
+def load_pair_index(pair_index=None) -> Optional[Set[Pair]]:
+    """저장된 쌍 목록 (저장소나 목록이 없으면 None - 호출자가 상태 테이블 키를 한 번 스캔)"""
+    keys = pair_index.get(PAIR_INDEX_OBJECT) if pair_index is not None else None
+    if keys is None:
+        return None
+    return {pair_from_id(key) for key in keys}
@@ -0,0 +1,167 @@
+"""
+프로젝트 협업 기간 모듈
+
+직원 프로젝트 이력의 참여 기간(period)을 한 번만 월 단위 구간으로 파싱하고,
+프로젝트별로 시작 월 순으로 정렬한 구간을 스윕하여 함께 참여한 모든 직원 쌍의
+실제 중복 개월 수를 구합니다. 직원 쌍마다 두 이력을 이중 루프로 비교하지 않으며,
+전사 계산량은 O(전체 참여 이력 수 · log + 중복 쌍 수)입니다.
+
+- 스윕: 새 구간이 시작될 때 이미 끝난 구간을 최소 힙에서 제거하고,
+  남은(진행 중인) 구간마다 min(종료) - 시작 개월을 중복으로 기록
+- 기간 형식: "2024-01 ~ 2025-07" (종료 월 포함), "2024.01 ~ 현재",
+  {"start": "2024-01", "end": "2025-07"} (projects_data.json)
+"""
+
+import heapq
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from candidate_pairs import get_project_history, project_key
+except ImportError:
+    from lambda_functions.affinity_calculator.candidate_pairs import get_project_history, project_key
+
+
+# 종료 월 대신 쓰이는 진행 중 표기
+ONGOING_MARKERS = ('현재', '진행중', '진행 중', 'present', 'current', 'now', 'ongoing')
+
+MONTH_PATTERN = re.compile(r'(\d{4})\s*[-./년]\s*(\d{1,2})')
+
+Pair = Tuple[str, str]
+
+# (시작 월 번호, 종료 월 번호 - 포함) / 월 번호 = 연 × 12 + (월 - 1)
+MonthInterval = Tuple[int, int]
+
+
+def month_index(year: int, month: int) -> int:
+    """연·월 → 월 번호"""
+    return year * 12 + (month - 1)
+
+
+def current_month_index() -> int:
+    """현재 UTC 월 번호"""
+    now = datetime.now(timezone.utc)
+    return month_index(now.year, now.month)
+
+
+def parse_month(text: Any) -> Optional[int]:
+    """'YYYY-MM' 형태 문자열의 월 번호 (형식 오류면 None)"""
+    match = MONTH_PATTERN.search(str(text or ''))
+    if not match:
+        return None
+    year, month = int(match.group(1)), int(match.group(2))
+    return month_index(year, month) if 1 <= month <= 12 else None
+
+
+def parse_period(period: Any, current_month: Optional[int] = None) -> Optional[MonthInterval]:
+    """
+    참여 기간 → 월 구간 (종료 월 포함)
+
+    Args:
+        period: "YYYY-MM ~ YYYY-MM" 문자열 또는 {start, end} dict
+        current_month: 진행 중 기간의 종료 월 번호 (기본값: 현재 월)
+
+    Returns:
+        tuple: (시작 월 번호, 종료 월 번호) - 파싱 실패 또는 역전된 기간이면 None
+    """
+    if isinstance(period, dict):
+        start_text, end_text = period.get('start'), period.get('end')
+    else:
+        parts = re.split(r'\s*[~–]\s*', str(period or ''), maxsplit=1)
+        start_text, end_text = parts[0], parts[1] if len(parts) > 1 else ''
+
+    start = parse_month(start_text)
+    if start is None:
+        return None
+
+    end_text = str(end_text or '').strip()
+    end = parse_month(end_text)
+    if end is None:
+        if end_text and end_text.lower() not in ONGOING_MARKERS:
+            return None
+        # 종료 월이 없거나 진행 중이면 현재 월까지
+        end = current_month if current_month is not None else current_month_index()
+
+    return (start, end) if start <= end else None
+
+
+def overlap_months(interval_1: Optional[MonthInterval], interval_2: Optional[MonthInterval]) -> int:
+    """두 월 구간의 중복 개월 수 (종료 월 포함)"""
+    if not interval_1 or not interval_2:
+        return 0
+    return max(0, min(interval_1[1], interval_2[1]) - max(interval_1[0], interval_2[0]) + 1)
+
+
+def build_project_intervals(
+    employees: Dict[str, Dict[str, Any]],
+    current_month: Optional[int] = None
+) -> Dict[str, List[Tuple[int, int, str]]]:
+    """
+    프로젝트 → 참여 구간 목록 (기간은 이력마다 한 번만 파싱)
+
+    Args:
+        employees: {직원 ID: 직원 데이터}
+        current_month: 진행 중 기간의 종료 월 번호
+
+    Returns:
+        dict: {프로젝트 식별자: [(시작 월, 종료 월 다음 달, 직원 ID)]} - 종료는 배타적
+    """
+    current_month = current_month if current_month is not None else current_month_index()
+    intervals: Dict[str, List[Tuple[int, int, str]]] = {}
+    for employee_id, employee in employees.items():
+        for project in get_project_history(employee):
+            if not isinstance(project, dict):
+                continue
+            key = project_key(project)
+            interval = parse_period(project.get('duration') or project.get('period', ''), current_month)
+            if key and interval:
+                intervals.setdefault(key, []).append((interval[0], interval[1] + 1, employee_id))
+    return intervals
+
+
+def sweep_overlaps(intervals: Iterable[Tuple[int, int, str]]) -> Dict[Pair, int]:
+    """
+    한 프로젝트의 참여 구간을 스윕하여 직원 쌍별 중복 개월 수 계산
+
+    Args:
+        intervals: [(시작 월, 배타적 종료 월, 직원 ID)]
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): 중복 개월 수} - 같은 직원의 여러 참여 기간은 합산
+    """
+    overlaps: Dict[Pair, int] = {}
+    active: List[Tuple[int, str]] = []  # (배타적 종료 월, 직원 ID) 최소 힙
+
+    for start, end, employee_id in sorted(intervals):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for other_end, other_id in active:
+            if other_id == employee_id:
+                continue
+            pair = (employee_id, other_id) if employee_id <= other_id else (other_id, employee_id)
+            overlaps[pair] = overlaps.get(pair, 0) + min(end, other_end) - start
+        heapq.heappush(active, (end, employee_id))
+
+    return overlaps
+
+
+def compute_project_overlaps(
+    employees: Dict[str, Dict[str, Any]],
+    current_month: Optional[int] = None
+) -> Dict[Pair, Dict[str, int]]:
+    """
+    전사 직원 쌍별 프로젝트 중복 개월 수 (한 번의 스윕)
+
+    Args:
+        employees: {직원 ID: 직원 데이터}
+        current_month: 진행 중 기간의 종료 월 번호 (기본값: 현재 월)
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): {프로젝트 식별자: 중복 개월 수}} - 중복이 있는 쌍만
+    """
+    project_overlaps: Dict[Pair, Dict[str, int]] = {}
+    for key, intervals in build_project_intervals(employees, current_month).items():
+        for pair, months in sweep_overlaps(intervals).items():
+            project_overlaps.setdefault(pair, {})[key] = months
+    return project_overlaps
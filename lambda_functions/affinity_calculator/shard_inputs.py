@@ -0,0 +1,192 @@
+"""
+친밀도 분산 작업 입력 스냅샷 모듈
+
+워커와 이어서 처리하는 호출마다 Employees/CompanyEvents/AffinityPairState를 다시 스캔하면
+샤드 수 × 호출 수만큼 전체 입력을 반복해서 읽게 됩니다. 코디네이터가 입력을 한 번 집계한 뒤
+샤드마다 필요한 부분(샤드 쌍과 그 쌍의 메신저 집계, 공동 참여 행사, 프로젝트 중복 개월 수)만
+잘라 gzip JSON으로 저장하고, 워커는 자기 샤드 조각 하나만 읽어 점수를 계산합니다.
+
+- 위치: AFFINITY_JOB_SNAPSHOT_URI 환경 변수 (s3://버킷/접두사 또는 로컬 디렉토리)
+- 키: {접두사}/runs/{run_id}/run.json.gz (실행 정보), {접두사}/runs/{run_id}/shard-0000.json.gz (샤드 조각),
+  {접두사}/runs/{run_id}/neighbors-0000.json.gz (샤드를 끝낸 워커가 이번 점수로 만든 샤드별 상위 K 이웃과
+  직원별 점수 합계/쌍 수)
+- 실행별 항목은 S3 수명 주기 규칙으로 만료됩니다 (runs/ 접두사).
+- {접두사}/affinity-rows.json.gz: EmployeeAffinity에 남아 있을 수 있는 친밀도 ID 목록. 다음 실행이
+  후보에서 빠진 쌍(이전 행 - 이번 후보)을 찾아 샤드별 조각의 departed로 나누어 삭제합니다.
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import boto3
+from botocore.exceptions import ClientError
+from common.workforce_snapshot import parse_s3_uri
+
+try:
+    from messenger_aggregation import PairMessageStats
+    from sharded_job import pair_key, shard_id
+except ImportError:
+    from lambda_functions.affinity_calculator.messenger_aggregation import PairMessageStats
+    from lambda_functions.affinity_calculator.sharded_job import pair_key, shard_id
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_SNAPSHOT_URI = os.environ.get(
+    'AFFINITY_JOB_SNAPSHOT_URI', os.path.join(tempfile.gettempdir(), 'affinity-jobs')
+)
+
+# 실행별 항목 접두사 (수명 주기 만료 대상)
+RUNS_PREFIX = 'runs'
+
+# 저장된 친밀도 행 ID 목록 (실행 간 유지)
+KNOWN_ROWS_OBJECT = 'affinity-rows'
+
+Pair = Tuple[str, str]
+
+
+class ShardSlice(NamedTuple):
+    """샤드 하나의 계산 입력"""
+    pairs: List[Pair]
+    message_stats: Dict[Pair, PairMessageStats]
+    shared_events: Dict[Pair, List[str]]
+    project_overlaps: Dict[Pair, Dict[str, int]]
+    departed: List[str]
+
+
+def run_object_name(run_id: str, name: str) -> str:
+    """실행별 항목 이름 (runs/{run_id}/{name})"""
+    return f"{RUNS_PREFIX}/{run_id}/{name}"
+
+
+def shard_object_name(run_id: str, shard_index: int) -> str:
+    """샤드 조각 항목 이름"""
+    return run_object_name(run_id, f"shard-{shard_id(shard_index)}")
+
+
+def neighbors_object_name(run_id: str, shard_index: int) -> str:
+    """샤드별 상위 K 이웃 항목 이름"""
+    return run_object_name(run_id, f"neighbors-{shard_id(shard_index)}")
+
+
+def build_shard_slice(
+    pairs: Iterable[Pair],
+    message_stats: Dict[Pair, PairMessageStats],
+    shared_events: Dict[Pair, List[str]],
+    project_overlaps: Dict[Pair, Dict[str, int]],
+    departed: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    샤드 쌍의 입력만 잘라 저장 형식(dict)으로 변환
+
+    Args:
+        pairs: 쌍 키 순으로 정렬된 샤드 쌍
+        message_stats: 전체 쌍별 메신저 집계
+        shared_events: 전체 쌍별 공동 참여 행사
+        project_overlaps: 전체 쌍별 프로젝트 중복 개월 수
+        departed: 이 샤드가 삭제할 친밀도 ID (후보에서 빠진 이전 쌍)
+
+    Returns:
+        dict: {'pairs': [[직원, 직원]], 'messages' / 'events' / 'projects': {쌍 키: 값}, 'departed': [ID]}
+            - 쌍별 값은 근거가 있는 쌍만
+    """
+    pairs = list(pairs)
+    messages, events, projects = {}, {}, {}
+    for pair in pairs:
+        key = pair_key(pair)
+        stats = message_stats.get(pair)
+        if stats is not None:
+            messages[key] = [stats.total_messages, stats.weighted_score, stats.response_time_sum, stats.response_count]
+        if shared_events.get(pair):
+            events[key] = list(shared_events[pair])
+        if project_overlaps.get(pair):
+            projects[key] = dict(project_overlaps[pair])
+    return {
+        'pairs': [list(pair) for pair in pairs],
+        'messages': messages,
+        'events': events,
+        'projects': projects,
+        'departed': sorted(departed)
+    }
+
+
+def parse_shard_slice(payload: Dict[str, Any]) -> ShardSlice:
+    """저장 형식(dict) → ShardSlice"""
+    pairs = [(pair[0], pair[1]) for pair in payload['pairs']]
+    by_key = {pair_key(pair): pair for pair in pairs}
+
+    message_stats = {}
+    for key, (total, weighted, response_sum, response_count) in payload.get('messages', {}).items():
+        stats = PairMessageStats()
+        stats.total_messages = int(total)
+        stats.weighted_score = float(weighted)
+        stats.response_time_sum = float(response_sum)
+        stats.response_count = int(response_count)
+        message_stats[by_key[key]] = stats
+
+    return ShardSlice(
+        pairs,
+        message_stats,
+        {by_key[key]: list(events) for key, events in payload.get('events', {}).items()},
+        {by_key[key]: {project: int(months) for project, months in overlaps.items()}
+         for key, overlaps in payload.get('projects', {}).items()},
+        list(payload.get('departed', []))
+    )
+
+
+class JobSnapshotStore:
+    """분산 작업 입력 스냅샷 저장소 (S3 또는 로컬 디렉토리, gzip JSON)"""
+
+    def __init__(self, uri: str = DEFAULT_SNAPSHOT_URI, s3_client=None):
+        """
+        Args:
+            uri: s3://버킷/접두사 또는 로컬 디렉토리
+            s3_client: boto3 S3 클라이언트 (기본값: S3 위치이면 새로 생성)
+        """
+        self.s3_location = parse_s3_uri(uri)
+        self.root = uri.rstrip('/')
+        self.s3_client = s3_client
+        if self.s3_location and self.s3_client is None:
+            self.s3_client = boto3.client('s3', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+
+    def object_key(self, name: str) -> str:
+        """항목 이름 → S3 키 또는 로컬 경로"""
+        if self.s3_location:
+            prefix = self.s3_location[1]
+            return f"{prefix.strip('/')}/{name}.json.gz" if prefix.strip('/') else f"{name}.json.gz"
+        return os.path.join(self.root, f"{name}.json.gz")
+
+    def put(self, name: str, payload: Any) -> None:
+        """항목 저장 (덮어쓰기)"""
+        body = gzip.compress(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        key = self.object_key(name)
+        if self.s3_location:
+            self.s3_client.put_object(Bucket=self.s3_location[0], Key=key, Body=body)
+            return
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        with open(key, 'wb') as file:
+            file.write(body)
+
+    def get(self, name: str) -> Optional[Any]:
+        """항목 조회 (없으면 None)"""
+        key = self.object_key(name)
+        try:
+            if self.s3_location:
+                body = self.s3_client.get_object(Bucket=self.s3_location[0], Key=key)['Body'].read()
+            else:
+                with open(key, 'rb') as file:
+                    body = file.read()
+        except FileNotFoundError:
+            return None
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return None
+            raise
+        return json.loads(gzip.decompress(body).decode('utf-8'))
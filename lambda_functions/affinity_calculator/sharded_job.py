@@ -0,0 +1,355 @@
+"""
+친밀도 계산 분산 작업 모듈 (코디네이터 / 워커)
+
+후보 쌍 전체를 한 번의 호출에서 순차 처리하면 직원 수가 늘어날 때 Lambda 15분 제한에 걸립니다.
+코디네이터가 후보 쌍을 쌍 키 해시로 샤드에 나누어 워커를 비동기 자기 호출(InvocationType=Event)로
+실행하고, 워커는 처리한 마지막 쌍을 DynamoDB에 체크포인트하여 재시도나 이어서 처리할 때
+그 다음 쌍부터 다시 시작합니다. 마지막 샤드를 끝낸 워커가 실행(run) 버전을 게시합니다.
+
+- 작업 테이블: AFFINITY_JOB_TABLE 환경 변수 (기본값: AffinityJobRuns), 키 run_id + shard_id
+  - 실행 항목(shard_id=#RUN): shard_count, as_of(감쇠 기준 시각), completed_shards, status
+  - 샤드 항목(shard_id=0000…): status, last_pair, processed_pairs
+  - 게시 포인터(run_id=#LATEST): 마지막으로 완료된 run_id
+- 워커는 남은 실행 시간이 WORKER_TIME_MARGIN_MS 미만이면 체크포인트 후 같은 샤드를 다시 호출합니다.
+- 로컬 실행/테스트는 ProcessPoolRunner로 같은 페이로드를 프로세스 풀에서 실행합니다.
+"""
+
+import json
+import logging
+import os
+import time
+import uuid
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import boto3
+from botocore.exceptions import ClientError
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_TABLE_NAME = os.environ.get('AFFINITY_JOB_TABLE', 'AffinityJobRuns')
+
+# 샤드 수 (1이면 분산하지 않고 한 번의 호출에서 처리)
+DEFAULT_SHARD_COUNT = int(os.environ.get('AFFINITY_SHARD_COUNT', '1'))
+
+# 체크포인트 간격 (처리한 쌍 수)
+CHECKPOINT_INTERVAL = 200
+
+# 남은 실행 시간이 이보다 적으면 체크포인트 후 이어서 호출
+WORKER_TIME_MARGIN_MS = 60 * 1000
+
+# 작업 항목 보관 기간
+JOB_TTL_SECONDS = 30 * 24 * 60 * 60  # 30일
+
+# 호출 모드
+WORKER_MODE = 'worker'
+
+# 항목 키
+RUN_KEY = '#RUN'
+LATEST_RUN_KEY = '#LATEST'
+
+# 상태
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_PUBLISHED = 'published'
+
+Pair = Tuple[str, str]
+
+
+def new_job_run_id(now: datetime) -> str:
+    """실행 ID (시각 + 임의 접미사, 사전순 = 시간순)"""
+    return f"AFFRUN_{now:%Y%m%dT%H%M%SZ}_{uuid.uuid4().hex[:8]}"
+
+
+def pair_key(pair: Pair) -> str:
+    """체크포인트용 쌍 키 ("직원1#직원2")"""
+    return f"{pair[0]}#{pair[1]}"
+
+
+def shard_id(shard_index: int) -> str:
+    """샤드 항목 정렬 키"""
+    return f"{shard_index:04d}"
+
+
+def shard_of(pair: Pair, shard_count: int) -> int:
+    """쌍이 속한 샤드 (쌍 키 CRC32 - 호출과 프로세스가 달라도 같은 값)"""
+    return shard_of_key(pair_key(pair), shard_count)
+
+
+def shard_of_key(key: str, shard_count: int) -> int:
+    """문자열 키(쌍 키, 친밀도 ID)가 속한 샤드 (CRC32)"""
+    return zlib.crc32(key.encode('utf-8')) % shard_count
+
+
+def shard_pairs(pairs: Iterable[Pair], shard_count: int, shard_index: int) -> List[Pair]:
+    """샤드에 속한 쌍 (체크포인트 재개를 위해 쌍 키 순 정렬)"""
+    return sorted(pair for pair in pairs if shard_of(pair, shard_count) == shard_index)
+
+
+def run_shard(
+    pairs: List[Pair],
+    start_after: Optional[str],
+    processed: int,
+    process_pair: Callable[[Pair], None],
+    save_progress: Callable[[str, int], None],
+    should_yield: Callable[[], bool] = lambda: False,
+    checkpoint_interval: int = CHECKPOINT_INTERVAL
+) -> Tuple[int, bool]:
+    """
+    샤드의 쌍을 체크포인트 이후부터 처리
+
+    Args:
+        pairs: 쌍 키 순으로 정렬된 샤드 쌍
+        start_after: 마지막으로 처리한 쌍 키 (없으면 처음부터)
+        processed: 이전 호출까지 처리한 쌍 수
+        process_pair: 쌍 하나 처리 (점수 계산 및 저장 - 재실행해도 같은 결과여야 함)
+        save_progress: 체크포인트 저장 (마지막 쌍 키, 누적 처리 수)
+        should_yield: True를 반환하면 체크포인트 후 중단 (남은 실행 시간 부족)
+        checkpoint_interval: 체크포인트 간격
+
+    Returns:
+        tuple: (누적 처리 수, 샤드 완료 여부)
+    """
+    last_key = start_after
+    since_checkpoint = 0
+    for pair in pairs:
+        key = pair_key(pair)
+        if start_after is not None and key <= start_after:
+            continue
+        if should_yield():
+            if since_checkpoint:
+                save_progress(last_key, processed)
+            return processed, False
+
+        process_pair(pair)
+        processed += 1
+        since_checkpoint += 1
+        last_key = key
+        if since_checkpoint >= checkpoint_interval:
+            save_progress(last_key, processed)
+            since_checkpoint = 0
+
+    return processed, True
+
+
+class JobCheckpointStore:
+    """분산 작업 실행/샤드 체크포인트 저장소 (AffinityJobRuns)"""
+
+    def __init__(self, table):
+        """
+        Args:
+            table: DynamoDB Table (boto3 resource)
+        """
+        self.table = table
+
+    def start_run(self, run_id: str, shard_count: int, as_of: datetime, summary: Dict[str, Any]) -> None:
+        """
+        실행 항목과 샤드 항목 생성
+
+        Args:
+            run_id: 실행 ID
+            shard_count: 샤드 수
+            as_of: 메신저 감쇠 기준 시각 (모든 워커가 같은 시각으로 점수 계산)
+            summary: 코디네이터 요약 (후보 쌍 수 등)
+        """
+        now = int(time.time())
+        expires_at = now + JOB_TTL_SECONDS
+        with self.table.batch_writer() as batch:
+            batch.put_item(Item={
+                'run_id': run_id,
+                'shard_id': RUN_KEY,
+                'shard_count': shard_count,
+                'as_of': as_of.isoformat(),
+                'completed_shards': 0,
+                'processed_pairs': 0,
+                'status': STATUS_RUNNING,
+                'summary': json.dumps(summary, ensure_ascii=False),
+                'created_at': now,
+                'expires_at': expires_at
+            })
+            for shard_index in range(shard_count):
+                batch.put_item(Item={
+                    'run_id': run_id,
+                    'shard_id': shard_id(shard_index),
+                    'status': STATUS_PENDING,
+                    'processed_pairs': 0,
+                    'updated_at': now,
+                    'expires_at': expires_at
+                })
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """실행 항목 조회"""
+        return self.table.get_item(Key={'run_id': run_id, 'shard_id': RUN_KEY}).get('Item')
+
+    def get_shard(self, run_id: str, shard_index: int) -> Optional[Dict[str, Any]]:
+        """샤드 항목 조회 (강한 일관성 - 방금 저장한 체크포인트부터 재개)"""
+        return self.table.get_item(
+            Key={'run_id': run_id, 'shard_id': shard_id(shard_index)},
+            ConsistentRead=True
+        ).get('Item')
+
+    def save_progress(self, run_id: str, shard_index: int, last_pair: str, processed_pairs: int) -> None:
+        """샤드 체크포인트 저장"""
+        self.table.update_item(
+            Key={'run_id': run_id, 'shard_id': shard_id(shard_index)},
+            UpdateExpression='SET #status = :running, last_pair = :last_pair, '
+                             'processed_pairs = :processed, updated_at = :now',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={
+                ':running': STATUS_RUNNING,
+                ':last_pair': last_pair,
+                ':processed': processed_pairs,
+                ':now': int(time.time())
+            }
+        )
+
+    def add_counts(self, run_id: str, counts: Dict[str, int]) -> None:
+        """실행 항목에 워커 호출별 집계(저장/건너뜀 쌍 수 등) 누적"""
+        if not counts:
+            return
+        names = {f"#c{index}": name for index, name in enumerate(counts)}
+        self.table.update_item(
+            Key={'run_id': run_id, 'shard_id': RUN_KEY},
+            UpdateExpression='ADD ' + ', '.join(f"{alias} :c{index}" for index, alias in enumerate(names)),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues={f":c{index}": int(value) for index, value in enumerate(counts.values())}
+        )
+
+    def complete_shard(self, run_id: str, shard_index: int, processed_pairs: int) -> bool:
+        """
+        샤드 완료 처리 (중복 완료는 한 번만 집계)
+
+        Returns:
+            bool: 이 호출로 모든 샤드가 완료되었으면 True (게시 담당)
+        """
+        try:
+            self.table.update_item(
+                Key={'run_id': run_id, 'shard_id': shard_id(shard_index)},
+                UpdateExpression='SET #status = :done, processed_pairs = :processed, updated_at = :now',
+                ConditionExpression='#status <> :done',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':done': STATUS_DONE,
+                    ':processed': processed_pairs,
+                    ':now': int(time.time())
+                }
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+        response = self.table.update_item(
+            Key={'run_id': run_id, 'shard_id': RUN_KEY},
+            UpdateExpression='ADD completed_shards :one, processed_pairs :processed',
+            ExpressionAttributeValues={':one': 1, ':processed': processed_pairs},
+            ReturnValues='ALL_NEW'
+        )
+        run = response['Attributes']
+        return int(run['completed_shards']) >= int(run['shard_count'])
+
+    def publish(self, run_id: str) -> Dict[str, Any]:
+        """
+        실행 버전 게시 (실행 상태 변경 + #LATEST 포인터 갱신)
+
+        Returns:
+            dict: 게시 포인터 항목
+        """
+        now = int(time.time())
+        run = self.table.update_item(
+            Key={'run_id': run_id, 'shard_id': RUN_KEY},
+            UpdateExpression='SET #status = :published, published_at = :now',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={':published': STATUS_PUBLISHED, ':now': now},
+            ReturnValues='ALL_NEW'
+        )['Attributes']
+
+        latest = {
+            'run_id': LATEST_RUN_KEY,
+            'shard_id': RUN_KEY,
+            'published_run_id': run_id,
+            'as_of': run['as_of'],
+            'processed_pairs': int(run.get('processed_pairs', 0)),
+            'published_at': now
+        }
+        # 늦게 끝난 이전 실행이 최신 포인터를 되돌리지 않도록 실행 ID(시간순) 비교
+        try:
+            self.table.put_item(
+                Item=latest,
+                ConditionExpression='attribute_not_exists(published_run_id) OR published_run_id < :run_id',
+                ExpressionAttributeValues={':run_id': run_id}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            logger.info(f"더 최신 실행이 이미 게시됨 - 포인터 유지: {run_id}")
+        logger.info(f"친밀도 실행 게시: {run_id} ({latest['processed_pairs']} pairs)")
+        return latest
+
+    def get_latest(self) -> Optional[Dict[str, Any]]:
+        """마지막으로 게시된 실행 포인터"""
+        return self.table.get_item(Key={'run_id': LATEST_RUN_KEY, 'shard_id': RUN_KEY}).get('Item')
+
+
+class LambdaInvokeRunner:
+    """워커 실행기 - 같은 Lambda 함수를 비동기(Event)로 자기 호출"""
+
+    def __init__(self, function_name: str, lambda_client=None):
+        """
+        Args:
+            function_name: 호출할 함수 이름 (AWS_LAMBDA_FUNCTION_NAME)
+            lambda_client: boto3 Lambda 클라이언트 (기본값: 새로 생성)
+        """
+        self.function_name = function_name
+        self.lambda_client = lambda_client or boto3.client(
+            'lambda', region_name=os.environ.get('AWS_REGION', 'us-east-2')
+        )
+
+    def submit(self, payload: Dict[str, Any]) -> None:
+        """워커 호출 (응답을 기다리지 않음, 실패 시 Lambda 비동기 재시도)"""
+        self.lambda_client.invoke(
+            FunctionName=self.function_name,
+            InvocationType='Event',
+            Payload=json.dumps(payload).encode('utf-8')
+        )
+
+
+class ProcessPoolRunner:
+    """워커 실행기 - 로컬 프로세스 풀 (로컬 재계산, 테스트)"""
+
+    def __init__(self, target: Callable[[Dict[str, Any]], Any], max_workers: Optional[int] = None):
+        """
+        Args:
+            target: 페이로드를 받아 워커를 실행하는 모듈 수준 함수 (피클 가능)
+            max_workers: 프로세스 수 (기본값: CPU 수)
+        """
+        self.target = target
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._futures: List[Future] = []
+
+    def submit(self, payload: Dict[str, Any]) -> Future:
+        """워커 실행 예약"""
+        future = self._executor.submit(self.target, payload)
+        self._futures.append(future)
+        return future
+
+    def results(self) -> List[Any]:
+        """예약한 모든 워커의 결과 (예약 순서, 워커 예외는 그대로 전파)"""
+        wait(self._futures)
+        return [future.result() for future in self._futures]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ProcessPoolRunner':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
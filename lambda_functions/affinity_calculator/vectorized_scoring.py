@@ -0,0 +1,246 @@
+"""
+메신저 쌍별 집계 벡터화 경로 (NumPy)
+
+aggregate_messages()는 메시지마다 ISO 시각 파싱, 감쇠 계산, 시간/요일 판단, 행사일 조회를
+파이썬으로 반복합니다. 이 모듈은 같은 집계를 열 배열 연산으로 계산합니다.
+
+- 시각: datetime64[us] 배열로 한 번에 파싱 (Z/시간대 없음은 UTC, 다른 오프셋만 개별 파싱)
+- 감쇠·상황 가중치: 배열 식 (요일은 1970-01-01 목요일 기준 일수로 계산)
+- 행사일: 정렬된 datetime64[D] 배열에 대한 np.isin
+- 쌍별 합계: 직원 ID를 정수 코드로 바꾼 뒤 정수 쌍 ID에 대한 np.bincount
+
+결과는 aggregate_messages()와 같은 {(직원 ID, 직원 ID): PairMessageStats}이며,
+NumPy가 없는 레이어에서는 aggregate_message_batch()가 메시지 단위 루프를 사용합니다.
+"""
+
+import warnings
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Set
+
+try:
+    from messenger_aggregation import (
+        AFTER_HOURS_WEIGHT, COMPANY_EVENT_WEIGHT, DAYS_PER_MONTH, DECAY_RATE_PER_MONTH, VACATION_WEIGHT,
+        WORK_HOURS_WEIGHT, Pair, PairMessageStats, aggregate_messages, parse_timestamp
+    )
+except ImportError:
+    from lambda_functions.affinity_calculator.messenger_aggregation import (
+        AFTER_HOURS_WEIGHT, COMPANY_EVENT_WEIGHT, DAYS_PER_MONTH, DECAY_RATE_PER_MONTH, VACATION_WEIGHT,
+        WORK_HOURS_WEIGHT, Pair, PairMessageStats, aggregate_messages, parse_timestamp
+    )
+from common.pair_daily_stats import WORK_END_HOUR, WORK_START_HOUR
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없는 레이어에서는 메시지 단위 루프 사용
+    np = None
+
+
+# 1970-01-01(일수 0)의 요일 (월요일 = 0)
+EPOCH_WEEKDAY = 3
+
+
+class MessageColumns:
+    """
+    집계용 메시지 열 배열
+
+    Attributes:
+        employee_ids: 직원 ID 배열 (코드 → ID)
+        senders, receivers: 직원 코드 (int32, ID가 없으면 -1)
+        utc_times: 감쇠 계산용 UTC 시각 (datetime64[us], 형식 오류면 NaT)
+        wall_times: 상황 구분용 메시지 현지 시각 (datetime64[us])
+        response_times: 응답 시간(분) (float64, 없으면 NaN)
+        vacation: 연차 기간 여부 (bool)
+    """
+
+    def __init__(self, employee_ids, senders, receivers, utc_times, wall_times, response_times, vacation):
+        self.employee_ids = employee_ids
+        self.senders = senders
+        self.receivers = receivers
+        self.utc_times = utc_times
+        self.wall_times = wall_times
+        self.response_times = response_times
+        self.vacation = vacation
+
+    def __len__(self) -> int:
+        return len(self.senders)
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[Dict[str, Any]]) -> 'MessageColumns':
+        """
+        메시지 항목을 한 번 순회하여 열 배열 생성 (항목 dict는 보관하지 않음)
+
+        Args:
+            messages: 메시지 항목 (sender_id, receiver_id, timestamp, response_time_minutes, is_vacation_period)
+        """
+        codes: Dict[str, int] = {}
+        senders, receivers, timestamps, response_times, vacation = [], [], [], [], []
+        for message in messages:
+            sender_id = message.get('sender_id')
+            receiver_id = message.get('receiver_id')
+            senders.append(codes.setdefault(sender_id, len(codes)) if sender_id else -1)
+            receivers.append(codes.setdefault(receiver_id, len(codes)) if receiver_id else -1)
+            timestamps.append(str(message.get('timestamp') or ''))
+            response_time = message.get('response_time_minutes')
+            response_times.append(float(response_time) if response_time else np.nan)
+            vacation.append(bool(message.get('is_vacation_period', False)))
+
+        utc_times, wall_times = parse_timestamps(np.array(timestamps, dtype=str))
+        return cls(
+            np.array(list(codes), dtype=object),
+            np.array(senders, dtype=np.int32),
+            np.array(receivers, dtype=np.int32),
+            utc_times,
+            wall_times,
+            np.array(response_times, dtype=np.float64),
+            np.array(vacation, dtype=bool)
+        )
+
+
+def parse_timestamps(timestamps):
+    """
+    ISO 8601 시각 문자열 배열 파싱
+
+    Z로 끝나는 문자열은 NumPy가 한 번에 파싱하고, 다른 오프셋이나 형식 오류가 섞인 경우만
+    parse_timestamp()로 개별 파싱합니다 (형식 오류는 NaT).
+
+    Returns:
+        tuple: (UTC 시각, 현지 시각) datetime64[us] 배열
+    """
+    count = len(timestamps)
+    utc_times = np.full(count, np.datetime64('NaT'), dtype='datetime64[us]')
+    if not count:
+        return utc_times, utc_times.copy()
+
+    zulu = np.char.endswith(timestamps, 'Z')
+    try:
+        with warnings.catch_warnings():
+            # 'Z' 접미사 파싱 경고 (UTC로 해석되므로 무시)
+            warnings.simplefilter('ignore')
+            utc_times[zulu] = np.array(timestamps[zulu], dtype='datetime64[us]')
+        fallback = np.flatnonzero(~zulu)
+    except ValueError:
+        fallback = np.arange(count)
+
+    wall_times = utc_times.copy()
+    for index in fallback:
+        parsed = parse_timestamp(timestamps[index])
+        if parsed is None:
+            utc_times[index] = wall_times[index] = np.datetime64('NaT')
+            continue
+        utc_times[index] = np.datetime64(parsed.astimezone(timezone.utc).replace(tzinfo=None), 'us')
+        wall_times[index] = np.datetime64(parsed.replace(tzinfo=None), 'us')
+    return utc_times, wall_times
+
+
+def event_day_array(event_dates: Set[str]):
+    """행사 날짜 집합 → 정렬된 datetime64[D] 배열 (형식 오류 날짜 제외)"""
+    days = []
+    for event_date in event_dates:
+        try:
+            days.append(np.datetime64(str(event_date)[:10], 'D'))
+        except ValueError:
+            continue
+    return np.sort(np.array(days, dtype='datetime64[D]'))
+
+
+def context_weights(columns: MessageColumns, event_days):
+    """상황별 가중치 배열 (연차 > 회사 행사일 > 업무 시간 외/주말 > 업무 시간)"""
+    days = columns.wall_times.astype('datetime64[D]')
+    hours = (columns.wall_times - days) // np.timedelta64(1, 'h')
+    weekend = (days.astype(np.int64) + EPOCH_WEEKDAY) % 7 >= 5
+    after_hours = weekend | (hours < WORK_START_HOUR) | (hours >= WORK_END_HOUR)
+    return np.select(
+        [columns.vacation, np.isin(days, event_days), after_hours],
+        [VACATION_WEIGHT, COMPANY_EVENT_WEIGHT, AFTER_HOURS_WEIGHT],
+        default=WORK_HOURS_WEIGHT
+    )
+
+
+def time_decays(columns: MessageColumns, now: datetime):
+    """시간 감쇠 배열 e^(-λ × 경과 개월 수) (기준 시각 이후 메시지는 1)"""
+    now64 = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), 'us')
+    elapsed_days = np.maximum((now64 - columns.utc_times) / np.timedelta64(1, 'D'), 0.0)
+    return np.exp(-DECAY_RATE_PER_MONTH * elapsed_days / DAYS_PER_MONTH)
+
+
+def aggregate_columns(
+    columns: MessageColumns,
+    event_dates: Set[str],
+    now: Optional[datetime] = None
+) -> Dict[Pair, PairMessageStats]:
+    """
+    열 배열을 표준 직원 쌍별로 집계 (aggregate_messages()와 같은 결과)
+
+    Args:
+        columns: 메시지 열 배열
+        event_dates: 회사 행사 날짜 집합
+        now: 감쇠 기준 시각 (기본값: 현재 UTC)
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): PairMessageStats}
+    """
+    now = now or datetime.now(timezone.utc)
+    valid = (
+        (columns.senders >= 0) & (columns.receivers >= 0)
+        & (columns.senders != columns.receivers) & ~np.isnat(columns.utc_times)
+    )
+    if not valid.any():
+        return {}
+    if not valid.all():
+        columns = MessageColumns(
+            columns.employee_ids, columns.senders[valid], columns.receivers[valid], columns.utc_times[valid],
+            columns.wall_times[valid], columns.response_times[valid], columns.vacation[valid]
+        )
+
+    # 표준 쌍 (ID 사전순) - 코드를 ID 정렬 순위로 바꿔 작은 쪽을 앞에 둠
+    employee_count = len(columns.employee_ids)
+    rank = np.empty(employee_count, dtype=np.int64)
+    rank[np.argsort(columns.employee_ids.astype(str), kind='stable')] = np.arange(employee_count)
+    sender_rank = rank[columns.senders]
+    receiver_rank = rank[columns.receivers]
+    pair_codes = np.minimum(sender_rank, receiver_rank) * employee_count + np.maximum(sender_rank, receiver_rank)
+    unique_codes, pair_index = np.unique(pair_codes, return_inverse=True)
+    pair_index = pair_index.ravel()
+    pair_count = len(unique_codes)
+
+    weights = context_weights(columns, event_day_array(event_dates)) * time_decays(columns, now)
+    responded = ~np.isnan(columns.response_times)
+
+    totals = np.bincount(pair_index, minlength=pair_count)
+    weighted = np.bincount(pair_index, weights=weights, minlength=pair_count)
+    response_sums = np.bincount(
+        pair_index, weights=np.where(responded, columns.response_times, 0.0), minlength=pair_count
+    )
+    response_counts = np.bincount(pair_index, weights=responded, minlength=pair_count)
+
+    ids_by_rank = columns.employee_ids[np.argsort(rank)]
+    stats: Dict[Pair, PairMessageStats] = {}
+    for position, code in enumerate(unique_codes.tolist()):
+        pair_stats = PairMessageStats()
+        pair_stats.total_messages = int(totals[position])
+        pair_stats.weighted_score = float(weighted[position])
+        pair_stats.response_time_sum = float(response_sums[position])
+        pair_stats.response_count = int(response_counts[position])
+        stats[(ids_by_rank[code // employee_count], ids_by_rank[code % employee_count])] = pair_stats
+    return stats
+
+
+def aggregate_message_batch(
+    messages: Iterable[Dict[str, Any]],
+    event_dates: Set[str],
+    now: Optional[datetime] = None
+) -> Dict[Pair, PairMessageStats]:
+    """
+    메시지 집계 (NumPy가 있으면 벡터화 경로, 없으면 메시지 단위 루프)
+
+    Args:
+        messages: 메시지 항목
+        event_dates: 회사 행사 날짜 집합
+        now: 감쇠 기준 시각
+
+    Returns:
+        dict: {(직원 ID, 직원 ID): PairMessageStats}
+    """
+    if np is None:
+        return aggregate_messages(messages, event_dates, now)
+    return aggregate_columns(MessageColumns.from_messages(messages), event_dates, now)
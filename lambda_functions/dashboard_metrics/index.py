@@ -9,6 +9,7 @@ import boto3
 from decimal import Decimal
 from boto3.dynamodb.conditions import Attr
 from typing import Dict, List, Any
+from common.recommendation_log import RecommendationRunLog
 
 # DynamoDB 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb')
@@ -17,6 +18,13 @@ dynamodb = boto3.resource('dynamodb')
 EMPLOYEES_TABLE = os.environ.get('EMPLOYEES_TABLE', 'Employees')
 PROJECTS_TABLE = os.environ.get('PROJECTS_TABLE', 'Projects')
 EVALUATIONS_TABLE = os.environ.get('EVALUATIONS_TABLE', 'EmployeeEvaluations')
+RECOMMENDATION_RUNS_TABLE = os.environ.get('RECOMMENDATION_RUNS_TABLE', 'RecommendationRuns')
+
+# 대시보드에 표시할 최근 추천 수
+RECENT_RECOMMENDATIONS_LIMIT = 5
+
+# 추천 실행 로그 (조회 전용)
+run_log = RecommendationRunLog(dynamodb, table_name=RECOMMENDATION_RUNS_TABLE, projects_table_name=None)
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -94,29 +102,25 @@ def get_pending_reviews() -> int:
 
 
 def get_recent_recommendations() -> List[Dict[str, Any]]:
-    """최근 인력 추천 목록 조회"""
-    # 실제 구현에서는 추천 이력 테이블에서 조회
-    # 현재는 샘플 데이터 반환
-    return [
-        {
-            "project": "금융 플랫폼 구축",
-            "recommended": 3,
-            "match_rate": 95,
-            "status": "승인 대기"
-        },
-        {
-            "project": "AI 챗봇 개발",
-            "recommended": 2,
-            "match_rate": 88,
-            "status": "검토 중"
-        },
-        {
-            "project": "물류 시스템 개선",
-            "recommended": 4,
-            "match_rate": 92,
-            "status": "승인됨"
-        }
-    ]
+    """최근 인력 추천 목록 조회 (추천 실행 로그 GSI Query 1회)"""
+    try:
+        runs = run_log.recent(RECENT_RECOMMENDATIONS_LIMIT)
+        return [
+            {
+                "project": run.get('project_name') or run.get('project_id', ''),
+                "project_id": run.get('project_id', ''),
+                "recommended": int(run.get('recommended_count', 0)),
+                "match_rate": int(run.get('match_rate', 0)),
+                "status": run.get('status', ''),
+                "cache_hit": bool(run.get('cache_hit', False)),
+                "latency_ms": int(run.get('latency_ms', 0)),
+                "created_at": int(run.get('created_at', 0))
+            }
+            for run in runs
+        ]
+    except Exception as e:
+        print(f"Error getting recent recommendations: {str(e)}")
+        return []
 
 
 def get_top_skills() -> List[Dict[str, Any]]:
@@ -8,9 +8,10 @@ Requirements: 4.1, 4.2, 4.3, 4.4
 import json
 import logging
 import os
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 from decimal import Decimal
 import boto3
+from common.latency_budget import LatencyBudget
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -20,6 +21,9 @@ logger.setLevel(logging.INFO)
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
 bedrock_runtime = boto3.client('bedrock-runtime', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
 
+# LLM 근거 생성 예상 소요 시간(ms) - 남은 시간이 부족하면 구조화된 근거 사용
+LLM_REASONING_STAGE_MS = int(os.environ.get('LLM_REASONING_STAGE_MS', '6000'))
+
 
 def handler(event, context):
     """
@@ -37,6 +41,9 @@ def handler(event, context):
     try:
         logger.info(f"도메인 분석 요청 수신: {json.dumps(event)}")
         
+        # API Gateway 제한 시간 내 응답을 위한 처리 시간 예산
+        budget = LatencyBudget(context)
+        
         # 요청 본문 파싱
         body = json.loads(event.get('body', '{}'))
         analysis_type = body.get('analysis_type', 'new_domains')
@@ -49,11 +56,13 @@ def handler(event, context):
         
         # 도메인 분석 수행
         if analysis_type == 'new_domains':
-            result = analyze_new_domains(projects, employees)
+            result = analyze_new_domains(projects, employees, budget)
         elif analysis_type == 'expansion_strategy':
-            result = analyze_expansion_strategy(projects, employees)
+            result = analyze_expansion_strategy(projects, employees, budget)
         else:
-            result = analyze_new_domains(projects, employees)
+            result = analyze_new_domains(projects, employees, budget)
+        
+        result['skipped_stages'] = budget.skipped_stages
         
         return {
             'statusCode': 200,
@@ -132,7 +141,8 @@ def fetch_all_employees() -> List[Dict[str, Any]]:
 
 def analyze_new_domains(
     projects: List[Dict[str, Any]],
-    employees: List[Dict[str, Any]]
+    employees: List[Dict[str, Any]],
+    budget: Optional[LatencyBudget] = None
 ) -> Dict[str, Any]:
     """
     신규 도메인 분석
@@ -142,6 +152,7 @@ def analyze_new_domains(
     Args:
         projects: 프로젝트 목록
         employees: 직원 목록
+        budget: 처리 시간 예산 (부족하면 LLM 근거 생성 생략)
         
     Returns:
         dict: 도메인 분석 결과
@@ -155,7 +166,7 @@ def analyze_new_domains(
     # 3. 도메인 진입 분석 (Requirements: 4.3)
     domain_analysis = []
     for domain in potential_domains:
-        analysis = analyze_domain_entry(domain, employees)
+        analysis = analyze_domain_entry(domain, employees, budget)
         domain_analysis.append(analysis)
     
     return {
@@ -303,7 +314,8 @@ def identify_potential_domains(classification: Dict[str, Any]) -> List[str]:
 
 def analyze_domain_entry(
     domain: str,
-    employees: List[Dict[str, Any]]
+    employees: List[Dict[str, Any]],
+    budget: Optional[LatencyBudget] = None
 ) -> Dict[str, Any]:
     """
     도메인 진입 분석 (근거 기반)
@@ -313,6 +325,7 @@ def analyze_domain_entry(
     Args:
         domain: 도메인 이름
         employees: 직원 목록
+        budget: 처리 시간 예산 (부족하면 구조화된 근거 사용)
         
     Returns:
         dict: 도메인 진입 분석 결과
@@ -355,15 +368,23 @@ def analyze_domain_entry(
             transferable_employees
         )
         
-        # Claude를 사용한 상세 분석 및 근거 생성
-        reasoning = generate_domain_reasoning(
-            domain=domain,
-            feasibility_score=feasibility_score,
-            matched_skills=matched_skills,
-            skill_gap=skill_gap,
-            skill_proficiency=skill_proficiency,
-            transferable_count=len(transferable_employees)
-        )
+        # Claude를 사용한 상세 분석 및 근거 생성 (시간이 부족하면 구조화된 근거)
+        if budget is None or budget.allows('llm_reasoning', LLM_REASONING_STAGE_MS):
+            reasoning = generate_domain_reasoning(
+                domain=domain,
+                feasibility_score=feasibility_score,
+                matched_skills=matched_skills,
+                skill_gap=skill_gap,
+                skill_proficiency=skill_proficiency,
+                transferable_count=len(transferable_employees)
+            )
+        else:
+            reasoning = build_fallback_domain_reasoning(
+                feasibility_score=feasibility_score,
+                matched_skills=matched_skills,
+                skill_gap=skill_gap,
+                transferable_count=len(transferable_employees)
+            )
         
         return {
             'domain_name': domain,
@@ -470,29 +491,53 @@ def generate_domain_reasoning(
         
     except Exception as e:
         logger.error(f"도메인 근거 생성 실패: {str(e)}")
+        return build_fallback_domain_reasoning(
+            feasibility_score=feasibility_score,
+            matched_skills=matched_skills,
+            skill_gap=skill_gap,
+            transferable_count=transferable_count
+        )
+
+
+def build_fallback_domain_reasoning(
+    feasibility_score: float,
+    matched_skills: List[str],
+    skill_gap: List[str],
+    transferable_count: int
+) -> str:
+    """
+    구조화된 도메인 진입 근거 생성 (Bedrock 호출 실패 또는 처리 시간 부족 시)
+    
+    Args:
+        feasibility_score: 실현 가능성 점수
+        matched_skills: 보유 기술
+        skill_gap: 부족한 기술
+        transferable_count: 전환 가능 인력 수
         
-        # 폴백: 구조화된 근거 생성
-        if feasibility_score >= 70:
-            level = "높음"
-            recommendation = "즉시 진입 가능"
-        elif feasibility_score >= 40:
-            level = "중간"
-            recommendation = "단기 교육 후 진입 가능"
-        else:
-            level = "낮음"
-            recommendation = "장기 준비 필요"
-        
-        reasoning = f"[실현가능성: {level}] "
-        
-        if matched_skills:
-            reasoning += f"{', '.join(matched_skills[:3])} 등 {len(matched_skills)}개 기술을 보유하고 있으며, {transferable_count}명의 전환 가능 인력이 있습니다. "
-        
-        if skill_gap:
-            reasoning += f"다만 {', '.join(skill_gap[:3])} 등 {len(skill_gap)}개 기술이 부족합니다. "
-        
-        reasoning += f"[전략] {recommendation}."
-        
-        return reasoning
+    Returns:
+        str: 도메인 진입 근거
+    """
+    if feasibility_score >= 70:
+        level = "높음"
+        recommendation = "즉시 진입 가능"
+    elif feasibility_score >= 40:
+        level = "중간"
+        recommendation = "단기 교육 후 진입 가능"
+    else:
+        level = "낮음"
+        recommendation = "장기 준비 필요"
+    
+    reasoning = f"[실현가능성: {level}] "
+    
+    if matched_skills:
+        reasoning += f"{', '.join(matched_skills[:3])} 등 {len(matched_skills)}개 기술을 보유하고 있으며, {transferable_count}명의 전환 가능 인력이 있습니다. "
+    
+    if skill_gap:
+        reasoning += f"다만 {', '.join(skill_gap[:3])} 등 {len(skill_gap)}개 기술이 부족합니다. "
+    
+    reasoning += f"[전략] {recommendation}."
+    
+    return reasoning
 
 
 def get_required_skills_for_domain(domain: str) -> List[str]:
@@ -617,7 +662,8 @@ def calculate_feasibility_score(
 
 def analyze_expansion_strategy(
     projects: List[Dict[str, Any]],
-    employees: List[Dict[str, Any]]
+    employees: List[Dict[str, Any]],
+    budget: Optional[LatencyBudget] = None
 ) -> Dict[str, Any]:
     """
     확장 전략 분석
@@ -625,12 +671,13 @@ def analyze_expansion_strategy(
     Args:
         projects: 프로젝트 목록
         employees: 직원 목록
+        budget: 처리 시간 예산
         
     Returns:
         dict: 확장 전략 분석 결과
     """
     # 신규 도메인 분석 재사용
-    new_domains_result = analyze_new_domains(projects, employees)
+    new_domains_result = analyze_new_domains(projects, employees, budget)
     
     # 우선순위 정렬 (실현 가능성 기준)
     sorted_domains = sorted(
@@ -15,8 +15,9 @@ import json
 import os
 import boto3
 from decimal import Decimal
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from common.latency_budget import LatencyBudget
 
 dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
 bedrock = boto3.client('bedrock-runtime', region_name='us-east-2')
@@ -24,6 +25,9 @@ bedrock = boto3.client('bedrock-runtime', region_name='us-east-2')
 EMPLOYEES_TABLE = os.environ.get('EMPLOYEES_TABLE', 'Employees')
 PROJECTS_TABLE = os.environ.get('PROJECTS_TABLE', 'Projects')
 
+# 기술 격차 분석 예상 소요 시간(ms) - 남은 시간이 부족하면 생략
+SKILL_GAP_STAGE_MS = int(os.environ.get('SKILL_GAP_STAGE_MS', '2000'))
+
 # 기술 난이도 가중치
 TECH_DIFFICULTY_WEIGHTS = {
     'kubernetes': 1.5, 'k8s': 1.5, 'msa': 1.5, 'microservices': 1.5,
@@ -455,15 +459,31 @@ def analyze_skill_gaps(employee_data: Dict, all_employees: List[Dict]) -> Dict[s
     }
 
 
-def generate_ai_analysis(employee_data: Dict, scores: Dict, project_recommendations: List[Dict], all_employees: List[Dict]) -> Dict[str, Any]:
+def skipped_skill_gap_analysis() -> Dict[str, Any]:
+    """처리 시간 부족으로 기술 격차 분석을 생략한 결과"""
+    return {
+        'missing_skills': [],
+        'recommended_skills': [],
+        'peer_comparison': "처리 시간 제한으로 동료 비교 분석을 생략했습니다"
+    }
+
+
+def generate_ai_analysis(
+    employee_data: Dict,
+    scores: Dict,
+    project_recommendations: List[Dict],
+    all_employees: List[Dict],
+    skill_gap_analysis: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """AI 분석 결과 생성 (규칙 기반)"""
     experience_years = get_experience_years(employee_data)
     skills = employee_data.get('skills', [])
     project_history = get_project_history(employee_data)
     role = employee_data.get('basic_info', {}).get('role', employee_data.get('role', ''))
     
-    # 기술 격차 분석
-    skill_gap_analysis = analyze_skill_gaps(employee_data, all_employees)
+    # 기술 격차 분석 (호출자가 이미 계산했으면 재사용)
+    if skill_gap_analysis is None:
+        skill_gap_analysis = analyze_skill_gaps(employee_data, all_employees)
     
     # 강점 분석
     strengths = []
@@ -551,8 +571,14 @@ def generate_ai_analysis(employee_data: Dict, scores: Dict, project_recommendati
     }
 
 
-def analyze_with_ai(employee_data: Dict, all_projects: List[Dict], scores: Dict, all_employees: List[Dict]) -> Dict[str, Any]:
-    """AI를 사용한 상세 분석 및 추천"""
+def analyze_with_ai(
+    employee_data: Dict,
+    all_projects: List[Dict],
+    scores: Dict,
+    all_employees: List[Dict],
+    budget: Optional[LatencyBudget] = None
+) -> Dict[str, Any]:
+    """AI를 사용한 상세 분석 및 추천 (처리 시간이 부족하면 기술 격차 분석 생략)"""
     
     # 직원 정보 추출
     name = employee_data.get('basic_info', {}).get('name', employee_data.get('name', 'Unknown'))
@@ -598,11 +624,16 @@ def analyze_with_ai(employee_data: Dict, all_projects: List[Dict], scores: Dict,
     if not recommended_roles:
         recommended_roles.append(role if role else "개발자")
     
-    # 규칙 기반 AI 분석 생성
-    analysis = generate_ai_analysis(employee_data, scores, project_recommendations, all_employees)
+    # 기술 격차 분석 (한 번만 계산하여 규칙 기반 분석과 응답에 함께 사용)
+    if budget is None or budget.allows('skill_gap_analysis', SKILL_GAP_STAGE_MS):
+        skill_gap_analysis = analyze_skill_gaps(employee_data, all_employees)
+    else:
+        skill_gap_analysis = skipped_skill_gap_analysis()
     
-    # 기술 격차 분석
-    skill_gap_analysis = analyze_skill_gaps(employee_data, all_employees)
+    # 규칙 기반 AI 분석 생성
+    analysis = generate_ai_analysis(
+        employee_data, scores, project_recommendations, all_employees, skill_gap_analysis
+    )
     
     # 추가 정보 포함
     analysis['deployable'] = deployable
@@ -633,6 +664,9 @@ def lambda_handler(event, context):
         }
     
     try:
+        # API Gateway 제한 시간 내 응답을 위한 처리 시간 예산
+        budget = LatencyBudget(context)
+        
         # 요청 본문 파싱
         body = json.loads(event.get('body', '{}'))
         employee_id = body.get('employee_id')
@@ -675,7 +709,7 @@ def lambda_handler(event, context):
         scores = calculate_relative_scores(employee_data, all_employees, all_projects)
         
         # AI 분석 수행
-        ai_analysis = analyze_with_ai(employee_data, all_projects, scores, all_employees)
+        ai_analysis = analyze_with_ai(employee_data, all_projects, scores, all_employees, budget)
         
         # 평가 결과 구성
         # 직원 이름 추출 (여러 형식 지원)
@@ -714,7 +748,8 @@ def lambda_handler(event, context):
             'project_history': get_project_history(employee_data),
             'skills': employee_data.get('skills', []),
             'experience_years': get_experience_years(employee_data),
-            'status': 'completed'
+            'status': 'completed',
+            'skipped_stages': budget.skipped_stages
         }
         
         return {
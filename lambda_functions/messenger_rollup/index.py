@@ -0,0 +1,96 @@
+"""
+Messenger Rollup Lambda Function
+메신저 로그 적재 시 직원 쌍 일별 집계(PairDailyStats) 갱신
+
+MessengerLogs 테이블 스트림(NEW_IMAGE)을 구독하며, 배치의 새 메시지를 (직원 쌍, 날짜)별로
+먼저 합친 뒤 행마다 UpdateItem ADD 한 번으로 누적합니다.
+친밀도 계산의 증분 갱신은 메시지 원본 대신 이 일별 집계를 날짜별로 조회합니다.
+"""
+
+import json
+import logging
+import os
+import time
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from common.pair_daily_stats import DEFAULT_TABLE_NAME, PairDailyStatsStore, rollup_messages
+
+# 로깅 설정
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# AWS 클라이언트 초기화
+dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+daily_stats_store = PairDailyStatsStore(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('PAIR_DAILY_STATS_TABLE', DEFAULT_TABLE_NAME)
+)
+
+COMPANY_EVENTS_TABLE = os.environ.get('COMPANY_EVENTS_TABLE', 'CompanyEvents')
+
+# 회사 행사 날짜 캐시 유지 시간 (컨테이너 재사용 시 매 배치 스캔 방지)
+EVENT_DATES_TTL_SECONDS = 600
+
+# 집계 대상 이벤트 (메시지 로그는 추가만 됨)
+ROLLUP_EVENTS = ['INSERT']
+
+_event_dates_cache = {'dates': None, 'loaded_at': 0.0}
+
+
+def handler(event, context):
+    """
+    Lambda handler for DynamoDB Stream events
+
+    Args:
+        event: DynamoDB Stream 이벤트
+        context: Lambda 컨텍스트
+
+    Returns:
+        dict: 처리 결과
+    """
+    records = event.get('Records', [])
+    messages = list(extract_new_messages(records))
+    logger.info(f"메신저 로그 이벤트 수신: {len(records)}개 레코드, 새 메시지 {len(messages)}건")
+
+    if not messages:
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'messages': 0, 'updated_rows': 0})
+        }
+
+    # 실패 시 예외를 전파하여 스트림이 배치를 재시도하도록 함
+    rollups = rollup_messages(messages, get_event_dates())
+    updated_rows = daily_stats_store.increment(rollups)
+
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'messages': len(messages), 'updated_rows': updated_rows})
+    }
+
+
+def extract_new_messages(records):
+    """스트림 레코드에서 새 메시지 항목 추출"""
+    deserializer = TypeDeserializer()
+    for record in records:
+        if record.get('eventName') not in ROLLUP_EVENTS:
+            continue
+        new_image = record.get('dynamodb', {}).get('NewImage')
+        if new_image:
+            yield {key: deserializer.deserialize(value) for key, value in new_image.items()}
+
+
+def get_event_dates():
+    """회사 행사 날짜 집합 (YYYY-MM-DD, 컨테이너 단위 캐시)"""
+    now = time.monotonic()
+    if _event_dates_cache['dates'] is None or now - _event_dates_cache['loaded_at'] > EVENT_DATES_TTL_SECONDS:
+        table = dynamodb.Table(COMPANY_EVENTS_TABLE)
+        scan_kwargs = {'ProjectionExpression': 'event_date'}
+        response = table.scan(**scan_kwargs)
+        items = response.get('Items', [])
+        while 'LastEvaluatedKey' in response:
+            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan_kwargs)
+            items.extend(response.get('Items', []))
+
+        _event_dates_cache['dates'] = {str(item['event_date'])[:10] for item in items if item.get('event_date')}
+        _event_dates_cache['loaded_at'] = now
+    return _event_dates_cache['dates']
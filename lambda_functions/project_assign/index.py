@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import boto3
 from botocore.exceptions import ClientError
+from common.assignment_index import ASSIGNMENT_TABLE, AssignmentIndex, make_allocation
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -19,6 +20,10 @@ logger.setLevel(logging.INFO)
 
 # AWS 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+assignment_index = AssignmentIndex(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('ASSIGNMENT_INDEX_TABLE', ASSIGNMENT_TABLE)
+)
 
 
 def handler(event, context):
@@ -97,7 +102,12 @@ def handler(event, context):
             }
         
         # 4. 직원의 현재 프로젝트 배정 업데이트 (Requirements: 2.5)
-        update_employee_assignment(employee_id, project_id, assignment_date, role)
+        end_date = body.get('end_date') or project.get('period', {}).get('end')
+        update_employee_assignment(
+            employee_id, project_id, assignment_date, role,
+            project_name=project.get('project_name'),
+            end_date=end_date
+        )
         
         # 5. 프로젝트의 팀 멤버 목록 업데이트 (Requirements: 2.5)
         update_project_team(project_id, employee_id, role)
@@ -115,7 +125,8 @@ def handler(event, context):
                     'employee_id': employee_id,
                     'employee_name': employee.get('basic_info', {}).get('name'),
                     'role': role,
-                    'assignment_date': assignment_date
+                    'assignment_date': assignment_date,
+                    'end_date': end_date
                 }
             })
         }
@@ -209,18 +220,25 @@ def update_employee_assignment(
     employee_id: str,
     project_id: str,
     assignment_date: str,
-    role: str
+    role: str,
+    project_name: Optional[str] = None,
+    end_date: Optional[str] = None
 ) -> None:
     """
     직원의 현재 프로젝트 배정 업데이트
     
     Requirements: 2.5 - 직원 배정 정보 업데이트
     
+    Employees 항목의 current_project와 함께 배정 인덱스(EmployeeAssignments)에
+    기간 정보가 포함된 배정을 추가합니다. 추천 엔진의 가용성 확인은 배정 인덱스를 사용합니다.
+    
     Args:
         employee_id: 직원 ID
         project_id: 프로젝트 ID
         assignment_date: 배정 날짜
         role: 역할
+        project_name: 프로젝트 이름
+        end_date: 배정 종료일 (없으면 종료일 미정)
     """
     try:
         table = dynamodb.Table('Employees')
@@ -236,6 +254,12 @@ def update_employee_assignment(
             }
         )
         
+        # 배정 인덱스 갱신
+        assignment_index.add_allocation(
+            employee_id,
+            make_allocation(project_id, project_name, role, assignment_date, end_date)
+        )
+        
         logger.info(f"직원 {employee_id}의 배정 정보 업데이트 완료")
         
     except ClientError as e:
@@ -0,0 +1,126 @@
+"""
+상위 k명 후보 선택 모듈
+
+전체 후보를 정렬하는 대신 크기 k의 최소 힙으로 상위 후보만 유지합니다.
+후보마다 실제 점수 이하가 될 수 없는 상한(upper bound)을 먼저 계산하여,
+상한이 현재 k번째 점수(임계값)를 넘지 못하면 전체 점수 계산과 후속 처리를 생략합니다 (WAND 방식).
+
+- 메모리: O(k)
+- 정렬 결과: sorted(..., reverse=True)[:k]와 동일 (동점은 먼저 들어온 후보 우선)
+"""
+
+import heapq
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+class TopKSelector:
+    """
+    상위 k개 항목 선택기 (최소 힙)
+
+    힙 루트가 현재 k번째 점수이므로 임계값 조회는 O(1), 삽입은 O(log k)입니다.
+    """
+
+    def __init__(self, k: int):
+        """
+        Args:
+            k: 유지할 항목 수
+        """
+        self.k = max(0, int(k))
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._sequence = 0
+        self.offered = 0
+        self.pruned = 0
+
+    @property
+    def threshold(self) -> float:
+        """
+        진입 임계값 (힙이 가득 차지 않았으면 -inf)
+        """
+        if len(self._heap) < self.k:
+            return float('-inf')
+        return self._heap[0][0]
+
+    def can_enter(self, upper_bound: float) -> bool:
+        """
+        상한 점수로 진입 가능 여부 확인
+
+        동점이면 먼저 들어온 항목이 우선이므로 임계값과 같은 상한은 진입할 수 없습니다.
+
+        Args:
+            upper_bound: 항목 점수의 상한
+
+        Returns:
+            bool: 전체 점수를 계산할 가치가 있으면 True
+        """
+        if self.k == 0:
+            return False
+        if upper_bound <= self.threshold:
+            self.pruned += 1
+            return False
+        return True
+
+    def offer(self, score: float, item: Any) -> bool:
+        """
+        항목 추가 (상위 k개에 들지 못하면 버림)
+
+        Args:
+            score: 항목 점수
+            item: 항목
+
+        Returns:
+            bool: 상위 k개에 포함되었으면 True
+        """
+        self.offered += 1
+        if self.k == 0:
+            return False
+
+        # 동점 시 먼저 들어온 항목이 남도록 순번을 음수로 저장
+        entry = (score, -self._sequence, item)
+        self._sequence += 1
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def results(self) -> List[Any]:
+        """
+        점수 내림차순 항목 목록
+        """
+        ordered = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [item for _, _, item in ordered]
+
+
+def select_top_k(
+    items: Iterable[Any],
+    k: int,
+    score: Callable[[Any], Optional[Tuple[float, Any]]],
+    upper_bound: Optional[Callable[[Any], float]] = None
+) -> Tuple[List[Any], TopKSelector]:
+    """
+    상한 가지치기를 적용한 상위 k개 선택
+
+    Args:
+        items: 후보 항목 (제너레이터 가능)
+        k: 선택할 항목 수
+        score: 전체 점수 계산 함수 - (점수, 결과)를 반환하며 None이면 후보에서 제외
+        upper_bound: 점수 상한 계산 함수 (score보다 저렴해야 하며 실제 점수 이상이어야 함)
+
+    Returns:
+        tuple: (점수 내림차순 상위 k개 결과, 선택기 - 가지치기 통계 포함)
+    """
+    selector = TopKSelector(k)
+    if selector.k == 0:
+        return [], selector
+
+    for item in items:
+        if upper_bound is not None and not selector.can_enter(upper_bound(item)):
+            continue
+        scored = score(item)
+        if scored is not None:
+            selector.offer(*scored)
+
+    return selector.results(), selector
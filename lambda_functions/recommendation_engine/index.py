@@ -8,11 +8,52 @@ Requirements: 2.2, 2.4, 2.5, 1.3, 1.4, 11.3, 11.4
 import json
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
 import boto3
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from requests_aws4auth import AWS4Auth
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from common.affinity_neighbors import AffinityNeighborStore, graph_of
+from common.assignment_index import ASSIGNMENT_TABLE, AssignmentIndex, active_allocations
+from common.embedding_cache import EmbeddingCache
+from common.latency_budget import LatencyBudget
+from common.minhash_index import get_employee_similarity_index
+from common.project_shortlist import ProjectShortlistStore
+from common.recommendation_cache import RecommendationCache, make_request_key, normalize_skill_key
+from common.recommendation_log import RecommendationRunLog, build_run_entry
+from common.request_profiler import (
+    RequestProfiler,
+    instrument_client,
+    profile_stage,
+    record_opensearch_response
+)
+from common.recommendation_runs import (
+    RecommendationRunStore,
+    new_run_id,
+    normalize_weights,
+    rescore_candidates
+)
+from common.opensearch_client import (
+    EMPLOYEE_INDEX,
+    SKILL_FILTER_FIELD,
+    build_knn_query,
+    build_skill_filter_query,
+    get_opensearch_client,
+    normalize_vector
+)
+from common.skill_embedding import MAX_SIMILARITY_SCORE, SkillEmbedding, get_skill_embedding
+from common.utils import get_unique_skills
+from common.vector_index import get_local_vector_search
+
+try:
+    from candidate_selection import select_top_k
+    from team_optimizer import normalize_slots, optimize_team
+    from portfolio_assignment import solve_portfolio_assignment
+except ImportError:
+    from lambda_functions.recommendation_engine.candidate_selection import select_top_k
+    from lambda_functions.recommendation_engine.team_optimizer import normalize_slots, optimize_team
+    from lambda_functions.recommendation_engine.portfolio_assignment import solve_portfolio_assignment
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -22,326 +63,1679 @@ logger.setLevel(logging.INFO)
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
 bedrock_runtime = boto3.client('bedrock-runtime', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
 
-# OpenSearch 클라이언트 초기화
-def get_opensearch_client():
-    """OpenSearch 클라이언트 생성"""
-    endpoint = os.environ.get('OPENSEARCH_ENDPOINT')
-    if not endpoint:
-        raise ValueError("OPENSEARCH_ENDPOINT 환경 변수가 설정되지 않았습니다")
-    
-    credentials = boto3.Session().get_credentials()
-    awsauth = AWS4Auth(
-        credentials.access_key,
-        credentials.secret_key,
-        os.environ.get('AWS_REGION', 'us-east-2'),
-        'es',
-        session_token=credentials.token
+# profile=true 요청의 DynamoDB 항목/용량, Bedrock 토큰 수집 (프로파일링 중이 아니면 기록하지 않음)
+instrument_client(dynamodb.meta.client)
+instrument_client(bedrock_runtime)
+
+# 프로파일링을 허용하는 IAM 주체 ARN (쉼표 구분) - IAM 인증 경로 POST /recommendations/profile에서만 확인
+PROFILING_ADMIN_PRINCIPALS = {
+    arn.strip() for arn in os.environ.get('PROFILING_ADMIN_PRINCIPALS', '').split(',') if arn.strip()
+}
+
+# 임베딩 모델 및 캐시 (컨테이너 재사용 시 메모리 캐시 유지)
+EMBEDDING_MODEL_ID = 'amazon.titan-embed-text-v1'
+embedding_cache = EmbeddingCache(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('EMBEDDING_CACHE_TABLE', 'EmbeddingCache'),
+    max_entries=int(os.environ.get('EMBEDDING_CACHE_MAX_ENTRIES', '512')),
+    ttl_seconds=int(os.environ.get('EMBEDDING_CACHE_TTL_SECONDS', str(30 * 24 * 60 * 60)))
+)
+
+# 추천 결과 캐시 (인력 데이터 버전별)
+recommendation_cache = RecommendationCache(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('RECOMMENDATION_CACHE_TABLE', 'RecommendationCache'),
+    ttl_seconds=int(os.environ.get('RECOMMENDATION_CACHE_TTL_SECONDS', '3600'))
+)
+
+# 추천 실행별 구성 점수 저장소 (재점수화용)
+run_store = RecommendationRunStore(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('RECOMMENDATION_CACHE_TABLE', 'RecommendationCache'),
+    ttl_seconds=int(os.environ.get('RECOMMENDATION_RUN_TTL_SECONDS', str(24 * 60 * 60)))
+)
+
+# 재점수화용으로 저장할 최대 후보 수
+RUN_MAX_CANDIDATES = int(os.environ.get('RECOMMENDATION_RUN_MAX_CANDIDATES', '200'))
+
+# 추천 실행 로그 (대시보드 최근 추천, 응답 경로 밖에서 기록)
+run_log = RecommendationRunLog(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('RECOMMENDATION_RUNS_TABLE', 'RecommendationRuns'),
+    ttl_seconds=int(os.environ.get('RECOMMENDATION_RUNS_TTL_SECONDS', str(90 * 24 * 60 * 60)))
+)
+
+# 응답 반환 전 실행 로그 쓰기를 기다리는 최대 시간(초) - 반환 후 Lambda가 정지되면 쓰기가 유실될 수 있음
+RUN_LOG_FLUSH_TIMEOUT_SECONDS = float(os.environ.get('RUN_LOG_FLUSH_TIMEOUT_SECONDS', '2'))
+
+# 프로젝트별 사전 계산 후보 목록 (Projects 스트림으로 갱신)
+shortlist_store = ProjectShortlistStore(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('RECOMMENDATION_CACHE_TABLE', 'RecommendationCache')
+)
+
+# 우선순위별로 후보 목록에 남길 상위 후보 수 (목록은 우선순위별 상위 후보의 합집합)
+SHORTLIST_SIZE = int(os.environ.get('SHORTLIST_SIZE', '50'))
+
+# 프로젝트에 팀 규모 정보가 없을 때 사용할 기본 팀 크기
+DEFAULT_TEAM_SIZE = 5
+
+# 후보 목록 사전 계산 대상 스트림 이벤트
+SHORTLIST_EVENTS = ['INSERT', 'MODIFY']
+
+# 직원 배정 인덱스 (가용성 확인용)
+assignment_index = AssignmentIndex(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('ASSIGNMENT_INDEX_TABLE', ASSIGNMENT_TABLE)
+)
+
+# 하이브리드 검색에서 가져올 후보 수 (기술 필터 적용 후 k-NN 상위 k명)
+HYBRID_SEARCH_K = int(os.environ.get('HYBRID_SEARCH_K', '50'))
+
+# 유사 직원 검색 결과 수 / 로컬 기술 임베딩으로 순위를 매길 기술 필터 후보 수
+SIMILAR_SEARCH_K = 20
+
+# 투입 가능 직원만 요청할 때 가용성 확인 전 가져올 유사 직원 배수
+SIMILAR_AVAILABLE_MULTIPLIER = 3
+LOCAL_SIMILARITY_CANDIDATES = int(os.environ.get('LOCAL_SIMILARITY_CANDIDATES', '500'))
+
+# 직원 검색 응답 제한 시간(초) - 넘기면 로컬 벡터 인덱스 사용
+OPENSEARCH_SEARCH_TIMEOUT_SECONDS = float(os.environ.get('OPENSEARCH_SEARCH_TIMEOUT_SECONDS', '2'))
+
+# 팀 추천 시 슬롯 수 대비 검색할 후보 배수
+TEAM_CANDIDATE_MULTIPLIER = int(os.environ.get('TEAM_CANDIDATE_MULTIPLIER', '10'))
+
+# 선택 단계 예상 소요 시간(ms) - 남은 시간이 부족하면 대체 경로 사용
+VECTOR_SEARCH_STAGE_MS = int(os.environ.get('VECTOR_SEARCH_STAGE_MS', '3000'))
+LLM_REASONING_STAGE_MS = int(os.environ.get('LLM_REASONING_STAGE_MS', '6000'))
+
+# 추천 근거 Bedrock 호출 최대 시도 횟수 (남은 시간이 허용하는 만큼만 재시도)와 연결 제한 시간(초)
+BEDROCK_MAX_ATTEMPTS = int(os.environ.get('BEDROCK_MAX_ATTEMPTS', '2'))
+BEDROCK_CONNECT_TIMEOUT_SECONDS = 2
+
+# (응답 제한 시간 초, 시도 횟수)별 Bedrock 런타임 클라이언트 (웜 컨테이너에서 재사용)
+_reasoning_clients: Dict[Tuple[int, int], Any] = {}
+
+# 기술 숙련도 가중치 (Wlevel)
+LEVEL_WEIGHTS = {
+    'Beginner': 1.0,
+    'Intermediate': 1.5,
+    'Advanced': 1.8,
+    'Expert': 2.0
+}
+
+# 최신성 가중치 최대값 (Wrecency)
+MAX_RECENCY_WEIGHT = 1.0
+
+# 도메인 경험 보너스 비율 (Wdomain = 1.3)
+DOMAIN_BONUS_RATE = 0.3
+
+# 우선순위별 종합 점수 가중치
+PRIORITY_WEIGHTS = {
+    'skill': {'skill': 0.6, 'similarity': 0.3, 'affinity': 0.1},
+    'affinity': {'skill': 0.3, 'similarity': 0.2, 'affinity': 0.5},
+    'balanced': {'skill': 0.4, 'similarity': 0.3, 'affinity': 0.3}
+}
+
+
+def handler(event, context):
+    """
+    Lambda handler for API Gateway
+    
+    Requirements: 2.2 - 프로젝트 투입 인력 추천
+    
+    Args:
+        event: API Gateway 이벤트
+        context: Lambda 컨텍스트
+        
+    Returns:
+        dict: API Gateway 응답
+    """
+    # Projects 스트림: 후보 목록 사전 계산
+    if 'Records' in event:
+        return handle_project_stream(event)
+    
+    try:
+        logger.info(f"추천 요청 수신: {json.dumps(event)}")
+        
+        # API Gateway 제한 시간 내 응답을 위한 처리 시간 예산
+        budget = LatencyBudget(context)
+        
+        # 요청 본문 파싱 (Requirements: 2.2)
+        body = json.loads(event.get('body', '{}'))
+        
+        # 포트폴리오 일괄 추천 (POST /recommendations/batch)
+        if event.get('path', '').rstrip('/').endswith('/batch') or 'projects' in body:
+            return handle_portfolio_request(body)
+        
+        # 가중치 재점수화 (POST /recommendations/rescore)
+        if event.get('path', '').rstrip('/').endswith('/rescore') or ('run_id' in body and 'weights' in body):
+            return handle_rescore_request(body)
+        
+        # 유사 직원 검색 (POST /recommendations/similar)
+        if event.get('path', '').rstrip('/').endswith('/similar') or 'similar_to' in body:
+            return handle_similar_request(body)
+        
+        # 단계별 프로파일링 (관리자 전용, POST /recommendations/profile)
+        if is_profile_requested(event, body):
+            if not is_profiling_admin(event):
+                return {
+                    'statusCode': 403,
+                    'headers': {'Content-Type': 'application/json'},
+                    'body': json.dumps({
+                        'error': '프로파일링은 IAM 인증 경로(POST /recommendations/profile)에서 관리자만 요청할 수 있습니다'
+                    })
+                }
+            
+            profiler = RequestProfiler(top_n=int(body.get('profile_top', 0)))
+            with profiler.activate():
+                response = handle_recommendation_request(body, budget)
+            return attach_profile(response, profiler.report())
+        
+        return handle_recommendation_request(body, budget)
+        
+    except Exception as e:
+        logger.error(f"추천 생성 중 오류 발생: {str(e)}", exc_info=True)
+        return {
+            'statusCode': 500,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': str(e)})
+        }
+
+
+def handle_recommendation_request(body: Dict[str, Any], budget: LatencyBudget) -> Dict[str, Any]:
+    """
+    프로젝트 투입 인력 추천 요청 처리 (개인 추천/팀 추천)
+    
+    Args:
+        body: 요청 본문
+        budget: 처리 시간 예산
+        
+    Returns:
+        dict: API Gateway 응답
+    """
+    # 입력 검증
+    if not body.get('project_id'):
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': 'project_id가 필요합니다'})
+        }
+    
+    project_id = body['project_id']
+    required_skills = body.get('required_skills', [])
+    team_size = body.get('team_size', 5)
+    priority = body.get('priority', 'balanced')  # skill, affinity, balanced
+    mode = body.get('mode', 'individual')  # individual, team
+    
+    logger.info(f"프로젝트 {project_id}에 대한 추천 시작 (mode: {mode})")
+    
+    if mode == 'team':
+        # 역할 슬롯 기반 팀 구성 최적화
+        team = generate_team_recommendation(
+            project_id=project_id,
+            required_skills=required_skills,
+            team_size=team_size,
+            priority=priority,
+            team_composition=body.get('team_composition'),
+            beam_width=int(body.get('beam_width', 1)),
+            budget=budget
+        )
+        
+        run_log.record(build_run_entry(
+            project_id, None, team['members'], budget.elapsed_ms(), cache_hit=False,
+            mode='team', priority=priority, skipped_stages=budget.skipped_stages
+        ))
+        
+        response = {
+            'statusCode': 200,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({
+                'project_id': project_id,
+                'mode': 'team',
+                'recommendations': team['members'],
+                'team': team['summary'],
+                'skipped_stages': budget.skipped_stages
+            }, default=decimal_default)
+        }
+        flush_run_log()
+        return response
+    
+    # 추천 생성 (동일 요청·동일 데이터 버전이면 캐시 결과 반환)
+    recommendations, run_id, cache_age = get_or_generate_recommendations(
+        project_id=project_id,
+        required_skills=required_skills,
+        team_size=team_size,
+        priority=priority,
+        use_cache=body.get('use_cache', True),
+        budget=budget
+    )
+    
+    response_body = {
+        'project_id': project_id,
+        'run_id': run_id,
+        'recommendations': recommendations,
+        'cached': cache_age is not None,
+        'skipped_stages': budget.skipped_stages
+    }
+    if cache_age is not None:
+        response_body['cache_age_seconds'] = cache_age
+    
+    run_log.record(build_run_entry(
+        project_id, run_id, recommendations, budget.elapsed_ms(), cache_hit=cache_age is not None,
+        priority=priority, skipped_stages=budget.skipped_stages
+    ))
+    
+    response = {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(response_body, default=decimal_default)
+    }
+    flush_run_log()
+    return response
+
+
+def flush_run_log() -> None:
+    """응답 직렬화와 겹쳐 진행된 실행 로그 쓰기를 반환 전에 완료 (Lambda 정지 전에 끝내도록)"""
+    if not run_log.flush(timeout=RUN_LOG_FLUSH_TIMEOUT_SECONDS):
+        logger.warning(f"추천 실행 로그 쓰기가 {RUN_LOG_FLUSH_TIMEOUT_SECONDS}초 안에 끝나지 않음")
+
+
+def is_profile_requested(event: Dict[str, Any], body: Dict[str, Any]) -> bool:
+    """프로파일링 경로 요청이거나 요청 본문 또는 쿼리 문자열에 profile=true가 있는지 확인"""
+    if is_profile_route(event):
+        return True
+    query = event.get('queryStringParameters') or {}
+    for value in (body.get('profile'), query.get('profile')):
+        if value is True or str(value).lower() == 'true':
+            return True
+    return False
+
+
+def is_profile_route(event: Dict[str, Any]) -> bool:
+    """IAM 인증 프로파일링 경로(POST /recommendations/profile) 요청인지 확인"""
+    return event.get('path', '').rstrip('/').endswith('/profile')
+
+
+def is_profiling_admin(event: Dict[str, Any]) -> bool:
+    """
+    프로파일링 권한 확인
+    
+    /recommendations 등 다른 경로는 인증 없이(NONE) 호출되어 호출 주체가 없으므로,
+    AWS_IAM 인증 경로인 /recommendations/profile 요청이면서 API Gateway가 채운
+    호출 주체 ARN이 PROFILING_ADMIN_PRINCIPALS에 있어야 합니다.
+    
+    Args:
+        event: API Gateway 이벤트
+        
+    Returns:
+        bool: 관리자이면 True
+    """
+    if not is_profile_route(event):
+        return False
+    identity = (event.get('requestContext') or {}).get('identity') or {}
+    return identity.get('userArn') in PROFILING_ADMIN_PRINCIPALS
+
+
+def attach_profile(response: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    응답 본문에 프로파일 보고서 추가
+    
+    Args:
+        response: API Gateway 응답
+        profile: RequestProfiler.report() 결과
+        
+    Returns:
+        dict: profile 필드가 추가된 응답 (본문이 JSON 객체가 아니면 그대로)
+    """
+    try:
+        response_body = json.loads(response.get('body') or '{}')
+    except ValueError:
+        return response
+    if not isinstance(response_body, dict):
+        return response
+    response_body['profile'] = profile
+    return {**response, 'body': json.dumps(response_body, default=decimal_default)}
+
+
+def handle_rescore_request(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    저장된 추천 실행의 가중치 재점수화
+    
+    저장된 구성 점수(기술, 유사도, 친밀도, 가용성)에 새 가중치를 적용해 메모리에서 재정렬합니다.
+    Employees 스캔, OpenSearch, Bedrock을 호출하지 않습니다.
+    
+    Args:
+        body: 요청 본문 ({'run_id', 'weights', 'team_size'})
+        
+    Returns:
+        dict: API Gateway 응답
+    """
+    started = time.perf_counter()
+    
+    run_id = body.get('run_id')
+    weights = body.get('weights')
+    if not run_id or not isinstance(weights, dict):
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': 'run_id와 weights가 필요합니다'})
+        }
+    
+    run = run_store.load(run_id)
+    if run is None:
+        return {
+            'statusCode': 404,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': '추천 실행을 찾을 수 없거나 만료되었습니다'})
+        }
+    
+    team_size = int(body.get('team_size') or run['request'].get('team_size', 5))
+    try:
+        recommendations = rescore_candidates(run['candidates'], weights, top_k=team_size)
+        applied_weights = normalize_weights(weights)
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': str(e)})
+        }
+    
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps({
+            'project_id': run['request'].get('project_id'),
+            'run_id': run_id,
+            'weights': applied_weights,
+            'recommendations': recommendations,
+            'candidate_pool_size': len(run['candidates']),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)
+        }, default=decimal_default)
+    }
+
+
+def handle_similar_request(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    유사 직원 검색 ("X와 비슷하면서 투입 가능한 직원")
+    
+    직원 스냅샷의 MinHash LSH 색인으로 기술 집합/프로젝트 이력 집합의 Jaccard 이웃을 찾습니다.
+    전체 직원 비교 없이 같은 LSH 버킷의 후보만 비교하며, 결과 직원만 BatchGet으로 조회합니다.
+    
+    Args:
+        body: 요청 본문 ({'similar_to' 또는 'user_id', 'k', 'basis', 'available_only', 'min_similarity'})
+        
+    Returns:
+        dict: API Gateway 응답
+    """
+    started = time.perf_counter()
+    
+    user_id = body.get('similar_to') or body.get('user_id')
+    if not user_id:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': 'similar_to(직원 ID)가 필요합니다'})
+        }
+    
+    index = get_employee_similarity_index()
+    if index is None:
+        return {
+            'statusCode': 503,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': '유사 직원 색인을 사용할 수 없습니다 (직원 스냅샷 없음)'})
+        }
+    
+    # 스냅샷 이후 등록된 직원은 현재 데이터로 서명 생성
+    signatures = None
+    if user_id not in index:
+        employees = batch_get_employees([user_id])
+        if not employees:
+            return {
+                'statusCode': 404,
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({'error': f'직원을 찾을 수 없습니다: {user_id}'})
+            }
+        signatures = index.signatures_for(employees[0])
+    
+    k = int(body.get('k', SIMILAR_SEARCH_K))
+    available_only = bool(body.get('available_only', False))
+    basis = body.get('basis', 'both')
+    try:
+        neighbours = index.similar(
+            user_id,
+            signatures,
+            k=k * SIMILAR_AVAILABLE_MULTIPLIER if available_only else k,
+            basis=basis,
+            min_similarity=float(body.get('min_similarity', 0))
+        )
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': str(e)})
+        }
+    
+    employees = {
+        employee.get('user_id'): employee
+        for employee in batch_get_employees([neighbour['user_id'] for neighbour in neighbours])
+    }
+    for neighbour in neighbours:
+        basic_info = employees.get(neighbour['user_id'], {}).get('basic_info', {})
+        neighbour['name'] = basic_info.get('name', '')
+        neighbour['role'] = basic_info.get('role', '')
+    
+    neighbours = check_availability(neighbours)
+    if available_only:
+        neighbours = [neighbour for neighbour in neighbours if neighbour['availability'] == 'Available']
+    
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps({
+            'user_id': user_id,
+            'basis': basis,
+            'similar_employees': neighbours[:k],
+            'index_size': len(index.user_ids),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)
+        }, default=decimal_default)
+    }
+
+
+def handle_portfolio_request(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    포트폴리오 일괄 추천 요청 처리
+    
+    Args:
+        body: 요청 본문 ({'projects': [...], 'priority': ...})
+        
+    Returns:
+        dict: API Gateway 응답
+    """
+    projects = body.get('projects')
+    if not isinstance(projects, list) or not projects:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': 'projects 목록이 필요합니다'})
+        }
+    
+    if any(not isinstance(project, dict) or not project.get('project_id') for project in projects):
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': '모든 프로젝트에 project_id가 필요합니다'})
+        }
+    
+    result = generate_portfolio_recommendations(
+        projects=projects,
+        priority=body.get('priority', 'balanced')
     )
     
-    return OpenSearch(
-        hosts=[{'host': endpoint, 'port': 443}],
-        http_auth=awsauth,
-        use_ssl=True,
-        verify_certs=True,
-        connection_class=RequestsHttpConnection
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(result, default=decimal_default)
+    }
+
+
+def get_or_generate_recommendations(
+    project_id: str,
+    required_skills: List[str],
+    team_size: int,
+    priority: str,
+    use_cache: bool = True,
+    budget: Optional[LatencyBudget] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+    """
+    추천 결과 캐시 조회 후 미스일 때만 추천 생성
+    
+    캐시 키에 인력 데이터 버전이 포함되므로 Employees/EmployeeAffinity가 변경되면
+    이전 결과는 자동으로 무시됩니다.
+    
+    Args:
+        project_id: 프로젝트 ID
+        required_skills: 요구 기술 목록
+        team_size: 팀 크기
+        priority: 우선순위 (skill, affinity, balanced)
+        use_cache: 캐시 사용 여부 (False면 항상 새로 생성하고 결과를 저장)
+        budget: 처리 시간 예산 (선택 단계를 생략한 결과는 캐시하지 않음)
+        
+    Returns:
+        tuple: (추천 후보자 목록, run ID, 캐시 경과 시간(초) - 새로 생성했으면 None)
+    """
+    data_version = recommendation_cache.get_data_version()
+    cache_key = make_request_key(project_id, required_skills, team_size, priority, data_version)
+    
+    if use_cache:
+        with profile_stage('cache_lookup'):
+            cached = recommendation_cache.get(cache_key)
+        if cached is not None:
+            payload, age_seconds = cached
+            logger.info(f"추천 캐시 적중: {project_id} (데이터 버전 {data_version}, {age_seconds}초 경과)")
+            return payload['recommendations'], payload.get('run_id'), age_seconds
+    
+    run_id = new_run_id()
+    recommendations = generate_recommendations(
+        project_id=project_id,
+        required_skills=required_skills,
+        team_size=team_size,
+        priority=priority,
+        run_id=run_id,
+        budget=budget,
+        data_version=data_version
     )
+    
+    if budget is not None and budget.degraded:
+        logger.info("선택 단계가 생략된 결과이므로 추천 캐시에 저장하지 않습니다")
+    else:
+        with profile_stage('cache_store'):
+            recommendation_cache.put(
+                cache_key,
+                {'run_id': run_id, 'recommendations': recommendations},
+                data_version
+            )
+    
+    return recommendations, run_id, None
 
 
-def handler(event, context):
+def generate_recommendations(
+    project_id: str,
+    required_skills: List[str],
+    team_size: int,
+    priority: str,
+    run_id: Optional[str] = None,
+    budget: Optional[LatencyBudget] = None,
+    data_version: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    프로젝트 투입 인력 추천 생성
+    
+    Requirements: 2.2, 2.4 - 다중 요소 점수 계산 및 추천
+    
+    Args:
+        project_id: 프로젝트 ID
+        required_skills: 요구 기술 목록
+        team_size: 팀 크기
+        priority: 우선순위 (skill, affinity, balanced)
+        run_id: 지정 시 후보자별 구성 점수를 이 ID로 저장 (재점수화용)
+        budget: 처리 시간 예산 (부족하면 벡터 검색과 LLM 근거 생성을 생략)
+        data_version: 인력 데이터 버전 (사전 계산 후보 목록 신선도 확인용, None이면 조회)
+        
+    Returns:
+        list: 추천 후보자 목록
+    """
+    # 0. 프로젝트 등록 시 사전 계산된 신선한 후보 목록이 있으면 가중치만 적용
+    if data_version is None:
+        data_version = recommendation_cache.get_data_version()
+    ranked = serve_from_shortlist(project_id, required_skills, team_size, priority, data_version)
+    
+    if ranked is None:
+        # 1-6. 후보자 검색, 점수 계산, 상위 후보 선택, 가용성 확인
+        # 재점수화용으로 저장할 후보까지만 유지하므로 처리량이 전체 인력이 아닌 k에 비례
+        keep = max(team_size, RUN_MAX_CANDIDATES if run_id else 0)
+        ranked, _ = collect_scored_candidates(required_skills, priority, top_k=keep, budget=budget)
+    top_candidates = ranked[:team_size]
+    
+    # 7. 추천 근거 생성 (Requirements: 2.4) - 사전 계산된 근거는 재사용, 시간이 부족하면 구조화된 근거로 대체
+    for candidate in top_candidates:
+        if candidate.get('reasoning'):
+            continue
+        if budget is None or budget.allows('llm_reasoning', LLM_REASONING_STAGE_MS):
+            candidate['reasoning'] = generate_reasoning(candidate, budget)
+        else:
+            candidate['reasoning'] = build_fallback_reasoning(candidate)
+    
+    # 8. 재점수화용 구성 점수 저장
+    if run_id:
+        with profile_stage('run_store'):
+            run_store.save(
+                run_id,
+                ranked[:RUN_MAX_CANDIDATES],
+                {
+                    'project_id': project_id,
+                    'required_skills': required_skills,
+                    'team_size': team_size,
+                    'priority': priority
+                }
+            )
+    
+    return top_candidates
+
+
+@profile_stage('shortlist')
+def serve_from_shortlist(
+    project_id: str,
+    required_skills: List[str],
+    team_size: int,
+    priority: str,
+    data_version: int
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    사전 계산된 후보 목록으로 순위 생성 (GetItem 1회)
+    
+    Args:
+        project_id: 프로젝트 ID
+        required_skills: 요구 기술 목록
+        team_size: 팀 크기
+        priority: 우선순위
+        data_version: 현재 인력 데이터 버전
+        
+    Returns:
+        list: 종합 점수 내림차순 후보자 목록 - 신선한 목록이 없으면 None
+    """
+    if team_size > SHORTLIST_SIZE:
+        return None
+    
+    shortlist = shortlist_store.get_fresh(project_id, required_skills, data_version)
+    if not shortlist or not shortlist.get('candidates'):
+        return None
+    
+    priority = priority if priority in PRIORITY_WEIGHTS else 'balanced'
+    ranked = rescore_candidates(shortlist['candidates'], PRIORITY_WEIGHTS[priority])
+    
+    logger.info(f"사전 계산 후보 목록 사용: {project_id} ({len(ranked)}명)")
+    served = []
+    for candidate in ranked:
+        # 이 우선순위로 미리 생성한 근거만 사용 (없으면 조회 시 생성)
+        reasoning = (candidate.get('reasoning_by_priority') or {}).get(priority)
+        served.append({
+            **{field: value for field, value in candidate.items()
+               if field not in ('components', 'reasoning', 'reasoning_by_priority')},
+            **({'reasoning': reasoning} if reasoning else {})
+        })
+    return served
+
+
+def handle_project_stream(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Projects 스트림 처리 - 등록·수정된 프로젝트의 후보 목록 사전 계산
+    
+    사전 계산은 최선 노력(best effort)이므로 실패한 레코드는 로그만 남기고
+    배치를 재시도하지 않습니다 (조회 시 일반 추천 경로로 대체됨).
+    
+    Args:
+        event: DynamoDB Stream 이벤트 (NEW_IMAGE)
+        
+    Returns:
+        dict: 처리 결과
+    """
+    deserializer = TypeDeserializer()
+    computed = []
+    skipped = 0
+    
+    for record in event.get('Records', []):
+        if record.get('eventName') not in SHORTLIST_EVENTS:
+            continue
+        
+        new_image = record.get('dynamodb', {}).get('NewImage')
+        if not new_image:
+            continue
+        
+        project = {key: deserializer.deserialize(value) for key, value in new_image.items()}
+        try:
+            if precompute_project_shortlist(project):
+                computed.append(project.get('project_id'))
+            else:
+                skipped += 1
+        except Exception as e:
+            logger.error(f"후보 목록 사전 계산 실패 ({project.get('project_id')}): {str(e)}", exc_info=True)
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'computed': computed, 'skipped': skipped})
+    }
+
+
+def precompute_project_shortlist(project: Dict[str, Any]) -> bool:
+    """
+    프로젝트 후보 목록 사전 계산 및 저장
+    
+    우선순위와 무관한 구성 점수를 저장하고, 우선순위별 상위 SHORTLIST_SIZE명의 합집합을 남깁니다.
+    우선순위별 상위 팀 크기만큼의 후보에게는 그 우선순위의 종합 점수로 추천 근거도 미리 생성합니다
+    (reasoning_by_priority).
+    
+    Args:
+        project: 프로젝트 데이터
+        
+    Returns:
+        bool: 새로 계산했으면 True (요구 기술이 없거나 이미 신선한 목록이 있으면 False)
+    """
+    project_id = project.get('project_id')
+    required_skills = get_project_required_skills(project)
+    if not project_id or not required_skills:
+        return False
+    
+    # 계산 전에 버전을 읽어야 계산 중 데이터가 바뀌면 오래된 목록으로 판정됨
+    data_version = recommendation_cache.get_data_version()
+    
+    # 배정 등 요구 기술과 무관한 수정이면 재계산하지 않음
+    existing = shortlist_store.get_item(project_id)
+    if existing and int(existing.get('data_version', -1)) == data_version and \
+            list(existing.get('skills', [])) == normalize_skill_key(required_skills):
+        return False
+    
+    requirement_embedding = generate_embedding(build_requirement_text(required_skills))
+    candidates, _ = collect_scored_candidates(required_skills, 'balanced')
+    team_size = get_project_team_size(project)
+    
+    shortlisted = {}
+    for priority, weights in PRIORITY_WEIGHTS.items():
+        def score(candidate, weights=weights):
+            value = weighted_overall_score(
+                candidate['skill_match_score'],
+                candidate['similarity_score'],
+                candidate['affinity_score'],
+                weights
+            )
+            return value, (value, candidate)
+        
+        top, _ = select_top_k(candidates, SHORTLIST_SIZE, score=score)
+        for rank, (value, candidate) in enumerate(top):
+            shortlisted.setdefault(candidate['user_id'], candidate)
+            # 근거에 우선순위별 종합 점수가 들어가므로 우선순위마다 따로 저장
+            if rank < team_size:
+                candidate.setdefault('reasoning_by_priority', {})[priority] = generate_reasoning(
+                    {**candidate, 'overall_score': value}
+                )
+    
+    shortlist_store.put(
+        project_id,
+        required_skills,
+        data_version,
+        list(shortlisted.values()),
+        requirement_embedding
+    )
+    return True
+
+
+def get_project_required_skills(project: Dict[str, Any]) -> List[str]:
+    """
+    프로젝트 요구 기술 목록 (project_create가 requirements에 저장)
+    
+    Args:
+        project: 프로젝트 데이터
+        
+    Returns:
+        list: 요구 기술 목록 (requirements가 없으면 tech_stack)
+    """
+    requirements = project.get('requirements') or project.get('required_skills')
+    if isinstance(requirements, list) and requirements:
+        return [str(skill) for skill in requirements]
+    
+    tech_stack = project.get('tech_stack') or {}
+    if isinstance(tech_stack, dict):
+        return [str(skill) for skills in tech_stack.values() if isinstance(skills, list) for skill in skills]
+    return []
+
+
+def get_project_team_size(project: Dict[str, Any]) -> int:
+    """
+    프로젝트 팀 크기 (team_composition의 required_members 또는 역할 슬롯 합계)
+    
+    Args:
+        project: 프로젝트 데이터
+        
+    Returns:
+        int: 팀 크기
+    """
+    team_composition = project.get('team_composition') or {}
+    if team_composition.get('required_members'):
+        return int(team_composition['required_members'])
+    return sum(normalize_slots(team_composition, DEFAULT_TEAM_SIZE).values())
+
+
+@profile_stage('candidate_search')
+def collect_scored_candidates(
+    required_skills: List[str],
+    priority: str,
+    search_k: int = HYBRID_SEARCH_K,
+    top_k: Optional[int] = None,
+    budget: Optional[LatencyBudget] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, float]]]:
+    """
+    후보자 검색 및 종합 점수 계산 (개인 추천/팀 추천 공통)
+    
+    Args:
+        required_skills: 요구 기술 목록
+        priority: 우선순위 (skill, affinity, balanced)
+        search_k: 하이브리드 검색 후보 수
+        top_k: 지정 시 종합 점수 상위 k명만 점수 내림차순으로 반환하고,
+            가용성 확인도 이 k명에게만 수행
+        budget: 처리 시간 예산 (부족하면 벡터 검색 없이 기술 매칭만 사용)
+        
+    Returns:
+        tuple: (가용성 정보가 포함된 후보자 목록, 친밀도 그래프)
+            - 그래프는 후보자 사이의 상위 K 이웃 관계 (팀 최적화용)
+    """
+    # 1-2. 기술 필터 + 벡터 유사도 하이브리드 검색 (Requirements: 1.3, 11.3, 11.4)
+    hybrid_result = None
+    if budget is None or budget.allows('vector_search', VECTOR_SEARCH_STAGE_MS):
+        hybrid_result = search_hybrid_candidates(required_skills, k=search_k)
+    
+    # 3. 친밀도 조회 (Requirements: 2.2) - 후보자 인접 목록만 BatchGet
+    if hybrid_result is not None:
+        skill_matches, vector_matches = hybrid_result
+        affinity_graph, affinity_means = load_affinity(
+            [match['user_id'] for match in skill_matches + vector_matches]
+        )
+    elif top_k:
+        # OpenSearch 또는 임베딩을 사용할 수 없으면 전체 직원 기술 매칭으로 대체 (상한 가지치기)
+        # 전체 직원의 점수 상한에 평균 친밀도가 필요하므로 인접 목록 전체를 읽음
+        affinity_graph, affinity_means = load_affinity()
+        skill_matches = find_top_employees_by_skills(
+            required_skills, priority, affinity_graph, top_k, affinity_means
+        )
+        vector_matches = []
+    else:
+        skill_matches = find_employees_by_skills(required_skills)
+        vector_matches = []
+        affinity_graph, affinity_means = load_affinity([match['user_id'] for match in skill_matches])
+    
+    logger.info(f"기술 매칭 결과: {len(skill_matches)} 명")
+    logger.info(f"벡터 검색 결과: {len(vector_matches)} 명")
+    
+    # 4. 후보자 통합 및 점수 계산
+    candidates = merge_and_score_candidates(
+        skill_matches=skill_matches,
+        vector_matches=vector_matches,
+        affinity_scores={},
+        priority=priority,
+        affinity_graph=affinity_graph,
+        affinity_means=affinity_means
+    )
+    
+    # 5. 상위 k명 선택 (힙, 전체 정렬 생략)
+    if top_k:
+        candidates, _ = select_top_k(
+            candidates,
+            top_k,
+            score=lambda candidate: (candidate['overall_score'], candidate)
+        )
+    
+    # 6. 가용성 확인 (Requirements: 2.5)
+    candidates = check_availability(candidates)
+    
+    return candidates, affinity_graph
+
+
+def generate_team_recommendation(
+    project_id: str,
+    required_skills: List[str],
+    team_size: int,
+    priority: str,
+    team_composition: Optional[Dict[str, Any]] = None,
+    beam_width: int = 1,
+    budget: Optional[LatencyBudget] = None
+) -> Dict[str, Any]:
+    """
+    역할 슬롯 기반 팀 구성 추천
+    
+    개인 점수 상위 N명 대신, 역할 슬롯을 채우면서 요구 기술 커버리지와
+    팀원 간 친밀도를 함께 최대화하는 팀을 선택합니다 (team_optimizer 참고).
+    
+    Args:
+        project_id: 프로젝트 ID
+        required_skills: 요구 기술 목록
+        team_size: 팀 크기 (역할 슬롯이 없을 때 사용)
+        priority: 우선순위 (skill, affinity, balanced)
+        team_composition: 역할별 인원 (없으면 프로젝트 정보에서 조회)
+        beam_width: 1이면 lazy greedy, 2 이상이면 beam search
+        budget: 처리 시간 예산
+        
+    Returns:
+        dict: 팀원 목록(members)과 팀 지표(summary)
+    """
+    if not team_composition:
+        team_composition = get_project_team_composition(project_id)
+    slots = normalize_slots(team_composition, team_size)
+    
+    # 팀 최적화는 슬롯보다 넓은 후보군이 필요하므로 검색 범위를 확장
+    search_k = max(HYBRID_SEARCH_K, sum(slots.values()) * TEAM_CANDIDATE_MULTIPLIER)
+    candidates, affinity_graph = collect_scored_candidates(required_skills, priority, search_k, budget=budget)
+    
+    # 투입 불가능한 인원은 팀 후보에서 제외
+    available = [c for c in candidates if c.get('availability') != 'Busy']
+    
+    with profile_stage('team_optimizer'):
+        result = optimize_team(
+            candidates=available,
+            required_skills=required_skills,
+            affinity_graph=affinity_graph,
+            slots=slots,
+            priority=priority,
+            beam_width=beam_width
+        )
+    
+    by_user = {c['user_id']: c for c in available}
+    members = []
+    for user_id in result['members']:
+        candidate = by_user[user_id]
+        candidate['assigned_role'] = result['assignments'][user_id]
+        # 개인 추천과 같이 팀원마다 남은 시간을 확인하고 부족하면 구조화된 근거로 대체
+        if budget is None or budget.allows('llm_reasoning', LLM_REASONING_STAGE_MS):
+            candidate['reasoning'] = generate_reasoning(candidate, budget)
+        else:
+            candidate['reasoning'] = build_fallback_reasoning(candidate)
+        members.append(candidate)
+    
+    slot_members: Dict[str, List[str]] = {slot: [] for slot in slots}
+    for user_id in result['members']:
+        slot_members[result['assignments'][user_id]].append(user_id)
+    
+    summary = {
+        'slots': slot_members,
+        'unfilled_slots': result['unfilled_slots'],
+        'objective': result['objective'],
+        'skill_coverage': result['skill_coverage'],
+        'uncovered_skills': result['uncovered_skills'],
+        'pairwise_affinity_avg': result['pairwise_affinity_avg'],
+        'candidate_pool_size': len(available),
+        'algorithm': 'beam_search' if beam_width > 1 else 'lazy_greedy'
+    }
+    
+    logger.info(f"팀 추천 완료: {len(members)}명, 목적 함수 {result['objective']}")
+    return {'members': members, 'summary': summary}
+
+
+def get_project_team_composition(project_id: str) -> Dict[str, Any]:
+    """
+    프로젝트의 역할별 인원 구성 조회
+    
+    Args:
+        project_id: 프로젝트 ID
+        
+    Returns:
+        dict: team_composition (조회 실패 시 빈 딕셔너리)
+    """
+    try:
+        table = dynamodb.Table('Projects')
+        response = table.get_item(Key={'project_id': project_id})
+        return response.get('Item', {}).get('team_composition', {}) or {}
+        
+    except Exception as e:
+        logger.error(f"프로젝트 팀 구성 조회 실패: {str(e)}")
+        return {}
+
+
+def generate_portfolio_recommendations(
+    projects: List[Dict[str, Any]],
+    priority: str = 'balanced'
+) -> Dict[str, Any]:
+    """
+    여러 프로젝트의 투입 인력을 한 번에 추천 (전역 배정)
+    
+    직원·친밀도·배정 현황을 한 번만 조회하고 프로젝트 × 직원 점수 행렬을 계산한 뒤,
+    최소 비용 유량으로 한 직원이 여러 프로젝트에 중복 배정되지 않도록 전역 배정합니다.
+    현재 다른 프로젝트에 투입 중인(Busy) 직원은 배정 대상에서 제외합니다.
+    
+    Args:
+        projects: 프로젝트 목록 ({project_id, required_skills, team_size, team_composition})
+        priority: 우선순위 (skill, affinity, balanced)
+        
+    Returns:
+        dict: 프로젝트별 팀(projects)과 미배정 인력(unassigned_pool)
+    """
+    from datetime import datetime
+    
+    # 1. 공통 데이터 1회 조회
+    employees = scan_all_employees()
+    affinity_graph, affinity_means = load_affinity()
+    try:
+        active_assignments = get_active_assignments(
+            [employee['user_id'] for employee in employees if employee.get('user_id')]
+        )
+    except Exception as e:
+        logger.error(f"배정 현황 조회 실패: {str(e)}")
+        active_assignments = {}
+    stored_projects = batch_get_projects([project['project_id'] for project in projects])
+    
+    current_year = datetime.now().year
+    available_employees = {
+        employee['user_id']: employee
+        for employee in employees
+        if employee.get('user_id') and employee['user_id'] not in active_assignments
+    }
+    
+    # 2. 프로젝트 × 직원 점수 행렬
+    score_matrix: Dict[str, Dict[str, float]] = {}
+    candidate_details: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    project_slots: Dict[str, Dict[str, int]] = {}
+    
+    for project in projects:
+        project_id = project['project_id']
+        stored = stored_projects.get(project_id, {})
+        required_skills = project.get('required_skills') or stored.get('requirements') or []
+        team_size = int(project.get('team_size', 5))
+        team_composition = project.get('team_composition') or stored.get('team_composition')
+        project_slots[project_id] = normalize_slots(team_composition, team_size)
+        
+        skill_matches = []
+        for employee in available_employees.values():
+            match = score_employee_skills(employee, required_skills, current_year)
+            if match:
+                skill_matches.append(match)
+        
+        candidates = merge_and_score_candidates(
+            skill_matches=skill_matches,
+            vector_matches=[],
+            affinity_scores={},
+            priority=priority,
+            affinity_graph=affinity_graph,
+            affinity_means=affinity_means
+        )
+        score_matrix[project_id] = {c['user_id']: c['overall_score'] for c in candidates}
+        candidate_details[project_id] = {c['user_id']: c for c in candidates}
+    
+    # 3. 전역 배정
+    solution = solve_portfolio_assignment(
+        score_matrix=score_matrix,
+        project_slots=project_slots,
+        employee_roles={
+            user_id: employee.get('basic_info', {}).get('role', '')
+            for user_id, employee in available_employees.items()
+        }
+    )
+    
+    results = []
+    for project in projects:
+        project_id = project['project_id']
+        team = []
+        for member in solution['assignments'].get(project_id, []):
+            candidate = dict(candidate_details[project_id][member['user_id']])
+            candidate['assigned_role'] = member['slot']
+            candidate['availability'] = 'Available'
+            team.append(candidate)
+        
+        results.append({
+            'project_id': project_id,
+            'recommendations': team,
+            'unfilled_slots': solution['unfilled'].get(project_id, {})
+        })
+    
+    unassigned_pool = []
+    for user_id in solution['unassigned']:
+        basic_info = available_employees[user_id].get('basic_info', {})
+        unassigned_pool.append({
+            'user_id': user_id,
+            'name': basic_info.get('name', ''),
+            'role': basic_info.get('role', '')
+        })
+    
+    return {
+        'projects': results,
+        'unassigned_pool': unassigned_pool,
+        'total_score': solution['total_score'],
+        'busy_employees': len(active_assignments)
+    }
+
+
+def batch_get_projects(project_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    프로젝트 다건 조회 (BatchGetItem, 100건 단위)
+    
+    Args:
+        project_ids: 프로젝트 ID 목록
+        
+    Returns:
+        dict: {project_id: 프로젝트 데이터} (조회 실패 시 빈 딕셔너리)
+    """
+    projects = {}
+    
+    try:
+        unique_ids = list(dict.fromkeys(project_ids))
+        for start in range(0, len(unique_ids), 100):
+            request_items = {
+                'Projects': {
+                    'Keys': [{'project_id': project_id} for project_id in unique_ids[start:start + 100]]
+                }
+            }
+            
+            while request_items:
+                response = dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get('Responses', {}).get('Projects', []):
+                    projects[item['project_id']] = item
+                request_items = response.get('UnprocessedKeys') or {}
+        
+    except Exception as e:
+        logger.error(f"프로젝트 조회 실패: {str(e)}")
+    
+    return projects
+
+
+@profile_stage('employees_scan')
+def find_employees_by_skills(required_skills: List[str]) -> List[Dict[str, Any]]:
+    """
+    기술 스택으로 직원 검색 (가중치 기반)
+    
+    Requirements: 1.3 - 기술 매칭 알고리즘
+    
+    Employees 테이블 전체를 스캔하므로 하이브리드 검색을 사용할 수 없을 때의 대체 경로입니다.
+    
+    Args:
+        required_skills: 요구 기술 목록
+        
+    Returns:
+        list: 매칭된 직원 목록
+    """
+    try:
+        from datetime import datetime
+        
+        # 모든 직원 조회
+        employees = scan_all_employees()
+        
+        # 기술 매칭 점수 계산 (가중치 적용) + 로컬 기술 임베딩 유사도
+        current_year = datetime.now().year
+        model, query = local_skill_query(required_skills)
+        matches = []
+        
+        for employee in employees:
+            match = score_employee_skills(employee, required_skills, current_year)
+            if match:
+                match['similarity_score'] = local_similarity(model, query, employee)
+                matches.append(match)
+        
+        logger.info(f"기술 매칭 완료: {len(matches)}명 발견")
+        return matches
+        
+    except Exception as e:
+        logger.error(f"기술 검색 실패: {str(e)}")
+        return []
+
+
+@profile_stage('employees_scan')
+def find_top_employees_by_skills(
+    required_skills: List[str],
+    priority: str,
+    affinity_graph: Dict[str, Dict[str, float]],
+    top_k: int,
+    affinity_means: Optional[Dict[str, float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    기술 스택으로 종합 점수 상위 k명 검색 (상한 가지치기)
+    
+    find_employees_by_skills와 같은 전체 스캔 대체 경로이지만, 직원마다 보유 기술의
+    숙련도만으로 기술 점수 상한을 구해(유사도는 최대값으로 가정) 현재 k번째 종합 점수를
+    넘을 수 없는 직원은 최신성/도메인/유사도 계산과 결과 생성을 생략합니다. 스캔은 페이지 단위로 처리하므로
+    메모리는 k에 비례합니다.
+    
+    Args:
+        required_skills: 요구 기술 목록
+        priority: 우선순위 (skill, affinity, balanced)
+        affinity_graph: 친밀도 그래프
+        top_k: 유지할 후보 수
+        affinity_means: 직원별 평균 친밀도 (없으면 그래프 이웃 평균)
+        
+    Returns:
+        list: 종합 점수 상위 k명의 기술 매칭 결과 (점수 내림차순)
+    """
+    try:
+        from datetime import datetime
+        
+        current_year = datetime.now().year
+        weights = PRIORITY_WEIGHTS.get(priority, PRIORITY_WEIGHTS['balanced'])
+        
+        # 벡터 유사도는 로컬 기술 임베딩으로 계산 (모델이 없으면 0 - 기술 점수와 친밀도만 사용)
+        model, query = local_skill_query(required_skills)
+        similarity_bound = MAX_SIMILARITY_SCORE if query is not None else 0
+        
+        def overall_upper_bound(employee):
+            return weighted_overall_score(
+                skill_match_upper_bound(employee, required_skills),
+                similarity_bound,
+                affinity_average(affinity_graph, employee.get('user_id'), affinity_means),
+                weights
+            )
+        
+        def score(employee):
+            match = score_employee_skills(employee, required_skills, current_year)
+            if not match:
+                return None
+            match['similarity_score'] = local_similarity(model, query, employee)
+            overall = weighted_overall_score(
+                match['skill_match_score'],
+                match['similarity_score'],
+                affinity_average(affinity_graph, match['user_id'], affinity_means),
+                weights
+            )
+            return overall, match
+        
+        matches, selector = select_top_k(
+            iter_all_employees(),
+            top_k,
+            score=score,
+            upper_bound=overall_upper_bound
+        )
+        
+        logger.info(
+            f"기술 매칭 완료: 상위 {len(matches)}명 선택 "
+            f"(점수 계산 {selector.offered}명, 상한 가지치기 {selector.pruned}명)"
+        )
+        return matches
+        
+    except Exception as e:
+        logger.error(f"기술 검색 실패: {str(e)}")
+        return []
+
+
+def local_skill_query(
+    required_skills: List[str]
+) -> Tuple[Optional[SkillEmbedding], Optional[Any]]:
+    """
+    로컬 기술 임베딩 모델과 요구 기술 질의 벡터
+    
+    Args:
+        required_skills: 요구 기술 목록
+        
+    Returns:
+        tuple: (모델, 질의 벡터) - 모델이 없거나 알려진 기술이 없으면 질의 벡터는 None
+    """
+    model = get_skill_embedding()
+    if model is None:
+        return None, None
+    return model, model.embed(required_skills)
+
+
+def local_similarity(
+    model: Optional[SkillEmbedding],
+    query: Optional[Any],
+    employee: Dict[str, Any]
+) -> float:
+    """
+    로컬 기술 임베딩 유사도 (OpenSearch innerproduct _score 척도, 계산 불가 시 0)
+    
+    Args:
+        model: 기술 임베딩 모델
+        query: 요구 기술 질의 벡터
+        employee: 직원 데이터
+        
+    Returns:
+        float: 유사도 점수 (0-2)
+    """
+    if model is None or query is None:
+        return 0.0
+    skills = [
+        skill.get('name', '') if isinstance(skill, dict) else str(skill)
+        for skill in employee.get('skills', [])
+    ]
+    return model.score(query, skills)
+
+
+def iter_all_employees():
+    """
+    Employees 테이블 전체 순회 (페이지 단위 스캔)
+    
+    Yields:
+        dict: 직원 데이터
+    """
+    table = dynamodb.Table('Employees')
+    
+    response = table.scan()
+    yield from response.get('Items', [])
+    
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        yield from response.get('Items', [])
+
+
+def scan_all_employees() -> List[Dict[str, Any]]:
+    """
+    Employees 테이블 전체 조회 (페이지네이션 처리)
+    
+    Returns:
+        list: 직원 데이터 목록
+    """
+    return list(iter_all_employees())
+
+
+def skill_match_upper_bound(employee: Dict[str, Any], required_skills: List[str]) -> float:
+    """
+    score_employee_skills 기술 적합도 점수의 상한
+    
+    요구 기술별 상한 = Wlevel × 최대 Wrecency이며, 도메인 보너스는 항상 적용된다고 가정합니다.
+    프로젝트 이력 파싱 없이 보유 기술 목록만 확인합니다.
+    
+    Args:
+        employee: 직원 데이터
+        required_skills: 요구 기술 목록
+        
+    Returns:
+        float: 기술 적합도 점수 상한 (0-100)
+    """
+    if not required_skills:
+        return 0.0
+    
+    level_by_skill = {}
+    for emp_skill in employee.get('skills', []):
+        if isinstance(emp_skill, dict):
+            name = emp_skill.get('name', '').lower()
+            weight = LEVEL_WEIGHTS.get(emp_skill.get('level', 'Intermediate'), 1.0)
+            level_by_skill[name] = max(weight, level_by_skill.get(name, 0.0))
+    
+    bound = sum(
+        level_by_skill.get(req_skill.lower(), 0.0) * MAX_RECENCY_WEIGHT
+        for req_skill in required_skills
+    )
+    bound *= 1 + DOMAIN_BONUS_RATE
+    
+    return min(100.0, (bound / len(required_skills)) * 50)
+
+
+def score_employee_skills(
+    employee: Dict[str, Any],
+    required_skills: List[str],
+    current_year: int
+) -> Optional[Dict[str, Any]]:
+    """
+    직원 한 명의 기술 적합도 점수 계산
+    
+    적합도 점수 공식: Score(P, E) = Σ(Smatch × Wlevel × Wrecency) + (Expdomain × Wdomain)
+    - Smatch: 요구 기술 일치 여부 (0 or 1)
+    - Wlevel: 기술 숙련도 가중치 (Beginner: 1.0 ~ Expert: 2.0)
+    - Wrecency: 최신성 가중치 (최근 6개월: 1.0, 3년 전: 0.3)
+    - Wdomain: 도메인 경험 가중치 (1.3)
+    
+    Args:
+        employee: 직원 데이터
+        required_skills: 요구 기술 목록
+        current_year: 기준 연도
+        
+    Returns:
+        dict: 매칭 결과 (일치하는 기술이 없으면 None)
+    """
+    import math
+    
+    skills = employee.get('skills', [])
+    work_experience = employee.get('work_experience', [])
+    
+    # 가중치 점수 계산
+    weighted_score = 0.0
+    matched_skills = []
+    skill_details = []
+    
+    for req_skill in required_skills:
+        # 직원이 해당 기술을 보유하는지 확인
+        for emp_skill in skills:
+            if not isinstance(emp_skill, dict):
+                continue
+            
+            skill_name = emp_skill.get('name', '')
+            if skill_name.lower() == req_skill.lower():
+                # 1. 기본 매칭 (Smatch = 1)
+                s_match = 1.0
+                
+                # 2. 숙련도 가중치 (Wlevel)
+                level = emp_skill.get('level', 'Intermediate')
+                w_level = LEVEL_WEIGHTS.get(level, 1.0)
+                
+                # 3. 최신성 가중치 (Wrecency)
+                # 최근 프로젝트에서 사용했는지 확인
+                w_recency = 0.5  # 기본값
+                
+                for project in work_experience:
+                    if not isinstance(project, dict):
+                        continue
+                    
+                    # 프로젝트 기간 파싱
+                    period = project.get('period', '')
+                    if period:
+                        try:
+                            # "2024-01 ~ 2025-07" 형식 파싱
+                            end_date = period.split('~')[-1].strip()
+                            end_year = int(end_date.split('-')[0])
+                            # 종료 예정일이 미래인 프로젝트는 현재 진행 중으로 간주
+                            years_ago = max(0, current_year - end_year)
+                            
+                            # 시간 감쇠: e^(-λt), λ = 0.3
+                            w_recency = max(w_recency, math.exp(-0.3 * years_ago))
+                        except:
+                            pass
+                
+                # 가중치 점수 계산
+                skill_score = s_match * w_level * w_recency
+                weighted_score += skill_score
+                
+                matched_skills.append(req_skill)
+                skill_details.append({
+                    'skill': skill_name,
+                    'level': level,
+                    'years': emp_skill.get('years', 0),
+                    'score': round(skill_score, 2)
+                })
+                break
+    
+    if not matched_skills:
+        return None
+    
+    # 도메인 경험 보너스 (Wdomain = 1.3)
+    # 프로젝트 이력에서 유사 도메인 경험 확인
+    domain_bonus = 0.0
+    for project in work_experience:
+        if isinstance(project, dict):
+            # 프로젝트 이름이나 설명에서 도메인 키워드 확인
+            project_name = project.get('project_name', '').lower()
+            # 간단한 도메인 매칭 (실제로는 더 정교한 로직 필요)
+            if any(keyword in project_name for keyword in ['금융', 'finance', '은행', 'banking']):
+                domain_bonus = weighted_score * DOMAIN_BONUS_RATE  # 30% 보너스
+                break
+    
+    weighted_score += domain_bonus
+    
+    # 0-100 범위로 정규화
+    match_score = min(100.0, (weighted_score / len(required_skills)) * 50)
+    
+    return {
+        'user_id': employee.get('user_id'),
+        'name': employee.get('basic_info', {}).get('name', ''),
+        'role': employee.get('basic_info', {}).get('role', ''),
+        'matched_skills': matched_skills,
+        'skill_match_score': match_score,
+        'skill_details': skill_details,
+        'years_of_experience': employee.get('basic_info', {}).get('years_of_experience', 0),
+        'domain_bonus': domain_bonus > 0
+    }
+
+
+@profile_stage('hybrid_search')
+def search_hybrid_candidates(
+    required_skills: List[str],
+    k: int = HYBRID_SEARCH_K
+) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
     """
-    Lambda handler for API Gateway
+    기술 필터가 적용된 단일 하이브리드 검색
     
-    Requirements: 2.2 - 프로젝트 투입 인력 추천
+    Requirements: 1.3, 11.3, 11.4
+    
+    요구 기술 중 하나 이상을 보유한 직원을 기술 필터로 조회하고 로컬 기술 임베딩으로
+    순위를 매깁니다 (Titan 호출 없음). 로컬 모델로 계산할 수 없으면 Titan 임베딩 k-NN 검색의
+    knn 절 내부에서 같은 기술 필터를 적용합니다.
+    반환된 후보만 BatchGet으로 조회하여 가중치 기술 점수를 계산합니다.
+    Employees 전체 스캔과 필터 없는 k-NN 검색을 한 번의 검색으로 대체합니다.
     
     Args:
-        event: API Gateway 이벤트
-        context: Lambda 컨텍스트
+        required_skills: 요구 기술 목록
+        k: 최근접 이웃 수
         
     Returns:
-        dict: API Gateway 응답
+        tuple: (기술 매칭 결과, 벡터 검색 결과) - 검색 불가 시 None
     """
     try:
-        logger.info(f"추천 요청 수신: {json.dumps(event)}")
-        
-        # 요청 본문 파싱 (Requirements: 2.2)
-        body = json.loads(event.get('body', '{}'))
-        
-        # 입력 검증
-        if not body.get('project_id'):
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'error': 'project_id가 필요합니다'})
+        local_matches = search_similar_employees_locally(required_skills, k)
+        if local_matches is not None:
+            similarity_by_user = {
+                match['user_id']: match['similarity_score'] for match in local_matches if match['user_id']
             }
+        else:
+            similarity_by_user = search_titan_candidates(required_skills, k)
+            if similarity_by_user is None:
+                return None
         
-        project_id = body['project_id']
-        required_skills = body.get('required_skills', [])
-        team_size = body.get('team_size', 5)
-        priority = body.get('priority', 'balanced')  # skill, affinity, balanced
-        
-        logger.info(f"프로젝트 {project_id}에 대한 추천 시작")
+        # 후보 직원만 조회하여 가중치 기술 점수 계산
+        from datetime import datetime
+        current_year = datetime.now().year
+        employees = batch_get_employees(list(similarity_by_user.keys()))
         
-        # 추천 생성
-        recommendations = generate_recommendations(
-            project_id=project_id,
-            required_skills=required_skills,
-            team_size=team_size,
-            priority=priority
-        )
+        skill_matches = []
+        vector_matches = []
+        for employee in employees:
+            user_id = employee.get('user_id')
+            match = score_employee_skills(employee, required_skills, current_year)
+            if match:
+                skill_matches.append(match)
+            
+            vector_matches.append({
+                'user_id': user_id,
+                'name': employee.get('basic_info', {}).get('name', ''),
+                'role': employee.get('basic_info', {}).get('role', ''),
+                'similarity_score': similarity_by_user.get(user_id, 0),
+                'vector_match': True
+            })
         
-        return {
-            'statusCode': 200,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
-                'project_id': project_id,
-                'recommendations': recommendations
-            }, default=decimal_default)
-        }
+        logger.info(f"하이브리드 검색 완료: 후보 {len(similarity_by_user)}명, 기술 매칭 {len(skill_matches)}명")
+        return skill_matches, vector_matches
         
     except Exception as e:
-        logger.error(f"추천 생성 중 오류 발생: {str(e)}", exc_info=True)
-        return {
-            'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({'error': str(e)})
-        }
+        logger.error(f"하이브리드 검색 실패: {str(e)}")
+        return None
 
 
-def generate_recommendations(
-    project_id: str,
-    required_skills: List[str],
-    team_size: int,
-    priority: str
-) -> List[Dict[str, Any]]:
+def search_titan_candidates(required_skills: List[str], k: int) -> Optional[Dict[str, float]]:
     """
-    프로젝트 투입 인력 추천 생성
-    
-    Requirements: 2.2, 2.4 - 다중 요소 점수 계산 및 추천
+    기술 필터가 적용된 Titan 임베딩 k-NN 검색 (로컬 기술 임베딩을 사용할 수 없을 때)
     
     Args:
-        project_id: 프로젝트 ID
         required_skills: 요구 기술 목록
-        team_size: 팀 크기
-        priority: 우선순위 (skill, affinity, balanced)
+        k: 최근접 이웃 수
         
     Returns:
-        list: 추천 후보자 목록
+        dict: {직원 ID: 유사도 _score} - 임베딩 생성 실패 시 None
     """
-    # 1. 기술 매칭 알고리즘 (Requirements: 1.3, 2.2)
-    skill_matches = find_employees_by_skills(required_skills)
-    logger.info(f"기술 매칭 결과: {len(skill_matches)} 명")
-    
-    # 2. 벡터 유사도 검색 (Requirements: 11.3, 11.4)
-    vector_matches = search_similar_employees(project_id, required_skills)
-    logger.info(f"벡터 검색 결과: {len(vector_matches)} 명")
-    
-    # 3. 친밀도 점수 조회 (Requirements: 2.2)
-    affinity_scores = get_affinity_scores()
+    requirement_vector = generate_embedding(build_requirement_text(required_skills))
+    if not requirement_vector:
+        logger.warning("요구사항 임베딩이 없어 하이브리드 검색을 사용할 수 없습니다")
+        return None
     
-    # 4. 후보자 통합 및 점수 계산
-    candidates = merge_and_score_candidates(
-        skill_matches=skill_matches,
-        vector_matches=vector_matches,
-        affinity_scores=affinity_scores,
-        priority=priority
+    query = build_knn_query(
+        normalize_vector(requirement_vector),
+        k=k,
+        required_skills=required_skills
     )
     
-    # 5. 가용성 확인 (Requirements: 2.5)
-    candidates = check_availability(candidates)
-    
-    # 6. 상위 후보자 선택
-    top_candidates = sorted(
-        candidates,
-        key=lambda x: x['overall_score'],
-        reverse=True
-    )[:team_size]
-    
-    # 7. 추천 근거 생성 (Requirements: 2.4)
-    for candidate in top_candidates:
-        candidate['reasoning'] = generate_reasoning(candidate)
+    response = search_employee_index(query)
     
-    return top_candidates
+    similarity_by_user = {}
+    for hit in response['hits']['hits']:
+        user_id = hit['_source'].get('user_id')
+        if user_id:
+            similarity_by_user[user_id] = hit['_score']
+    return similarity_by_user
 
 
-def find_employees_by_skills(required_skills: List[str]) -> List[Dict[str, Any]]:
+@profile_stage('opensearch_search')
+def search_employee_index(body: Dict[str, Any]) -> Dict[str, Any]:
     """
-    기술 스택으로 직원 검색 (가중치 기반)
-    
-    Requirements: 1.3 - 기술 매칭 알고리즘
+    직원 프로필 인덱스 검색 (OpenSearch 장애 시 로컬 벡터 인덱스)
     
-    적합도 점수 공식: Score(P, E) = Σ(Smatch × Wlevel × Wrecency) + (Expdomain × Wdomain)
-    - Smatch: 요구 기술 일치 여부 (0 or 1)
-    - Wlevel: 기술 숙련도 가중치 (Beginner: 1.0 ~ Expert: 2.0)
-    - Wrecency: 최신성 가중치 (최근 6개월: 1.0, 3년 전: 0.3)
-    - Wdomain: 도메인 경험 가중치 (1.3)
+    OpenSearch가 응답 제한 시간을 넘기거나 연결할 수 없으면 직원 스냅샷으로 만든
+    프로세스 내 인덱스에서 같은 쿼리를 실행합니다. 스냅샷이 없으면 원래 오류를 그대로 발생시킵니다.
     
     Args:
-        required_skills: 요구 기술 목록
+        body: build_knn_query / build_skill_filter_query 검색 본문
         
     Returns:
-        list: 매칭된 직원 목록
+        dict: OpenSearch 검색 응답 형식
     """
     try:
-        import math
-        from datetime import datetime
-        
-        table = dynamodb.Table('Employees')
-        
-        # 모든 직원 조회
-        response = table.scan()
-        employees = response.get('Items', [])
-        
-        # 페이지네이션 처리
-        while 'LastEvaluatedKey' in response:
-            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-            employees.extend(response.get('Items', []))
-        
-        # 기술 매칭 점수 계산 (가중치 적용)
-        matches = []
-        current_year = datetime.now().year
-        
-        for employee in employees:
-            skills = employee.get('skills', [])
-            work_experience = employee.get('work_experience', [])
-            
-            # 가중치 점수 계산
-            weighted_score = 0.0
-            matched_skills = []
-            skill_details = []
-            
-            for req_skill in required_skills:
-                # 직원이 해당 기술을 보유하는지 확인
-                for emp_skill in skills:
-                    if not isinstance(emp_skill, dict):
-                        continue
-                    
-                    skill_name = emp_skill.get('name', '')
-                    if skill_name.lower() == req_skill.lower():
-                        # 1. 기본 매칭 (Smatch = 1)
-                        s_match = 1.0
-                        
-                        # 2. 숙련도 가중치 (Wlevel)
-                        level = emp_skill.get('level', 'Intermediate')
-                        level_weights = {
-                            'Beginner': 1.0,
-                            'Intermediate': 1.5,
-                            'Advanced': 1.8,
-                            'Expert': 2.0
-                        }
-                        w_level = level_weights.get(level, 1.0)
-                        
-                        # 3. 최신성 가중치 (Wrecency)
-                        # 최근 프로젝트에서 사용했는지 확인
-                        w_recency = 0.5  # 기본값
-                        
-                        for project in work_experience:
-                            if not isinstance(project, dict):
-                                continue
-                            
-                            # 프로젝트 기간 파싱
-                            period = project.get('period', '')
-                            if period:
-                                try:
-                                    # "2024-01 ~ 2025-07" 형식 파싱
-                                    end_date = period.split('~')[-1].strip()
-                                    end_year = int(end_date.split('-')[0])
-                                    years_ago = current_year - end_year
-                                    
-                                    # 시간 감쇠: e^(-λt), λ = 0.3
-                                    w_recency = max(w_recency, math.exp(-0.3 * years_ago))
-                                except:
-                                    pass
-                        
-                        # 가중치 점수 계산
-                        skill_score = s_match * w_level * w_recency
-                        weighted_score += skill_score
-                        
-                        matched_skills.append(req_skill)
-                        skill_details.append({
-                            'skill': skill_name,
-                            'level': level,
-                            'years': emp_skill.get('years', 0),
-                            'score': round(skill_score, 2)
-                        })
-                        break
-            
-            # 도메인 경험 보너스 (Wdomain = 1.3)
-            # 프로젝트 이력에서 유사 도메인 경험 확인
-            domain_bonus = 0.0
-            for project in work_experience:
-                if isinstance(project, dict):
-                    # 프로젝트 이름이나 설명에서 도메인 키워드 확인
-                    project_name = project.get('project_name', '').lower()
-                    # 간단한 도메인 매칭 (실제로는 더 정교한 로직 필요)
-                    if any(keyword in project_name for keyword in ['금융', 'finance', '은행', 'banking']):
-                        domain_bonus = weighted_score * 0.3  # 30% 보너스
-                        break
-            
-            weighted_score += domain_bonus
-            
-            if matched_skills:
-                # 0-100 범위로 정규화
-                match_score = min(100.0, (weighted_score / len(required_skills)) * 50)
-                
-                matches.append({
-                    'user_id': employee.get('user_id'),
-                    'name': employee.get('basic_info', {}).get('name', ''),
-                    'role': employee.get('basic_info', {}).get('role', ''),
-                    'matched_skills': matched_skills,
-                    'skill_match_score': match_score,
-                    'skill_details': skill_details,
-                    'years_of_experience': employee.get('basic_info', {}).get('years_of_experience', 0),
-                    'domain_bonus': domain_bonus > 0
-                })
+        opensearch_client = get_opensearch_client()
+        response = opensearch_client.search(
+            index=EMPLOYEE_INDEX,
+            body=body,
+            request_timeout=OPENSEARCH_SEARCH_TIMEOUT_SECONDS
+        )
+    except Exception as e:
+        local_search = get_local_vector_search()
+        if local_search is None:
+            raise
+        logger.warning(f"OpenSearch 검색 실패, 로컬 벡터 인덱스 사용: {str(e)}")
+        response = local_search.search(index=EMPLOYEE_INDEX, body=body)
+    
+    record_opensearch_response(response)
+    return response
+
+
+@profile_stage('employees_batch_get')
+def batch_get_employees(user_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    직원 다건 조회 (BatchGetItem, 100건 단위)
+    
+    Args:
+        user_ids: 직원 ID 목록
         
-        logger.info(f"기술 매칭 완료: {len(matches)}명 발견")
-        return matches
+    Returns:
+        list: 직원 데이터 목록 (순서 보장 안 됨)
+    """
+    employees = []
+    
+    for start in range(0, len(user_ids), 100):
+        request_items = {
+            'Employees': {
+                'Keys': [{'user_id': user_id} for user_id in user_ids[start:start + 100]]
+            }
+        }
         
-    except Exception as e:
-        logger.error(f"기술 검색 실패: {str(e)}")
-        return []
+        # 처리되지 않은 키는 재요청
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            employees.extend(response.get('Responses', {}).get('Employees', []))
+            request_items = response.get('UnprocessedKeys') or {}
+    
+    return employees
 
 
 def search_similar_employees(
     project_id: str,
-    required_skills: List[str]
+    required_skills: List[str],
+    description: Optional[str] = None,
+    k: int = SIMILAR_SEARCH_K
 ) -> List[Dict[str, Any]]:
     """
     벡터 유사도 검색
     
     Requirements: 11.3, 11.4 - OpenSearch 벡터 검색
     
+    요구사항이 기술 목록뿐이면 Titan 호출 없이 기술 필터로 후보를 조회한 뒤
+    로컬 기술 임베딩으로 순위를 매깁니다. 자유 텍스트 설명이 있거나 로컬 모델로
+    계산할 수 없으면 Titan 임베딩 k-NN 검색을 사용합니다.
+    
     Args:
         project_id: 프로젝트 ID
         required_skills: 요구 기술 목록
+        description: 프로젝트 설명 등 자유 텍스트 (선택사항)
+        k: 반환할 직원 수
         
     Returns:
         list: 유사한 직원 목록
     """
     try:
+        if not description:
+            local_matches = search_similar_employees_locally(required_skills, k)
+            if local_matches is not None:
+                return local_matches
+        
         # 프로젝트 요구사항 벡터 생성
-        requirement_text = f"프로젝트 요구 기술: {', '.join(required_skills)}"
+        requirement_text = build_requirement_text(required_skills)
+        if description:
+            requirement_text = f"{requirement_text}\n프로젝트 설명: {description}"
         requirement_vector = generate_embedding(requirement_text)
         
-        # OpenSearch k-NN 검색
-        opensearch_client = get_opensearch_client()
-        
-        query = {
-            "size": 20,
-            "query": {
-                "knn": {
-                    "profile_vector": {
-                        "vector": requirement_vector,
-                        "k": 20
-                    }
-                }
-            }
-        }
+        # 임베딩 실패 시 영벡터로 검색하지 않음 (무의미한 kNN 결과 방지)
+        if not requirement_vector:
+            logger.warning("요구사항 임베딩을 생성하지 못해 벡터 검색을 건너뜁니다")
+            return []
         
-        response = opensearch_client.search(
-            index='employee_profiles',
-            body=query
-        )
+        # OpenSearch k-NN 검색 (장애 시 로컬 벡터 인덱스)
+        query = build_knn_query(normalize_vector(requirement_vector), k=k)
+        response = search_employee_index(query)
         
         matches = []
         for hit in response['hits']['hits']:
@@ -363,19 +1757,95 @@ def search_similar_employees(
         return []
 
 
+def search_similar_employees_locally(
+    required_skills: List[str],
+    k: int = SIMILAR_SEARCH_K
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    기술 목록 요구사항의 로컬 임베딩 유사도 검색
+    
+    요구 기술 중 하나 이상을 보유한 직원을 기술 필터로 조회하고(벡터 없음),
+    보유 기술 집합과 요구 기술의 로컬 임베딩 유사도로 상위 k명을 선택합니다.
+    
+    Args:
+        required_skills: 요구 기술 목록
+        k: 반환할 직원 수
+        
+    Returns:
+        list: 유사한 직원 목록 (로컬 모델로 계산할 수 없으면 None)
+    """
+    model, query = local_skill_query(required_skills)
+    if query is None:
+        return None
+    
+    response = search_employee_index(
+        build_skill_filter_query(required_skills, size=max(k, LOCAL_SIMILARITY_CANDIDATES))
+    )
+    
+    def score(hit):
+        source = hit['_source']
+        similarity_score = local_similarity(model, query, {'skills': source.get(SKILL_FILTER_FIELD, [])})
+        return similarity_score, {
+            'user_id': source.get('user_id'),
+            'name': source.get('name'),
+            'role': source.get('role'),
+            'similarity_score': similarity_score,
+            'vector_match': True
+        }
+    
+    matches, _ = select_top_k(response['hits']['hits'], k, score=score)
+    logger.info(f"로컬 기술 임베딩 검색 완료: 후보 {len(response['hits']['hits'])}명 → {len(matches)}명")
+    return matches
+
+
+def build_requirement_text(required_skills: List[str]) -> str:
+    """
+    요구 기술 목록을 임베딩 입력 텍스트로 변환
+    
+    기술 이름을 정규화·정렬하여 같은 기술 조합이 항상 같은 텍스트(같은 캐시 키)가 되도록 합니다.
+    
+    Args:
+        required_skills: 요구 기술 목록
+        
+    Returns:
+        str: 임베딩 입력 텍스트
+    """
+    skills = sorted(get_unique_skills(required_skills))
+    return f"프로젝트 요구 기술: {', '.join(skills)}"
+
+
+@profile_stage('titan_embedding')
 def generate_embedding(text: str) -> List[float]:
     """
     텍스트를 벡터 임베딩으로 변환
     
+    동일한 텍스트는 임베딩 캐시(메모리 LRU → DynamoDB)에서 반환하고,
+    캐시 미스일 때만 Bedrock Titan을 호출합니다.
+    
+    Args:
+        text: 입력 텍스트
+        
+    Returns:
+        list: 벡터 임베딩 (생성 실패 시 빈 리스트)
+    """
+    vector = embedding_cache.get_or_compute(EMBEDDING_MODEL_ID, text, invoke_embedding_model)
+    logger.info(f"임베딩 캐시 통계: {json.dumps(embedding_cache.stats())}")
+    return vector
+
+
+def invoke_embedding_model(text: str) -> List[float]:
+    """
+    Bedrock Titan 임베딩 호출
+    
     Args:
         text: 입력 텍스트
         
     Returns:
-        list: 벡터 임베딩
+        list: 벡터 임베딩 (실패 시 빈 리스트 - 캐시에 저장되지 않음)
     """
     try:
         response = bedrock_runtime.invoke_model(
-            modelId='amazon.titan-embed-text-v1',
+            modelId=EMBEDDING_MODEL_ID,
             body=json.dumps({'inputText': text})
         )
         
@@ -384,7 +1854,7 @@ def generate_embedding(text: str) -> List[float]:
         
     except Exception as e:
         logger.error(f"임베딩 생성 실패: {str(e)}")
-        return [0.0] * 1536  # 기본 벡터
+        return []
 
 
 def get_affinity_scores() -> Dict[str, float]:
@@ -396,36 +1866,144 @@ def get_affinity_scores() -> Dict[str, float]:
     Returns:
         dict: 직원 쌍별 친밀도 점수
     """
+    return flatten_affinity_graph(load_affinity()[0])
+
+
+@profile_stage('affinity_lookup')
+def load_affinity(
+    user_ids: Optional[List[str]] = None
+) -> Tuple[Dict[str, Dict[str, float]], Dict[str, float]]:
+    """
+    친밀도 그래프와 직원별 평균 친밀도 조회
+    
+    친밀도 계산 작업이 저장한 직원별 인접 목록(AffinityNeighbors)을 우선 읽습니다.
+    user_ids가 주어지면 그 직원들의 항목만 BatchGet하고 그래프는 그 안의 관계만 포함합니다
+    (team_affinity - 팀 최적화용). 평균 친밀도는 항목의 후보 쌍 전체 합계/쌍 수이므로
+    상위 K만이 아니라 EmployeeAffinity 행 평균과 같습니다.
+    목록이 없으면 EmployeeAffinity 전체(직원 쌍마다 한 행)를 스캔합니다.
+    
+    Args:
+        user_ids: 조회할 직원 ID (없으면 전체)
+        
+    Returns:
+        tuple: ({직원 ID: {직원 ID: 친밀도 점수}} - 양방향, {직원 ID: 평균 친밀도})
+    """
+    if user_ids is not None and not user_ids:
+        return {}, {}
+    try:
+        store = AffinityNeighborStore(dynamodb)
+        if user_ids is None:
+            profiles = store.scan_profiles()
+            graph = graph_of(profiles)
+        else:
+            profiles = store.get_profiles(user_ids)
+            graph = {}
+            for (emp1, emp2), score in store.team_affinity(user_ids, profiles).items():
+                graph.setdefault(emp1, {})[emp2] = score
+                graph.setdefault(emp2, {})[emp1] = score
+        if profiles:
+            return graph, {user_id: profile.mean for user_id, profile in profiles.items()}
+    except Exception as e:
+        logger.warning(f"친밀도 이웃 목록 조회 실패, 전체 친밀도 스캔으로 대체: {str(e)}")
+    
+    graph = get_affinity_graph()
+    return graph, {user_id: affinity_average(graph, user_id) for user_id in graph}
+
+
+def get_affinity_graph() -> Dict[str, Dict[str, float]]:
+    """
+    친밀도 그래프 조회 - EmployeeAffinity 전체 스캔 (인접 목록이 없을 때의 대체 경로)
+    
+    Returns:
+        dict: {직원 ID: {직원 ID: 친밀도 점수}} - 양방향 저장
+    """
     try:
         table = dynamodb.Table('EmployeeAffinity')
         response = table.scan()
+        items = response.get('Items', [])
+        
+        # 페이지네이션 처리
+        while 'LastEvaluatedKey' in response:
+            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+            items.extend(response.get('Items', []))
         
-        affinity_map = {}
-        for item in response.get('Items', []):
+        graph: Dict[str, Dict[str, float]] = {}
+        for item in items:
             employee_pair = item.get('employee_pair', {})
             emp1 = employee_pair.get('employee_1')
             emp2 = employee_pair.get('employee_2')
             score = float(item.get('overall_affinity_score', 0))
             
             if emp1 and emp2:
-                key = f"{emp1}_{emp2}"
-                affinity_map[key] = score
-                # 양방향 저장
-                key_reverse = f"{emp2}_{emp1}"
-                affinity_map[key_reverse] = score
+                graph.setdefault(emp1, {})[emp2] = score
+                graph.setdefault(emp2, {})[emp1] = score
         
-        return affinity_map
+        return graph
         
     except Exception as e:
         logger.error(f"친밀도 점수 조회 실패: {str(e)}")
         return {}
 
 
+def flatten_affinity_graph(graph: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """
+    친밀도 그래프를 "{emp1}_{emp2}" 키의 평면 딕셔너리로 변환
+    
+    Args:
+        graph: 친밀도 그래프
+        
+    Returns:
+        dict: 직원 쌍별 친밀도 점수 (양방향)
+    """
+    return {
+        f"{emp1}_{emp2}": score
+        for emp1, neighbors in graph.items()
+        for emp2, score in neighbors.items()
+    }
+
+
+def affinity_average(
+    graph: Dict[str, Dict[str, float]],
+    user_id: str,
+    means: Optional[Dict[str, float]] = None
+) -> float:
+    """
+    직원의 평균 친밀도 점수 (이웃이 없으면 0)
+    
+    means가 주어지면 그 값(인접 목록의 후보 쌍 전체 평균)을, 없으면 그래프 이웃 평균을 사용합니다.
+    """
+    if means is not None:
+        return means.get(user_id, 0.0)
+    neighbors = graph.get(user_id) or {}
+    if not neighbors:
+        return 0.0
+    return sum(neighbors.values()) / len(neighbors)
+
+
+def weighted_overall_score(
+    skill_score: float,
+    similarity_score: float,
+    affinity_score: float,
+    weights: Dict[str, float]
+) -> float:
+    """
+    구성 점수의 가중합 (종합 점수)
+    """
+    return (
+        skill_score * weights['skill'] +
+        similarity_score * weights['similarity'] +
+        affinity_score * weights['affinity']
+    )
+
+
+@profile_stage('scoring')
 def merge_and_score_candidates(
     skill_matches: List[Dict[str, Any]],
     vector_matches: List[Dict[str, Any]],
     affinity_scores: Dict[str, float],
-    priority: str
+    priority: str,
+    affinity_graph: Optional[Dict[str, Dict[str, float]]] = None,
+    affinity_means: Optional[Dict[str, float]] = None
 ) -> List[Dict[str, Any]]:
     """
     후보자 통합 및 종합 점수 계산
@@ -437,6 +2015,8 @@ def merge_and_score_candidates(
         vector_matches: 벡터 검색 결과
         affinity_scores: 친밀도 점수
         priority: 우선순위
+        affinity_graph: 친밀도 그래프 (주어지면 직원별 이웃 목록으로 평균 계산)
+        affinity_means: 직원별 평균 친밀도 (주어지면 그래프 대신 사용)
         
     Returns:
         list: 통합된 후보자 목록
@@ -452,9 +2032,11 @@ def merge_and_score_candidates(
             'name': match.get('name', ''),
             'role': match.get('role', ''),
             'skill_match_score': match.get('skill_match_score', 0),
-            'similarity_score': 0,
+            'similarity_score': match.get('similarity_score', 0),
             'affinity_score': 0,
             'matched_skills': match.get('matched_skills', []),
+            'skill_details': match.get('skill_details', []),
+            'domain_bonus': match.get('domain_bonus', False),
             'years_of_experience': match.get('years_of_experience', 0)
         }
     
@@ -477,6 +2059,9 @@ def merge_and_score_candidates(
     
     # 친밀도 점수 추가 (평균)
     for user_id in candidates_map:
+        if affinity_graph is not None:
+            candidates_map[user_id]['affinity_score'] = affinity_average(affinity_graph, user_id, affinity_means)
+            continue
         related_scores = [
             score for key, score in affinity_scores.items()
             if user_id in key
@@ -485,25 +2070,19 @@ def merge_and_score_candidates(
             candidates_map[user_id]['affinity_score'] = sum(related_scores) / len(related_scores)
     
     # 종합 점수 계산
+    weights = PRIORITY_WEIGHTS.get(priority, PRIORITY_WEIGHTS['balanced'])
     for candidate in candidates_map.values():
-        if priority == 'skill':
-            weights = {'skill': 0.6, 'similarity': 0.3, 'affinity': 0.1}
-        elif priority == 'affinity':
-            weights = {'skill': 0.3, 'similarity': 0.2, 'affinity': 0.5}
-        else:  # balanced
-            weights = {'skill': 0.4, 'similarity': 0.3, 'affinity': 0.3}
-        
-        overall_score = (
-            candidate['skill_match_score'] * weights['skill'] +
-            candidate['similarity_score'] * weights['similarity'] +
-            candidate['affinity_score'] * weights['affinity']
+        candidate['overall_score'] = weighted_overall_score(
+            candidate['skill_match_score'],
+            candidate['similarity_score'],
+            candidate['affinity_score'],
+            weights
         )
-        
-        candidate['overall_score'] = overall_score
     
     return list(candidates_map.values())
 
 
+@profile_stage('availability')
 def check_availability(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     직원 가용성 확인
@@ -517,18 +2096,8 @@ def check_availability(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         list: 가용성 정보가 추가된 후보자 목록
     """
     try:
-        # 현재 프로젝트 배정 확인
-        table = dynamodb.Table('Projects')
-        response = table.scan()
-        
-        # 진행 중인 프로젝트 찾기
-        active_projects = {}
-        for project in response.get('Items', []):
-            team = project.get('team_composition', {})
-            for role, members in team.items():
-                if isinstance(members, list):
-                    for member_id in members:
-                        active_projects[member_id] = project.get('project_name', '')
+        # 후보자의 현재 프로젝트 배정 확인
+        active_projects = get_active_assignments([candidate['user_id'] for candidate in candidates])
         
         # 가용성 정보 추가
         for candidate in candidates:
@@ -551,7 +2120,69 @@ def check_availability(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         return candidates
 
 
-def generate_reasoning(candidate: Dict[str, Any]) -> str:
+def get_active_assignments(user_ids: List[str]) -> Dict[str, str]:
+    """
+    진행 중인 프로젝트 배정 현황 조회 (배정 인덱스 BatchGet)
+    
+    Args:
+        user_ids: 조회할 직원 ID 목록
+        
+    Returns:
+        dict: {직원 ID: 진행 중인 프로젝트 이름} - 진행 중인 배정이 있는 직원만 포함
+        
+    Raises:
+        Exception: 배정 인덱스 조회 실패 시
+    """
+    allocations_by_user = assignment_index.batch_get_allocations(user_ids)
+    
+    active_projects = {}
+    for user_id, allocations in allocations_by_user.items():
+        active = active_allocations(allocations)
+        if active:
+            active_projects[user_id] = active[-1].get('project_name') or active[-1].get('project_id', '')
+    
+    return active_projects
+
+
+def get_reasoning_client(budget: Optional[LatencyBudget] = None):
+    """
+    남은 처리 시간에 맞춘 Bedrock 런타임 클라이언트
+    
+    botocore 기본값(응답 대기 60초, 재시도 포함)으로는 한 번의 느린 호출이 API Gateway 제한 시간을
+    넘길 수 있으므로, 응답 제한 시간 × 시도 횟수가 남은 시간 안에 들어오도록 설정합니다.
+    
+    Args:
+        budget: 처리 시간 예산 (없으면 기본 클라이언트)
+        
+    Returns:
+        boto3 bedrock-runtime 클라이언트
+    """
+    if budget is None:
+        return bedrock_runtime
+    
+    remaining_ms = budget.remaining_ms()
+    attempts = max(1, min(BEDROCK_MAX_ATTEMPTS, remaining_ms // LLM_REASONING_STAGE_MS))
+    read_timeout = max(1, remaining_ms // attempts // 1000)
+    key = (read_timeout, attempts)
+    
+    client = _reasoning_clients.get(key)
+    if client is None:
+        client = boto3.client(
+            'bedrock-runtime',
+            region_name=os.environ.get('AWS_REGION', 'us-east-2'),
+            config=Config(
+                connect_timeout=min(BEDROCK_CONNECT_TIMEOUT_SECONDS, read_timeout),
+                read_timeout=read_timeout,
+                retries={'total_max_attempts': attempts, 'mode': 'standard'}
+            )
+        )
+        instrument_client(client)
+        _reasoning_clients[key] = client
+    return client
+
+
+@profile_stage('claude_reasoning')
+def generate_reasoning(candidate: Dict[str, Any], budget: Optional[LatencyBudget] = None) -> str:
     """
     추천 근거 생성 (상세 근거 포함)
     
@@ -559,6 +2190,7 @@ def generate_reasoning(candidate: Dict[str, Any]) -> str:
     
     Args:
         candidate: 후보자 정보
+        budget: 처리 시간 예산 (Bedrock 응답 제한 시간과 재시도 횟수 결정)
         
     Returns:
         str: 추천 근거
@@ -605,7 +2237,7 @@ def generate_reasoning(candidate: Dict[str, Any]) -> str:
 
 총 3-4문장으로 간결하게 작성해주세요."""
 
-        response = bedrock_runtime.invoke_model(
+        response = get_reasoning_client(budget).invoke_model(
             modelId='anthropic.claude-v2',
             body=json.dumps({
                 'prompt': f"\n\nHuman: {prompt}\n\nAssistant:",
@@ -621,24 +2253,35 @@ def generate_reasoning(candidate: Dict[str, Any]) -> str:
         
     except Exception as e:
         logger.error(f"추천 근거 생성 실패: {str(e)}")
+        return build_fallback_reasoning(candidate)
+
+
+def build_fallback_reasoning(candidate: Dict[str, Any]) -> str:
+    """
+    구조화된 추천 근거 생성 (Bedrock 호출 실패 또는 처리 시간 부족 시)
+    
+    Args:
+        candidate: 후보자 정보
         
-        # 폴백: 구조화된 근거 생성
-        matched_skills = ', '.join(candidate.get('matched_skills', []))
-        skill_score = candidate.get('skill_match_score', 0)
-        affinity_score = candidate.get('affinity_score', 0)
-        availability = candidate.get('availability', 'Unknown')
-        
-        reasoning = f"""[핵심 강점] {matched_skills} 기술을 보유하고 있으며, 가중치 기반 기술 매칭 점수 {skill_score:.1f}점을 기록했습니다. """
-        
-        if affinity_score > 50:
-            reasoning += f"[팀 적합성] 기존 팀원들과의 친밀도 점수가 {affinity_score:.1f}점으로 높아 원활한 협업이 예상됩니다. "
-        
-        if availability == 'Available':
-            reasoning += "[가용성] 현재 투입 가능한 상태입니다."
-        elif availability == 'Busy':
-            reasoning += f"[고려사항] 현재 '{candidate.get('current_project', '다른 프로젝트')}'에 참여 중이므로 일정 조율이 필요합니다."
-        
-        return reasoning
+    Returns:
+        str: 추천 근거
+    """
+    matched_skills = ', '.join(candidate.get('matched_skills', []))
+    skill_score = candidate.get('skill_match_score', 0)
+    affinity_score = candidate.get('affinity_score', 0)
+    availability = candidate.get('availability', 'Unknown')
+    
+    reasoning = f"""[핵심 강점] {matched_skills} 기술을 보유하고 있으며, 가중치 기반 기술 매칭 점수 {skill_score:.1f}점을 기록했습니다. """
+    
+    if affinity_score > 50:
+        reasoning += f"[팀 적합성] 기존 팀원들과의 친밀도 점수가 {affinity_score:.1f}점으로 높아 원활한 협업이 예상됩니다. "
+    
+    if availability == 'Available':
+        reasoning += "[가용성] 현재 투입 가능한 상태입니다."
+    elif availability == 'Busy':
+        reasoning += f"[고려사항] 현재 '{candidate.get('current_project', '다른 프로젝트')}'에 참여 중이므로 일정 조율이 필요합니다."
+    
+    return reasoning
 
 
 def decimal_default(obj):
@@ -0,0 +1,229 @@
+"""
+포트폴리오 일괄 배정 모듈
+
+여러 프로젝트의 추천을 한 번에 계산할 때 같은 상위 인력이 여러 프로젝트에 중복 추천되지 않도록
+프로젝트 × 직원 점수 행렬에 대해 전역 배정(최소 비용 유량)을 수행합니다.
+
+유량 그래프:
+    source → (프로젝트, 역할 슬롯) [용량: 슬롯 인원, 비용 0]
+           → 직원               [용량: 1, 비용: (100 - 점수) × COST_SCALE]
+           → sink               [용량: 직원 투입 가능 수, 비용 0]
+
+최소 비용 최대 유량이므로 채울 수 있는 좌석 수를 먼저 최대화하고, 그 안에서 점수 합을 최대화합니다.
+슬롯별 간선은 점수 상위 후보로 제한하여 대규모 인력 풀에서도 그래프 크기를 일정하게 유지합니다.
+"""
+
+import heapq
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from team_optimizer import role_matches_slot
+except ImportError:
+    from lambda_functions.recommendation_engine.team_optimizer import role_matches_slot
+
+
+logger = logging.getLogger()
+
+# 점수(0-100)를 정수 비용으로 변환하는 배율
+COST_SCALE = 100
+
+# 좌석 하나당 유지할 후보 간선 수
+CANDIDATES_PER_SEAT = 20
+
+
+class MinCostFlow:
+    """
+    최소 비용 유량 (Successive Shortest Path + 포텐셜 Dijkstra)
+
+    모든 간선 비용이 0 이상이라고 가정합니다.
+    """
+
+    def __init__(self, node_count: int):
+        """
+        그래프 초기화
+
+        Args:
+            node_count: 노드 수
+        """
+        self.node_count = node_count
+        # 간선: [도착 노드, 잔여 용량, 비용, 역방향 간선 인덱스]
+        self.graph: List[List[List[int]]] = [[] for _ in range(node_count)]
+
+    def add_edge(self, source: int, target: int, capacity: int, cost: int) -> Tuple[int, int]:
+        """
+        간선 추가
+
+        Args:
+            source: 출발 노드
+            target: 도착 노드
+            capacity: 용량
+            cost: 단위 비용
+
+        Returns:
+            tuple: (출발 노드, 간선 인덱스) - 유량 조회용
+        """
+        self.graph[source].append([target, capacity, cost, len(self.graph[target])])
+        self.graph[target].append([source, 0, -cost, len(self.graph[source]) - 1])
+        return source, len(self.graph[source]) - 1
+
+    def flow_on(self, edge_ref: Tuple[int, int]) -> int:
+        """간선에 흐른 유량 (역방향 간선의 잔여 용량)"""
+        node, index = edge_ref
+        target, _, _, reverse = self.graph[node][index]
+        return self.graph[target][reverse][1]
+
+    def solve(self, source: int, sink: int, max_flow: Optional[int] = None) -> Tuple[int, int]:
+        """
+        최소 비용 최대 유량 계산
+
+        Args:
+            source: 시작 노드
+            sink: 도착 노드
+            max_flow: 최대 유량 (None이면 제한 없음)
+
+        Returns:
+            tuple: (총 유량, 총 비용)
+        """
+        infinity = float('inf')
+        potential = [0] * self.node_count
+        total_flow = 0
+        total_cost = 0
+
+        while max_flow is None or total_flow < max_flow:
+            distance = [infinity] * self.node_count
+            previous: List[Optional[Tuple[int, int]]] = [None] * self.node_count
+            distance[source] = 0
+            heap = [(0, source)]
+
+            while heap:
+                dist, node = heapq.heappop(heap)
+                if dist > distance[node]:
+                    continue
+                for index, (target, capacity, cost, _) in enumerate(self.graph[node]):
+                    if capacity <= 0:
+                        continue
+                    candidate = dist + cost + potential[node] - potential[target]
+                    if candidate < distance[target]:
+                        distance[target] = candidate
+                        previous[target] = (node, index)
+                        heapq.heappush(heap, (candidate, target))
+
+            if distance[sink] == infinity:
+                break
+
+            for node in range(self.node_count):
+                if distance[node] < infinity:
+                    potential[node] += distance[node]
+
+            # 증가 경로의 병목 용량
+            push = infinity if max_flow is None else max_flow - total_flow
+            node = sink
+            while node != source:
+                prev_node, index = previous[node]
+                push = min(push, self.graph[prev_node][index][1])
+                node = prev_node
+
+            node = sink
+            while node != source:
+                prev_node, index = previous[node]
+                edge = self.graph[prev_node][index]
+                edge[1] -= push
+                self.graph[node][edge[3]][1] += push
+                total_cost += push * edge[2]
+                node = prev_node
+
+            total_flow += push
+
+        return total_flow, total_cost
+
+
+def solve_portfolio_assignment(
+    score_matrix: Dict[str, Dict[str, float]],
+    project_slots: Dict[str, Dict[str, int]],
+    employee_roles: Dict[str, str],
+    employee_capacity: Optional[Dict[str, int]] = None,
+    candidates_per_seat: int = CANDIDATES_PER_SEAT
+) -> Dict[str, Any]:
+    """
+    프로젝트 × 직원 점수 행렬의 전역 배정
+
+    Args:
+        score_matrix: {project_id: {user_id: 점수(0-100)}} - 점수가 없는 쌍은 배정 불가
+        project_slots: {project_id: {역할 슬롯: 인원}}
+        employee_roles: {user_id: 직무명} - 배정 가능한 직원 목록
+        employee_capacity: {user_id: 동시 투입 가능 프로젝트 수} (기본값 1)
+        candidates_per_seat: 좌석당 유지할 후보 간선 수
+
+    Returns:
+        dict: assignments {project_id: [{user_id, slot, score}]},
+              unfilled {project_id: {slot: 인원}}, unassigned [user_id], total_score
+    """
+    employee_capacity = employee_capacity or {}
+    employees = [user_id for user_id in employee_roles if employee_capacity.get(user_id, 1) > 0]
+    employee_node = {user_id: index for index, user_id in enumerate(employees)}
+
+    slot_keys = [
+        (project_id, slot, count)
+        for project_id, slots in project_slots.items()
+        for slot, count in slots.items()
+        if count > 0
+    ]
+
+    source = 0
+    slot_offset = 1
+    employee_offset = slot_offset + len(slot_keys)
+    sink = employee_offset + len(employees)
+    flow = MinCostFlow(sink + 1)
+
+    assignment_edges = []
+    for slot_index, (project_id, slot, count) in enumerate(slot_keys):
+        slot_node = slot_offset + slot_index
+        flow.add_edge(source, slot_node, count, 0)
+
+        scores = score_matrix.get(project_id, {})
+        eligible = [
+            (score, user_id) for user_id, score in scores.items()
+            if user_id in employee_node and score > 0
+            and role_matches_slot(slot, employee_roles[user_id])
+        ]
+        for score, user_id in heapq.nlargest(count * candidates_per_seat, eligible):
+            cost = int(round((100.0 - min(100.0, score)) * COST_SCALE))
+            edge_ref = flow.add_edge(slot_node, employee_offset + employee_node[user_id], 1, cost)
+            assignment_edges.append((edge_ref, project_id, slot, user_id, score))
+
+    for user_id, index in employee_node.items():
+        flow.add_edge(employee_offset + index, sink, employee_capacity.get(user_id, 1), 0)
+
+    total_flow, _ = flow.solve(source, sink)
+
+    assignments: Dict[str, List[Dict[str, Any]]] = {project_id: [] for project_id in project_slots}
+    remaining = {project_id: dict(slots) for project_id, slots in project_slots.items()}
+    assigned_users = set()
+    total_score = 0.0
+
+    for edge_ref, project_id, slot, user_id, score in assignment_edges:
+        if flow.flow_on(edge_ref) > 0:
+            assignments[project_id].append({'user_id': user_id, 'slot': slot, 'score': score})
+            remaining[project_id][slot] -= 1
+            assigned_users.add(user_id)
+            total_score += score
+
+    for members in assignments.values():
+        members.sort(key=lambda member: member['score'], reverse=True)
+
+    logger.info(
+        f"포트폴리오 배정 완료: 프로젝트 {len(project_slots)}개, 좌석 {total_flow}개 배정, "
+        f"간선 {len(assignment_edges)}개"
+    )
+
+    return {
+        'assignments': assignments,
+        'unfilled': {
+            project_id: {slot: count for slot, count in slots.items() if count > 0}
+            for project_id, slots in remaining.items()
+            if any(count > 0 for count in slots.values())
+        },
+        'unassigned': [user_id for user_id in employees if user_id not in assigned_users],
+        'total_score': round(total_score, 2)
+    }
@@ -0,0 +1,418 @@
+"""
+팀 구성 최적화 모듈
+
+개인 점수 상위 N명을 나열하는 대신, 역할 슬롯(team_composition)을 채우면서
+요구 기술 커버리지와 팀원 간 친밀도를 함께 최대화하는 팀을 선택합니다.
+
+목적 함수: F(S) = Wcov × Coverage(S) + Wind × Σ Individual(i) / n + Waff × Σ Affinity(i, j) / (n - 1)
+- Coverage(S): 요구 기술별 팀 내 최고 숙련도의 평균 (0-100, 단조 submodular)
+- Individual(i): 후보자 종합 점수 (modular)
+- Affinity(i, j): 선택된 팀원 쌍의 친밀도 점수 (0-100)
+
+최적화:
+- Lazy greedy: 커버리지 이득은 submodular이므로 이전 계산값이 상한이 되어 재계산을 생략합니다.
+  친밀도 이득은 팀원이 추가될 때마다 증가할 수 있으므로 이웃 후보의 값을 즉시 갱신해
+  힙 키가 항상 실제 이득의 상한이 되도록 유지합니다 (일반 greedy와 같은 결과).
+- Beam search (선택): 상위 후보군에서 beam_width개의 부분 팀을 유지하며 확장합니다.
+"""
+
+import heapq
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+logger = logging.getLogger()
+
+GENERIC_SLOT = 'Any'
+
+# 우선순위별 목적 함수 가중치
+TEAM_OBJECTIVE_WEIGHTS = {
+    'skill': {'coverage': 1.0, 'individual': 0.4, 'affinity': 0.2},
+    'affinity': {'coverage': 0.6, 'individual': 0.3, 'affinity': 0.8},
+    'balanced': {'coverage': 0.8, 'individual': 0.4, 'affinity': 0.4},
+}
+
+# 역할 슬롯 약어 → 직무명 키워드
+ROLE_SLOT_ALIASES = {
+    'pm': ['project manager', 'product manager', 'pm', 'pmo'],
+    'pl': ['project leader', 'tech lead', 'team lead'],
+    'qa': ['qa', 'quality', 'test'],
+    'devops': ['devops', 'sre', 'infra', 'cloud'],
+    'fe': ['frontend', 'front-end'],
+    'be': ['backend', 'back-end'],
+}
+
+# 기술 점수(숙련도 × 최신성)의 최댓값 - 숙련도 정규화에 사용
+MAX_SKILL_SCORE = 2.0
+
+
+def _tokens(text: str) -> List[str]:
+    """역할 이름을 소문자 토큰으로 분리"""
+    return [token for token in re.split(r'[\s_\-/]+', text.lower()) if token]
+
+
+def role_matches_slot(slot: str, role: str) -> bool:
+    """
+    직무명이 역할 슬롯에 해당하는지 판단
+
+    슬롯 토큰이 모두 직무명 토큰의 접두어이면 일치로 봅니다.
+    예: 'Backend_Dev' ↔ 'Senior Backend Developer', 'PM' ↔ 'Project Manager'
+
+    Args:
+        slot: 역할 슬롯 이름 (team_composition 키)
+        role: 후보자 직무명
+
+    Returns:
+        bool: 일치 여부
+    """
+    if slot == GENERIC_SLOT:
+        return True
+
+    role_lower = (role or '').lower()
+    slot_key = slot.lower().replace('_', ' ').strip()
+    for keyword in ROLE_SLOT_ALIASES.get(slot_key, []):
+        if keyword in role_lower:
+            return True
+
+    role_tokens = _tokens(role_lower)
+    slot_tokens = _tokens(slot)
+    if not slot_tokens or not role_tokens:
+        return False
+
+    return all(
+        any(role_token.startswith(slot_token) for role_token in role_tokens)
+        for slot_token in slot_tokens
+    )
+
+
+def normalize_slots(
+    team_composition: Optional[Dict[str, Any]],
+    team_size: int
+) -> Dict[str, int]:
+    """
+    team_composition을 {역할: 인원} 슬롯으로 정리
+
+    정수가 아닌 값(기존 배정 명단 등)과 'required_members' 키는 무시합니다.
+    유효한 슬롯이 없으면 team_size 크기의 범용 슬롯 하나를 사용합니다.
+
+    Args:
+        team_composition: 역할별 인원 (예: {'PM': 1, 'Backend_Dev': 2})
+        team_size: 팀 크기
+
+    Returns:
+        dict: 역할 슬롯
+    """
+    slots = {}
+    for role, count in (team_composition or {}).items():
+        if role == 'required_members' or isinstance(count, bool):
+            continue
+        try:
+            count = int(count)
+        except (TypeError, ValueError):
+            continue
+        if count > 0:
+            slots[role] = count
+
+    if not slots:
+        slots[GENERIC_SLOT] = max(1, int(team_size))
+    return slots
+
+
+class TeamOptimizer:
+    """
+    역할 슬롯 제약 하의 팀 구성 최적화기
+
+    후보자 목록은 merge_and_score_candidates 결과 형식
+    (user_id, role, overall_score, skill_details)을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        candidates: List[Dict[str, Any]],
+        required_skills: List[str],
+        affinity_graph: Dict[str, Dict[str, float]],
+        slots: Dict[str, int],
+        priority: str = 'balanced'
+    ):
+        """
+        최적화기 초기화
+
+        Args:
+            candidates: 후보자 목록
+            required_skills: 요구 기술 목록
+            affinity_graph: 직원별 이웃 친밀도 {user_id: {user_id: score}}
+            slots: 역할 슬롯 {역할: 인원}
+            priority: 우선순위 (skill, affinity, balanced)
+        """
+        self.candidates = {c['user_id']: c for c in candidates if c.get('user_id')}
+        self.skills = sorted({skill.lower() for skill in required_skills})
+        self.skill_weight = 100.0 / len(self.skills) if self.skills else 0.0
+        self.graph = affinity_graph or {}
+        self.slots = dict(slots)
+        self.team_size = sum(self.slots.values())
+        self.weights = TEAM_OBJECTIVE_WEIGHTS.get(priority, TEAM_OBJECTIVE_WEIGHTS['balanced'])
+        self.pair_scale = self.weights['affinity'] / max(1, self.team_size - 1)
+
+        # 후보자별 기술 숙련도 (0-1)와 지원 가능한 슬롯
+        self.proficiency: Dict[str, Dict[str, float]] = {}
+        self.eligible_slots: Dict[str, List[str]] = {}
+        for user_id, candidate in self.candidates.items():
+            self.proficiency[user_id] = self._proficiency(candidate)
+            eligible = [slot for slot in self.slots if role_matches_slot(slot, candidate.get('role', ''))]
+            if eligible:
+                self.eligible_slots[user_id] = eligible
+
+    def _proficiency(self, candidate: Dict[str, Any]) -> Dict[str, float]:
+        """skill_details 점수를 0-1 숙련도로 변환"""
+        result = {}
+        for detail in candidate.get('skill_details', []) or []:
+            skill = str(detail.get('skill', '')).lower()
+            if skill in self.skills:
+                result[skill] = min(1.0, float(detail.get('score', 0)) / MAX_SKILL_SCORE)
+        # skill_details가 없으면 matched_skills를 기본 숙련도로 사용
+        if not result:
+            for skill in candidate.get('matched_skills', []) or []:
+                if skill.lower() in self.skills:
+                    result[skill.lower()] = 0.5
+        return result
+
+    def individual_value(self, user_id: str) -> float:
+        """후보자 개인 점수 기여분 (modular)"""
+        score = float(self.candidates[user_id].get('overall_score', 0) or 0)
+        return self.weights['individual'] * score / self.team_size
+
+    def coverage_gain(self, user_id: str, best: Dict[str, float]) -> float:
+        """현재 팀 최고 숙련도 대비 커버리지 이득"""
+        gain = 0.0
+        for skill, level in self.proficiency[user_id].items():
+            if level > best.get(skill, 0.0):
+                gain += level - best.get(skill, 0.0)
+        return self.weights['coverage'] * self.skill_weight * gain
+
+    def affinity(self, user_a: str, user_b: str) -> float:
+        """두 직원 간 친밀도 (없으면 0)"""
+        return float(self.graph.get(user_a, {}).get(user_b, 0.0))
+
+    def objective(self, members: Iterable[str]) -> float:
+        """
+        팀 목적 함수 값 계산
+
+        Args:
+            members: 팀원 ID 목록
+
+        Returns:
+            float: F(S)
+        """
+        members = list(members)
+        best: Dict[str, float] = {}
+        for user_id in members:
+            for skill, level in self.proficiency[user_id].items():
+                best[skill] = max(best.get(skill, 0.0), level)
+
+        coverage = self.weights['coverage'] * self.skill_weight * sum(best.values())
+        individual = sum(self.individual_value(user_id) for user_id in members)
+        pair_sum = sum(
+            self.affinity(members[i], members[j])
+            for i in range(len(members))
+            for j in range(i + 1, len(members))
+        )
+        return coverage + individual + self.pair_scale * pair_sum
+
+    def _open_slot(self, user_id: str, remaining: Dict[str, int]) -> Optional[str]:
+        """후보자가 채울 수 있는 남은 슬롯 (구체적인 역할 우선)"""
+        open_slots = [slot for slot in self.eligible_slots.get(user_id, []) if remaining.get(slot, 0) > 0]
+        if not open_slots:
+            return None
+        specific = [slot for slot in open_slots if slot != GENERIC_SLOT]
+        return (specific or open_slots)[0]
+
+    def lazy_greedy(self) -> Dict[str, Any]:
+        """
+        Lazy greedy 팀 선택
+
+        Returns:
+            dict: 선택 결과 (members, assignments, objective)
+        """
+        remaining = dict(self.slots)
+        best: Dict[str, float] = {}
+        selected: List[str] = []
+        assignments: Dict[str, str] = {}
+
+        cached_coverage: Dict[str, float] = {}
+        affinity_gain: Dict[str, float] = {}
+        version: Dict[str, int] = {}
+        heap: List[Tuple[float, str, int]] = []
+        evaluations = 0
+
+        for user_id in self.eligible_slots:
+            cached_coverage[user_id] = self.coverage_gain(user_id, best)
+            affinity_gain[user_id] = 0.0
+            version[user_id] = 0
+            upper = cached_coverage[user_id] + self.individual_value(user_id)
+            heap.append((-upper, user_id, 0))
+        heapq.heapify(heap)
+
+        while heap and len(selected) < self.team_size:
+            _, user_id, entry_version = heapq.heappop(heap)
+            if user_id in assignments or entry_version != version[user_id]:
+                continue
+
+            slot = self._open_slot(user_id, remaining)
+            if slot is None:
+                continue
+
+            # 커버리지 이득만 재계산 (친밀도 이득은 항상 최신 값)
+            cached_coverage[user_id] = self.coverage_gain(user_id, best)
+            evaluations += 1
+            gain = cached_coverage[user_id] + self.individual_value(user_id) + affinity_gain[user_id]
+
+            if heap and gain < -heap[0][0] - 1e-9:
+                version[user_id] += 1
+                heapq.heappush(heap, (-gain, user_id, version[user_id]))
+                continue
+
+            # 선택
+            selected.append(user_id)
+            assignments[user_id] = slot
+            remaining[slot] -= 1
+            for skill, level in self.proficiency[user_id].items():
+                best[skill] = max(best.get(skill, 0.0), level)
+
+            # 이웃 후보의 친밀도 이득 증가 → 상한 갱신
+            for neighbor, score in self.graph.get(user_id, {}).items():
+                if neighbor in self.eligible_slots and neighbor not in assignments:
+                    affinity_gain[neighbor] += self.pair_scale * float(score)
+                    version[neighbor] += 1
+                    upper = (
+                        cached_coverage[neighbor]
+                        + self.individual_value(neighbor)
+                        + affinity_gain[neighbor]
+                    )
+                    heapq.heappush(heap, (-upper, neighbor, version[neighbor]))
+
+        logger.info(f"Lazy greedy 완료: {len(selected)}명 선택, 이득 평가 {evaluations}회")
+        return self._result(selected, assignments, remaining, evaluations)
+
+    def beam_search(self, beam_width: int = 5, shortlist_size: int = 60) -> Dict[str, Any]:
+        """
+        Beam search 팀 선택
+
+        단일 후보 가치 상위 shortlist_size명 안에서 beam_width개의 부분 팀을 유지하며 확장하고,
+        lazy greedy 결과와 비교해 더 좋은 팀을 반환합니다.
+
+        Args:
+            beam_width: 유지할 부분 팀 수
+            shortlist_size: 확장 대상 후보 수
+
+        Returns:
+            dict: 선택 결과 (members, assignments, objective)
+        """
+        greedy = self.lazy_greedy()
+
+        empty: Dict[str, float] = {}
+        shortlist = sorted(
+            self.eligible_slots,
+            key=lambda user_id: self.coverage_gain(user_id, empty) + self.individual_value(user_id),
+            reverse=True
+        )[:shortlist_size]
+        # 친밀도 이득을 놓치지 않도록 greedy 선택 인원은 항상 포함
+        shortlist = list(dict.fromkeys(shortlist + greedy['members']))
+
+        beams: List[Tuple[float, List[str], Dict[str, str], Dict[str, int]]] = [
+            (0.0, [], {}, dict(self.slots))
+        ]
+        evaluations = 0
+
+        for _ in range(self.team_size):
+            expansions: Dict[frozenset, Tuple[float, List[str], Dict[str, str], Dict[str, int]]] = {}
+            for _, members, assignments, remaining in beams:
+                for user_id in shortlist:
+                    if user_id in assignments:
+                        continue
+                    slot = self._open_slot(user_id, remaining)
+                    if slot is None:
+                        continue
+                    new_members = members + [user_id]
+                    key = frozenset(new_members)
+                    if key in expansions:
+                        continue
+                    evaluations += 1
+                    new_remaining = dict(remaining)
+                    new_remaining[slot] -= 1
+                    expansions[key] = (
+                        self.objective(new_members),
+                        new_members,
+                        {**assignments, user_id: slot},
+                        new_remaining
+                    )
+            if not expansions:
+                break
+            beams = sorted(expansions.values(), key=lambda beam: beam[0], reverse=True)[:beam_width]
+
+        logger.info(f"Beam search 완료: beam={beam_width}, 평가 {evaluations}회")
+
+        if not beams or not beams[0][1]:
+            return greedy
+        value, members, assignments, remaining = beams[0]
+        if value <= greedy['objective']:
+            return greedy
+        return self._result(members, assignments, remaining, greedy['evaluations'] + evaluations)
+
+    def _result(
+        self,
+        members: List[str],
+        assignments: Dict[str, str],
+        remaining: Dict[str, int],
+        evaluations: int
+    ) -> Dict[str, Any]:
+        """선택 결과와 팀 지표 구성"""
+        best: Dict[str, float] = {}
+        for user_id in members:
+            for skill, level in self.proficiency[user_id].items():
+                best[skill] = max(best.get(skill, 0.0), level)
+
+        pairs = [
+            self.affinity(members[i], members[j])
+            for i in range(len(members))
+            for j in range(i + 1, len(members))
+        ]
+
+        return {
+            'members': members,
+            'assignments': assignments,
+            'objective': round(self.objective(members), 4),
+            'skill_coverage': round(sum(best.values()) * self.skill_weight, 2),
+            'uncovered_skills': [skill for skill in self.skills if best.get(skill, 0.0) == 0.0],
+            'pairwise_affinity_avg': round(sum(pairs) / len(pairs), 2) if pairs else 0.0,
+            'unfilled_slots': {slot: count for slot, count in remaining.items() if count > 0},
+            'evaluations': evaluations
+        }
+
+
+def optimize_team(
+    candidates: List[Dict[str, Any]],
+    required_skills: List[str],
+    affinity_graph: Dict[str, Dict[str, float]],
+    slots: Dict[str, int],
+    priority: str = 'balanced',
+    beam_width: int = 1
+) -> Dict[str, Any]:
+    """
+    팀 구성 최적화 진입점
+
+    Args:
+        candidates: 후보자 목록
+        required_skills: 요구 기술 목록
+        affinity_graph: 직원별 이웃 친밀도
+        slots: 역할 슬롯
+        priority: 우선순위
+        beam_width: 1이면 lazy greedy, 2 이상이면 beam search
+
+    Returns:
+        dict: 선택 결과
+    """
+    optimizer = TeamOptimizer(candidates, required_skills, affinity_graph, slots, priority)
+    if beam_width and beam_width > 1:
+        return optimizer.beam_search(beam_width=beam_width)
+    return optimizer.lazy_greedy()
@@ -7,10 +7,18 @@ Requirements: 11.1, 11.2
 
 import json
 import logging
+import os
 import boto3
 from typing import Dict, Any, List
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from requests_aws4auth import AWS4Auth
+from opensearchpy import OpenSearch
+from common.opensearch_client import (
+    EMPLOYEE_INDEX,
+    SKILL_FILTER_FIELD,
+    VECTOR_FIELD,
+    get_opensearch_client as get_pooled_opensearch_client,
+    normalize_vector,
+    skill_filter_terms
+)
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -208,8 +216,9 @@ def create_profile_text(employee_data: Dict[str, Any]) -> str:
         parts.append(f"이름: {employee_data['name']}")
     
     # 스킬
-    if employee_data.get('skills'):
-        skills_text = ', '.join(employee_data['skills'])
+    skill_names = extract_skill_names(employee_data.get('skills', []))
+    if skill_names:
+        skills_text = ', '.join(skill_names)
         parts.append(f"기술: {skills_text}")
     
     # 경력
@@ -255,28 +264,37 @@ def index_to_opensearch(employee_data: Dict[str, Any], embedding_vector: List[fl
     try:
         logger.info(f"OpenSearch 인덱싱 시작: {employee_data.get('employee_id')}")
         
-        # OpenSearch 클라이언트 생성
+        # OpenSearch 클라이언트 (컨테이너 단위 재사용)
         opensearch_client = get_opensearch_client()
         
         # 인덱스 이름
-        index_name = 'employee_profiles'
+        index_name = EMPLOYEE_INDEX
+        
+        user_id = employee_data.get('user_id') or employee_data.get('employee_id')
+        skill_names = extract_skill_names(employee_data.get('skills', []))
         
         # 문서 생성
+        # - user_id: 추천 엔진이 결과를 직원 테이블과 연결하는 키
+        # - skill_names: k-NN 효율적 필터링용 소문자 키워드
+        # - profile_vector: 내적 공간 검색을 위해 단위 벡터로 저장
         document = {
-            'employee_id': employee_data.get('employee_id'),
-            'name': employee_data.get('name'),
+            'user_id': user_id,
+            'employee_id': user_id,
+            'name': employee_data.get('name') or employee_data.get('basic_info', {}).get('name'),
+            'role': employee_data.get('role') or employee_data.get('basic_info', {}).get('role'),
             'skills': employee_data.get('skills', []),
+            SKILL_FILTER_FIELD: skill_filter_terms(skill_names),
             'experience_years': employee_data.get('experience_years', 0),
             'education': employee_data.get('education'),
             'certifications': employee_data.get('certifications', []),
-            'embedding_vector': embedding_vector,
+            VECTOR_FIELD: normalize_vector(embedding_vector),
             'profile_text': create_profile_text(employee_data)
         }
         
         # OpenSearch에 인덱싱
         response = opensearch_client.index(
             index=index_name,
-            id=employee_data.get('employee_id'),
+            id=user_id,
             body=document
         )
         
@@ -287,36 +305,35 @@ def index_to_opensearch(employee_data: Dict[str, Any], embedding_vector: List[fl
         raise
 
 
+def extract_skill_names(skills: List[Any]) -> List[str]:
+    """
+    기술 목록에서 기술 이름만 추출
+    
+    Employees 테이블은 {'name', 'level', 'years'} 형식, 이력서 파서는 문자열 형식을 사용합니다.
+    
+    Args:
+        skills: 기술 목록
+        
+    Returns:
+        list: 기술 이름 목록
+    """
+    names = []
+    for skill in skills or []:
+        name = skill.get('name', '') if isinstance(skill, dict) else str(skill)
+        if name:
+            names.append(name)
+    return names
+
+
 def get_opensearch_client() -> OpenSearch:
     """
-    OpenSearch 클라이언트 생성
+    OpenSearch 클라이언트 반환 (컨테이너 단위 풀링)
     
     Returns:
         OpenSearch: OpenSearch 클라이언트
     """
-    import os
-    
     # 환경 변수에서 OpenSearch 엔드포인트 가져오기
     opensearch_endpoint = os.environ.get('OPENSEARCH_ENDPOINT', 'localhost:9200')
     region = os.environ.get('AWS_REGION', 'us-east-2')
     
-    # AWS 인증 설정
-    credentials = boto3.Session().get_credentials()
-    awsauth = AWS4Auth(
-        credentials.access_key,
-        credentials.secret_key,
-        region,
-        'es',
-        session_token=credentials.token
-    )
-    
-    # OpenSearch 클라이언트 생성
-    client = OpenSearch(
-        hosts=[{'host': opensearch_endpoint.replace('https://', ''), 'port': 443}],
-        http_auth=awsauth,
-        use_ssl=True,
-        verify_certs=True,
-        connection_class=RequestsHttpConnection
-    )
-    
-    return client
+    return get_pooled_opensearch_client(opensearch_endpoint, region)
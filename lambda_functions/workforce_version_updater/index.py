@@ -0,0 +1,77 @@
+"""
+Workforce Version Updater Lambda Function
+인력 데이터 변경 시 추천 캐시 무효화용 데이터 버전 증가
+
+Employees/EmployeeAffinity/AffinityNeighbors 테이블 스트림을 구독하며, 변경이 포함된 배치마다
+인력 데이터 버전을 한 번 증가시킵니다. 추천 캐시 키에 버전이 포함되므로
+버전이 바뀌면 이전 추천 결과는 더 이상 조회되지 않습니다.
+"""
+
+import json
+import logging
+import os
+import boto3
+from common.recommendation_cache import DEFAULT_TABLE_NAME, RecommendationCache
+
+# 로깅 설정
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# AWS 클라이언트 초기화
+dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+recommendation_cache = RecommendationCache(
+    dynamodb_resource=dynamodb,
+    table_name=os.environ.get('RECOMMENDATION_CACHE_TABLE', DEFAULT_TABLE_NAME)
+)
+
+# 데이터 버전에 영향을 주는 이벤트
+VERSION_EVENTS = ['INSERT', 'MODIFY', 'REMOVE']
+
+
+def handler(event, context):
+    """
+    Lambda handler for DynamoDB Stream events
+
+    Args:
+        event: DynamoDB Stream 이벤트
+        context: Lambda 컨텍스트
+
+    Returns:
+        dict: 처리 결과
+    """
+    records = event.get('Records', [])
+    logger.info(f"인력 데이터 변경 이벤트 수신: {len(records)}개 레코드")
+
+    # 배치 내 변경 테이블 수집 (레코드마다 버전을 올리지 않음)
+    changed_tables = set()
+    for record in records:
+        if record.get('eventName') in VERSION_EVENTS:
+            changed_tables.add(get_table_name(record))
+
+    if not changed_tables:
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'updated': False})
+        }
+
+    # 실패 시 예외를 전파하여 스트림이 배치를 재시도하도록 함
+    version = recommendation_cache.bump_data_version(','.join(sorted(changed_tables)))
+
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'updated': True,
+            'data_version': version,
+            'tables': sorted(changed_tables)
+        })
+    }
+
+
+def get_table_name(record) -> str:
+    """
+    스트림 레코드의 테이블 이름 추출
+
+    eventSourceARN 형식: arn:aws:dynamodb:region:account:table/Employees/stream/...
+    """
+    parts = record.get('eventSourceARN', '').split('/')
+    return parts[1] if len(parts) > 1 else 'unknown'
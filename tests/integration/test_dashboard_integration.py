@@ -403,9 +403,7 @@ class TestDashboardIntegration:
         assert body['active_projects'] == 0
         assert body['available_employees'] == 0
         assert body['pending_reviews'] == 0
-        # recent_recommendations는 Lambda 함수에서 하드코딩되어 있으므로 항상 반환됨
-        # 실제 구현에서는 추천 이력 테이블에서 조회해야 함
-        # assert len(body['recent_recommendations']) == 0  # 현재는 하드코딩되어 있음
+        assert len(body['recent_recommendations']) == 0
         assert len(body['top_skills']) == 0
 
     def test_dashboard_cors_headers(self):
@@ -119,6 +119,18 @@ def dynamodb_tables(aws_credentials):
             }
         )
         
+        # EmployeeAssignments 테이블 생성 (배정 인덱스)
+        assignments_table = dynamodb.create_table(
+            TableName='EmployeeAssignments',
+            KeySchema=[
+                {'AttributeName': 'user_id', 'KeyType': 'HASH'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'user_id', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        
         os.environ['PROJECTS_TABLE'] = 'Projects'
         os.environ['EMPLOYEES_TABLE'] = 'Employees'
         os.environ['AFFINITY_TABLE'] = 'EmployeeAffinity'
@@ -126,7 +138,8 @@ def dynamodb_tables(aws_credentials):
         yield {
             'projects': projects_table,
             'employees': employees_table,
-            'affinity': affinity_table
+            'affinity': affinity_table,
+            'assignments': assignments_table
         }
 
 
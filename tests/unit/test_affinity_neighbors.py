@@ -0,0 +1,103 @@
+"""
+직원별 상위 K 친밀도 이웃 목록 유닛 테스트
+
+상위 K 누적과 샤드별 목록 병합, 인접 목록 저장 후 GetItem/BatchGet 조회와 팀 내 친밀도,
+추천 엔진이 후보자 인접 목록만 읽고 평균 친밀도를 후보 쌍 전체 기준으로 유지하는지 검증합니다.
+"""
+
+import boto3
+import pytest
+from moto import mock_aws
+from common.affinity_neighbors import AffinityNeighborStore, TopKNeighbors
+
+
+class TestTopKNeighbors:
+    """상위 K 누적 테스트"""
+
+    def test_keeps_strongest_both_sides(self):
+        """쌍은 양쪽 목록에 반영, 직원마다 상위 K만 유지, 0점 제외"""
+        neighbors = TopKNeighbors(k=2)
+        for employee_1, employee_2, score in [
+            ('U_001', 'U_002', 80.0), ('U_001', 'U_003', 10.0), ('U_001', 'U_004', 50.0),
+            ('U_002', 'U_003', 30.0), ('U_003', 'U_004', 0.0)
+        ]:
+            neighbors.add(employee_1, employee_2, score)
+
+        assert neighbors.lists() == {
+            'U_001': [('U_002', 80.0), ('U_004', 50.0)],
+            'U_002': [('U_001', 80.0), ('U_003', 30.0)],
+            'U_003': [('U_002', 30.0), ('U_001', 10.0)],
+            'U_004': [('U_001', 50.0)]
+        }
+        assert neighbors.totals()['U_003'] == (40.0, 3)
+        assert neighbors.totals()['U_004'] == (50.0, 2)
+
+    def test_merge_shard_lists(self):
+        """샤드별 상위 K(JSON 복원값 포함)를 병합하면 전체 쌍을 한 번에 누적한 결과와 같음"""
+        pairs = [('U_001', 'U_002', 80.0), ('U_001', 'U_003', 10.0), ('U_001', 'U_004', 50.0), ('U_002', 'U_003', 30.0)]
+        whole, merged = TopKNeighbors(k=2), TopKNeighbors(k=2)
+        for employee_1, employee_2, score in pairs:
+            whole.add(employee_1, employee_2, score)
+        for shard in (pairs[:2], pairs[2:]):
+            shard_neighbors = TopKNeighbors(k=2)
+            for employee_1, employee_2, score in shard:
+                shard_neighbors.add(employee_1, employee_2, score)
+            merged.merge(
+                {owner: [list(item) for item in items] for owner, items in shard_neighbors.lists().items()},
+                {owner: list(total) for owner, total in shard_neighbors.totals().items()}
+            )
+
+        assert merged.lists() == whole.lists()
+        assert merged.totals() == whole.totals()
+
+
+class TestAffinityNeighborStore:
+    """인접 목록 저장소 테스트"""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        """AffinityNeighbors 테이블"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            resource.create_table(
+                TableName='AffinityNeighbors',
+                KeySchema=[{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': 'user_id', 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            yield AffinityNeighborStore(resource)
+
+    def test_get_and_team_affinity(self, store):
+        """GetItem 이웃 조회, 팀원 BatchGet 팀 내 쌍, 이웃 없는 직원은 빈 목록으로 덮어씀"""
+        store.replace({'U_005': [('U_001', 99.0)]})
+        neighbors = TopKNeighbors(k=2)
+        neighbors.add('U_001', 'U_002', 80.0)
+        neighbors.add('U_001', 'U_003', 40.5)
+        neighbors.add('U_002', 'U_003', 30.0)
+
+        assert store.replace(neighbors.lists(), ['U_001', 'U_002', 'U_003', 'U_005']) == 4
+        assert store.get_neighbors('U_001') == [('U_002', 80.0), ('U_003', 40.5)]
+        assert store.get_neighbors('U_005') == []
+        assert store.get_neighbors('U_404') == []
+        assert store.team_affinity(['U_001', 'U_003', 'U_005']) == {('U_001', 'U_003'): 40.5}
+        assert store.scan_graph()['U_003'] == {'U_001': 40.5, 'U_002': 30.0}
+
+    def test_recommender_reads_candidate_lists(self, store, monkeypatch):
+        """추천 엔진은 후보자 항목만 BatchGet, 그래프는 후보자 사이 관계, 평균은 상위 K가 아닌 후보 쌍 전체 기준"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        neighbors = TopKNeighbors(k=1)
+        neighbors.add('U_001', 'U_002', 70.0)
+        neighbors.add('U_001', 'U_003', 10.0)
+        neighbors.add('U_002', 'U_003', 0.0)
+        store.replace(neighbors.lists(), totals=neighbors.totals())
+        monkeypatch.setattr(recommendation_engine, 'dynamodb', store.dynamodb)
+
+        graph, means = recommendation_engine.load_affinity(['U_001', 'U_003'])
+        assert graph == {'U_001': {'U_003': 10.0}, 'U_003': {'U_001': 10.0}}
+        assert means == {'U_001': 40.0, 'U_003': 5.0}
+
+        graph, means = recommendation_engine.load_affinity()
+        assert graph['U_001'] == {'U_002': 70.0, 'U_003': 10.0}
+        assert means['U_002'] == 35.0
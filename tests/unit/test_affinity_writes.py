@@ -0,0 +1,168 @@
+"""
+친밀도 점수 변경분 저장 유닛 테스트
+
+허용 오차 비교, 이전 점수 청크 조회 후 바뀐 쌍과 새 쌍만 저장하는지, 후보에서 빠진 쌍 삭제,
+핸들러 재실행 시 저장/건너뜀/삭제 쌍 수 보고를 검증합니다.
+"""
+
+import json
+import boto3
+import pytest
+from moto import mock_aws
+from common.dynamodb_client import DynamoDBClient
+from common.models import (
+    Affinity, CompanyEvents, EmployeePair, MessengerCommunication, PersonalCloseness, ProjectCollaboration
+)
+from common.repositories import AffinityRepository
+from lambda_functions.affinity_calculator.affinity_writes import (
+    DeltaAffinityWriter,
+    score_vector,
+    scores_changed
+)
+from lambda_functions.affinity_calculator.shard_inputs import JobSnapshotStore
+
+
+def affinity(employee_1, employee_2, overall, social=0.0):
+    """테스트 친밀도 객체"""
+    return Affinity(
+        affinity_id=f"AFF_{employee_1}_{employee_2}",
+        employee_pair=EmployeePair(employee_1=employee_1, employee_2=employee_2),
+        project_collaboration=ProjectCollaboration(collaboration_score=0.0),
+        messenger_communication=MessengerCommunication(
+            total_messages_exchanged=0, avg_response_time_minutes=0.0, communication_score=0.0
+        ),
+        company_events=CompanyEvents(social_score=social),
+        personal_closeness=PersonalCloseness(
+            payday_contact_frequency=0, vacation_day_contact_frequency=0, personal_score=0.0
+        ),
+        overall_affinity_score=overall
+    )
+
+
+def create_table(resource, name, key):
+    """해시 키 하나인 테스트 테이블"""
+    return resource.create_table(
+        TableName=name,
+        KeySchema=[{'AttributeName': key, 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': key, 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST'
+    )
+
+
+
+def create_daily_stats_table(resource):
+    """PairDailyStats 테스트 테이블 (DayIndex 포함 - 메신저 상태가 날짜별 행을 조회)"""
+    return resource.create_table(
+        TableName='PairDailyStats',
+        KeySchema=[
+            {'AttributeName': 'pair_id', 'KeyType': 'HASH'},
+            {'AttributeName': 'day', 'KeyType': 'RANGE'}
+        ],
+        AttributeDefinitions=[
+            {'AttributeName': 'pair_id', 'AttributeType': 'S'},
+            {'AttributeName': 'day', 'AttributeType': 'S'}
+        ],
+        GlobalSecondaryIndexes=[{
+            'IndexName': 'DayIndex',
+            'KeySchema': [
+                {'AttributeName': 'day', 'KeyType': 'HASH'},
+                {'AttributeName': 'pair_id', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }],
+        BillingMode='PAY_PER_REQUEST'
+    )
+
+
+class TestScoresChanged:
+    """허용 오차 비교 테스트"""
+
+    def test_epsilon_per_component(self):
+        """새 쌍은 저장, 어느 점수든 허용 오차 초과 시 저장"""
+        current = score_vector(affinity('U_001', 'U_002', 40.0, social=20.0).to_dynamodb())
+
+        assert current == (40.0, 0.0, 0.0, 20.0, 0.0)
+        assert scores_changed(None, current, 0.5)
+        assert not scores_changed((40.3, 0.0, 0.0, 19.8, 0.0), current, 0.5)
+        assert scores_changed((40.0, 0.0, 0.0, 19.0, 0.0), current, 0.5)
+
+
+class TestDeltaAffinityWriter:
+    """변경분 저장 테스트"""
+
+    @pytest.fixture
+    def table(self, monkeypatch):
+        """EmployeeAffinity 테이블"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+        with mock_aws():
+            yield create_table(boto3.resource('dynamodb', region_name='us-east-2'), 'EmployeeAffinity', 'affinity_id')
+
+    def test_writes_only_changed_pairs(self, table):
+        """청크 단위 이전 점수 조회 - 작은 변화는 건너뛰고 바뀐 쌍과 새 쌍만 저장"""
+        with DeltaAffinityWriter(table, epsilon=0.5, chunk_size=2) as writer:
+            for index in range(5):
+                writer.add(affinity(f'U_00{index}', 'U_009', 10.0 * index))
+        assert writer.counts == {'written_pairs': 5, 'unchanged_pairs': 0, 'removed_pairs': 0}
+
+        with DeltaAffinityWriter(table, epsilon=0.5, chunk_size=2) as writer:
+            writer.add(affinity('U_000', 'U_009', 0.2))
+            writer.add(affinity('U_001', 'U_009', 10.0, social=5.0))
+            writer.add(affinity('U_002', 'U_009', 20.0))
+            writer.add(affinity('U_005', 'U_009', 50.0))
+        assert writer.counts == {'written_pairs': 2, 'unchanged_pairs': 2, 'removed_pairs': 0}
+
+        items = {item['affinity_id']: item for item in table.scan()['Items']}
+        assert len(items) == 6
+        assert float(items['AFF_U_000_U_009']['overall_affinity_score']) == 0.0
+        assert float(items['AFF_U_001_U_009']['company_events']['social_score']) == 5.0
+
+    def test_remove_departed_pairs(self, table):
+        """후보에서 빠진 쌍의 행 삭제 (없는 행은 무시)"""
+        with DeltaAffinityWriter(table) as writer:
+            writer.add(affinity('U_001', 'U_002', 40.0))
+            writer.add(affinity('U_001', 'U_003', 30.0))
+
+        with DeltaAffinityWriter(table) as writer:
+            writer.remove(['AFF_U_001_U_003', 'AFF_U_404_U_405'])
+
+        assert writer.counts['removed_pairs'] == 2
+        assert [item['affinity_id'] for item in table.scan()['Items']] == ['AFF_U_001_U_002']
+
+    def test_handler_rerun_skips_unchanged(self, monkeypatch, tmp_path):
+        """같은 입력으로 다시 실행하면 저장 0, 건너뜀 = 후보 쌍 수, 근거가 사라진 쌍은 삭제"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            for name, key in [('Employees', 'user_id'), ('CompanyEvents', 'event_id'),
+                              ('MessengerLogs', 'log_id'), ('EmployeeAffinity', 'affinity_id'),
+                              ('AffinityPairState', 'pair_id'), ('AffinityNeighbors', 'user_id')]:
+                create_table(resource, name, key)
+            create_daily_stats_table(resource)
+            participants = ['U_001', 'U_002', 'U_003']
+            for user_id in participants:
+                resource.Table('Employees').put_item(Item={'user_id': user_id, 'work_experience': []})
+            resource.Table('CompanyEvents').put_item(Item={
+                'event_id': 'EVT_001', 'event_date': '2025-12-24', 'participants': participants
+            })
+
+            from lambda_functions.affinity_calculator import index as affinity_calculator
+            client = DynamoDBClient()
+            monkeypatch.setattr(affinity_calculator, 'dynamodb_client', client)
+            monkeypatch.setattr(affinity_calculator, 'affinity_repo', AffinityRepository(client))
+            monkeypatch.setattr(affinity_calculator, 'snapshot_store', JobSnapshotStore(str(tmp_path)))
+
+            first = json.loads(affinity_calculator.handler({}, None)['body'])
+            second = json.loads(affinity_calculator.handler({}, None)['body'])
+
+            # U_003이 행사에서 빠지면 U_003 쌍은 후보가 아니므로 마지막 점수를 남기지 않고 삭제
+            resource.Table('CompanyEvents').put_item(Item={
+                'event_id': 'EVT_001', 'event_date': '2025-12-24', 'participants': ['U_001', 'U_002']
+            })
+            third = json.loads(affinity_calculator.handler({}, None)['body'])
+            stored = {item['affinity_id'] for item in resource.Table('EmployeeAffinity').scan()['Items']}
+
+        assert (first['processed_pairs'], first['written_pairs'], first['unchanged_pairs']) == (3, 3, 0)
+        assert first['neighbor_items'] == 3
+        assert (second['processed_pairs'], second['written_pairs'], second['unchanged_pairs']) == (3, 0, 3)
+        assert (third['processed_pairs'], third['written_pairs'], third['removed_pairs']) == (1, 0, 2)
+        assert stored == {'AFF_U_001_U_002'}
@@ -0,0 +1,100 @@
+"""
+직원 배정 인덱스 유닛 테스트
+
+배정 기간 판단과 EmployeeAssignments 테이블 갱신/BatchGet 조회를 검증합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import pytest
+import boto3
+from moto import mock_aws
+from common.assignment_index import (
+    AssignmentIndex,
+    active_allocations,
+    is_active,
+    make_allocation
+)
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def index(aws_credentials):
+    """EmployeeAssignments 테이블이 생성된 배정 인덱스"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='EmployeeAssignments',
+            KeySchema=[{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'user_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield AssignmentIndex(dynamodb_resource=resource)
+
+
+class TestAllocationPeriod:
+    """배정 기간 판단 테스트"""
+
+    def test_make_allocation_normalizes_dates(self):
+        """ISO 일시와 월 단위 날짜 정규화"""
+        allocation = make_allocation('P_001', '차세대', 'Backend', '2025-01-15T09:30:00', '2025-12')
+        assert allocation['start_date'] == '2025-01-15'
+        assert allocation['end_date'] == '2025-12-31'
+
+    def test_open_ended_allocation(self):
+        """종료일이 없으면 시작일 이후 계속 진행 중"""
+        allocation = make_allocation('P_001', None, 'PM', '2025-01-01')
+        assert 'end_date' not in allocation
+        assert is_active(allocation, '2030-01-01')
+        assert not is_active(allocation, '2024-12-31')
+
+    def test_finished_allocation_inactive(self):
+        """종료된 배정은 가용성에 영향 없음"""
+        allocations = [
+            make_allocation('P_OLD', None, 'Dev', '2023-01-01', '2024-06-30'),
+            make_allocation('P_NOW', None, 'Dev', '2025-01-01', '2025-12-31'),
+        ]
+        active = active_allocations(allocations, '2025-06-01')
+        assert [a['project_id'] for a in active] == ['P_NOW']
+
+
+class TestAssignmentIndex:
+    """배정 인덱스 테이블 테스트"""
+
+    def test_add_allocation_appends(self, index):
+        """배정 추가 시 기존 배정 목록에 이어서 저장"""
+        index.add_allocation('U_001', make_allocation('P_001', 'A', 'Dev', '2024-01-01', '2024-12-31'))
+        index.add_allocation('U_001', make_allocation('P_002', 'B', 'Dev', '2025-01-01'))
+
+        allocations = index.get_allocations('U_001')
+        assert [a['project_id'] for a in allocations] == ['P_001', 'P_002']
+
+    def test_batch_get_only_returns_indexed_users(self, index):
+        """BatchGet은 인덱스 항목이 있는 직원만 반환"""
+        index.add_allocation('U_001', make_allocation('P_001', 'A', 'Dev', '2025-01-01'))
+        index.add_allocation('U_002', make_allocation('P_002', 'B', 'QA', '2025-01-01'))
+
+        result = index.batch_get_allocations(['U_001', 'U_002', 'U_003', 'U_001'])
+
+        assert set(result) == {'U_001', 'U_002'}
+        assert result['U_002'][0]['role'] == 'QA'
+
+    def test_batch_get_chunks_large_requests(self, index):
+        """100건 초과 요청도 모두 조회"""
+        for number in range(150):
+            index.add_allocation(f'U_{number:03d}', make_allocation('P_001', 'A', 'Dev', '2025-01-01'))
+
+        result = index.batch_get_allocations([f'U_{number:03d}' for number in range(150)])
+        assert len(result) == 150
+
+    def test_missing_user_has_no_allocations(self, index):
+        """인덱스 항목이 없는 직원은 빈 목록"""
+        assert index.get_allocations('U_404') == []
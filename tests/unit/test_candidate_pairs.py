@@ -0,0 +1,150 @@
+"""
+친밀도 후보 쌍 생성 유닛 테스트
+
+프로젝트/행사/메신저 역색인으로 근거가 있는 쌍만 생성하는지, 대규모 그룹 제외,
+핸들러가 근거 없는 쌍의 친밀도 행을 저장하지 않는지 검증합니다.
+"""
+
+import json
+import boto3
+import pytest
+from moto import mock_aws
+from common.dynamodb_client import DynamoDBClient
+from common.repositories import AffinityRepository
+from lambda_functions.affinity_calculator.candidate_pairs import (
+    build_event_participants,
+    build_project_members,
+    generate_candidate_pairs,
+    pairs_from_groups
+)
+
+
+def employee(user_id, *project_names):
+    """테스트 직원 데이터"""
+    return {
+        'user_id': user_id,
+        'work_experience': [
+            {'project_id': name, 'project_name': name, 'period': '2024-01 ~ 2024-12'}
+            for name in project_names
+        ]
+    }
+
+
+EMPLOYEES = {
+    'U_001': employee('U_001', '코어 뱅킹'),
+    'U_002': employee('U_002', '코어 뱅킹', '커머스'),
+    'U_003': employee('U_003', '커머스'),
+    'U_004': employee('U_004'),
+    'U_005': employee('U_005')
+}
+
+
+class TestCandidatePairs:
+    """후보 쌍 생성 테스트"""
+
+    def test_project_members_index(self):
+        """프로젝트 → 참여 직원 역색인"""
+        members = build_project_members(EMPLOYEES)
+
+        assert members == {'코어 뱅킹': {'U_001', 'U_002'}, '커머스': {'U_002', 'U_003'}}
+
+    def test_only_pairs_with_evidence(self):
+        """프로젝트·행사·메신저 근거가 있는 쌍만 생성"""
+        events = build_event_participants([{'event_id': 'EVT_001', 'participants': ['U_003', 'U_004']}])
+
+        pairs, counts = generate_candidate_pairs(
+            EMPLOYEES.keys(),
+            build_project_members(EMPLOYEES),
+            events,
+            [('U_005', 'U_001'), ('U_001', 'U_999')]
+        )
+
+        assert pairs == {('U_001', 'U_002'), ('U_002', 'U_003'), ('U_003', 'U_004'), ('U_001', 'U_005')}
+        assert counts == {'project': 2, 'event': 1, 'message': 1}
+
+    def test_large_groups_do_not_generate_pairs(self):
+        """최대 인원을 넘는 그룹은 쌍을 만들지 않음"""
+        company_wide = {f'U_{index:03d}' for index in range(10)}
+
+        assert pairs_from_groups([company_wide], max_group_size=5) == set()
+        assert len(pairs_from_groups([company_wide], max_group_size=10)) == 45
+
+
+class TestAffinityHandler:
+    """친밀도 계산 핸들러 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    def create_table(self, resource, name, key):
+        return resource.create_table(
+            TableName=name,
+            KeySchema=[{'AttributeName': key, 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': key, 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+
+    def create_daily_stats_table(self, resource):
+        """PairDailyStats (DayIndex 포함 - 메신저 상태가 날짜별 행을 조회)"""
+        return resource.create_table(
+            TableName='PairDailyStats',
+            KeySchema=[
+                {'AttributeName': 'pair_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'day', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'pair_id', 'AttributeType': 'S'},
+                {'AttributeName': 'day', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'DayIndex',
+                'KeySchema': [
+                    {'AttributeName': 'day', 'KeyType': 'HASH'},
+                    {'AttributeName': 'pair_id', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }],
+            BillingMode='PAY_PER_REQUEST'
+        )
+
+    def test_rows_only_for_candidate_pairs(self, monkeypatch, tmp_path):
+        """근거 없는 쌍은 EmployeeAffinity 행 없음"""
+        from lambda_functions.affinity_calculator import index as affinity_calculator
+        from lambda_functions.affinity_calculator.shard_inputs import JobSnapshotStore
+
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            employees = self.create_table(resource, 'Employees', 'user_id')
+            events = self.create_table(resource, 'CompanyEvents', 'event_id')
+            messenger = self.create_table(resource, 'MessengerLogs', 'log_id')
+            affinity = self.create_table(resource, 'EmployeeAffinity', 'affinity_id')
+            self.create_table(resource, 'AffinityPairState', 'pair_id')
+            self.create_table(resource, 'AffinityNeighbors', 'user_id')
+            self.create_daily_stats_table(resource)
+            for item in EMPLOYEES.values():
+                employees.put_item(Item=item)
+            events.put_item(Item={
+                'event_id': 'EVT_001', 'event_date': '2025-12-24', 'participants': ['U_003', 'U_004']
+            })
+            messenger.put_item(Item={
+                'log_id': 'MSG_001', 'sender_id': 'U_005', 'receiver_id': 'U_001',
+                'timestamp': '2025-12-20T10:00:00Z', 'response_time_minutes': 5
+            })
+
+            client = DynamoDBClient()
+            monkeypatch.setattr(affinity_calculator, 'dynamodb_client', client)
+            monkeypatch.setattr(affinity_calculator, 'affinity_repo', AffinityRepository(client))
+            monkeypatch.setattr(affinity_calculator, 'snapshot_store', JobSnapshotStore(str(tmp_path)))
+
+            response = affinity_calculator.handler({}, None)
+            stored = {item['affinity_id'] for item in affinity.scan()['Items']}
+
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 200
+        assert body['processed_pairs'] == 4
+        assert body['skipped_pairs'] == 6
+        assert stored == {
+            'AFF_U_001_U_002', 'AFF_U_002_U_003', 'AFF_U_003_U_004', 'AFF_U_001_U_005'
+        }
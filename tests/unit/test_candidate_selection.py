@@ -0,0 +1,126 @@
+"""
+상위 k명 후보 선택 유닛 테스트
+
+힙 기반 상위 k 선택이 전체 정렬과 같은 결과를 내는지, 기술 점수 상한이
+실제 점수 이상이어서 가지치기가 결과를 바꾸지 않는지 검증합니다.
+"""
+
+import random
+from datetime import datetime
+import pytest
+from lambda_functions.recommendation_engine.candidate_selection import TopKSelector, select_top_k
+
+
+LEVELS = ['Beginner', 'Intermediate', 'Advanced', 'Expert', 'Unknown']
+SKILLS = ['Java', 'Python', 'React', 'AWS', 'Spring', 'Kotlin', 'Go', 'SQL']
+
+
+def random_employee(rng, user_id):
+    """임의의 직원 데이터 생성"""
+    return {
+        'user_id': user_id,
+        'basic_info': {'name': user_id, 'role': 'Developer', 'years_of_experience': rng.randint(1, 15)},
+        'skills': [
+            {'name': name, 'level': rng.choice(LEVELS), 'years': rng.randint(1, 10)}
+            for name in rng.sample(SKILLS, rng.randint(0, 5))
+        ],
+        'work_experience': [
+            {
+                'project_id': f'P_{user_id}_{index}',
+                'project_name': rng.choice(['금융 플랫폼', 'Commerce', 'Banking App', 'Internal Tool']),
+                'period': f"{rng.randint(2015, 2030)}-01 ~ {rng.randint(2015, 2030)}-06"
+            }
+            for index in range(rng.randint(0, 3))
+        ]
+    }
+
+
+@pytest.fixture
+def recommendation_index(monkeypatch):
+    """recommendation_engine 핸들러 모듈 (boto3 클라이언트 생성을 위해 리전 설정)"""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+    from lambda_functions.recommendation_engine import index
+    return index
+
+
+class TestTopKSelector:
+    """힙 기반 상위 k 선택 테스트"""
+
+    def test_matches_full_sort(self):
+        """동점을 포함해도 안정 정렬 후 상위 k개와 동일"""
+        rng = random.Random(7)
+        items = [(rng.randint(0, 20), f'item_{index}') for index in range(500)]
+
+        selected, _ = select_top_k(items, 25, score=lambda item: (item[0], item))
+
+        assert selected == sorted(items, key=lambda item: item[0], reverse=True)[:25]
+
+    def test_threshold_and_pruning(self):
+        """임계값 이하의 상한은 점수 계산 없이 제외"""
+        selector = TopKSelector(2)
+        assert selector.threshold == float('-inf')
+
+        selector.offer(10, 'a')
+        selector.offer(5, 'b')
+
+        assert selector.threshold == 5
+        assert not selector.can_enter(5)
+        assert selector.can_enter(6)
+        assert selector.pruned == 1
+
+    def test_zero_k(self):
+        """k가 0이면 아무것도 선택하지 않음"""
+        selected, selector = select_top_k(range(10), 0, score=lambda item: (item, item))
+        assert selected == []
+        assert selector.offered == 0
+
+
+class TestSkillUpperBound:
+    """기술 점수 상한 테스트"""
+
+    def test_bound_never_below_score(self, recommendation_index):
+        """상한은 항상 실제 기술 적합도 점수 이상"""
+        rng = random.Random(11)
+        required = ['Java', 'Spring', 'AWS', 'java']
+
+        for number in range(2000):
+            employee = random_employee(rng, f'U_{number:04d}')
+            match = recommendation_index.score_employee_skills(employee, required, 2026)
+            bound = recommendation_index.skill_match_upper_bound(employee, required)
+
+            if match:
+                assert bound >= match['skill_match_score'] - 1e-9
+            else:
+                assert bound == 0.0
+
+    def test_pruned_top_k_matches_exhaustive(self, recommendation_index, monkeypatch):
+        """가지치기 결과가 전체 계산 후 정렬한 결과와 동일"""
+        rng = random.Random(3)
+        employees = [random_employee(rng, f'U_{number:04d}') for number in range(3000)]
+        graph = {}
+        for _ in range(4000):
+            first, second = rng.sample(employees, 2)
+            score = rng.uniform(0, 100)
+            graph.setdefault(first['user_id'], {})[second['user_id']] = score
+            graph.setdefault(second['user_id'], {})[first['user_id']] = score
+        monkeypatch.setattr(recommendation_index, 'iter_all_employees', lambda: iter(employees))
+
+        required = ['Java', 'Spring', 'AWS']
+        top = recommendation_index.find_top_employees_by_skills(required, 'balanced', graph, 10)
+
+        matches = [
+            match for match in (
+                recommendation_index.score_employee_skills(employee, required, datetime.now().year)
+                for employee in employees
+            ) if match
+        ]
+        candidates = recommendation_index.merge_and_score_candidates(
+            skill_matches=matches,
+            vector_matches=[],
+            affinity_scores={},
+            priority='balanced',
+            affinity_graph=graph
+        )
+        expected = sorted(candidates, key=lambda candidate: candidate['overall_score'], reverse=True)[:10]
+
+        assert [match['user_id'] for match in top] == [candidate['user_id'] for candidate in expected]
@@ -0,0 +1,154 @@
+"""
+임베딩 캐시 유닛 테스트
+
+메모리 LRU와 DynamoDB 영구 캐시 동작을 검증합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import pytest
+import boto3
+from moto import mock_aws
+from common.embedding_cache import (
+    EmbeddingCache,
+    make_cache_key,
+    pack_vector,
+    unpack_vector
+)
+
+
+MODEL_ID = 'amazon.titan-embed-text-v1'
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials):
+    """EmbeddingCache 테이블이 생성된 DynamoDB 리소스"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='EmbeddingCache',
+            KeySchema=[{'AttributeName': 'cache_key', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'cache_key', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield resource
+
+
+class CountingEmbedder:
+    """호출 횟수를 기록하는 가짜 임베딩 함수"""
+
+    def __init__(self, vector=None):
+        self.calls = 0
+        self.vector = vector if vector is not None else [0.25, -0.5, 1.0]
+
+    def __call__(self, text):
+        self.calls += 1
+        return list(self.vector)
+
+
+class TestCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_same_input_same_key(self):
+        """같은 모델·텍스트는 같은 키"""
+        assert make_cache_key(MODEL_ID, 'Java') == make_cache_key(MODEL_ID, 'Java')
+
+    def test_model_id_separates_keys(self):
+        """모델이 다르면 키도 달라야 함"""
+        assert make_cache_key(MODEL_ID, 'Java') != make_cache_key('other-model', 'Java')
+
+    def test_vector_round_trip(self):
+        """float32 직렬화 왕복"""
+        vector = [0.5, -1.25, 3.0]
+        assert unpack_vector(pack_vector(vector)) == vector
+
+
+class TestMemoryCache:
+    """메모리 LRU 캐시 테스트"""
+
+    def test_repeated_text_skips_compute(self):
+        """같은 텍스트 재요청 시 임베딩 함수가 다시 호출되지 않음"""
+        cache = EmbeddingCache()
+        embedder = CountingEmbedder()
+
+        first = cache.get_or_compute(MODEL_ID, 'Java, Spring', embedder)
+        second = cache.get_or_compute(MODEL_ID, 'Java, Spring', embedder)
+
+        assert first == second
+        assert embedder.calls == 1
+        stats = cache.stats()
+        assert stats['memory_hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_lru_eviction(self):
+        """용량 초과 시 가장 오래된 항목 제거"""
+        cache = EmbeddingCache(max_entries=2)
+        embedder = CountingEmbedder()
+
+        cache.get_or_compute(MODEL_ID, 'a', embedder)
+        cache.get_or_compute(MODEL_ID, 'b', embedder)
+        cache.get_or_compute(MODEL_ID, 'a', embedder)  # a를 최신으로
+        cache.get_or_compute(MODEL_ID, 'c', embedder)  # b 제거
+
+        assert cache.stats()['memory_entries'] == 2
+        cache.get_or_compute(MODEL_ID, 'b', embedder)
+        assert embedder.calls == 4
+
+    def test_empty_vector_not_cached(self):
+        """임베딩 실패(빈 벡터)는 캐시하지 않음"""
+        cache = EmbeddingCache()
+        embedder = CountingEmbedder(vector=[])
+
+        assert cache.get_or_compute(MODEL_ID, 'Java', embedder) == []
+        assert cache.get_or_compute(MODEL_ID, 'Java', embedder) == []
+        assert embedder.calls == 2
+
+
+class TestPersistentCache:
+    """DynamoDB 영구 캐시 테스트"""
+
+    def test_store_hit_after_cold_start(self, dynamodb):
+        """메모리가 비워진 뒤에도 DynamoDB에서 조회"""
+        cache = EmbeddingCache(dynamodb_resource=dynamodb)
+        embedder = CountingEmbedder()
+        cache.get_or_compute(MODEL_ID, 'Python', embedder)
+
+        # 새 컨테이너 시뮬레이션
+        cold_cache = EmbeddingCache(dynamodb_resource=dynamodb)
+        vector = cold_cache.get_or_compute(MODEL_ID, 'Python', embedder)
+
+        assert vector == embedder.vector
+        assert embedder.calls == 1
+        assert cold_cache.stats()['store_hits'] == 1
+
+    def test_expired_item_ignored(self, dynamodb):
+        """만료된 항목은 미스로 처리"""
+        cache = EmbeddingCache(dynamodb_resource=dynamodb, ttl_seconds=-1)
+        embedder = CountingEmbedder()
+        cache.get_or_compute(MODEL_ID, 'Go', embedder)
+        cache.clear_memory()
+
+        assert cache.get(MODEL_ID, 'Go') is None
+
+    def test_missing_table_degrades_to_memory(self, aws_credentials):
+        """테이블이 없어도 예외 없이 동작"""
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            cache = EmbeddingCache(dynamodb_resource=resource)
+            embedder = CountingEmbedder()
+
+            cache.get_or_compute(MODEL_ID, 'Rust', embedder)
+            cache.get_or_compute(MODEL_ID, 'Rust', embedder)
+
+            assert embedder.calls == 1
+            assert cache.stats()['store_errors'] >= 1
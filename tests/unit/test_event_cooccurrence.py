@@ -0,0 +1,78 @@
+"""
+회사 행사 공동 참여 유닛 테스트
+
+참여 행렬 A·Aᵀ로 계산한 쌍별 공동 참여 행사가 쌍별 교집합과 같은지,
+최소 공동 참여 수와 행별 상위 K 추출, NumPy 없는 경로와의 일치, 행사 분석 점수를 검증합니다.
+"""
+
+import json
+import os
+from itertools import combinations
+from unittest.mock import MagicMock
+import pytest
+from lambda_functions.affinity_calculator import event_cooccurrence
+from lambda_functions.affinity_calculator.event_cooccurrence import compute_shared_events
+
+
+COMPANY_EVENTS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data', 'company_events.json')
+
+EVENTS = [
+    {'event_id': 'EVT_001', 'participants': ['U_001', 'U_002', 'U_003']},
+    {'event_id': 'EVT_002', 'participants': ['U_002', 'U_001']},
+    {'event_id': 'EVT_003', 'participants': ['U_003', 'U_004']},
+    {'event_id': 'EVT_004', 'participants': ['U_005']}
+]
+
+
+def intersect_pairs(events):
+    """쌍별 참여 행사 교집합 (기준 구현)"""
+    attended = {}
+    for event in events:
+        for participant in event['participants']:
+            attended.setdefault(participant, []).append(event['event_id'])
+    return {
+        (first, second): [event_id for event_id in attended[first] if event_id in attended[second]]
+        for first, second in combinations(sorted(attended), 2)
+        if set(attended[first]) & set(attended[second])
+    }
+
+
+class TestSharedEvents:
+    """공동 참여 행사 테스트"""
+
+    def test_matches_pairwise_intersection(self):
+        """test_data 회사 행사 - A·Aᵀ 결과가 쌍별 교집합과 같음"""
+        with open(COMPANY_EVENTS_PATH, 'r', encoding='utf-8') as f:
+            events = json.load(f)
+
+        assert compute_shared_events(events, top_k=1000) == intersect_pairs(events)
+
+    def test_threshold_and_top_k(self):
+        """최소 공동 참여 수 미만 제외, 직원별 상위 K만 유지"""
+        assert compute_shared_events(EVENTS, min_shared=2) == {('U_001', 'U_002'): ['EVT_001', 'EVT_002']}
+        # U_003의 상위 1쌍은 동점 중 ID가 앞선 U_001, U_004의 상위 1쌍은 U_003
+        assert set(compute_shared_events(EVENTS, top_k=1)) == {
+            ('U_001', 'U_002'), ('U_001', 'U_003'), ('U_003', 'U_004')
+        }
+
+    def test_python_fallback_matches(self, monkeypatch):
+        """NumPy 없는 경로도 같은 결과"""
+        expected = compute_shared_events(EVENTS, top_k=1)
+        monkeypatch.setattr(event_cooccurrence, 'np', None)
+
+        assert compute_shared_events(EVENTS, top_k=1) == expected
+
+    def test_social_score_from_shared_events(self, monkeypatch):
+        """공동 참여 행사 수 × 20점"""
+        from lambda_functions.affinity_calculator import index as affinity_calculator
+
+        monkeypatch.setattr(affinity_calculator, 'dynamodb_client', MagicMock())
+        shared = compute_shared_events(EVENTS)
+
+        events = affinity_calculator.analyze_company_events('U_002', 'U_001', shared)
+        none = affinity_calculator.analyze_company_events('U_001', 'U_005', shared)
+
+        assert events.shared_events == ['EVT_001', 'EVT_002']
+        assert events.social_score == pytest.approx(40.0)
+        assert none.shared_events == []
+        assert none.social_score == 0.0
@@ -0,0 +1,166 @@
+"""
+처리 시간 예산 유닛 테스트
+
+남은 시간 계산(API Gateway 제한과 Lambda 컨텍스트 중 작은 값), 단계 생략 기록,
+예산이 부족할 때 Lambda가 대체 경로를 사용하는지 검증합니다.
+"""
+
+from unittest.mock import MagicMock
+import pytest
+from common.latency_budget import LatencyBudget
+
+
+class FakeClock:
+    """수동으로 진행시키는 단조 시계 (초 단위)"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance_ms(self, milliseconds):
+        self.now += milliseconds / 1000
+
+
+class FakeContext:
+    """Lambda 컨텍스트 모킹"""
+
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+class TestLatencyBudget:
+    """처리 시간 예산 테스트"""
+
+    def test_gateway_limit_applies_without_context(self):
+        """컨텍스트가 없으면 제한 시간에서 경과 시간과 여유분을 뺀 값"""
+        clock = FakeClock()
+        budget = LatencyBudget(limit_ms=29000, reserve_ms=1000, clock=clock)
+
+        clock.advance_ms(5000)
+
+        assert budget.elapsed_ms() == 5000
+        assert budget.remaining_ms() == 23000
+
+    def test_lambda_remaining_time_is_respected(self):
+        """Lambda 남은 시간이 더 짧으면 그 값을 사용"""
+        budget = LatencyBudget(FakeContext(4000), limit_ms=29000, reserve_ms=1000, clock=FakeClock())
+        assert budget.remaining_ms() == 3000
+
+    def test_skipped_stage_recorded_once_with_count(self):
+        """같은 단계는 한 번만 기록하고 횟수를 누적"""
+        budget = LatencyBudget(FakeContext(5000), reserve_ms=0, clock=FakeClock())
+
+        assert budget.allows('vector_search', 3000)
+        assert not budget.allows('llm_reasoning', 6000)
+        assert not budget.allows('llm_reasoning', 6000)
+
+        assert budget.degraded
+        assert budget.skipped_stages == [
+            {'stage': 'llm_reasoning', 'reason': 'deadline', 'remaining_ms': 5000, 'count': 2}
+        ]
+
+    def test_exhausted_budget_never_negative(self):
+        """제한 시간을 넘겨도 남은 시간은 0"""
+        clock = FakeClock()
+        budget = LatencyBudget(limit_ms=1000, reserve_ms=0, clock=clock)
+        clock.advance_ms(5000)
+        assert budget.remaining_ms() == 0
+
+
+class TestBudgetFallbacks:
+    """예산 부족 시 대체 경로 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    def test_domain_reasoning_skipped(self, monkeypatch):
+        """시간이 부족하면 Bedrock 호출 없이 구조화된 근거 사용"""
+        from lambda_functions.domain_analysis import index as domain_analysis
+
+        bedrock = MagicMock()
+        monkeypatch.setattr(domain_analysis, 'bedrock_runtime', bedrock)
+        budget = LatencyBudget(FakeContext(0), clock=FakeClock())
+        employees = [{'user_id': 'U_001', 'skills': [{'name': 'Python', 'level': 'Expert'}]}]
+
+        result = domain_analysis.analyze_domain_entry('AI/ML', employees, budget)
+
+        bedrock.invoke_model.assert_not_called()
+        assert result['reasoning'].startswith('[실현가능성:')
+        assert budget.skipped_stages[0]['stage'] == 'llm_reasoning'
+
+    def test_recommendation_reasoning_skipped(self, monkeypatch):
+        """시간이 부족하면 벡터 검색과 LLM 근거 생성을 생략"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        candidate = {
+            'user_id': 'U_001', 'name': 'Kim', 'role': 'Developer',
+            'matched_skills': ['Java'], 'skill_match_score': 80.0, 'similarity_score': 0,
+            'affinity_score': 0, 'overall_score': 32.0, 'availability': 'Available'
+        }
+        hybrid = MagicMock()
+        reasoning = MagicMock()
+        monkeypatch.setattr(recommendation_engine, 'search_hybrid_candidates', hybrid)
+        monkeypatch.setattr(recommendation_engine, 'generate_reasoning', reasoning)
+        monkeypatch.setattr(recommendation_engine, 'load_affinity', lambda *args: ({}, {}))
+        monkeypatch.setattr(
+            recommendation_engine, 'find_top_employees_by_skills', lambda *args: [dict(candidate)]
+        )
+        monkeypatch.setattr(recommendation_engine, 'check_availability', lambda candidates: candidates)
+        monkeypatch.setattr(recommendation_engine, 'serve_from_shortlist', lambda *args: None)
+        budget = LatencyBudget(FakeContext(0), clock=FakeClock())
+
+        result = recommendation_engine.generate_recommendations(
+            'P_001', ['Java'], 1, 'balanced', budget=budget, data_version=0
+        )
+
+        hybrid.assert_not_called()
+        reasoning.assert_not_called()
+        assert result[0]['reasoning'].startswith('[핵심 강점]')
+        assert [stage['stage'] for stage in budget.skipped_stages] == ['vector_search', 'llm_reasoning']
+
+    def test_team_reasoning_skipped(self, monkeypatch):
+        """팀 추천도 팀원마다 남은 시간을 확인하고 부족하면 구조화된 근거 사용"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        candidates = [
+            {'user_id': f'U_00{index}', 'name': 'Kim', 'role': 'Developer', 'matched_skills': ['Java'], 'skill_match_score': 80.0,
+             'affinity_score': 0, 'overall_score': 32.0, 'availability': 'Available'}
+            for index in range(2)
+        ]
+        reasoning = MagicMock()
+        monkeypatch.setattr(recommendation_engine, 'generate_reasoning', reasoning)
+        monkeypatch.setattr(recommendation_engine, 'collect_scored_candidates', lambda *args, **kwargs: (candidates, {}))
+        budget = LatencyBudget(FakeContext(0), clock=FakeClock())
+
+        team = recommendation_engine.generate_team_recommendation(
+            'P_001', ['Java'], 2, 'balanced', team_composition={'Developer': 2}, budget=budget
+        )
+
+        reasoning.assert_not_called()
+        assert all(member['reasoning'].startswith('[핵심 강점]') for member in team['members'])
+        assert budget.skipped_stages[0] == {
+            'stage': 'llm_reasoning', 'reason': 'deadline', 'remaining_ms': 0, 'count': 2
+        }
+
+    def test_reasoning_client_fits_budget(self):
+        """Bedrock 응답 제한 시간 × 시도 횟수가 남은 시간 안에 들어옴"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        assert recommendation_engine.get_reasoning_client(None) is recommendation_engine.bedrock_runtime
+
+        roomy = recommendation_engine.get_reasoning_client(LatencyBudget(FakeContext(21500), clock=FakeClock()))
+        tight = recommendation_engine.get_reasoning_client(LatencyBudget(FakeContext(8500), clock=FakeClock()))
+
+        assert (roomy.meta.config.read_timeout, roomy.meta.config.retries['total_max_attempts']) == (10, 2)
+        assert (tight.meta.config.read_timeout, tight.meta.config.retries['total_max_attempts']) == (7, 1)
+        assert tight.meta.config.connect_timeout == 2
+        assert recommendation_engine.get_reasoning_client(
+            LatencyBudget(FakeContext(8500), clock=FakeClock())
+        ) is tight
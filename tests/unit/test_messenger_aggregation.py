@@ -0,0 +1,145 @@
+"""
+메신저 로그 쌍별 집계 유닛 테스트
+
+표준 쌍 집계(방향 무관), 상황 가중치와 시간 감쇠, 응답 시간 합계,
+MessengerLogs/CompanyEvents 1회 스캔과 집계 기반 커뮤니케이션 점수를 검증합니다.
+"""
+
+import math
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+from lambda_functions.affinity_calculator.messenger_aggregation import (
+    AFTER_HOURS_WEIGHT,
+    COMPANY_EVENT_WEIGHT,
+    VACATION_WEIGHT,
+    WORK_HOURS_WEIGHT,
+    aggregate_messages,
+    aggregate_messenger_logs,
+    canonical_pair,
+    load_event_dates
+)
+
+
+NOW = datetime(2025, 12, 31, 12, 0, tzinfo=timezone.utc)
+
+
+def message(sender_id, receiver_id, timestamp, response_time=None, **extra):
+    """테스트 메시지 항목"""
+    item = {'sender_id': sender_id, 'receiver_id': receiver_id, 'timestamp': timestamp}
+    if response_time is not None:
+        item['response_time_minutes'] = response_time
+    item.update(extra)
+    return item
+
+
+class TestAggregateMessages:
+    """쌍별 집계 테스트"""
+
+    def test_both_directions_share_one_pair(self):
+        """A→B와 B→A는 같은 표준 쌍으로 집계"""
+        stats = aggregate_messages([
+            message('U_002', 'U_001', '2025-12-31T10:00:00Z', 10),
+            message('U_001', 'U_002', '2025-12-31T11:00:00Z', 30),
+            message('U_001', 'U_003', '2025-12-31T11:00:00Z')
+        ], set(), NOW)
+
+        pair = stats[canonical_pair('U_002', 'U_001')]
+        assert canonical_pair('U_002', 'U_001') == ('U_001', 'U_002')
+        assert pair.total_messages == 2
+        assert pair.avg_response_time_minutes == 20.0
+        assert stats[('U_001', 'U_003')].response_count == 0
+
+    def test_context_weights(self):
+        """업무 시간, 업무 외, 행사일, 연차 가중치"""
+        stats = aggregate_messages([
+            message('A', 'B', '2025-12-31T12:00:00Z'),
+            message('A', 'C', '2025-12-31T20:00:00Z'),
+            message('A', 'D', '2025-12-24T10:00:00Z'),
+            message('A', 'E', '2025-12-31T12:00:00Z', is_vacation_period=True)
+        ], {'2025-12-24'}, NOW)
+
+        decay_week = math.exp(-0.1 * (7 + 2 / 24) / 30.0)
+        assert stats[('A', 'B')].weighted_score == WORK_HOURS_WEIGHT
+        assert stats[('A', 'C')].weighted_score == AFTER_HOURS_WEIGHT
+        assert stats[('A', 'D')].weighted_score == pytest.approx(COMPANY_EVENT_WEIGHT * decay_week)
+        assert stats[('A', 'E')].weighted_score == VACATION_WEIGHT
+
+    def test_invalid_messages_skipped(self):
+        """시각 형식 오류, 자기 자신, ID 누락 메시지 제외"""
+        stats = aggregate_messages([
+            message('A', 'B', 'not-a-date'),
+            message('A', 'A', '2025-12-31T10:00:00Z'),
+            message('A', '', '2025-12-31T10:00:00Z')
+        ], set(), NOW)
+
+        assert stats == {}
+
+
+class TestSinglePassScan:
+    """테이블 1회 스캔 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    @pytest.fixture
+    def tables(self):
+        """MessengerLogs, CompanyEvents 테이블"""
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            messenger = resource.create_table(
+                TableName='MessengerLogs',
+                KeySchema=[{'AttributeName': 'log_id', 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': 'log_id', 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            events = resource.create_table(
+                TableName='CompanyEvents',
+                KeySchema=[{'AttributeName': 'event_id', 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': 'event_id', 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            events.put_item(Item={'event_id': 'EVT_001', 'event_date': '2025-12-24', 'participants': ['A']})
+            for index, (sender_id, receiver_id) in enumerate([('A', 'B'), ('B', 'A'), ('A', 'C')]):
+                messenger.put_item(Item={
+                    'log_id': f'MSG_{index}',
+                    'sender_id': sender_id,
+                    'receiver_id': receiver_id,
+                    'timestamp': '2025-12-24T10:00:00Z',
+                    'response_time_minutes': 12,
+                    'message_content': '[ANONYMIZED]'
+                })
+            yield messenger, events
+
+    def test_scan_once_for_all_pairs(self, tables):
+        """MessengerLogs와 CompanyEvents를 쌍 수와 무관하게 한 번씩 스캔"""
+        messenger, events = tables
+
+        event_dates = load_event_dates(events)
+        stats = aggregate_messenger_logs(messenger, event_dates, NOW)
+
+        assert event_dates == {'2025-12-24'}
+        assert set(stats) == {('A', 'B'), ('A', 'C')}
+        assert stats[('A', 'B')].total_messages == 2
+        assert stats[('A', 'B')].response_time_sum == 24.0
+
+    def test_affinity_scores_from_aggregates(self, tables, monkeypatch):
+        """직원 쌍 점수는 추가 스캔 없이 집계에서 계산"""
+        from lambda_functions.affinity_calculator import index as affinity_calculator
+
+        messenger, events = tables
+        stats = aggregate_messenger_logs(messenger, load_event_dates(events), NOW)
+        monkeypatch.setattr(affinity_calculator, 'dynamodb_client', MagicMock())
+
+        communication = affinity_calculator.analyze_messenger_communication('B', 'A', stats)
+        silent = affinity_calculator.analyze_messenger_communication('B', 'C', stats)
+
+        assert communication.total_messages_exchanged == 2
+        assert communication.avg_response_time_minutes == 12.0
+        assert communication.communication_score > 0
+        assert silent.communication_score == 0.0
+        affinity_calculator.dynamodb_client.get_table.assert_not_called()
@@ -0,0 +1,168 @@
+"""
+MinHash LSH 직원 유사도 색인 유닛 테스트
+
+서명의 Jaccard 추정, LSH 후보 검색, 기술/프로젝트 이력 기준별 순위,
+직원 스냅샷 저장/로드와 유사 직원 API 응답을 검증합니다.
+"""
+
+import json
+import pytest
+from common.minhash_index import (
+    EmployeeSimilarityIndex,
+    MinHasher,
+    MinHashLSH,
+    build_minhash_signatures,
+    employee_project_tokens,
+    employee_skill_tokens,
+    estimated_jaccard,
+    get_employee_similarity_index
+)
+from common.workforce_snapshot import WorkforceSnapshot
+
+
+def employee(user_id, skills, projects=()):
+    """테스트 직원 데이터"""
+    return {
+        'user_id': user_id,
+        'skills': [{'name': skill, 'level': 'Advanced'} for skill in skills],
+        'work_experience': [{'project_id': project_id} for project_id in projects]
+    }
+
+
+EMPLOYEES = [
+    employee('KIM', ['Java', 'Spring Boot', 'MySQL', 'AWS', 'Docker'], ['P_001', 'P_002']),
+    employee('LEE', ['java', 'Spring Boot', 'MySQL', 'AWS', 'Kubernetes'], ['P_009']),
+    employee('PARK', ['React', 'TypeScript', 'Redux'], ['P_001', 'P_002']),
+    employee('CHOI', ['Python', 'TensorFlow', 'Pandas'], ['P_005']),
+    employee('NEW', [], [])
+]
+
+
+@pytest.fixture
+def index():
+    """테스트 직원으로 만든 유사도 색인"""
+    user_ids, signatures = build_minhash_signatures(EMPLOYEES)
+    return EmployeeSimilarityIndex(user_ids, signatures)
+
+
+class TestMinHash:
+    """서명 및 LSH 테스트"""
+
+    def test_tokens_normalized(self):
+        """기술은 정규화 소문자, 프로젝트는 ID 소문자"""
+        assert employee_skill_tokens(EMPLOYEES[1]) == {'java', 'spring boot', 'mysql', 'aws', 'kubernetes'}
+        assert employee_project_tokens(EMPLOYEES[0]) == {'p_001', 'p_002'}
+
+    def test_signature_estimates_jaccard(self):
+        """서명 일치 비율이 실제 Jaccard에 근접"""
+        hasher = MinHasher()
+        first = {f'skill{i}' for i in range(40)}
+        second = {f'skill{i}' for i in range(20, 60)}  # Jaccard = 20 / 60
+
+        estimate = float(estimated_jaccard(hasher.signature(first), hasher.signature(second)))
+
+        assert abs(estimate - 1 / 3) < 0.12
+
+    def test_signature_stable_across_instances(self):
+        """같은 시드면 프로세스와 무관하게 같은 서명"""
+        assert (MinHasher().signature({'java'}) == MinHasher().signature({'java'})).all()
+
+    def test_lsh_query_excludes_self_and_dissimilar(self):
+        """LSH 후보 중 유사한 직원만 반환"""
+        user_ids, signatures = build_minhash_signatures(EMPLOYEES)
+        lsh = MinHashLSH(user_ids, signatures['skills'])
+
+        neighbours = lsh.query(signatures['skills'][0], k=3, exclude='KIM')
+
+        assert [key for key, _ in neighbours] == ['LEE']
+
+    def test_empty_set_has_no_neighbours(self, index):
+        """기술·프로젝트 이력이 없으면 결과 없음"""
+        assert index.similar('NEW') == []
+
+
+class TestEmployeeSimilarityIndex:
+    """기준별 유사 직원 테스트"""
+
+    def test_skill_basis(self, index):
+        """기술 기준이면 같은 기술 스택 직원"""
+        results = index.similar('KIM', basis='skills')
+
+        assert results[0]['user_id'] == 'LEE'
+        assert results[0]['project_similarity'] == 0.0
+
+    def test_project_basis(self, index):
+        """프로젝트 이력 기준이면 같은 프로젝트 경험 직원"""
+        results = index.similar('KIM', basis='projects')
+
+        assert results[0] == {
+            'user_id': 'PARK', 'similarity': 1.0, 'skill_similarity': 0.0, 'project_similarity': 1.0
+        }
+
+    def test_unknown_employee_signatures(self, index):
+        """색인에 없는 직원은 현재 데이터로 만든 서명으로 검색"""
+        newcomer = employee('HAN', ['Java', 'Spring Boot', 'MySQL', 'AWS', 'Docker'])
+
+        results = index.similar('HAN', index.signatures_for(newcomer), basis='skills')
+
+        assert results[0]['user_id'] == 'KIM'
+        assert results[0]['skill_similarity'] == 1.0
+
+    def test_invalid_basis(self, index):
+        """지원하지 않는 기준"""
+        with pytest.raises(ValueError):
+            index.similar('KIM', basis='salary')
+
+    def test_snapshot_round_trip(self, tmp_path):
+        """스냅샷에 저장한 서명으로 색인 생성"""
+        import numpy as np
+
+        user_ids, signatures = build_minhash_signatures(EMPLOYEES)
+        path = str(tmp_path / 'snapshot.npz')
+        WorkforceSnapshot([], np.zeros((0, 4)), minhash_user_ids=user_ids, minhash_signatures=signatures).save(path)
+
+        loaded = get_employee_similarity_index(path)
+
+        assert loaded.user_ids == user_ids
+        assert loaded.similar('KIM', basis='skills')[0]['user_id'] == 'LEE'
+
+
+class TestSimilarEmployeesApi:
+    """유사 직원 API 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    def test_available_only(self, index, monkeypatch):
+        """투입 중인 직원을 제외하고 이름·역할을 포함"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        monkeypatch.setattr(recommendation_engine, 'get_employee_similarity_index', lambda: index)
+        monkeypatch.setattr(recommendation_engine, 'batch_get_employees', lambda user_ids: [
+            {'user_id': user_id, 'basic_info': {'name': user_id.title(), 'role': 'Developer'}}
+            for user_id in user_ids
+        ])
+        monkeypatch.setattr(recommendation_engine, 'get_active_assignments', lambda user_ids: {'PARK': 'P_010'})
+
+        event = {'path': '/recommendations/similar', 'body': json.dumps({
+            'similar_to': 'KIM', 'basis': 'both', 'available_only': True
+        })}
+        response = recommendation_engine.handler(event, None)
+        body = json.loads(response['body'])
+
+        assert response['statusCode'] == 200
+        assert [item['user_id'] for item in body['similar_employees']] == ['LEE']
+        assert body['similar_employees'][0]['name'] == 'Lee'
+        assert body['similar_employees'][0]['availability'] == 'Available'
+
+    def test_snapshot_unavailable(self, monkeypatch):
+        """스냅샷이 없으면 503"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        monkeypatch.setattr(recommendation_engine, 'get_employee_similarity_index', lambda: None)
+
+        response = recommendation_engine.handler({'body': json.dumps({'similar_to': 'KIM'})}, None)
+
+        assert response['statusCode'] == 503
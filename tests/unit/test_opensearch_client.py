@@ -0,0 +1,108 @@
+"""
+OpenSearch 클라이언트 풀 유닛 테스트
+
+클라이언트 재사용과 k-NN 쿼리 구성을 검증합니다.
+실제 OpenSearch 연결은 필요하지 않습니다.
+"""
+
+import math
+import pytest
+from common.opensearch_client import (
+    SKILL_FILTER_FIELD,
+    VECTOR_FIELD,
+    build_knn_query,
+    get_opensearch_client,
+    normalize_endpoint,
+    normalize_vector,
+    reset_opensearch_clients,
+    skill_filter_terms
+)
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+    reset_opensearch_clients()
+    yield
+    reset_opensearch_clients()
+
+
+class TestClientPool:
+    """클라이언트 재사용 테스트"""
+
+    def test_same_endpoint_returns_same_client(self, aws_credentials):
+        """같은 엔드포인트는 같은 클라이언트 인스턴스"""
+        first = get_opensearch_client('https://search-test.us-east-2.es.amazonaws.com/')
+        second = get_opensearch_client('search-test.us-east-2.es.amazonaws.com')
+        assert first is second
+
+    def test_different_endpoint_returns_new_client(self, aws_credentials):
+        """다른 엔드포인트는 별도 클라이언트"""
+        first = get_opensearch_client('search-a.us-east-2.es.amazonaws.com')
+        second = get_opensearch_client('search-b.us-east-2.es.amazonaws.com')
+        assert first is not second
+
+    def test_reset_creates_new_client(self, aws_credentials):
+        """reset 이후에는 새 클라이언트 생성"""
+        first = get_opensearch_client('search-test.us-east-2.es.amazonaws.com')
+        reset_opensearch_clients()
+        second = get_opensearch_client('search-test.us-east-2.es.amazonaws.com')
+        assert first is not second
+
+    def test_missing_endpoint_raises(self, aws_credentials, monkeypatch):
+        """엔드포인트 미설정 시 ValueError"""
+        monkeypatch.delenv("OPENSEARCH_ENDPOINT", raising=False)
+        with pytest.raises(ValueError):
+            get_opensearch_client()
+
+    def test_normalize_endpoint(self):
+        """스킴과 후행 슬래시 제거"""
+        assert normalize_endpoint('https://host.example.com/') == 'host.example.com'
+        assert normalize_endpoint('host.example.com') == 'host.example.com'
+
+
+class TestKnnQuery:
+    """k-NN 쿼리 구성 테스트"""
+
+    def test_filter_inside_knn_clause(self):
+        """요구 기술 필터는 knn 절 내부에 위치"""
+        query = build_knn_query([0.1, 0.2], k=30, required_skills=['Java', 'Spring Boot'])
+
+        knn_clause = query['query']['knn'][VECTOR_FIELD]
+        assert knn_clause['k'] == 30
+        assert query['size'] == 30
+        terms = knn_clause['filter']['bool']['filter'][0]['terms'][SKILL_FILTER_FIELD]
+        assert terms == ['java', 'spring boot']
+
+    def test_no_filter_without_skills(self):
+        """요구 기술이 없으면 필터 없이 검색"""
+        query = build_knn_query([0.1, 0.2], k=20)
+        assert 'filter' not in query['query']['knn'][VECTOR_FIELD]
+
+    def test_vector_not_returned_in_source(self):
+        """기본 _source에 벡터 필드 제외"""
+        query = build_knn_query([0.1], k=5)
+        assert VECTOR_FIELD not in query['_source']
+        assert 'user_id' in query['_source']
+
+    def test_skill_filter_terms_deduplicates(self):
+        """대소문자가 다른 중복 기술 제거"""
+        assert skill_filter_terms(['Java', 'java ', 'React']) == ['java', 'react']
+
+
+class TestNormalizeVector:
+    """벡터 정규화 테스트"""
+
+    def test_unit_length(self):
+        """정규화 후 길이 1"""
+        vector = normalize_vector([3.0, 4.0])
+        assert math.isclose(math.sqrt(sum(v * v for v in vector)), 1.0)
+        assert vector == [0.6, 0.8]
+
+    def test_zero_vector_unchanged(self):
+        """영벡터는 그대로 반환"""
+        assert normalize_vector([0.0, 0.0]) == [0.0, 0.0]
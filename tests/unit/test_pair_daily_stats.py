@@ -0,0 +1,170 @@
+"""
+직원 쌍 일별 메신저 집계 유닛 테스트
+
+상황 구분, (쌍, 날짜)별 집계, 스트림 소비자의 원자적 누적과 배치 로더의 덮어쓰기,
+날짜별 조회, 일별 집계로 계산한 가중 점수와 메시지 단위 집계의 일치를 검증합니다.
+"""
+
+import json
+from datetime import datetime, timezone
+import boto3
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from moto import mock_aws
+from common.pair_daily_stats import (
+    AFTER_HOURS,
+    EVENT_DAY,
+    VACATION,
+    WEEKEND,
+    WORK_HOURS,
+    PairDailyStatsStore,
+    rollup_messages
+)
+from lambda_functions.affinity_calculator.messenger_aggregation import aggregate_messages
+from lambda_functions.affinity_calculator.pair_state import fetch_daily_stats
+
+
+def message(sender_id, receiver_id, timestamp, response_time=None, **extra):
+    """테스트 메시지 항목"""
+    item = {'sender_id': sender_id, 'receiver_id': receiver_id, 'timestamp': timestamp}
+    if response_time is not None:
+        item['response_time_minutes'] = response_time
+    item.update(extra)
+    return item
+
+
+MESSAGES = [
+    message('U_002', 'U_001', '2025-12-01T10:00:00Z', 10),
+    message('U_001', 'U_002', '2025-12-01T20:00:00Z', 30),
+    message('U_001', 'U_002', '2025-12-06T10:00:00Z'),
+    message('U_001', 'U_002', '2025-12-24T10:00:00Z'),
+    message('U_001', 'U_002', '2025-12-26T10:00:00Z', is_vacation_period=True),
+    message('U_001', 'U_003', '2025-12-01T10:00:00Z', 5)
+]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """PairDailyStats 테이블 (DayIndex 포함)"""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='PairDailyStats',
+            KeySchema=[
+                {'AttributeName': 'pair_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'day', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'pair_id', 'AttributeType': 'S'},
+                {'AttributeName': 'day', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'DayIndex',
+                'KeySchema': [
+                    {'AttributeName': 'day', 'KeyType': 'HASH'},
+                    {'AttributeName': 'pair_id', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield PairDailyStatsStore(resource)
+
+
+class TestRollupMessages:
+    """(쌍, 날짜)별 집계 테스트"""
+
+    def test_buckets_per_pair_and_day(self):
+        """방향과 무관하게 쌍·날짜별로 상황 구분 집계"""
+        rollups = rollup_messages(MESSAGES, {'2025-12-24'})
+
+        first_day = rollups[(('U_001', 'U_002'), '2025-12-01')]
+        assert first_day.counts[WORK_HOURS] == 1
+        assert first_day.counts[AFTER_HOURS] == 1
+        assert first_day.message_count == 2
+        assert first_day.response_time_sum == 40.0
+        assert rollups[(('U_001', 'U_002'), '2025-12-06')].counts[WEEKEND] == 1
+        assert rollups[(('U_001', 'U_002'), '2025-12-24')].counts[EVENT_DAY] == 1
+        assert rollups[(('U_001', 'U_002'), '2025-12-26')].counts[VACATION] == 1
+        assert len(rollups) == 5
+
+
+class TestPairDailyStatsStore:
+    """집계 저장소 테스트"""
+
+    def test_increment_accumulates(self, store):
+        """스트림 배치마다 같은 행에 누적"""
+        store.increment(rollup_messages(MESSAGES[:1], set()))
+        store.increment(rollup_messages(MESSAGES[1:2], set()))
+
+        rows = list(store.query_day('2025-12-01'))
+
+        assert [pair for pair, _ in rows] == [('U_001', 'U_002')]
+        assert rows[0][1].counts[WORK_HOURS] == 1
+        assert rows[0][1].counts[AFTER_HOURS] == 1
+        assert rows[0][1].response_count == 2
+
+    def test_replace_overwrites_rows(self, store):
+        """배치 로더 덮어쓰기 후 날짜별 조회 (누적분 대신 재계산 값, 행사일 반영)"""
+        store.increment(rollup_messages(MESSAGES, set()))
+        store.replace(rollup_messages(MESSAGES, {'2025-12-24'}))
+
+        first_day = dict(store.query_day('2025-12-01'))
+        event_day = dict(store.query_day('2025-12-24'))
+
+        assert set(first_day) == {('U_001', 'U_002'), ('U_001', 'U_003')}
+        assert first_day[('U_001', 'U_002')].message_count == 2
+        assert event_day[('U_001', 'U_002')].counts[EVENT_DAY] == 1
+        assert event_day[('U_001', 'U_002')].message_count == 1
+        assert list(store.query_day('2025-12-25')) == []
+
+    def test_daily_rows_match_message_aggregate(self, store):
+        """날짜별 조회 후 일별 집계로 계산한 가중 점수가 메시지 단위 집계와 거의 같음"""
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        store.replace(rollup_messages(MESSAGES, {'2025-12-24'}))
+
+        days = [f'2025-12-{day:02d}' for day in range(1, 32)]
+        from_rows = fetch_daily_stats(store, days, now)[('U_001', 'U_002')]
+        expected = aggregate_messages(MESSAGES, {'2025-12-24'}, now)[('U_001', 'U_002')]
+
+        assert from_rows.total_messages == expected.total_messages
+        assert from_rows.avg_response_time_minutes == expected.avg_response_time_minutes
+        assert from_rows.weighted_score == pytest.approx(expected.weighted_score, rel=2e-3)
+
+
+class TestMessengerRollupHandler:
+    """MessengerLogs 스트림 소비자 테스트"""
+
+    def test_insert_records_rolled_up(self, store, monkeypatch):
+        """INSERT 레코드만 집계하고 행사일은 CompanyEvents 기준"""
+        from lambda_functions.messenger_rollup import index as messenger_rollup
+
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        events = resource.create_table(
+            TableName='CompanyEvents',
+            KeySchema=[{'AttributeName': 'event_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'event_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        events.put_item(Item={'event_id': 'EVT_001', 'event_date': '2025-12-24'})
+        monkeypatch.setattr(messenger_rollup, 'dynamodb', resource)
+        monkeypatch.setattr(messenger_rollup, 'daily_stats_store', store)
+        monkeypatch.setattr(messenger_rollup, '_event_dates_cache', {'dates': None, 'loaded_at': 0.0})
+
+        serializer = TypeSerializer()
+        records = [
+            {
+                'eventName': event_name,
+                'dynamodb': {'NewImage': {key: serializer.serialize(value) for key, value in item.items()}}
+            }
+            for event_name, item in [('INSERT', MESSAGES[3]), ('INSERT', MESSAGES[5]), ('MODIFY', MESSAGES[0])]
+        ]
+
+        response = messenger_rollup.handler({'Records': records}, None)
+
+        assert json.loads(response['body']) == {'messages': 2, 'updated_rows': 2}
+        assert [(pair, stats.counts[EVENT_DAY]) for pair, stats in store.query_day('2025-12-24')] == [
+            (('U_001', 'U_002'), 1)
+        ]
+        assert [pair for pair, _ in store.query_day('2025-12-01')] == [('U_001', 'U_003')]
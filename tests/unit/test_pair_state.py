@@ -0,0 +1,222 @@
+"""
+메신저 친밀도 증분 감쇠 상태 유닛 테스트
+
+최초 실행의 전체 재계산(끝난 날짜까지), 워터마크 이후 날짜의 일별 집계만 반영하는 증분 갱신,
+증분 결과와 전체 재계산 결과의 일치, 새 메시지가 없는 쌍의 상태 보존, 끝나지 않은 날짜의 반영,
+전체 재계산의 이전 상태 삭제, 상태 테이블을 스캔하지 않는 쌍 목록과 읽을 때 감쇠를 검증합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+import boto3
+import pytest
+from moto import mock_aws
+from common.pair_daily_stats import PairDailyStatsStore, rollup_messages
+from lambda_functions.affinity_calculator.messenger_aggregation import aggregate_messages
+from lambda_functions.affinity_calculator.pair_state import (
+    INCREMENTAL,
+    FULL_REBUILD,
+    PAIR_INDEX_OBJECT,
+    PairStateStore,
+    update_pair_states
+)
+from lambda_functions.affinity_calculator.shard_inputs import JobSnapshotStore
+
+
+START = datetime(2025, 12, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    """MessengerLogs, PairDailyStats(DayIndex 포함), AffinityPairState 테이블"""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        messenger = resource.create_table(
+            TableName='MessengerLogs',
+            KeySchema=[{'AttributeName': 'log_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'log_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        resource.create_table(
+            TableName='PairDailyStats',
+            KeySchema=[
+                {'AttributeName': 'pair_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'day', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'pair_id', 'AttributeType': 'S'},
+                {'AttributeName': 'day', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'DayIndex',
+                'KeySchema': [
+                    {'AttributeName': 'day', 'KeyType': 'HASH'},
+                    {'AttributeName': 'pair_id', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        state = resource.create_table(
+            TableName='AffinityPairState',
+            KeySchema=[{'AttributeName': 'pair_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'pair_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield messenger, PairDailyStatsStore(resource), state
+
+
+def put_message(tables, log_id, sender_id, receiver_id, when, response_time=10):
+    """메시지 적재 (스트림 소비자와 같이 일별 집계도 누적)"""
+    messenger, daily_store, _ = tables
+    item = {
+        'log_id': log_id,
+        'sender_id': sender_id,
+        'receiver_id': receiver_id,
+        'timestamp': when.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'response_time_minutes': response_time
+    }
+    messenger.put_item(Item=item)
+    daily_store.increment(rollup_messages([item], set()))
+    return item
+
+
+def update(tables, now, full_rebuild=False, pair_index=None):
+    """상태 갱신"""
+    messenger, daily_store, state_table = tables
+    return update_pair_states(
+        PairStateStore(state_table), messenger, daily_store, set(), now=now, full_rebuild=full_rebuild,
+        pair_index=pair_index
+    )
+
+
+class TestIncrementalDecay:
+    """증분 감쇠 상태 테스트"""
+
+    def test_first_run_is_full_rebuild(self, tables):
+        """워터마크가 없으면 끝난 날짜까지의 전체 이력으로 상태 생성 (오늘 메시지는 값에만 더하고 다음 날 저장)"""
+        put_message(tables, 'M1', 'A', 'B', START)
+        put_message(tables, 'M2', 'B', 'A', START + timedelta(hours=1))
+        put_message(tables, 'M3', 'A', 'B', START + timedelta(hours=22))
+
+        stats, summary = update(tables, START + timedelta(days=1))
+
+        assert summary['mode'] == FULL_REBUILD
+        assert (summary['new_messages'], summary['partial_messages']) == (2, 1)
+        assert summary['watermark'] == '2025-12-01'
+        assert stats[('A', 'B')].total_messages == 3
+        assert PairStateStore(tables[2]).scan_states()[('A', 'B')].stats.total_messages == 2
+
+        # 다음 날 증분 갱신이 오늘(12-02) 메시지를 일별 집계로 반영
+        stats, summary = update(tables, START + timedelta(days=2))
+        assert (summary['mode'], summary['new_messages'], summary['watermark']) == (INCREMENTAL, 1, '2025-12-02')
+        assert stats[('A', 'B')].total_messages == 3
+
+    def test_incremental_matches_full_recompute(self, tables):
+        """감쇠 후 새 날짜의 일별 집계만 더한 점수가 전체 재계산과 일치 (정오 기준 감쇠 오차 이내)"""
+        history = [
+            put_message(tables, 'M1', 'A', 'B', START),
+            put_message(tables, 'M2', 'C', 'A', START + timedelta(days=3))
+        ]
+        update(tables, START + timedelta(days=5))
+
+        history.append(put_message(tables, 'M3', 'B', 'A', START + timedelta(days=40, hours=3), 30))
+        later = START + timedelta(days=45)
+        stats, summary = update(tables, later)
+
+        expected = aggregate_messages(history, set(), later)
+        assert summary['mode'] == INCREMENTAL
+        assert summary['new_messages'] == 1
+        assert summary['updated_pairs'] == 1
+        for pair in expected:
+            assert stats[pair].weighted_score == pytest.approx(expected[pair].weighted_score, rel=1e-3)
+            assert stats[pair].total_messages == expected[pair].total_messages
+        assert stats[('A', 'B')].avg_response_time_minutes == 20.0
+
+    def test_untouched_pairs_not_rewritten(self, tables):
+        """새 날짜에 메시지가 없는 쌍은 읽거나 다시 쓰지 않고, 같은 날 재실행은 아무것도 갱신하지 않음"""
+        put_message(tables, 'M1', 'A', 'B', START)
+        put_message(tables, 'M2', 'A', 'C', START)
+        update(tables, START + timedelta(days=1))
+
+        put_message(tables, 'M3', 'A', 'B', START + timedelta(days=2))
+        update(tables, START + timedelta(days=3))
+        _, rerun = update(tables, START + timedelta(days=3, hours=2))
+
+        store = PairStateStore(tables[2])
+        states = store.scan_states()
+        assert store.get_watermark() == '2025-12-03'
+        assert states[('A', 'C')].as_of == START + timedelta(days=1)
+        assert states[('A', 'B')].as_of == START + timedelta(days=3)
+        assert (rerun['updated_pairs'], rerun['watermark']) == (0, '2025-12-03')
+        assert set(store.get_many([('A', 'B'), ('B', 'C')])) == {('A', 'B')}
+
+    def test_full_rebuild_ignores_state(self, tables):
+        """full_rebuild이면 기존 상태를 무시하고 다시 계산"""
+        put_message(tables, 'M1', 'A', 'B', START)
+        update(tables, START + timedelta(days=1))
+
+        stats, summary = update(tables, START + timedelta(days=1), full_rebuild=True)
+
+        assert summary['mode'] == FULL_REBUILD
+        assert stats[('A', 'B')].total_messages == 1
+
+    def test_partial_day_counted_once(self, tables):
+        """같은 날 시간 단위 재실행은 오늘 메시지를 매번 반영하되 상태에는 한 번만 누적"""
+        put_message(tables, 'M1', 'A', 'B', START)
+        update(tables, START + timedelta(days=1))
+
+        put_message(tables, 'M2', 'A', 'C', START + timedelta(days=1, hours=2))
+        stats, summary = update(tables, START + timedelta(days=1, hours=3))
+        assert (summary['mode'], summary['updated_pairs'], summary['partial_messages']) == (INCREMENTAL, 0, 1)
+        assert stats[('A', 'C')].total_messages == 1
+        assert stats[('A', 'B')].total_messages == 1
+
+        put_message(tables, 'M3', 'A', 'C', START + timedelta(days=1, hours=4))
+        stats, summary = update(tables, START + timedelta(days=1, hours=5))
+        assert stats[('A', 'C')].total_messages == 2
+
+        # 날짜가 끝난 뒤 완성된 행으로 한 번만 저장
+        stats, summary = update(tables, START + timedelta(days=2))
+        assert (summary['new_messages'], summary['partial_messages']) == (2, 0)
+        assert stats[('A', 'C')].total_messages == 2
+        assert PairStateStore(tables[2]).scan_states()[('A', 'C')].stats.total_messages == 2
+
+    def test_full_rebuild_removes_stale_states(self, tables):
+        """전체 재계산에 없는 쌍의 이전 상태 행은 삭제 (이후 증분 실행이 오래된 값을 읽지 않음)"""
+        messenger = tables[0]
+        put_message(tables, 'M1', 'A', 'B', START)
+        put_message(tables, 'M2', 'A', 'C', START)
+        update(tables, START + timedelta(days=1))
+
+        messenger.delete_item(Key={'log_id': 'M2'})
+        stats, summary = update(tables, START + timedelta(days=2), full_rebuild=True)
+
+        assert summary['removed_pairs'] == 1
+        assert set(stats) == {('A', 'B')}
+        assert set(PairStateStore(tables[2]).scan_states()) == {('A', 'B')}
+
+    def test_incremental_reads_index_not_state_table(self, tables, tmp_path, monkeypatch):
+        """증분 실행은 상태 테이블을 스캔하지 않고 쌍 목록을 쓰며, 갱신하지 않은 쌍은 읽을 때 감쇠"""
+        pair_index = JobSnapshotStore(str(tmp_path))
+        put_message(tables, 'M1', 'A', 'B', START)
+        put_message(tables, 'M2', 'A', 'C', START)
+        update(tables, START + timedelta(days=1), pair_index=pair_index)
+        assert pair_index.get(PAIR_INDEX_OBJECT) == ['A#B', 'A#C']
+
+        put_message(tables, 'M3', 'B', 'C', START + timedelta(days=2))
+        monkeypatch.setattr(PairStateStore, 'scan_pairs', lambda self: pytest.fail("상태 테이블 스캔"))
+        monkeypatch.setattr(PairStateStore, 'scan_states', lambda self: pytest.fail("상태 테이블 스캔"))
+        later = START + timedelta(days=40)
+        stats, summary = update(tables, later, pair_index=pair_index)
+
+        assert summary['updated_pairs'] == 1
+        assert pair_index.get(PAIR_INDEX_OBJECT) == ['A#B', 'A#C', 'B#C']
+        assert set(stats) == {('A', 'B'), ('A', 'C'), ('B', 'C')}
+        assert ('A', 'B') not in stats.values
+        expected = aggregate_messages([{
+            'sender_id': 'A', 'receiver_id': 'B', 'timestamp': START.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'response_time_minutes': 10
+        }], set(), later)
+        assert stats[('A', 'B')].weighted_score == pytest.approx(expected[('A', 'B')].weighted_score, rel=1e-3)
+        assert stats.get(('B', 'D')) is None
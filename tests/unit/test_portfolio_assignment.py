@@ -0,0 +1,117 @@
+"""
+포트폴리오 일괄 배정 유닛 테스트
+
+최소 비용 유량 솔버와 프로젝트 × 직원 전역 배정을 검증합니다.
+"""
+
+import itertools
+
+from lambda_functions.recommendation_engine.portfolio_assignment import (
+    MinCostFlow,
+    solve_portfolio_assignment
+)
+from lambda_functions.recommendation_engine.team_optimizer import GENERIC_SLOT
+
+
+class TestMinCostFlow:
+    """최소 비용 유량 솔버 테스트"""
+
+    def test_prefers_cheaper_path(self):
+        """같은 유량이면 비용이 낮은 경로 선택"""
+        flow = MinCostFlow(4)
+        cheap = flow.add_edge(0, 1, 1, 1)
+        expensive = flow.add_edge(0, 2, 1, 5)
+        flow.add_edge(1, 3, 1, 0)
+        flow.add_edge(2, 3, 1, 0)
+
+        total_flow, total_cost = flow.solve(0, 3, max_flow=1)
+
+        assert (total_flow, total_cost) == (1, 1)
+        assert flow.flow_on(cheap) == 1
+        assert flow.flow_on(expensive) == 0
+
+    def test_reroutes_through_residual_edges(self):
+        """역방향 간선으로 이전 배정을 재조정하여 최대 유량 달성"""
+        # 작업자 a, b / 작업 x, y: a는 x, y 모두 가능, b는 x만 가능
+        flow = MinCostFlow(6)
+        source, a, b, x, y, sink = range(6)
+        flow.add_edge(source, a, 1, 0)
+        flow.add_edge(source, b, 1, 0)
+        a_x = flow.add_edge(a, x, 1, 0)
+        a_y = flow.add_edge(a, y, 1, 3)
+        b_x = flow.add_edge(b, x, 1, 1)
+        flow.add_edge(x, sink, 1, 0)
+        flow.add_edge(y, sink, 1, 0)
+
+        total_flow, total_cost = flow.solve(source, sink)
+
+        assert total_flow == 2
+        assert total_cost == 4
+        assert flow.flow_on(a_x) == 0
+        assert flow.flow_on(a_y) == 1
+        assert flow.flow_on(b_x) == 1
+
+
+class TestPortfolioAssignment:
+    """전역 배정 테스트"""
+
+    def test_no_double_booking(self):
+        """최고 점수 직원이 여러 프로젝트에 중복 배정되지 않음"""
+        score_matrix = {
+            'P1': {'STAR': 95, 'A': 70, 'B': 20},
+            'P2': {'STAR': 90, 'B': 60, 'A': 10},
+        }
+        roles = {'STAR': 'Developer', 'A': 'Developer', 'B': 'Developer'}
+        slots = {'P1': {GENERIC_SLOT: 1}, 'P2': {GENERIC_SLOT: 1}}
+
+        result = solve_portfolio_assignment(score_matrix, slots, roles)
+
+        assigned = [m['user_id'] for members in result['assignments'].values() for m in members]
+        assert len(assigned) == len(set(assigned)) == 2
+        # 프로젝트별 탐욕 배정(STAR→P1, B→P2 = 155)보다 전역 최적(A→P1, STAR→P2 = 160)이 우선
+        assert result['total_score'] == 160
+        assert result['assignments']['P1'][0]['user_id'] == 'A'
+        assert result['assignments']['P2'][0]['user_id'] == 'STAR'
+        assert result['unassigned'] == ['B']
+
+    def test_matches_brute_force(self):
+        """소규모 문제에서 전수 탐색 최적값과 일치"""
+        score_matrix = {
+            'P1': {'E1': 80, 'E2': 75, 'E3': 30, 'E4': 65},
+            'P2': {'E1': 85, 'E2': 40, 'E3': 70, 'E4': 60},
+        }
+        roles = {user_id: 'Developer' for user_id in ['E1', 'E2', 'E3', 'E4']}
+        slots = {'P1': {GENERIC_SLOT: 2}, 'P2': {GENERIC_SLOT: 2}}
+
+        result = solve_portfolio_assignment(score_matrix, slots, roles)
+
+        best = max(
+            sum(score_matrix['P1'][u] for u in order[:2]) + sum(score_matrix['P2'][u] for u in order[2:])
+            for order in itertools.permutations(roles)
+        )
+        assert result['total_score'] == best
+
+    def test_role_slots_and_unfilled(self):
+        """역할 슬롯 제약과 미충원 좌석 보고"""
+        score_matrix = {'P1': {'PM1': 50, 'BE1': 90, 'BE2': 80}}
+        roles = {'PM1': 'Project Manager', 'BE1': 'Backend Developer', 'BE2': 'Backend Developer'}
+        slots = {'P1': {'PM': 1, 'Backend_Dev': 1, 'QA': 1}}
+
+        result = solve_portfolio_assignment(score_matrix, slots, roles)
+
+        by_slot = {m['slot']: m['user_id'] for m in result['assignments']['P1']}
+        assert by_slot == {'PM': 'PM1', 'Backend_Dev': 'BE1'}
+        assert result['unfilled'] == {'P1': {'QA': 1}}
+        assert result['unassigned'] == ['BE2']
+
+    def test_zero_capacity_excluded(self):
+        """투입 불가능한 직원은 배정하지 않음"""
+        score_matrix = {'P1': {'A': 90, 'B': 50}}
+        roles = {'A': 'Developer', 'B': 'Developer'}
+
+        result = solve_portfolio_assignment(
+            score_matrix, {'P1': {GENERIC_SLOT: 1}}, roles, employee_capacity={'A': 0}
+        )
+
+        assert result['assignments']['P1'][0]['user_id'] == 'B'
+        assert result['unassigned'] == []
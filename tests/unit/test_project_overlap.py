@@ -0,0 +1,100 @@
+"""
+프로젝트 협업 기간 유닛 테스트
+
+참여 기간 파싱 형식, 프로젝트별 스윕 결과와 쌍별 이중 루프 비교의 일치,
+중복 개월 수 기반 협업 점수를 검증합니다.
+"""
+
+import json
+import os
+from itertools import combinations
+from unittest.mock import MagicMock
+import pytest
+from lambda_functions.affinity_calculator.project_overlap import (
+    build_project_intervals,
+    compute_project_overlaps,
+    month_index,
+    overlap_months,
+    parse_period,
+    sweep_overlaps
+)
+
+
+EMPLOYEES_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data', 'employees_extended.json')
+
+CURRENT_MONTH = month_index(2025, 12)
+
+
+def employee(user_id, *projects):
+    """테스트 직원 데이터 (프로젝트 이름, 기간)"""
+    return {
+        'user_id': user_id,
+        'work_experience': [{'project_name': name, 'period': period} for name, period in projects]
+    }
+
+
+class TestParsePeriod:
+    """참여 기간 파싱 테스트"""
+
+    @pytest.mark.parametrize('period, expected', [
+        ('2024-01 ~ 2025-07', (month_index(2024, 1), month_index(2025, 7))),
+        ('2024.03~2024.03', (month_index(2024, 3), month_index(2024, 3))),
+        ('2025-06 ~ 현재', (month_index(2025, 6), CURRENT_MONTH)),
+        ({'start': '2025-01', 'end': '2025-06', 'duration_months': 6}, (month_index(2025, 1), month_index(2025, 6))),
+        ('2025-07 ~ 2025-01', None),
+        ('미정', None)
+    ])
+    def test_formats(self, period, expected):
+        """문자열/dict 기간, 진행 중, 역전·형식 오류"""
+        assert parse_period(period, CURRENT_MONTH) == expected
+
+    def test_overlap_inclusive_months(self):
+        """종료 월 포함 중복 개월 수"""
+        assert overlap_months(parse_period('2024-01 ~ 2024-06'), parse_period('2024-06 ~ 2024-12')) == 1
+        assert overlap_months(parse_period('2024-01 ~ 2024-05'), parse_period('2024-06 ~ 2024-12')) == 0
+
+
+class TestSweepOverlaps:
+    """프로젝트별 스윕 테스트"""
+
+    def test_matches_pairwise_comparison(self):
+        """employees_extended 300명 - 스윕 결과가 쌍별 이중 루프와 같음"""
+        with open(EMPLOYEES_PATH, 'r', encoding='utf-8') as f:
+            employees = {item['user_id']: item for item in json.load(f)}
+
+        expected = {}
+        for key, intervals in build_project_intervals(employees, CURRENT_MONTH).items():
+            for (start_1, end_1, id_1), (start_2, end_2, id_2) in combinations(intervals, 2):
+                months = min(end_1, end_2) - max(start_1, start_2)
+                if id_1 != id_2 and months > 0:
+                    pair = tuple(sorted((id_1, id_2)))
+                    expected.setdefault(pair, {}).setdefault(key, 0)
+                    expected[pair][key] += months
+
+        assert compute_project_overlaps(employees, CURRENT_MONTH) == expected
+        assert expected
+
+    def test_repeated_stints_summed(self):
+        """같은 프로젝트의 여러 참여 기간은 합산, 같은 직원끼리는 제외"""
+        overlaps = sweep_overlaps([
+            (month_index(2024, 1), month_index(2024, 4), 'A'),
+            (month_index(2024, 2), month_index(2024, 12), 'B'),
+            (month_index(2024, 6), month_index(2024, 8), 'A')
+        ])
+
+        assert overlaps == {('A', 'B'): 2 + 2}
+
+    def test_collaboration_score(self, monkeypatch):
+        """중복 개월 수 × 5점, 중복 없는 공동 프로젝트는 제외"""
+        from lambda_functions.affinity_calculator import index as affinity_calculator
+
+        monkeypatch.setattr(affinity_calculator, 'dynamodb_client', MagicMock())
+        first = employee('U_001', ('코어 뱅킹', '2024-01 ~ 2024-06'), ('커머스', '2023-01 ~ 2023-03'))
+        second = employee('U_002', ('코어 뱅킹', '2024-04 ~ 2024-12'), ('커머스', '2023-05 ~ 2023-09'))
+
+        collaboration = affinity_calculator.analyze_project_collaboration(second, first)
+
+        assert [(project.project_id, project.overlap_period_months) for project in collaboration.shared_projects] == [
+            ('코어 뱅킹', 3)
+        ]
+        assert collaboration.collaboration_score == 15.0
@@ -0,0 +1,176 @@
+"""
+프로젝트 후보 목록 사전 계산 유닛 테스트
+
+후보 목록 신선도 판단(요구 기술, 데이터 버전, TTL), Projects 스트림 사전 계산과
+사전 계산된 목록으로 추천을 제공하는 경로를 검증합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+from unittest.mock import MagicMock
+import pytest
+import boto3
+from boto3.dynamodb.types import TypeSerializer
+from moto import mock_aws
+from common.project_shortlist import ProjectShortlistStore
+from common.recommendation_cache import RecommendationCache
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials):
+    """RecommendationCache 테이블이 생성된 DynamoDB 리소스"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='RecommendationCache',
+            KeySchema=[{'AttributeName': 'cache_key', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'cache_key', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield resource
+
+
+def scored_candidate(user_id, skill, similarity, affinity):
+    """collect_scored_candidates 결과 형식의 후보자"""
+    return {
+        'user_id': user_id,
+        'name': user_id,
+        'role': 'Developer',
+        'matched_skills': ['Java'],
+        'skill_match_score': skill,
+        'similarity_score': similarity,
+        'affinity_score': affinity,
+        'availability': 'Available',
+        'current_project': None,
+        'overall_score': 0
+    }
+
+
+class TestProjectShortlistStore:
+    """후보 목록 저장소 테스트"""
+
+    def test_fresh_shortlist(self, dynamodb):
+        """요구 기술 순서·표기가 달라도 같은 데이터 버전이면 조회"""
+        store = ProjectShortlistStore(dynamodb_resource=dynamodb)
+        store.put('P_001', ['Java', 'React'], 3, [scored_candidate('U_001', 80, 1.0, 40)], [0.1, 0.2])
+
+        shortlist = store.get_fresh('P_001', ['react', 'JAVA'], 3)
+
+        assert shortlist['candidates'][0]['components']['skill'] == 80.0
+        assert shortlist['requirement_embedding'] == [0.1, 0.2]
+
+    def test_stale_shortlist_ignored(self, dynamodb):
+        """요구 기술 또는 데이터 버전이 다르면 사용하지 않음"""
+        store = ProjectShortlistStore(dynamodb_resource=dynamodb)
+        store.put('P_001', ['Java'], 3, [scored_candidate('U_001', 80, 1.0, 40)])
+
+        assert store.get_fresh('P_001', ['Java', 'AWS'], 3) is None
+        assert store.get_fresh('P_001', ['Java'], 4) is None
+        assert store.get_fresh('P_002', ['Java'], 3) is None
+
+    def test_expired_shortlist_ignored(self, dynamodb):
+        """TTL이 지난 목록은 사용하지 않음"""
+        store = ProjectShortlistStore(dynamodb_resource=dynamodb, ttl_seconds=-1)
+        store.put('P_001', ['Java'], 0, [scored_candidate('U_001', 80, 1.0, 40)])
+
+        assert store.get_fresh('P_001', ['Java'], 0) is None
+
+
+class TestShortlistPrecompute:
+    """스트림 사전 계산 및 조회 경로 테스트"""
+
+    @pytest.fixture
+    def engine(self, dynamodb, monkeypatch):
+        """저장소를 moto 테이블로 교체한 recommendation_engine 모듈"""
+        from lambda_functions.recommendation_engine import index
+
+        monkeypatch.setattr(index, 'shortlist_store', ProjectShortlistStore(dynamodb_resource=dynamodb))
+        monkeypatch.setattr(index, 'recommendation_cache', RecommendationCache(dynamodb_resource=dynamodb))
+        monkeypatch.setattr(index, 'generate_embedding', lambda text: [0.5, 0.5])
+        monkeypatch.setattr(index, 'generate_reasoning', lambda candidate, budget=None: f"근거 {candidate['user_id']}")
+        return index
+
+    def stream_event(self, project, event_name='INSERT'):
+        """Projects 스트림 이벤트 생성 (NEW_IMAGE)"""
+        serializer = TypeSerializer()
+        return {'Records': [{
+            'eventName': event_name,
+            'dynamodb': {'NewImage': {key: serializer.serialize(value) for key, value in project.items()}}
+        }]}
+
+    def test_precompute_then_serve(self, engine, monkeypatch):
+        """사전 계산 후 추천 요청은 검색 없이 저장된 목록으로 응답"""
+        candidates = [
+            scored_candidate('SKILLED', 95, 1.0, 10),
+            scored_candidate('FRIENDLY', 40, 1.0, 95),
+            scored_candidate('AVERAGE', 60, 1.0, 50),
+        ]
+        collect = MagicMock(return_value=(candidates, {}))
+        monkeypatch.setattr(engine, 'collect_scored_candidates', collect)
+        project = {
+            'project_id': 'P_100',
+            'requirements': ['Java'],
+            'team_composition': {'required_members': 1}
+        }
+
+        result = engine.handler(self.stream_event(project), None)
+
+        assert result['statusCode'] == 200
+        assert collect.call_count == 1
+
+        # 요구 기술과 무관한 수정은 재계산하지 않음
+        engine.handler(self.stream_event(project, 'MODIFY'), None)
+        assert collect.call_count == 1
+
+        by_skill = engine.generate_recommendations('P_100', ['Java'], 1, 'skill')
+        by_affinity = engine.generate_recommendations('P_100', ['Java'], 1, 'affinity')
+
+        assert collect.call_count == 1
+        assert by_skill[0]['user_id'] == 'SKILLED'
+        assert by_skill[0]['reasoning'] == '근거 SKILLED'
+        assert by_affinity[0]['user_id'] == 'FRIENDLY'
+        assert by_affinity[0]['reasoning'] == '근거 FRIENDLY'
+        assert 'components' not in by_skill[0]
+
+    def test_reasoning_kept_per_priority(self, engine, monkeypatch):
+        """여러 우선순위의 상위 후보는 우선순위마다 그 종합 점수로 만든 근거를 받음"""
+        monkeypatch.setattr(
+            engine, 'generate_reasoning',
+            lambda candidate, budget=None: f"근거 {candidate['user_id']} {candidate['overall_score']:.1f}"
+        )
+        collect = MagicMock(return_value=([scored_candidate('ACE', 90, 1.0, 90)], {}))
+        monkeypatch.setattr(engine, 'collect_scored_candidates', collect)
+        engine.handler(self.stream_event({
+            'project_id': 'P_300', 'requirements': ['Java'], 'team_composition': {'required_members': 1}
+        }), None)
+
+        reasons = {
+            priority: engine.generate_recommendations('P_300', ['Java'], 1, priority)[0]['reasoning']
+            for priority in ('skill', 'affinity')
+        }
+
+        assert collect.call_count == 1
+        assert reasons['skill'] != reasons['affinity']
+        for priority, reasoning in reasons.items():
+            expected = engine.weighted_overall_score(90, 1.0, 90, engine.PRIORITY_WEIGHTS[priority])
+            assert reasoning == f"근거 ACE {expected:.1f}"
+
+    def test_stale_shortlist_recomputes(self, engine, monkeypatch):
+        """데이터 버전이 바뀌면 일반 추천 경로로 계산"""
+        collect = MagicMock(return_value=([scored_candidate('U_001', 80, 1.0, 40)], {}))
+        monkeypatch.setattr(engine, 'collect_scored_candidates', collect)
+        engine.handler(self.stream_event({'project_id': 'P_200', 'requirements': ['Java']}), None)
+
+        engine.recommendation_cache.bump_data_version('Employees')
+        engine.generate_recommendations('P_200', ['Java'], 1, 'balanced')
+
+        assert collect.call_count == 2
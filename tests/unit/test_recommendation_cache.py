@@ -0,0 +1,128 @@
+"""
+추천 결과 캐시 유닛 테스트
+
+요청 키 정규화, 데이터 버전 증가에 따른 무효화, TTL 만료와 스트림 버전 갱신을 검증합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import pytest
+import boto3
+from moto import mock_aws
+from common.recommendation_cache import RecommendationCache, make_request_key
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials):
+    """RecommendationCache 테이블이 생성된 DynamoDB 리소스"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='RecommendationCache',
+            KeySchema=[{'AttributeName': 'cache_key', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'cache_key', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield resource
+
+
+class TestRequestKey:
+    """요청 캐시 키 테스트"""
+
+    def test_skill_order_and_case_ignored(self):
+        """기술 순서·대소문자가 달라도 같은 키"""
+        first = make_request_key('P_001', ['Java', 'React'], 5, 'balanced', 1)
+        second = make_request_key('P_001', ['react', 'JAVA'], 5, 'balanced', 1)
+        assert first == second
+
+    def test_parameters_separate_keys(self):
+        """팀 크기, 우선순위, 데이터 버전이 다르면 다른 키"""
+        base = make_request_key('P_001', ['Java'], 5, 'balanced', 1)
+        assert base != make_request_key('P_001', ['Java'], 6, 'balanced', 1)
+        assert base != make_request_key('P_001', ['Java'], 5, 'skill', 1)
+        assert base != make_request_key('P_001', ['Java'], 5, 'balanced', 2)
+
+
+class TestRecommendationCache:
+    """추천 결과 캐시 테스트"""
+
+    def test_round_trip_with_age(self, dynamodb):
+        """저장한 결과를 경과 시간과 함께 반환"""
+        cache = RecommendationCache(dynamodb_resource=dynamodb)
+        key = make_request_key('P_001', ['Java'], 3, 'balanced', 0)
+        result = [{'user_id': 'U_001', 'overall_score': 72.5}]
+
+        cache.put(key, result, 0)
+        cached, age = cache.get(key)
+
+        assert cached == result
+        assert age >= 0
+
+    def test_version_bump_invalidates(self, dynamodb):
+        """데이터 버전이 증가하면 이전 결과가 조회되지 않음"""
+        cache = RecommendationCache(dynamodb_resource=dynamodb)
+        version = cache.get_data_version()
+        cache.put(make_request_key('P_001', ['Java'], 3, 'balanced', version), [{'user_id': 'U_001'}], version)
+
+        new_version = cache.bump_data_version('Employees')
+
+        assert new_version == version + 1
+        assert cache.get_data_version() == new_version
+        assert cache.get(make_request_key('P_001', ['Java'], 3, 'balanced', new_version)) is None
+
+    def test_expired_entry_ignored(self, dynamodb):
+        """TTL이 지난 항목은 미스로 처리"""
+        cache = RecommendationCache(dynamodb_resource=dynamodb, ttl_seconds=-1)
+        key = make_request_key('P_001', ['Java'], 3, 'balanced', 0)
+        cache.put(key, [{'user_id': 'U_001'}], 0)
+
+        assert cache.get(key) is None
+
+    def test_missing_table_degrades(self, aws_credentials):
+        """테이블이 없어도 예외 없이 미스로 처리"""
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            cache = RecommendationCache(dynamodb_resource=resource)
+
+            assert cache.get_data_version() == 0
+            cache.put('key', [], 0)
+            assert cache.get('key') is None
+
+
+class TestWorkforceVersionUpdater:
+    """스트림 기반 데이터 버전 갱신 테스트"""
+
+    def test_one_bump_per_batch(self, dynamodb):
+        """배치에 변경이 여러 건이어도 버전은 한 번만 증가"""
+        from lambda_functions.workforce_version_updater import index
+
+        index.recommendation_cache = RecommendationCache(dynamodb_resource=dynamodb)
+        arn = 'arn:aws:dynamodb:us-east-2:123456789012:table/{}/stream/2025-01-01T00:00:00.000'
+        event = {'Records': [
+            {'eventName': 'MODIFY', 'eventSourceARN': arn.format('Employees')},
+            {'eventName': 'INSERT', 'eventSourceARN': arn.format('EmployeeAffinity')},
+            {'eventName': 'REMOVE', 'eventSourceARN': arn.format('Employees')},
+        ]}
+
+        result = index.handler(event, None)
+
+        assert result['statusCode'] == 200
+        assert index.recommendation_cache.get_data_version() == 1
+
+    def test_empty_batch_does_not_bump(self, dynamodb):
+        """변경 이벤트가 없으면 버전 유지"""
+        from lambda_functions.workforce_version_updater import index
+
+        index.recommendation_cache = RecommendationCache(dynamodb_resource=dynamodb)
+        index.handler({'Records': []}, None)
+
+        assert index.recommendation_cache.get_data_version() == 0
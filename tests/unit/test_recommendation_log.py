@@ -0,0 +1,211 @@
+"""
+추천 실행 로그 유닛 테스트
+
+로그 항목 요약(상위 후보, 매칭률, 상태), 백그라운드 기록과 프로젝트 이름 조회,
+RecentRunsIndex 최신순 조회와 TTL 만료 항목 제외, 대시보드 조회 형식을 검증합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import pytest
+import boto3
+from moto import mock_aws
+from common.recommendation_log import (
+    RECENT_RUNS_INDEX,
+    STATUS_COMPLETED,
+    STATUS_DEGRADED,
+    RecommendationRunLog,
+    build_run_entry
+)
+
+
+class FakeClock:
+    """수동으로 진행시키는 시계 (초 단위)"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials):
+    """RecommendationRuns, Projects 테이블이 생성된 DynamoDB 리소스"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='RecommendationRuns',
+            KeySchema=[{'AttributeName': 'log_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[
+                {'AttributeName': 'log_id', 'AttributeType': 'S'},
+                {'AttributeName': 'log_partition', 'AttributeType': 'S'},
+                {'AttributeName': 'created_at', 'AttributeType': 'N'}
+            ],
+            GlobalSecondaryIndexes=[{
+                'IndexName': RECENT_RUNS_INDEX,
+                'KeySchema': [
+                    {'AttributeName': 'log_partition', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        projects = resource.create_table(
+            TableName='Projects',
+            KeySchema=[{'AttributeName': 'project_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'project_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        projects.put_item(Item={'project_id': 'P_001', 'project_name': '금융 플랫폼 구축'})
+        yield resource
+
+
+def recommendation(user_id, skill, overall):
+    """응답 형식의 추천 후보자"""
+    return {'user_id': user_id, 'name': user_id, 'skill_match_score': skill, 'overall_score': overall}
+
+
+class TestBuildRunEntry:
+    """로그 항목 요약 테스트"""
+
+    def test_summary_fields(self):
+        """추천 수, 평균 기술 점수 매칭률, 상위 후보"""
+        recommendations = [recommendation(f'U_{i}', 90 - i * 10, 80 - i) for i in range(7)]
+
+        entry = build_run_entry('P_001', 'RUN_1', recommendations, 1234, cache_hit=True)
+
+        assert entry['recommended_count'] == 7
+        assert entry['match_rate'] == 60
+        assert [candidate['user_id'] for candidate in entry['top_candidates']] == ['U_0', 'U_1', 'U_2', 'U_3', 'U_4']
+        assert entry['cache_hit'] is True
+        assert entry['status'] == STATUS_COMPLETED
+
+    def test_degraded_status(self):
+        """생략된 단계가 있으면 부분 추천"""
+        entry = build_run_entry('P_001', None, [], 10, cache_hit=False, skipped_stages=[{'stage': 'llm_reasoning'}])
+
+        assert entry['status'] == STATUS_DEGRADED
+        assert entry['match_rate'] == 0
+
+
+class TestRecommendationRunLog:
+    """로그 기록/조회 테스트"""
+
+    def test_recent_runs_newest_first(self, dynamodb):
+        """GSI Query로 최신 N건을 최신순 조회"""
+        clock = FakeClock()
+        run_log = RecommendationRunLog(dynamodb, clock=clock)
+        for index in range(4):
+            run_log.record(build_run_entry(f'P_00{index}', f'RUN_{index}', [], 100, cache_hit=False))
+            clock.now += 1
+        assert run_log.flush(timeout=10)
+
+        recent = run_log.recent(limit=3)
+
+        assert [run['run_id'] for run in recent] == ['RUN_3', 'RUN_2', 'RUN_1']
+
+    def test_project_name_resolved_in_background(self, dynamodb):
+        """프로젝트 이름은 기록 스레드에서 조회"""
+        run_log = RecommendationRunLog(dynamodb, clock=FakeClock())
+        run_log.record(build_run_entry('P_001', 'RUN_1', [recommendation('U_1', 80, 75.5)], 100, cache_hit=False))
+        run_log.flush(timeout=10)
+
+        run = run_log.recent()[0]
+
+        assert run['project_name'] == '금융 플랫폼 구축'
+        assert float(run['top_candidates'][0]['overall_score']) == 75.5
+
+    def test_expired_runs_excluded(self, dynamodb):
+        """TTL이 지난 항목은 삭제 전이라도 제외"""
+        clock = FakeClock()
+        run_log = RecommendationRunLog(dynamodb, ttl_seconds=60, clock=clock)
+        run_log.record(build_run_entry('P_001', 'RUN_1', [], 100, cache_hit=False))
+        run_log.flush(timeout=10)
+
+        clock.now += 120
+
+        assert run_log.recent() == []
+
+    def test_recent_pages_past_expired_runs(self, dynamodb):
+        """보관 기간보다 먼저 만료된 최신 항목을 거르면 다음 페이지에서 limit건을 채움"""
+        clock = FakeClock()
+        long_log = RecommendationRunLog(dynamodb, ttl_seconds=3600, clock=clock)
+        for index in range(2):
+            long_log.record(build_run_entry('P_001', f'KEEP_{index}', [], 100, cache_hit=False))
+            clock.now += 1
+        short_log = RecommendationRunLog(dynamodb, ttl_seconds=60, clock=clock)
+        for index in range(3):
+            short_log.record(build_run_entry('P_001', f'GONE_{index}', [], 100, cache_hit=False))
+            clock.now += 1
+        long_log.flush(timeout=10)
+        short_log.flush(timeout=10)
+
+        clock.now += 120
+
+        assert [run['run_id'] for run in long_log.recent(limit=2)] == ['KEEP_1', 'KEEP_0']
+
+    def test_handler_waits_for_log_write(self, dynamodb, monkeypatch):
+        """추천 핸들러는 실행 로그 쓰기가 끝난 뒤 응답 반환 (Lambda 정지로 인한 유실 방지)"""
+        import json
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        run_log = RecommendationRunLog(dynamodb, clock=FakeClock())
+        monkeypatch.setattr(recommendation_engine, 'run_log', run_log)
+        monkeypatch.setattr(
+            recommendation_engine, 'get_or_generate_recommendations',
+            lambda **kwargs: ([recommendation('U_1', 80, 75)], 'RUN_1', None)
+        )
+
+        response = recommendation_engine.handler({
+            'path': '/recommendations',
+            'body': json.dumps({'project_id': 'P_001', 'required_skills': ['Java']})
+        }, None)
+
+        assert response['statusCode'] == 200
+        assert run_log.flush(timeout=0)
+        assert [run['run_id'] for run in run_log.recent()] == ['RUN_1']
+
+    def test_write_failure_does_not_raise(self, aws_credentials):
+        """테이블이 없어도 기록 실패는 경고만 남김"""
+        with mock_aws():
+            run_log = RecommendationRunLog(boto3.resource('dynamodb', region_name='us-east-2'))
+            future = run_log.record(build_run_entry('P_001', 'RUN_1', [], 100, cache_hit=False))
+
+            assert future.result(timeout=10) is None
+
+
+class TestDashboardRecentRecommendations:
+    """대시보드 최근 추천 조회 테스트"""
+
+    def test_dashboard_reads_run_log(self, dynamodb, monkeypatch):
+        """샘플 데이터 대신 실행 로그를 대시보드 형식으로 반환"""
+        from lambda_functions.dashboard_metrics import index as dashboard_metrics
+
+        run_log = RecommendationRunLog(dynamodb, clock=FakeClock())
+        run_log.record(build_run_entry('P_001', 'RUN_1', [recommendation('U_1', 88, 70)], 250, cache_hit=False))
+        run_log.flush(timeout=10)
+        monkeypatch.setattr(dashboard_metrics, 'run_log', run_log)
+
+        recent = dashboard_metrics.get_recent_recommendations()
+
+        assert recent == [{
+            'project': '금융 플랫폼 구축',
+            'project_id': 'P_001',
+            'recommended': 1,
+            'match_rate': 88,
+            'status': STATUS_COMPLETED,
+            'cache_hit': False,
+            'latency_ms': 250,
+            'created_at': 1_700_000_000_000
+        }]
@@ -0,0 +1,141 @@
+"""
+추천 실행 저장소 및 재점수화 유닛 테스트
+
+구성 점수 추출, 가중치 정규화, 재정렬과 실행 저장/조회를 검증합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import pytest
+import boto3
+from moto import mock_aws
+from common.recommendation_runs import (
+    RecommendationRunStore,
+    extract_components,
+    normalize_weights,
+    rescore_candidates
+)
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials):
+    """RecommendationCache 테이블이 생성된 DynamoDB 리소스"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='RecommendationCache',
+            KeySchema=[{'AttributeName': 'cache_key', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'cache_key', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield resource
+
+
+def scored_candidate(user_id, skill, similarity, affinity, availability='Available'):
+    """check_availability 결과 형식의 후보자"""
+    return {
+        'user_id': user_id,
+        'name': user_id,
+        'role': 'Developer',
+        'skill_match_score': skill,
+        'similarity_score': similarity,
+        'affinity_score': affinity,
+        'availability': availability,
+        'overall_score': 0
+    }
+
+
+class TestComponents:
+    """구성 점수 및 가중치 테스트"""
+
+    def test_extract_components(self):
+        """가용성 상태를 점수로 변환"""
+        components = extract_components(scored_candidate('U_001', 80, 1.2, 40, 'Busy'))
+        assert components == {'skill': 80.0, 'similarity': 1.2, 'affinity': 40.0, 'availability': 0.0}
+
+    def test_weights_normalized(self):
+        """슬라이더 스케일과 무관하게 비율로 정규화"""
+        assert normalize_weights({'skill': 3, 'affinity': 1}) == {
+            'skill': 0.75, 'similarity': 0.0, 'affinity': 0.25, 'availability': 0.0
+        }
+
+    @pytest.mark.parametrize('weights', [{'skill': -1, 'affinity': 2}, {'skill': 0}, {'speed': 1}])
+    def test_invalid_weights(self, weights):
+        """음수, 합 0, 알 수 없는 항목은 거부"""
+        with pytest.raises(ValueError):
+            normalize_weights(weights)
+
+
+class TestRescore:
+    """재정렬 테스트"""
+
+    def test_weights_change_ranking(self):
+        """가중치에 따라 순위가 바뀜"""
+        candidates = [
+            {'user_id': 'SKILLED', 'components': {'skill': 90, 'similarity': 0, 'affinity': 10, 'availability': 100}},
+            {'user_id': 'FRIENDLY', 'components': {'skill': 30, 'similarity': 0, 'affinity': 95, 'availability': 100}},
+        ]
+
+        by_skill = rescore_candidates(candidates, {'skill': 1})
+        by_affinity = rescore_candidates(candidates, {'affinity': 1})
+
+        assert [c['user_id'] for c in by_skill] == ['SKILLED', 'FRIENDLY']
+        assert [c['user_id'] for c in by_affinity] == ['FRIENDLY', 'SKILLED']
+        assert 'overall_score' not in candidates[0]
+
+    def test_top_k(self):
+        """상위 k명만 반환"""
+        candidates = [
+            {'user_id': f'U_{i}', 'components': {'skill': i, 'similarity': 0, 'affinity': 0, 'availability': 0}}
+            for i in range(10)
+        ]
+        result = rescore_candidates(candidates, {'skill': 1}, top_k=3)
+        assert [c['user_id'] for c in result] == ['U_9', 'U_8', 'U_7']
+
+
+class TestRunStore:
+    """실행 저장소 테스트"""
+
+    def test_save_and_load_from_memory(self):
+        """메모리 저장소만으로 조회"""
+        store = RecommendationRunStore()
+        store.save('RUN_1', [scored_candidate('U_001', 80, 1.0, 50)], {'project_id': 'P_001', 'team_size': 3})
+
+        run = store.load('RUN_1')
+        assert run['request']['project_id'] == 'P_001'
+        assert run['candidates'][0]['components']['skill'] == 80.0
+
+    def test_load_after_cold_start(self, dynamodb):
+        """메모리가 비워진 뒤 DynamoDB에서 조회"""
+        RecommendationRunStore(dynamodb_resource=dynamodb).save(
+            'RUN_2', [scored_candidate('U_002', 70, 1.1, 20)], {'project_id': 'P_002', 'team_size': 1}
+        )
+
+        cold_store = RecommendationRunStore(dynamodb_resource=dynamodb)
+        run = cold_store.load('RUN_2')
+
+        assert run['candidates'][0]['user_id'] == 'U_002'
+        assert run['candidates'][0]['components']['availability'] == 100.0
+
+    def test_memory_lru_eviction(self):
+        """용량 초과 시 오래된 실행 제거"""
+        store = RecommendationRunStore(max_runs=2)
+        for number in range(3):
+            store.save(f'RUN_{number}', [], {})
+
+        assert store.load('RUN_0') is None
+        assert store.load('RUN_2') is not None
+
+    def test_expired_run_ignored(self, dynamodb):
+        """만료된 실행은 조회되지 않음"""
+        RecommendationRunStore(dynamodb_resource=dynamodb, ttl_seconds=-1).save('RUN_3', [], {})
+        assert RecommendationRunStore(dynamodb_resource=dynamodb).load('RUN_3') is None
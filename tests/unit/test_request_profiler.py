@@ -0,0 +1,237 @@
+"""
+요청 단위 프로파일러 유닛 테스트
+
+단계 시간 트리 합산, 비활성 상태의 무동작, DynamoDB 항목/소비 용량과 Bedrock 토큰 수집,
+관리자 전용 profile=true 응답을 검증합니다.
+"""
+
+import json
+from types import SimpleNamespace
+import boto3
+import pytest
+from moto import mock_aws
+from common.request_profiler import (
+    RequestProfiler,
+    current_profiler,
+    instrument_client,
+    profile_stage,
+    record_opensearch_response
+)
+
+
+class FakeClock:
+    """수동으로 진행시키는 시계 (초 단위)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance_ms(self, milliseconds):
+        self.now += milliseconds / 1000
+
+
+class TestStageTree:
+    """단계 시간 트리 테스트"""
+
+    def test_nested_stages_and_sibling_merge(self):
+        """중첩 단계는 하위 노드로, 같은 이름의 형제 단계는 합산"""
+        clock = FakeClock()
+        profiler = RequestProfiler(clock=clock)
+
+        with profiler.activate():
+            with profile_stage('candidate_search'):
+                clock.advance_ms(5)
+                with profile_stage('affinity_scan'):
+                    clock.advance_ms(20)
+            for _ in range(3):
+                with profile_stage('claude_reasoning'):
+                    clock.advance_ms(100)
+
+        stages = profiler.report()['stages']
+
+        assert stages['ms'] == 325.0
+        assert stages['self_ms'] == 0.0
+        reasoning, search = stages['children']
+        assert reasoning == {'stage': 'claude_reasoning', 'ms': 300.0, 'calls': 3}
+        assert search['self_ms'] == 5.0
+        assert search['children'] == [{'stage': 'affinity_scan', 'ms': 20.0, 'calls': 1}]
+
+    def test_decorator_is_noop_without_profiler(self):
+        """활성 프로파일러가 없으면 원래 함수만 실행"""
+        @profile_stage('scoring')
+        def score(value):
+            return value * 2
+
+        assert current_profiler() is None
+        assert score(21) == 42
+        record_opensearch_response({'took': 12})
+
+    def test_opensearch_took(self):
+        """검색 응답의 took 합계"""
+        profiler = RequestProfiler()
+        with profiler.activate():
+            record_opensearch_response({'took': 12, 'hits': {'hits': []}})
+            record_opensearch_response({'took': 30, 'hits': {'hits': []}})
+
+        assert profiler.report()['opensearch'] == {'searches': 2, 'took_ms': 42}
+
+    def test_cprofile_top_n(self):
+        """profile_top 지정 시 누적 시간 상위 함수"""
+        profiler = RequestProfiler(top_n=3)
+        with profiler.activate():
+            sorted(range(1000), key=lambda value: -value)
+
+        summary = profiler.report()['cprofile']
+
+        assert 0 < len(summary) <= 3
+        assert set(summary[0]) == {'function', 'calls', 'total_ms', 'cumulative_ms'}
+
+
+class TestClientInstrumentation:
+    """boto3 클라이언트 계측 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    def test_dynamodb_items_and_operations(self):
+        """Scan/GetItem/BatchGetItem 항목 수를 작업별로 기록"""
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            table = resource.create_table(
+                TableName='Employees',
+                KeySchema=[{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': 'user_id', 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            for user_id in ['U_001', 'U_002', 'U_003']:
+                table.put_item(Item={'user_id': user_id})
+            instrument_client(resource.meta.client)
+            instrument_client(resource.meta.client)
+
+            profiler = RequestProfiler()
+            with profiler.activate():
+                table.scan()
+                table.get_item(Key={'user_id': 'U_001'})
+                resource.batch_get_item(RequestItems={
+                    'Employees': {'Keys': [{'user_id': 'U_002'}, {'user_id': 'U_003'}]}
+                })
+            table.scan()
+
+        dynamodb = profiler.report()['dynamodb']
+
+        assert dynamodb['items'] == 6
+        assert {operation: entry['calls'] for operation, entry in dynamodb['operations'].items()} == {
+            'BatchGetItem': 1, 'GetItem': 1, 'Scan': 1
+        }
+        assert dynamodb['read_capacity_units'] >= 0
+
+    def test_bedrock_tokens_from_headers(self):
+        """Bedrock 응답 헤더의 토큰 수를 모델별로 기록"""
+        client = boto3.client('bedrock-runtime', region_name='us-east-2')
+        instrument_client(client)
+        context = {}
+
+        profiler = RequestProfiler()
+        with profiler.activate():
+            client.meta.events.emit(
+                'provide-client-params.bedrock-runtime.InvokeModel',
+                params={'modelId': 'anthropic.claude-v2'}, model=None, context=context
+            )
+            client.meta.events.emit(
+                'after-call.bedrock-runtime.InvokeModel',
+                http_response=SimpleNamespace(headers={
+                    'x-amzn-bedrock-input-token-count': '420',
+                    'x-amzn-bedrock-output-token-count': '180'
+                }),
+                parsed={}, model=None, context=context
+            )
+
+        bedrock = profiler.report()['bedrock']
+
+        assert bedrock['input_tokens'] == 420
+        assert bedrock['models'] == {
+            'anthropic.claude-v2': {'calls': 1, 'input_tokens': 420, 'output_tokens': 180}
+        }
+
+
+class TestProfileRequest:
+    """profile=true 추천 요청 테스트"""
+
+    ADMIN_ARN = 'arn:aws:iam::123456789012:user/hr-admin'
+
+    @pytest.fixture
+    def engine(self, monkeypatch):
+        """추천 생성을 대체한 추천 엔진 모듈"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        def fake_generate(**kwargs):
+            with profile_stage('candidate_search'):
+                record_opensearch_response({'took': 7})
+            return [{'user_id': 'U_001', 'overall_score': 90.0}], 'run-1', None
+
+        monkeypatch.setattr(recommendation_engine, 'PROFILING_ADMIN_PRINCIPALS', {self.ADMIN_ARN})
+        monkeypatch.setattr(recommendation_engine, 'get_or_generate_recommendations', fake_generate)
+        monkeypatch.setattr(recommendation_engine.run_log, 'record', lambda entry: None)
+        return recommendation_engine
+
+    def event(self, caller_arn, query=None, path='/recommendations/profile'):
+        return {
+            'path': path,
+            'body': json.dumps({'project_id': 'P_001', 'required_skills': ['Java']}),
+            'queryStringParameters': query,
+            'requestContext': {'identity': {'userArn': caller_arn}}
+        }
+
+    def test_admin_receives_profile(self, engine):
+        """IAM 인증 경로의 관리자 요청은 추천 결과와 프로파일을 함께 반환"""
+        response = engine.handler(self.event(self.ADMIN_ARN), None)
+        body = json.loads(response['body'])
+
+        assert response['statusCode'] == 200
+        assert body['recommendations'][0]['user_id'] == 'U_001'
+        assert body['profile']['stages']['children'][0]['stage'] == 'candidate_search'
+        assert body['profile']['opensearch'] == {'searches': 1, 'took_ms': 7}
+
+    def test_non_admin_forbidden(self, engine):
+        """관리자가 아니면 403"""
+        response = engine.handler(self.event('arn:aws:iam::123456789012:user/planner'), None)
+
+        assert response['statusCode'] == 403
+
+    def test_unauthenticated_route_forbidden(self, engine):
+        """인증 없는 /recommendations 경로의 profile=true는 호출 주체가 없으므로 403"""
+        response = engine.handler(self.event(None, query={'profile': 'true'}, path='/recommendations'), None)
+
+        assert response['statusCode'] == 403
+
+    def test_profile_absent_by_default(self, engine):
+        """profile 미지정 요청에는 프로파일 없음"""
+        response = engine.handler(self.event(None, path='/recommendations'), None)
+
+        assert 'profile' not in json.loads(response['body'])
+
+    def test_reasoning_stage_times_bedrock_call(self, engine, monkeypatch):
+        """claude_reasoning 단계는 클라이언트 생성이 아니라 Bedrock 호출 시간을 기록"""
+        clock = FakeClock()
+        profiler = RequestProfiler(clock=clock)
+
+        def invoke_model(**kwargs):
+            clock.advance_ms(250)
+            body = SimpleNamespace(read=lambda: json.dumps({'completion': '근거'}))
+            return {'body': body}
+
+        client = SimpleNamespace(invoke_model=invoke_model)
+        monkeypatch.setattr(engine, 'get_reasoning_client', lambda budget=None: client)
+
+        with profiler.activate():
+            reasoning = engine.generate_reasoning({'name': '홍길동'})
+
+        assert reasoning == '근거'
+        assert profiler.report()['stages']['children'] == [
+            {'stage': 'claude_reasoning', 'ms': 250.0, 'calls': 1}
+        ]
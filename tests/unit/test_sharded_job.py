@@ -0,0 +1,246 @@
+"""
+친밀도 분산 작업 유닛 테스트
+
+샤드 분할, 체크포인트 이후부터의 재개, 샤드 입력 조각 저장/조회, 코디네이터/워커 핸들러의
+실행 시간 부족 시 이어서 처리와 실행 버전 게시, 중복 완료 무시, 로컬 프로세스 풀 실행기를 검증합니다.
+"""
+
+import json
+import boto3
+import pytest
+from moto import mock_aws
+from common.dynamodb_client import DynamoDBClient
+from common.repositories import AffinityRepository
+from lambda_functions.affinity_calculator.messenger_aggregation import PairMessageStats
+from lambda_functions.affinity_calculator.shard_inputs import JobSnapshotStore, build_shard_slice, parse_shard_slice
+from lambda_functions.affinity_calculator.sharded_job import (
+    STATUS_PUBLISHED,
+    JobCheckpointStore,
+    ProcessPoolRunner,
+    pair_key,
+    run_shard,
+    shard_of,
+    shard_pairs
+)
+
+
+def square_shard(payload):
+    """프로세스 풀 실행기 테스트용 워커 (모듈 수준 - 피클 가능)"""
+    return {'shard_index': payload['shard_index'], 'value': payload['shard_index'] ** 2}
+
+
+PAIRS = [(f'U_{index:03d}', f'U_{index + 1:03d}') for index in range(10)]
+
+
+class TestShardPlanning:
+    """샤드 분할과 재개 테스트"""
+
+    def test_shards_partition_pairs(self):
+        """모든 쌍이 정확히 한 샤드에 속하고 샤드 안은 쌍 키 순"""
+        shards = [shard_pairs(PAIRS, 3, index) for index in range(3)]
+
+        assert sorted(pair for shard in shards for pair in shard) == sorted(PAIRS)
+        assert all(shard == sorted(shard) for shard in shards)
+        assert all(shard_of(pair, 3) == index for index, shard in enumerate(shards) for pair in shard)
+
+    def test_resume_after_checkpoint(self):
+        """중단 후 재개하면 체크포인트 다음 쌍부터 처리"""
+        processed, checkpoints = [], []
+        budget = iter([False] * 4 + [True])
+
+        count, finished = run_shard(
+            PAIRS, None, 0, processed.append, lambda last, n: checkpoints.append((last, n)),
+            should_yield=lambda: next(budget), checkpoint_interval=3
+        )
+        assert (count, finished) == (4, False)
+        assert checkpoints == [(pair_key(PAIRS[2]), 3), (pair_key(PAIRS[3]), 4)]
+
+        count, finished = run_shard(PAIRS, checkpoints[-1][0], count, processed.append, lambda *_: None)
+        assert (count, finished) == (10, True)
+        assert processed == PAIRS
+
+
+class TestShardInputs:
+    """샤드 입력 조각 테스트"""
+
+    def test_slice_keeps_only_shard_evidence(self, tmp_path):
+        """샤드 쌍의 근거와 삭제할 이전 행만 저장하고 같은 입력으로 복원"""
+        stats = PairMessageStats()
+        stats.add(1.5, 12.0)
+        stats.add(0.5)
+        pairs = [('U_000', 'U_001'), ('U_001', 'U_002')]
+        payload = build_shard_slice(
+            pairs,
+            {('U_000', 'U_001'): stats, ('U_005', 'U_006'): PairMessageStats()},
+            {('U_001', 'U_002'): ['EVT_001'], ('U_005', 'U_006'): ['EVT_002']},
+            {('U_000', 'U_001'): {'P_001': 4}},
+            departed=['AFF_U_007_U_009', 'AFF_U_003_U_004']
+        )
+        store = JobSnapshotStore(str(tmp_path))
+        store.put('runs/RUN/shard-0000', payload)
+
+        shard_slice = parse_shard_slice(store.get('runs/RUN/shard-0000'))
+
+        assert shard_slice.pairs == pairs
+        restored = shard_slice.message_stats[('U_000', 'U_001')]
+        assert (restored.total_messages, restored.weighted_score, restored.avg_response_time_minutes) == (2, 2.0, 12.0)
+        assert shard_slice.shared_events == {('U_001', 'U_002'): ['EVT_001']}
+        assert shard_slice.project_overlaps == {('U_000', 'U_001'): {'P_001': 4}}
+        assert shard_slice.departed == ['AFF_U_003_U_004', 'AFF_U_007_U_009']
+        assert store.get('runs/RUN/shard-0001') is None
+
+
+class TestShardedHandler:
+    """코디네이터/워커 핸들러 테스트"""
+
+    class CollectingRunner:
+        """워커 호출 페이로드 수집 (비동기 자기 호출 대신)"""
+
+        def __init__(self):
+            self.payloads = []
+
+        def submit(self, payload):
+            self.payloads.append(payload)
+
+    class ShortContext:
+        """남은 실행 시간이 처음 몇 번만 충분한 Lambda 컨텍스트"""
+
+        def __init__(self, calls):
+            self.calls = calls
+
+        def get_remaining_time_in_millis(self):
+            self.calls -= 1
+            return 600000 if self.calls >= 0 else 1000
+
+    @pytest.fixture
+    def aws(self, monkeypatch):
+        """친밀도 계산 테이블과 분산 작업 테이블"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+        with mock_aws():
+            resource = boto3.resource('dynamodb', region_name='us-east-2')
+            for name, key in [('Employees', 'user_id'), ('CompanyEvents', 'event_id'),
+                              ('MessengerLogs', 'log_id'), ('EmployeeAffinity', 'affinity_id'),
+                              ('AffinityPairState', 'pair_id'), ('AffinityNeighbors', 'user_id')]:
+                resource.create_table(
+                    TableName=name,
+                    KeySchema=[{'AttributeName': key, 'KeyType': 'HASH'}],
+                    AttributeDefinitions=[{'AttributeName': key, 'AttributeType': 'S'}],
+                    BillingMode='PAY_PER_REQUEST'
+                )
+            resource.create_table(
+                TableName='PairDailyStats',
+                KeySchema=[
+                    {'AttributeName': 'pair_id', 'KeyType': 'HASH'},
+                    {'AttributeName': 'day', 'KeyType': 'RANGE'}
+                ],
+                AttributeDefinitions=[
+                    {'AttributeName': 'pair_id', 'AttributeType': 'S'},
+                    {'AttributeName': 'day', 'AttributeType': 'S'}
+                ],
+                GlobalSecondaryIndexes=[{
+                    'IndexName': 'DayIndex',
+                    'KeySchema': [
+                        {'AttributeName': 'day', 'KeyType': 'HASH'},
+                        {'AttributeName': 'pair_id', 'KeyType': 'RANGE'}
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'}
+                }],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            resource.create_table(
+                TableName='AffinityJobRuns',
+                KeySchema=[
+                    {'AttributeName': 'run_id', 'KeyType': 'HASH'},
+                    {'AttributeName': 'shard_id', 'KeyType': 'RANGE'}
+                ],
+                AttributeDefinitions=[
+                    {'AttributeName': 'run_id', 'AttributeType': 'S'},
+                    {'AttributeName': 'shard_id', 'AttributeType': 'S'}
+                ],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            participants = [f'U_{index:03d}' for index in range(8)]
+            for user_id in participants:
+                resource.Table('Employees').put_item(Item={'user_id': user_id, 'work_experience': []})
+            resource.Table('CompanyEvents').put_item(Item={
+                'event_id': 'EVT_001', 'event_date': '2025-12-24', 'participants': participants
+            })
+
+            s3 = boto3.client('s3', region_name='us-east-2')
+            s3.create_bucket(Bucket='data-lake', CreateBucketConfiguration={'LocationConstraint': 'us-east-2'})
+
+            from lambda_functions.affinity_calculator import index as affinity_calculator
+            client = DynamoDBClient()
+            runner = self.CollectingRunner()
+            monkeypatch.setattr(affinity_calculator, 'dynamodb_client', client)
+            monkeypatch.setattr(affinity_calculator, 'affinity_repo', AffinityRepository(client))
+            monkeypatch.setattr(affinity_calculator, 'job_runner', runner)
+            monkeypatch.setattr(
+                affinity_calculator, 'snapshot_store', JobSnapshotStore('s3://data-lake/affinity-jobs', s3)
+            )
+            yield affinity_calculator, resource, runner
+
+    def test_coordinator_workers_publish(self, aws, monkeypatch):
+        """샤드별 워커, 실행 시간 부족 시 이어서 처리, 마지막 샤드가 이번 실행 점수로 인접 목록 게시"""
+        affinity_calculator, resource, runner = aws
+        # 행 ID 목록 도입 전에 저장된 행 (역순 ID) - 첫 실행이 키 스캔으로 찾아 삭제, 인접 목록에도 반영 안 됨
+        resource.Table('EmployeeAffinity').put_item(Item={
+            'affinity_id': 'AFF_U_007_U_000',
+            'employee_pair': {'employee_1': 'U_007', 'employee_2': 'U_000'},
+            'overall_affinity_score': 99
+        })
+
+        def reload_inputs(*args, **kwargs):
+            raise AssertionError("워커는 입력 테이블을 다시 읽지 않아야 함")
+
+        response = affinity_calculator.handler({'shard_count': 3}, None)
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 202
+        assert body['candidate_pairs'] == 28
+        assert body['departed_pairs'] == 1
+        assert sum(body['shard_sizes']) == 28
+        assert [payload['shard_index'] for payload in runner.payloads] == [0, 1, 2]
+
+        # 워커와 이어서 처리하는 호출은 저장된 자기 샤드 조각만 읽음
+        monkeypatch.setattr(affinity_calculator, 'load_affinity_inputs', reload_inputs)
+        monkeypatch.setattr(affinity_calculator, 'get_all_employees', reload_inputs)
+
+        # 첫 워커는 쌍 2개 처리 후 실행 시간 부족 → 같은 샤드 재호출
+        first = affinity_calculator.handler(runner.payloads[0], self.ShortContext(calls=2))
+        assert json.loads(first['body'])['status'] == 'continued'
+        assert runner.payloads[-1] == runner.payloads[0]
+
+        results = [json.loads(affinity_calculator.handler(payload, None)['body']) for payload in runner.payloads[1:]]
+        assert [result['published'] for result in results] == [False, False, True]
+
+        store = JobCheckpointStore(resource.Table('AffinityJobRuns'))
+        run = store.get_run(body['run_id'])
+        assert run['status'] == STATUS_PUBLISHED
+        assert int(run['processed_pairs']) == 28
+        assert (int(run['written_pairs']), int(run['unchanged_pairs'])) == (28, 0)
+        assert store.get_latest()['published_run_id'] == body['run_id']
+        stored = {item['affinity_id'] for item in resource.Table('EmployeeAffinity').scan()['Items']}
+        assert len(stored) == 28 and 'AFF_U_007_U_000' not in stored
+        neighbor_lists = {item['user_id']: item for item in resource.Table('AffinityNeighbors').scan()['Items']}
+        assert len(neighbor_lists) == 8
+        assert all(len(item['neighbor_ids']) == 7 for item in neighbor_lists.values())
+        assert all(int(item['pair_count']) == 7 for item in neighbor_lists.values())
+        assert all(float(score) < 99 for item in neighbor_lists.values() for score in item['scores'])
+
+        # 재시도된 완료 샤드는 다시 집계하지 않음
+        again = json.loads(affinity_calculator.handler(runner.payloads[1], None)['body'])
+        assert again['status'] == 'done'
+        assert int(store.get_run(body['run_id'])['completed_shards']) == 3
+
+
+class TestProcessPoolRunner:
+    """로컬 프로세스 풀 실행기 테스트"""
+
+    def test_runs_payloads_in_processes(self):
+        """예약 순서대로 워커 결과 반환"""
+        with ProcessPoolRunner(square_shard, max_workers=2) as runner:
+            for shard_index in range(4):
+                runner.submit({'shard_index': shard_index})
+            results = runner.results()
+
+        assert [result['value'] for result in results] == [0, 1, 4, 9]
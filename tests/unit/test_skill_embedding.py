@@ -0,0 +1,172 @@
+"""
+로컬 기술 임베딩 유닛 테스트
+
+PPMI + SVD 학습, 아티팩트 저장/로드, 기술 집합 유사도 순서와
+레이어에 포함된 아티팩트를 사용하는 추천 대체 경로를 검증합니다.
+"""
+
+from unittest.mock import MagicMock
+import pytest
+from common.skill_embedding import (
+    DEFAULT_ARTIFACT_PATH,
+    SkillEmbedding,
+    get_skill_embedding,
+    innerproduct_score,
+    train_skill_embedding
+)
+
+
+# 백엔드/프론트엔드 기술이 각각 함께 나타나는 기술 집합
+SKILL_SETS = (
+    [['Java', 'Spring Boot', 'MySQL']] * 5 +
+    [['Java', 'Spring Boot', 'JPA']] * 5 +
+    [['React', 'TypeScript', 'Redux']] * 5 +
+    [['React', 'TypeScript', 'Next.js']] * 5
+)
+
+
+@pytest.fixture
+def model():
+    """테스트 기술 집합으로 학습한 모델"""
+    vocab, vectors = train_skill_embedding(SKILL_SETS, dimensions=4)
+    return SkillEmbedding(vocab, vectors)
+
+
+class TestSkillEmbedding:
+    """기술 임베딩 학습 및 유사도 테스트"""
+
+    def test_related_skills_rank_higher(self, model):
+        """함께 쓰이는 기술 집합이 다른 분야 기술 집합보다 유사"""
+        query = model.embed(['Java', 'Spring Boot'])
+
+        backend = model.score(query, ['JPA', 'MySQL'])
+        frontend = model.score(query, ['Redux', 'Next.js'])
+
+        assert backend > frontend
+        assert 0 < frontend < backend <= 2.0
+
+    def test_skill_names_normalized(self, model):
+        """대소문자·별칭이 달라도 같은 기술로 인식"""
+        assert model.known_skills(['java', 'SPRING BOOT', 'Cobol']) == ['java', 'spring boot']
+
+    def test_unknown_skills(self, model):
+        """알려진 기술이 없으면 벡터 None, 점수 0"""
+        assert model.embed(['Cobol']) is None
+        assert model.score(model.embed(['Java']), ['Cobol']) == 0.0
+        assert model.score(None, ['Java']) == 0.0
+
+    def test_artifact_round_trip(self, model, tmp_path):
+        """저장한 아티팩트를 로드하면 같은 점수"""
+        path = str(tmp_path / 'embedding.npz')
+        model.save(path)
+
+        loaded = get_skill_embedding(path)
+        query = loaded.embed(['React'])
+
+        assert loaded.vocab == model.vocab
+        assert loaded.score(query, ['Redux']) == pytest.approx(model.score(model.embed(['React']), ['Redux']))
+
+    def test_missing_artifact(self, tmp_path):
+        """아티팩트가 없으면 None (Titan 경로 사용)"""
+        assert get_skill_embedding(str(tmp_path / 'missing.npz')) is None
+
+    def test_innerproduct_scale(self):
+        """OpenSearch faiss innerproduct _score와 같은 척도"""
+        assert innerproduct_score(1.0) == 2.0
+        assert innerproduct_score(0.0) == 1.0
+        assert innerproduct_score(-1.0) == 0.5
+
+
+class TestLocalSimilaritySearch:
+    """추천 엔진 로컬 유사도 경로 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    def test_bundled_artifact_loads(self):
+        """레이어에 포함된 아티팩트 로드"""
+        bundled = get_skill_embedding(DEFAULT_ARTIFACT_PATH)
+        assert bundled is not None
+        assert bundled.embed(['Java', 'Spring Boot']) is not None
+
+    def test_skill_only_request_skips_titan(self, monkeypatch):
+        """기술 목록만 있으면 Titan 없이 로컬 임베딩으로 순위 결정"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        client = MagicMock()
+        client.search.return_value = {'hits': {'hits': [
+            {'_source': {'user_id': 'FRONT', 'skill_names': ['react', 'typescript']}},
+            {'_source': {'user_id': 'BACK', 'skill_names': ['java', 'spring boot', 'jpa']}},
+        ]}}
+        embedding = MagicMock()
+        monkeypatch.setattr(recommendation_engine, 'get_opensearch_client', lambda: client)
+        monkeypatch.setattr(recommendation_engine, 'generate_embedding', embedding)
+
+        matches = recommendation_engine.search_similar_employees('P_001', ['Java', 'Spring Boot'])
+
+        embedding.assert_not_called()
+        assert [match['user_id'] for match in matches] == ['BACK', 'FRONT']
+        assert 'knn' not in client.search.call_args.kwargs['body']['query']
+
+    def test_free_text_uses_titan(self, monkeypatch):
+        """자유 텍스트 설명이 있으면 Titan 임베딩 k-NN 검색"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        client = MagicMock()
+        client.search.return_value = {'hits': {'hits': [
+            {'_source': {'user_id': 'U_001'}, '_score': 1.8}
+        ]}}
+        monkeypatch.setattr(recommendation_engine, 'get_opensearch_client', lambda: client)
+        monkeypatch.setattr(recommendation_engine, 'generate_embedding', lambda text: [1.0, 0.0])
+
+        matches = recommendation_engine.search_similar_employees(
+            'P_001', ['Java'], description='대용량 결제 시스템 구축'
+        )
+
+        assert matches[0]['similarity_score'] == 1.8
+        assert 'knn' in client.search.call_args.kwargs['body']['query']
+
+    def test_hybrid_search_skips_titan(self, monkeypatch):
+        """추천/팀 추천 후보 검색도 기술 목록만으로는 Titan을 호출하지 않음"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        client = MagicMock()
+        client.search.return_value = {'hits': {'hits': [
+            {'_source': {'user_id': 'FRONT', 'skill_names': ['react', 'typescript']}},
+            {'_source': {'user_id': 'BACK', 'skill_names': ['java', 'spring boot', 'jpa']}},
+        ]}}
+        employees = {
+            user_id: {'user_id': user_id, 'basic_info': {'name': user_id}, 'skills': [{'name': skill} for skill in skills]}
+            for user_id, skills in [('FRONT', ['React']), ('BACK', ['Java', 'Spring Boot'])]
+        }
+        embedding = MagicMock()
+        monkeypatch.setattr(recommendation_engine, 'get_opensearch_client', lambda: client)
+        monkeypatch.setattr(recommendation_engine, 'generate_embedding', embedding)
+        monkeypatch.setattr(
+            recommendation_engine, 'batch_get_employees', lambda user_ids: [employees[user_id] for user_id in user_ids]
+        )
+
+        skill_matches, vector_matches = recommendation_engine.search_hybrid_candidates(['Java', 'Spring Boot'], k=1)
+
+        embedding.assert_not_called()
+        assert 'knn' not in client.search.call_args.kwargs['body']['query']
+        assert [match['user_id'] for match in vector_matches] == ['BACK']
+        assert [match['user_id'] for match in skill_matches] == ['BACK']
+
+    def test_hybrid_search_without_model_uses_titan(self, monkeypatch):
+        """로컬 모델이 없으면 기술 필터가 적용된 Titan k-NN 검색"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        client = MagicMock()
+        client.search.return_value = {'hits': {'hits': [{'_source': {'user_id': 'U_001'}, '_score': 1.8}]}}
+        monkeypatch.setattr(recommendation_engine, 'get_opensearch_client', lambda: client)
+        monkeypatch.setattr(recommendation_engine, 'get_skill_embedding', lambda: None)
+        monkeypatch.setattr(recommendation_engine, 'generate_embedding', lambda text: [1.0, 0.0])
+        monkeypatch.setattr(recommendation_engine, 'batch_get_employees', lambda user_ids: [{'user_id': 'U_001'}])
+
+        _, vector_matches = recommendation_engine.search_hybrid_candidates(['Java'], k=5)
+
+        assert vector_matches[0]['similarity_score'] == 1.8
+        assert 'knn' in client.search.call_args.kwargs['body']['query']
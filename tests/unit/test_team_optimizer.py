@@ -0,0 +1,190 @@
+"""
+팀 구성 최적화 유닛 테스트
+
+역할 슬롯 매칭, lazy greedy 선택, beam search와 대규모 후보군 성능을 검증합니다.
+"""
+
+import itertools
+import random
+import time
+
+from lambda_functions.recommendation_engine.team_optimizer import (
+    GENERIC_SLOT,
+    TeamOptimizer,
+    normalize_slots,
+    optimize_team,
+    role_matches_slot
+)
+
+
+def make_candidate(user_id, role, skills, overall_score=50.0):
+    """merge_and_score_candidates 결과 형식의 후보자 생성"""
+    return {
+        'user_id': user_id,
+        'name': user_id,
+        'role': role,
+        'overall_score': overall_score,
+        'matched_skills': list(skills),
+        'skill_details': [
+            {'skill': skill, 'level': 'Expert', 'years': 3, 'score': score}
+            for skill, score in skills.items()
+        ]
+    }
+
+
+class TestRoleSlots:
+    """역할 슬롯 테스트"""
+
+    def test_role_matches_slot(self):
+        """슬롯 토큰 접두어 및 약어 매칭"""
+        assert role_matches_slot('Backend_Dev', 'Senior Backend Developer')
+        assert role_matches_slot('PM', 'Project Manager')
+        assert not role_matches_slot('Backend_Dev', 'Frontend Developer')
+        assert role_matches_slot(GENERIC_SLOT, 'Designer')
+
+    def test_normalize_slots_ignores_non_counts(self):
+        """인원이 아닌 값과 required_members 키는 무시"""
+        slots = normalize_slots({'PM': 1, 'Backend_Dev': '2', 'Frontend': ['U_001'], 'required_members': 5}, 5)
+        assert slots == {'PM': 1, 'Backend_Dev': 2}
+
+    def test_normalize_slots_generic_fallback(self):
+        """슬롯이 없으면 범용 슬롯 사용"""
+        assert normalize_slots(None, 4) == {GENERIC_SLOT: 4}
+        assert normalize_slots({'required_members': 3}, 3) == {GENERIC_SLOT: 3}
+
+
+class TestLazyGreedy:
+    """Lazy greedy 선택 테스트"""
+
+    def test_prefers_complementary_skills(self):
+        """같은 기술 보유자보다 부족한 기술을 채우는 후보 선택"""
+        candidates = [
+            make_candidate('A', 'Backend Developer', {'Java': 2.0}, 60),
+            make_candidate('B', 'Backend Developer', {'Java': 2.0}, 59),
+            make_candidate('C', 'Backend Developer', {'Python': 1.6}, 40),
+        ]
+        result = optimize_team(candidates, ['Java', 'Python'], {}, {'Backend_Dev': 2}, priority='skill')
+
+        assert set(result['members']) == {'A', 'C'}
+        assert result['uncovered_skills'] == []
+        assert result['skill_coverage'] == 90.0
+
+    def test_respects_role_slots(self):
+        """역할 슬롯별 인원 제약"""
+        candidates = [
+            make_candidate('PM1', 'Project Manager', {'Agile': 1.0}, 40),
+            make_candidate('BE1', 'Backend Developer', {'Java': 2.0}, 90),
+            make_candidate('BE2', 'Backend Developer', {'Java': 1.8}, 85),
+            make_candidate('BE3', 'Backend Developer', {'Java': 1.6}, 80),
+        ]
+        result = optimize_team(candidates, ['Java', 'Agile'], {}, {'PM': 1, 'Backend_Dev': 2})
+
+        assert result['assignments']['PM1'] == 'PM'
+        assert sorted(result['assignments'].values()) == ['Backend_Dev', 'Backend_Dev', 'PM']
+        assert result['unfilled_slots'] == {}
+
+    def test_reports_unfilled_slots(self):
+        """지원자가 없는 슬롯은 미충원으로 보고"""
+        candidates = [make_candidate('BE1', 'Backend Developer', {'Java': 2.0})]
+        result = optimize_team(candidates, ['Java'], {}, {'PM': 1, 'Backend_Dev': 1})
+
+        assert result['members'] == ['BE1']
+        assert result['unfilled_slots'] == {'PM': 1}
+
+    def test_affinity_pulls_in_partner(self):
+        """기술이 같으면 선택된 팀원과 친밀도가 높은 후보 선택"""
+        candidates = [
+            make_candidate('A', 'Developer', {'Java': 2.0}, 80),
+            make_candidate('B', 'Developer', {'Java': 1.0}, 50),
+            make_candidate('C', 'Developer', {'Java': 1.0}, 51),
+        ]
+        graph = {'A': {'B': 95.0}, 'B': {'A': 95.0}}
+        result = optimize_team(candidates, ['Java'], graph, {GENERIC_SLOT: 2}, priority='affinity')
+
+        assert set(result['members']) == {'A', 'B'}
+        assert result['pairwise_affinity_avg'] == 95.0
+
+    def test_matches_plain_greedy(self):
+        """lazy 평가 결과가 매 단계 전체 재계산 greedy와 같아야 함"""
+        rng = random.Random(7)
+        skills = [f'S{i}' for i in range(8)]
+        candidates = [
+            make_candidate(
+                f'U{i}', 'Developer',
+                {skill: rng.uniform(0.2, 2.0) for skill in rng.sample(skills, 3)},
+                rng.uniform(20, 90)
+            )
+            for i in range(40)
+        ]
+        graph = {}
+        for a, b in itertools.combinations(range(40), 2):
+            if rng.random() < 0.1:
+                score = rng.uniform(10, 100)
+                graph.setdefault(f'U{a}', {})[f'U{b}'] = score
+                graph.setdefault(f'U{b}', {})[f'U{a}'] = score
+
+        optimizer = TeamOptimizer(candidates, skills, graph, {GENERIC_SLOT: 5})
+        lazy = optimizer.lazy_greedy()
+
+        plain = []
+        for _ in range(5):
+            best = max(
+                (c['user_id'] for c in candidates if c['user_id'] not in plain),
+                key=lambda user_id: optimizer.objective(plain + [user_id])
+            )
+            plain.append(best)
+
+        assert lazy['members'] == plain
+
+
+class TestBeamSearch:
+    """Beam search 테스트"""
+
+    def test_beam_not_worse_than_greedy(self):
+        """beam search 결과는 greedy 이상"""
+        candidates = [
+            make_candidate('A', 'Developer', {'Java': 2.0, 'Python': 2.0}, 60),
+            make_candidate('B', 'Developer', {'Java': 2.0}, 55),
+            make_candidate('C', 'Developer', {'Python': 2.0}, 55),
+        ]
+        graph = {'B': {'C': 100.0}, 'C': {'B': 100.0}}
+        optimizer = TeamOptimizer(candidates, ['Java', 'Python'], graph, {GENERIC_SLOT: 2}, 'affinity')
+
+        greedy = optimizer.lazy_greedy()
+        beam = optimizer.beam_search(beam_width=3)
+
+        assert beam['objective'] >= greedy['objective']
+        assert set(beam['members']) == {'B', 'C'}
+
+
+class TestPerformance:
+    """대규모 후보군 성능 테스트"""
+
+    def test_ten_person_team_from_ten_thousand(self):
+        """후보 10,000명에서 10인 팀 선택이 제한 시간 내 완료"""
+        rng = random.Random(42)
+        skills = [f'Skill{i}' for i in range(30)]
+        roles = ['Project Manager', 'Backend Developer', 'Frontend Developer', 'QA Engineer']
+        candidates = [
+            make_candidate(
+                f'U_{i:05d}', rng.choice(roles),
+                {skill: rng.uniform(0.5, 2.0) for skill in rng.sample(skills, 4)},
+                rng.uniform(10, 95)
+            )
+            for i in range(10000)
+        ]
+        graph = {}
+        for _ in range(50000):
+            a, b = rng.sample(range(10000), 2)
+            score = rng.uniform(0, 100)
+            graph.setdefault(f'U_{a:05d}', {})[f'U_{b:05d}'] = score
+            graph.setdefault(f'U_{b:05d}', {})[f'U_{a:05d}'] = score
+
+        slots = {'PM': 1, 'Backend_Dev': 4, 'Frontend': 3, 'QA': 2}
+        started = time.perf_counter()
+        result = optimize_team(candidates, skills, graph, slots, beam_width=3)
+        elapsed = time.perf_counter() - started
+
+        assert len(result['members']) == 10
+        assert result['unfilled_slots'] == {}
+        assert elapsed < 29.0
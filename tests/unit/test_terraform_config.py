@@ -103,6 +103,9 @@ class TestDynamoDBConfiguration:
         
         # EmployeeAffinity 테이블에 Employee1Index GSI
         assert "Employee1Index" in dynamodb_config
+        
+        # PairDailyStats 테이블에 DayIndex GSI (친밀도 증분 갱신)
+        assert 'name            = "DayIndex"' in dynamodb_config
 
 
 class TestS3Configuration:
@@ -197,12 +200,40 @@ class TestIAMConfiguration:
             assert f'resource "aws_iam_role_policy" "{policy}"' in iam_config, \
                 f"{policy} 정책이 정의되지 않았습니다"
     
+    def test_affinity_self_invoke(self, iam_config):
+        """친밀도 계산 코디네이터가 워커(자기 자신)를 호출할 수 있는지 테스트"""
+        start = iam_config.index('resource "aws_iam_role_policy" "lambda_affinity_self_invoke"')
+        policy = iam_config[start:iam_config.index('\n}\n', start)]
+        
+        assert 'role = aws_iam_role.lambda_execution_team2.id' in policy
+        assert '"lambda:InvokeFunction"' in policy
+        assert 'aws_lambda_function.affinity_calculator.arn' in policy
+    
     def test_bedrock_model_access(self, iam_config):
         """Bedrock 모델 접근 권한이 있는지 테스트"""
         assert "anthropic.claude-v2" in iam_config
         assert "amazon.titan-embed-text-v1" in iam_config
 
 
+class TestAPIGatewayConfiguration:
+    """API Gateway 설정 테스트"""
+    
+    @pytest.fixture
+    def api_config(self):
+        """API Gateway Terraform 설정 읽기"""
+        config_path = Path("deployment/terraform/api_gateway.tf")
+        return config_path.read_text(encoding='utf-8')
+    
+    def test_profiling_route_requires_iam(self, api_config):
+        """프로파일링 경로는 IAM 인증 (호출 주체 ARN으로 관리자 확인)"""
+        start = api_config.index('resource "aws_api_gateway_method" "recommendations_profile_post"')
+        method = api_config[start:api_config.index('}', start)]
+        
+        assert 'path_part   = "profile"' in api_config
+        assert 'authorization = "AWS_IAM"' in method
+        assert 'aws_api_gateway_integration.recommendations_profile_lambda.id' in api_config
+
+
 class TestMainConfiguration:
     """Main Terraform 설정 테스트"""
     
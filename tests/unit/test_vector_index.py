@@ -0,0 +1,179 @@
+"""
+프로세스 내 벡터 인덱스 유닛 테스트
+
+정확 검색과 IVF 근사 검색 결과, OpenSearch 쿼리 본문 호환(knn, 기술 필터),
+직원 스냅샷 저장/로드와 OpenSearch 장애 시 추천 엔진 대체 경로를 검증합니다.
+"""
+
+from unittest.mock import MagicMock
+import numpy as np
+import pytest
+from common.opensearch_client import build_knn_query, build_skill_filter_query
+from common.vector_index import (
+    ExactVectorIndex,
+    IVFVectorIndex,
+    LocalVectorSearch,
+    get_local_vector_search
+)
+from common.workforce_snapshot import (
+    SNAPSHOT_CHECK_SECONDS,
+    WorkforceSnapshot,
+    get_workforce_snapshot,
+    normalize_rows
+)
+
+
+def make_snapshot(size=200, dimensions=16, seed=0):
+    """기술 키워드가 교대로 지정된 무작위 스냅샷"""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((size, dimensions)).astype(np.float32)
+    sources = [
+        {
+            'user_id': f'U_{row:03d}',
+            'name': f'직원{row}',
+            'role': 'Developer',
+            'skill_names': ['java'] if row % 2 == 0 else ['react']
+        }
+        for row in range(size)
+    ]
+    return WorkforceSnapshot(sources, vectors)
+
+
+class TestVectorIndex:
+    """정확/IVF 인덱스 테스트"""
+
+    def test_exact_search_orders_by_cosine(self):
+        """가장 가까운 벡터 순서로 반환"""
+        vectors = normalize_rows(np.array([[1, 0], [0.8, 0.6], [0, 1]], dtype=np.float32))
+        rows, cosines = ExactVectorIndex(vectors).search(np.array([1, 0], dtype=np.float32), 2)
+
+        assert rows.tolist() == [0, 1]
+        assert cosines[0] == pytest.approx(1.0)
+
+    def test_ivf_full_probe_matches_exact(self):
+        """모든 리스트를 탐색하면 정확 검색과 같은 결과"""
+        snapshot = make_snapshot()
+        query = snapshot.vectors[7]
+        ivf = IVFVectorIndex(snapshot.vectors, nlist=8, nprobe=8)
+
+        exact_rows, _ = ExactVectorIndex(snapshot.vectors).search(query, 10)
+        ivf_rows, _ = ivf.search(query, 10)
+
+        assert ivf_rows.tolist() == exact_rows.tolist()
+
+    def test_ivf_filter_returns_k_results(self):
+        """필터 후 후보가 부족하면 리스트를 더 탐색하여 k개 반환"""
+        snapshot = make_snapshot()
+        ivf = IVFVectorIndex(snapshot.vectors, nlist=20, nprobe=1)
+        allowed = np.arange(0, 200, 10)
+
+        rows, _ = ivf.search(snapshot.vectors[0], 15, allowed)
+
+        assert len(rows) == 15
+        assert set(rows.tolist()) <= set(allowed.tolist())
+
+
+class TestLocalVectorSearch:
+    """OpenSearch 쿼리 호환 테스트"""
+
+    def test_knn_query_with_skill_filter(self):
+        """build_knn_query 본문을 실행하고 필터와 점수 척도를 적용"""
+        snapshot = make_snapshot()
+        search = LocalVectorSearch(snapshot)
+        body = build_knn_query(snapshot.vectors[4].tolist(), k=5, required_skills=['Java'])
+
+        response = search.search(index='employee_profiles', body=body)
+        hits = response['hits']['hits']
+
+        assert len(hits) == 5
+        assert hits[0]['_source']['user_id'] == 'U_004'
+        assert hits[0]['_score'] == pytest.approx(2.0)
+        assert all('java' in hit['_source']['skill_names'] for hit in hits)
+
+    def test_skill_filter_query(self):
+        """벡터 없는 기술 필터 쿼리"""
+        search = LocalVectorSearch(make_snapshot(size=10))
+
+        response = search.search(body=build_skill_filter_query(['React'], size=100))
+
+        assert [hit['_id'] for hit in response['hits']['hits']] == ['U_001', 'U_003', 'U_005', 'U_007', 'U_009']
+
+    def test_snapshot_round_trip(self, tmp_path):
+        """저장한 스냅샷을 로드하여 로컬 검색 백엔드 생성"""
+        path = str(tmp_path / 'snapshot.npz')
+        make_snapshot(size=20).save(path)
+
+        search = get_local_vector_search(path)
+
+        assert len(search.snapshot) == 20
+        assert search.snapshot.sources[3]['name'] == '직원3'
+
+    def test_load_failure_not_cached(self, tmp_path):
+        """로드 실패는 보관하지 않아 파일이 생기면 다음 호출에서 로드"""
+        path = str(tmp_path / 'late.npz')
+
+        assert get_workforce_snapshot(path) is None
+
+        make_snapshot(size=10).save(path)
+        assert len(get_workforce_snapshot(path)) == 10
+
+    def test_snapshot_reloaded_when_version_changes(self, tmp_path):
+        """확인 주기가 지나면 버전을 확인하여 바뀐 스냅샷만 다시 로드"""
+        now = [0.0]
+        path = str(tmp_path / 'versioned.npz')
+        make_snapshot(size=10).save(path)
+        first = get_workforce_snapshot(path, clock=lambda: now[0])
+
+        now[0] += SNAPSHOT_CHECK_SECONDS + 1
+        assert get_workforce_snapshot(path, clock=lambda: now[0]) is first
+
+        make_snapshot(size=30).save(path)
+        assert get_workforce_snapshot(path, clock=lambda: now[0]) is first
+
+        now[0] += SNAPSHOT_CHECK_SECONDS + 1
+        reloaded = get_workforce_snapshot(path, clock=lambda: now[0])
+        assert len(reloaded) == 30
+        assert len(get_local_vector_search(path).snapshot) == 30
+
+    def test_unconfigured_snapshot(self, monkeypatch):
+        """스냅샷 위치가 없으면 None"""
+        monkeypatch.delenv('WORKFORCE_SNAPSHOT_URI', raising=False)
+        assert get_local_vector_search() is None
+
+
+class TestOpenSearchFallback:
+    """추천 엔진 OpenSearch 장애 대체 경로 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def aws_region(self, monkeypatch):
+        """boto3 클라이언트 생성을 위한 리전 설정"""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    def test_similar_employees_from_local_index(self, monkeypatch):
+        """OpenSearch 검색이 실패하면 로컬 인덱스 결과 반환"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        snapshot = make_snapshot()
+        client = MagicMock()
+        client.search.side_effect = TimeoutError('read timeout')
+        monkeypatch.setattr(recommendation_engine, 'get_opensearch_client', lambda: client)
+        monkeypatch.setattr(recommendation_engine, 'get_local_vector_search', lambda: LocalVectorSearch(snapshot))
+        monkeypatch.setattr(recommendation_engine, 'generate_embedding', lambda text: snapshot.vectors[9].tolist())
+
+        matches = recommendation_engine.search_similar_employees('P_001', ['Java'], description='결제 시스템')
+
+        assert client.search.call_count == 1
+        assert matches[0]['user_id'] == 'U_009'
+        assert len(matches) == recommendation_engine.SIMILAR_SEARCH_K
+
+    def test_error_without_snapshot(self, monkeypatch):
+        """스냅샷이 없으면 기존처럼 빈 결과"""
+        from lambda_functions.recommendation_engine import index as recommendation_engine
+
+        client = MagicMock()
+        client.search.side_effect = TimeoutError('read timeout')
+        monkeypatch.setattr(recommendation_engine, 'get_opensearch_client', lambda: client)
+        monkeypatch.setattr(recommendation_engine, 'get_local_vector_search', lambda: None)
+        monkeypatch.setattr(recommendation_engine, 'generate_embedding', lambda text: [1.0, 0.0])
+
+        assert recommendation_engine.search_similar_employees('P_001', ['Java'], description='결제') == []
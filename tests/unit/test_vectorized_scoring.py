@@ -0,0 +1,72 @@
+"""
+메신저 쌍별 집계 벡터화 경로 유닛 테스트
+
+익명화 메신저 로그 전체에 대해 벡터화 집계가 메시지 단위 집계와 같은지,
+시간대 오프셋·형식 오류·누락 ID가 섞인 입력의 처리를 검증합니다.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+import pytest
+from lambda_functions.affinity_calculator.messenger_aggregation import aggregate_messages
+from lambda_functions.affinity_calculator.vectorized_scoring import (
+    MessageColumns,
+    aggregate_columns,
+    aggregate_message_batch
+)
+
+
+NOW = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+MESSENGER_LOGS_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'test_data', 'messenger_logs_anonymized.json'
+)
+
+
+def assert_same_stats(actual, expected):
+    """쌍별 집계 일치"""
+    assert set(actual) == set(expected)
+    for pair, stats in expected.items():
+        assert actual[pair].total_messages == stats.total_messages
+        assert actual[pair].weighted_score == pytest.approx(stats.weighted_score, rel=1e-9)
+        assert actual[pair].response_time_sum == pytest.approx(stats.response_time_sum)
+        assert actual[pair].response_count == stats.response_count
+
+
+class TestVectorizedScoring:
+    """벡터화 집계 테스트"""
+
+    def test_matches_scalar_on_messenger_logs(self):
+        """익명화 메신저 로그 2,000건 - 메시지 단위 집계와 일치"""
+        with open(MESSENGER_LOGS_PATH, 'r', encoding='utf-8') as f:
+            messages = json.load(f)
+        for index, message in enumerate(messages[::7]):
+            message['is_vacation_period'] = index % 3 == 0
+        event_dates = {'2025-12-05', '2025-12-24', 'TBD'}
+
+        actual = aggregate_message_batch(messages, event_dates, NOW)
+
+        assert_same_stats(actual, aggregate_messages(messages, event_dates, NOW))
+
+    def test_offsets_invalid_and_missing_ids(self):
+        """오프셋 시각은 현지 시각으로 상황 구분, 형식 오류·자기 자신·ID 누락은 제외"""
+        messages = [
+            {'sender_id': 'B', 'receiver_id': 'A', 'timestamp': '2025-12-31T20:00:00+09:00', 'response_time_minutes': 0},
+            {'sender_id': 'A', 'receiver_id': 'B', 'timestamp': '2025-12-31T10:00:00', 'response_time_minutes': 12},
+            {'sender_id': 'A', 'receiver_id': 'C', 'timestamp': 'not-a-date'},
+            {'sender_id': 'A', 'receiver_id': 'A', 'timestamp': '2025-12-31T10:00:00Z'},
+            {'sender_id': None, 'receiver_id': 'A', 'timestamp': '2025-12-31T10:00:00Z'}
+        ]
+
+        columns = MessageColumns.from_messages(messages)
+        actual = aggregate_columns(columns, set(), NOW)
+
+        assert len(columns) == 5
+        assert_same_stats(actual, aggregate_messages(messages, set(), NOW))
+        assert actual[('A', 'B')].total_messages == 2
+        assert actual[('A', 'B')].response_count == 1
+
+    def test_empty_input(self):
+        """메시지가 없으면 빈 집계"""
+        assert aggregate_message_batch([], set(), NOW) == {}